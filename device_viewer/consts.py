@@ -2,6 +2,7 @@ from pathlib import Path
 
 from device_viewer.models.media import (
     MediaCaptureEventModel, RecordingStatePublisher, RecordingStateModel,
+    RecorderStatsPublisher,
 )
 from dropbot_controller.consts import (
     CHIP_INSERTED,
@@ -32,6 +33,10 @@ DEVICE_VIEWER_SCREEN_RECORDING = "ui/device_viewer/screen_recording"
 DEVICE_VIEWER_CAMERA_ACTIVE    = "ui/device_viewer/camera_active"
 DEVICE_VIEWER_MEDIA_CAPTURED   = "ui/device_viewer/camera/media_captured"
 DEVICE_VIEWER_RECORDING_STATE  = "ui/device_viewer/recording_state"
+# Raw recorder frame accounting (captured/written/dropped, queue high-water),
+# published periodically while recording and once when it stops. Schema:
+# device_viewer.models.media.RecorderStats.
+DEVICE_VIEWER_RECORDER_STATS   = "ui/device_viewer/recorder_stats"
 DEVICE_VIEWER_GEOMETRY_CHANGED = "ui/device_viewer/geometry_changed"
 # Sidebar route preview/playback is running (payload "True"/"False"). Published
 # by device_viewer's RouteExecutionService. Canonical home moved here from the
@@ -120,6 +125,7 @@ ACTOR_TOPIC_DICT = {
 # Publishers
 # ---------------------------------------------------------------------------
 device_viewer_recording_state_publisher = RecordingStatePublisher(topic=DEVICE_VIEWER_RECORDING_STATE)
+device_viewer_recorder_stats_publisher = RecorderStatsPublisher(topic=DEVICE_VIEWER_RECORDER_STATS)
 
 # ---------------------------------------------------------------------------
 # app_globals keys (stored in APP_GLOBALS_REDIS_HASH via the redis client)
@@ -169,6 +175,9 @@ NUMBER_OF_CHANNELS = 120
 ZOOM_SENSITIVITY = 5
 # device view margin when auto fit
 AUTO_FIT_MARGIN_SCALE = 95
+# Devices with at least this many electrodes paint them through one batched
+# scene item (ElectrodeBatchItem) instead of one cached item per electrode.
+BATCHED_RENDER_MIN_ELECTRODES = 400
 
 # ---------------------------------------------------------------------------
 # Gamepad defaults (configurable in Device Viewer preferences). Env vars of the
@@ -253,6 +262,34 @@ RECORDING_60FPS_MIN_FPS = 45     # at least this fps uses the 60 fps classes
 # recorder taps the capture session's own sink at full rate).
 CAMERA_PREVIEW_MAX_FPS = 20
 
+# Ceiling for applying inbound display states (protocol step/phase changes) to
+# the device view. Bursts are coalesced latest-wins per topic, so fast
+# protocols or step scrubbing apply the newest state once per refresh tick
+# instead of working through a backlog of superseded repaints.
+DISPLAY_STATE_MAX_APPLY_HZ = 60
+
+# ---------------------------------------------------------------------------
+# Still captures
+# ---------------------------------------------------------------------------
+# Image formats a still capture can be encoded to (preference value -> file
+# extension / Qt writer format).
+CAPTURE_IMAGE_FORMATS = {"png": "PNG", "jpg": "JPEG"}
+# zlib level for PNG captures: lossless at any level, and 1 encodes several
+# times faster than the default 6 for slightly larger files.
+CAPTURE_DEFAULT_PNG_COMPRESSION = 1
+CAPTURE_DEFAULT_JPEG_QUALITY = 95
+# Dedicated encoder threads for still captures (not the global pool shared
+# with everything else), and how many captures may wait for them before new
+# ones are refused instead of piling up full frames in memory.
+CAPTURE_ENCODER_THREADS = 2
+CAPTURE_QUEUE_MAX_PENDING = 16
+# Saved captures are recorded in app globals in one batched write: when the
+# protocol moves to another step, or after this long without a new capture.
+CAPTURE_METADATA_FLUSH_DELAY_MS = 1000
+# At protocol end and at shutdown the pending batch is written synchronously,
+# after waiting at most this long for captures still being encoded.
+CAPTURE_FINISH_TIMEOUT_MS = 2000
+
 # ---------------------------------------------------------------------------
 # Resources & UI text
 # ---------------------------------------------------------------------------
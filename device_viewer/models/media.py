@@ -1,6 +1,6 @@
 import json
 
-from pydantic import BaseModel, FilePath, StrictBool
+from pydantic import BaseModel, FilePath, NonNegativeInt, StrictBool
 from enum import Enum
 from traits.api import HasTraits, Bool, Event, observe, Str
 
@@ -47,6 +47,30 @@ class RecordingStatePublisher(ValidatedTopicPublisher):
         super().publish({"state": state})
 
 
+class RecorderStats(BaseModel):
+    """
+    Frame accounting of a running (``recording`` True) or finished raw
+    recording. ``frames_dropped`` counts camera frames skipped because the
+    encoder fell behind; ``queue_high_water`` is the most frames ever
+    waiting for the encoder, out of ``queue_capacity``.
+    """
+    output_path: str
+    recording: StrictBool
+    frames_captured: NonNegativeInt
+    frames_written: NonNegativeInt
+    frames_dropped: NonNegativeInt
+    queue_high_water: NonNegativeInt
+    queue_capacity: NonNegativeInt
+
+
+class RecorderStatsPublisher(ValidatedTopicPublisher):
+    validator_class = RecorderStats
+
+    def publish(self, stats: dict):
+        """Publish a recorder's stats snapshot (see RecorderStats)."""
+        super().publish(stats)
+
+
 class MediaCaptureEventModel(HasTraits):
     """In-process notification that a capture file finished writing.
 
@@ -14,7 +14,7 @@ except Exception:
     pygame = None
 
 from device_viewer.models.electrodes import Electrode
-from device_viewer.utils.electrode_route_helpers import find_shortest_paths
+from device_viewer.utils.electrode_route_helpers import find_shortest_path_tree, ShortestPathTree
 from dropbot_controller.consts import (
     DETECT_DROPLETS, SET_REALTIME_MODE
 )
@@ -76,7 +76,8 @@ class ElectrodeInteractionControllerService(HasTraits):
     #: service only recolors it and sets its tooltip.
     gamepad_icon = Instance(object, allow_none=True)
 
-    autoroute_paths = Dict({})
+    #: Parent-pointer BFS result of the current autoroute drag; paths are rebuilt per hovered electrode.
+    autoroute_tree = Instance(ShortestPathTree, allow_none=True)
 
     electrode_hovered = Instance(ElectrodeView)
 
@@ -1438,6 +1439,8 @@ class ElectrodeInteractionControllerService(HasTraits):
             self.device_view.setDragMode(QGraphicsView.DragMode.NoDrag)
 
     def get_electrode_view_for_scene_pos(self, scene_pos):
+        if self.electrode_view_layer is not None and self.electrode_view_layer.batch_item is not None:
+            return self.electrode_view_layer.electrode_view_at(scene_pos)
         return self.device_view.scene().get_item_under_mouse(scene_pos, ElectrodeView)
 
     def detect_droplet(self):
@@ -1646,18 +1649,19 @@ class ElectrodeInteractionControllerService(HasTraits):
     def handle_autoroute_start(self, from_id, avoid_collisions=True): # Run when the user enables autorouting an clicks on an electrode
         logger.debug("Start Autoroute")
         routes = [layer.route for layer in self.model.routes.layers]
-        self.autoroute_paths = find_shortest_paths(from_id, self.model.electrodes.svg_model.neighbours, routes, avoid_collisions=avoid_collisions) # Run the BFS and cache the result dict
+        self.autoroute_tree = find_shortest_path_tree(from_id, self.model.electrodes.svg_model.neighbours, routes, avoid_collisions=avoid_collisions) # Run the BFS and cache the result tree
         self.model.routes.autoroute_layer = RouteLayer(route=Route(), color=AUTOROUTE_COLOR)
 
     def handle_autoroute(self, to_id):
         logger.debug(f"Autoroute: Adding route to {to_id}")
-        self.model.routes.autoroute_layer.route.route = self.autoroute_paths.get(to_id, []).copy() # Display cached result from BFS
+        paths = self.autoroute_tree.path_to(to_id) if self.autoroute_tree is not None else []
+        self.model.routes.autoroute_layer.route.route = paths # Display cached result from BFS
 
     def handle_autoroute_end(self):
         # only proceed if there is at least one segment and autoroute layer exists
         if self.model.routes.autoroute_layer:
             logger.debug("End Autoroute")
-            self.autoroute_paths = {}
+            self.autoroute_tree = None
             if self.model.routes.autoroute_layer.route.get_segments():
                 self.model.routes.add_layer(self.model.routes.autoroute_layer.route) # Keep the route, generate a normal color
             self.model.routes.autoroute_layer = None
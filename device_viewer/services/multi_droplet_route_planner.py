@@ -0,0 +1,207 @@
+"""Conflict-free multi-droplet route planning in space-time.
+
+Routes drawn in the device viewer execute in lock-step: with a trail length
+of 1, phase ``t`` actuates electrode ``route[t]`` of every route at once (see
+``microdrop_utils.route_execution``). Independently drawn routes can
+therefore bring two droplets onto neighbouring electrodes, where they merge.
+
+``MultiDropletRoutePlanner`` takes start/goal electrode pairs and the device
+neighbour graph and plans all routes together with prioritized cooperative
+A*: droplets are planned one at a time through (electrode, phase) space,
+each avoiding the space-time cells already reserved by the droplets planned
+before it. A droplet may wait in place (the electrode repeats in its route)
+to let another one pass, and stays parked on its goal once it arrives.
+
+Two droplets are in conflict when, at the same phase, they sit on the same
+or adjacent electrodes, or when a droplet moves next to an electrode another
+droplet occupied in the previous phase (the two would touch mid-transfer).
+
+Like ``PathExecutionService``, the planner is a plain calculator rather than
+a HasTraits object; ``apply_to`` writes the result into a
+``RouteLayerManager``.
+"""
+
+import heapq
+from collections import deque
+from itertools import count
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+from device_viewer.models.route import Route, RouteLayerManager
+from logger.logger_service import get_logger
+
+logger = get_logger(__name__)
+
+
+class RoutePlanningError(Exception):
+    """Raised when no conflict-free set of routes could be found."""
+    pass
+
+
+class MultiDropletRoutePlanner:
+    """Plans conflict-free simultaneous routes for several droplets.
+
+    Args:
+        neighbours: Map of electrode id to the ids of its neighbouring electrodes (``SvgUtil.neighbours``).
+        max_phases: Upper bound on the number of phases of any planned route. Defaults to twice the electrode count.
+        max_attempts: Number of priority orderings tried before giving up.
+    """
+
+    def __init__(self, neighbours: Dict[Hashable, Sequence[Hashable]], max_phases: Optional[int] = None,
+                 max_attempts: int = 5):
+        self.neighbours = neighbours
+        self.max_phases = max_phases if max_phases is not None else 2 * max(len(neighbours), 1)
+        self.max_attempts = max_attempts
+
+    # ------------------------------ Public API ---------------------------------------
+
+    def plan(self, pairs: Sequence[Tuple[Hashable, Hashable]]) -> List[List[Hashable]]:
+        """Plan one route per (start, goal) pair, returned in the order of ``pairs``.
+
+        Routes are electrode-id lists where index ``t`` is the droplet's electrode at phase ``t``;
+        a repeated id means the droplet waits for a phase.
+
+        Raises:
+            RoutePlanningError: if the pairs are invalid or no conflict-free plan was found.
+        """
+        pairs = list(pairs)
+        self._validate_pairs(pairs)
+
+        distances = [self._distances_to(goal) for _, goal in pairs]
+        for (start, goal), distance in zip(pairs, distances):
+            if start not in distance:
+                raise RoutePlanningError(f"Electrode {goal} is not reachable from {start}")
+
+        # Longest trips first: they are the hardest to route around others.
+        order = sorted(range(len(pairs)), key=lambda i: distances[i][pairs[i][0]], reverse=True)
+
+        for attempt in range(self.max_attempts):
+            paths, failed = self._plan_in_order(pairs, distances, order)
+            if failed is None:
+                logger.info(f"Planned {len(pairs)} droplet routes in {max(map(len, paths.values()), default=0)} phases "
+                            f"(attempt {attempt + 1})")
+                return [paths[i] for i in range(len(pairs))]
+
+            logger.debug(f"Route planning attempt {attempt + 1} failed for droplet {failed}; raising its priority")
+            order = [failed] + [i for i in order if i != failed]
+
+        raise RoutePlanningError(f"No conflict-free routes found for {len(pairs)} droplets "
+                                 f"after {self.max_attempts} attempts")
+
+    def plan_routes(self, pairs: Sequence[Tuple[Hashable, Hashable]]) -> List[Route]:
+        """``plan`` wrapped as Route models."""
+        return [Route(route=path) for path in self.plan(pairs)]
+
+    def apply_to(self, manager: RouteLayerManager, pairs: Sequence[Tuple[Hashable, Hashable]]) -> List[Route]:
+        """Plan ``pairs`` and replace the manager's layers with the result.
+
+        The plan assumes one electrode per droplet per phase, so the trail is reset to a single electrode
+        with no overlay; otherwise the executed phases would not line up with the planned ones.
+        """
+        routes = self.plan_routes(pairs)
+        manager.trait_set(trail_overlay=0)
+        manager.trait_set(trail_length=1)
+        manager.replace_all_layers(routes)
+        return routes
+
+    # ------------------------------ Helpers ------------------------------------------
+
+    def _validate_pairs(self, pairs):
+        for start, goal in pairs:
+            for electrode_id in (start, goal):
+                if electrode_id not in self.neighbours:
+                    raise RoutePlanningError(f"Unknown electrode {electrode_id}")
+
+        for label, cells in (("start", [start for start, _ in pairs]), ("goal", [goal for _, goal in pairs])):
+            for i, a in enumerate(cells):
+                for b in cells[i + 1:]:
+                    if a == b or b in self.neighbours[a]:
+                        raise RoutePlanningError(f"Droplet {label} electrodes {a} and {b} are too close: "
+                                                 f"they would merge")
+
+    def _distances_to(self, goal) -> Dict[Hashable, int]:
+        """Hop distance of every electrode to ``goal``, ignoring other droplets (exact A* heuristic)."""
+        distances = {goal: 0}
+        q = deque([goal])
+        while q:
+            current = q.popleft()
+            for neighbour in self.neighbours.get(current, ()):
+                if neighbour not in distances:
+                    distances[neighbour] = distances[current] + 1
+                    q.append(neighbour)
+        return distances
+
+    def _plan_in_order(self, pairs, distances, order):
+        """Plan droplets in priority order. Returns (paths by droplet index, index of the first failure or None)."""
+        paths = {}
+        for i in order:
+            start, goal = pairs[i]
+            # Droplets not planned yet still sit on their start electrodes at phase 0.
+            waiting_starts = [pairs[j][0] for j in order if j not in paths and j != i]
+            path = self._plan_single(start, goal, distances[i], list(paths.values()), waiting_starts)
+            if path is None:
+                return paths, i
+            paths[i] = path
+        return paths, None
+
+    @staticmethod
+    def _position(path, phase):
+        return path[phase] if phase < len(path) else path[-1]
+
+    def _zone(self, electrode_id) -> set:
+        return {electrode_id, *self.neighbours.get(electrode_id, ())}
+
+    def _blocked(self, electrode_id, phase, reserved_paths, waiting_starts, previous=None) -> bool:
+        """True if a droplet moving from ``previous`` onto electrode_id at ``phase`` would touch a reserved droplet."""
+        zone = self._zone(electrode_id)
+        previous_zone = self._zone(previous) if previous is not None else ()
+        for path in reserved_paths:
+            position = self._position(path, phase)
+            if position in zone:
+                return True
+            # Moving next to where another droplet was a phase ago, or it moving next to where we were.
+            if phase > 0 and (self._position(path, phase - 1) in zone or position in previous_zone):
+                return True
+        if phase <= 1 and not zone.isdisjoint(waiting_starts):
+            return True
+        return False
+
+    def _goal_is_final(self, goal, phase, reserved_paths) -> bool:
+        """True if no reserved droplet passes near ``goal`` at or after ``phase``, so the droplet can park."""
+        last_phase = max((len(path) for path in reserved_paths), default=0)
+        return not any(self._blocked(goal, t, reserved_paths, ()) for t in range(phase, last_phase + 1))
+
+    def _plan_single(self, start, goal, distance, reserved_paths, waiting_starts) -> Optional[List[Hashable]]:
+        """Space-time A* for one droplet around already reserved routes."""
+        if self._blocked(start, 0, reserved_paths, ()):
+            return None
+
+        tie_breaker = count()
+        frontier = [(distance[start], next(tie_breaker), start, 0)]
+        parents = {(start, 0): None}
+
+        while frontier:
+            _, _, current, phase = heapq.heappop(frontier)
+
+            if current == goal and self._goal_is_final(goal, phase, reserved_paths):
+                path = []
+                state = (current, phase)
+                while state is not None:
+                    path.append(state[0])
+                    state = parents[state]
+                path.reverse()
+                return path
+
+            next_phase = phase + 1
+            if next_phase >= self.max_phases:
+                continue
+
+            for candidate in (current, *self.neighbours.get(current, ())):
+                state = (candidate, next_phase)
+                if state in parents or candidate not in distance:
+                    continue
+                if self._blocked(candidate, next_phase, reserved_paths, waiting_starts, previous=current):
+                    continue
+                parents[state] = (current, phase)
+                heapq.heappush(frontier, (next_phase + distance[candidate], next(tie_breaker), candidate, next_phase))
+
+        return None
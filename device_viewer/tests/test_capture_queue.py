@@ -0,0 +1,91 @@
+"""CaptureQueue: bounded still-capture encoding with batched metadata writes."""
+
+import time
+
+import pytest
+
+from device_viewer.utils.camera import png_quality_for_compression
+from device_viewer.utils.capture_queue import CaptureQueue
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    from pyface.qt.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def process_until(qapp, predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.001)
+    return predicate()
+
+
+def image(width=64, height=48):
+    from PySide6.QtGui import QColor, QImage
+    img = QImage(width, height, QImage.Format.Format_RGB32)
+    img.fill(QColor(30, 60, 90))
+    return img
+
+
+def test_captures_of_a_step_are_recorded_in_one_batch(qapp, tmp_path):
+    batches, saved = [], []
+    queue = CaptureQueue(batches.append, flush_delay_ms=60_000)
+
+    for i in range(3):
+        assert queue.submit(image(), tmp_path / f"step1_{i}.png", step_id="step-1", on_saved=saved.append)
+    assert process_until(qapp, lambda: len(saved) == 3)
+    assert batches == []  # still the same step: nothing written yet
+
+    # The next step's first capture flushes the previous step's batch.
+    queue.submit(image(), tmp_path / "step2_0.jpg", "JPEG", 80, step_id="step-2", on_saved=saved.append)
+    assert len(batches) == 1
+    assert sorted(path for _, path in batches[0]) == sorted(str(tmp_path / f"step1_{i}.png") for i in range(3))
+    assert {kind for kind, _ in batches[0]} == {"image"}
+
+    assert process_until(qapp, lambda: len(saved) == 4)
+    queue.flush_metadata()
+    assert batches[1] == [("image", str(tmp_path / "step2_0.jpg"))]
+    assert (tmp_path / "step2_0.jpg").read_bytes()[:2] == b"\xff\xd8"  # JPEG SOI marker
+    assert queue.latency_summary()["count"] == 4
+
+
+def test_idle_flush_after_delay(qapp, tmp_path):
+    batches = []
+    queue = CaptureQueue(batches.append, flush_delay_ms=10)
+    queue.submit(image(), tmp_path / "only.png")
+    assert process_until(qapp, lambda: batches)
+    assert batches == [[("image", str(tmp_path / "only.png"))]]
+
+
+def test_full_queue_refuses_new_captures(qapp, tmp_path):
+    failed = []
+    queue = CaptureQueue(lambda batch: None, encoder_threads=1, max_pending=1)
+    assert queue.submit(image(2000, 2000), tmp_path / "big.png")
+    assert not queue.submit(image(), tmp_path / "refused.png")
+    assert queue.refused_count == 1
+    # Unwritable target: the failure callback fires and frees the slot.
+    assert process_until(qapp, lambda: queue.pending == 0)
+    queue.submit(image(), tmp_path / "missing-dir" / "x.png", on_failed=failed.append)
+    assert process_until(qapp, lambda: failed)
+
+
+def test_png_quality_maps_back_to_the_compression_level():
+    for level in range(10):
+        quality = png_quality_for_compression(level)
+        assert (100 - quality) * 9 // 91 == level  # Qt's PNG writer mapping
+
+
+def test_finish_records_in_flight_captures_synchronously(qapp, tmp_path):
+    batches, direct = [], []
+    queue = CaptureQueue(batches.append, flush_delay_ms=60_000)
+    for i in range(2):
+        queue.submit(image(), tmp_path / f"last_{i}.png", step_id="last")
+
+    # No event processing in between: finish() waits for the encoders and
+    # delivers their completions itself.
+    assert queue.finish(direct.append, timeout_ms=5000)
+    assert batches == []
+    assert sorted(path for _, path in direct[0]) == sorted(str(tmp_path / f"last_{i}.png") for i in range(2))
+    assert queue.pending == 0
@@ -0,0 +1,92 @@
+"""On-disk device geometry cache used by SvgUtil."""
+
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from device_viewer.utils import device_geometry_cache
+from device_viewer.utils.device_geometry_cache import (
+    GEOMETRY_CACHE_SUFFIX, geometry_cache_path, load_device_geometry,
+    save_device_geometry, svg_geometry_key,
+)
+from device_viewer.utils.dmf_utils import SvgUtil
+
+DEVICES_DIR = Path(__file__).parents[1] / "resources" / "devices"
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(device_geometry_cache, "geometry_cache_dir", lambda: cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def svg_file(tmp_path):
+    path = tmp_path / "2x3device.svg"
+    shutil.copy(DEVICES_DIR / "2x3device.svg", path)
+    return path
+
+
+def test_first_load_writes_artifact(cache_dir, svg_file):
+    svg = SvgUtil(filename=str(svg_file))
+
+    assert not svg.loaded_from_cache
+    assert len(list(cache_dir.glob(f"*{GEOMETRY_CACHE_SUFFIX}"))) == 1
+
+
+def test_second_load_matches_computed_geometry(cache_dir, svg_file):
+    computed = SvgUtil(filename=str(svg_file))
+
+    with patch.object(SvgUtil, "find_electrode_areas") as areas, \
+            patch.object(SvgUtil, "find_neighbours_all") as neighbours:
+        cached = SvgUtil(filename=str(svg_file))
+
+    areas.assert_not_called()
+    neighbours.assert_not_called()
+    assert cached.loaded_from_cache
+    assert cached.electrodes.keys() == computed.electrodes.keys()
+    for key, electrode in computed.electrodes.items():
+        assert cached.electrodes[key].channel == electrode.channel
+        np.testing.assert_array_equal(cached.electrodes[key].path, electrode.path)
+    assert cached.electrode_areas == computed.electrode_areas
+    assert cached.electrode_centers == computed.electrode_centers
+    assert cached.neighbours == computed.neighbours
+    assert cached.connections == computed.connections
+    assert cached.auto_found_connections == computed.auto_found_connections
+    assert (cached.min_x, cached.min_y, cached.max_x, cached.max_y) == \
+           (computed.min_x, computed.min_y, computed.max_x, computed.max_y)
+
+
+def test_editing_svg_changes_key(svg_file):
+    before = svg_geometry_key(svg_file)
+    svg_file.write_text(svg_file.read_text() + "\n")
+    assert svg_geometry_key(svg_file) != before
+
+
+def test_cache_disabled_does_not_touch_disk(cache_dir, svg_file):
+    SvgUtil(filename=str(svg_file), use_geometry_cache=False)
+    assert not list(cache_dir.iterdir())
+
+
+def test_corrupt_artifact_is_a_miss(cache_dir, svg_file):
+    geometry_cache_path(svg_file).write_bytes(b"not a pickle")
+
+    assert load_device_geometry(svg_file) is None
+    assert not geometry_cache_path(svg_file).exists()
+
+
+def test_stale_version_is_a_miss(cache_dir, svg_file, monkeypatch):
+    save_device_geometry(svg_file, {"electrodes": {}})
+    path = geometry_cache_path(svg_file)
+    monkeypatch.setattr(device_geometry_cache, "GEOMETRY_CACHE_VERSION", 2)
+
+    # Artifact written under the old version no longer matches any key.
+    assert load_device_geometry(svg_file) is None
+    assert path.exists()
+    path.rename(geometry_cache_path(svg_file))
+    assert load_device_geometry(svg_file) is None
@@ -0,0 +1,106 @@
+"""Batched electrode rendering through a single ElectrodeBatchItem."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+DEVICE_SVG = Path(__file__).parents[1] / "resources" / "devices" / "90_pin_array.svg"
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    from pyface.qt.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def electrodes(qapp):
+    from device_viewer.models.electrodes import Electrodes
+    from device_viewer.utils.dmf_utils import SvgUtil
+
+    electrodes = Electrodes()
+    electrodes.svg_model = SvgUtil(filename=str(DEVICE_SVG), use_geometry_cache=False)
+    return electrodes
+
+
+@pytest.fixture
+def batched_layer(electrodes):
+    from device_viewer.views.electrode_view.electrode_layer import ElectrodeLayer
+    return ElectrodeLayer(electrodes, default_alphas={}, batched=True)
+
+
+def test_small_device_is_not_batched_by_default(electrodes):
+    from device_viewer.views.electrode_view.electrode_layer import ElectrodeLayer
+    layer = ElectrodeLayer(electrodes, default_alphas={})
+    assert layer.batch_item is None
+    assert all(view.batch_item is None for view in layer.electrode_views.values())
+
+
+def test_recolor_repaints_only_the_electrode_rect(batched_layer):
+    from pyface.qt.QtGui import QColor
+    from device_viewer.views.electrode_view.electrode_batch_item import ElectrodeBatchItem
+
+    electrode_id, view = next(iter(batched_layer.electrode_views.items()))
+    colors = [QColor("red"), QColor("blue")]
+
+    with patch.object(ElectrodeBatchItem, "update", autospec=True) as batch_update, \
+            patch.object(type(view), "update", autospec=True) as view_update:
+        view.update_color(colors)
+        view.update_color([QColor("red"), QColor("blue")])  # equal stack: no repaint
+
+    assert view_update.call_count == 0
+    assert batch_update.call_count == 1
+    assert batch_update.call_args.args[-1] == batched_layer.batch_item.electrode_rect(electrode_id)
+    assert batched_layer.batch_item.color_stack(electrode_id) == colors
+
+
+def test_exposed_rect_limits_painted_electrodes(batched_layer):
+    batch_item = batched_layer.batch_item
+    electrode_id = next(iter(batched_layer.electrode_views))
+    rect = batch_item.electrode_rect(electrode_id)
+
+    in_rect = batch_item.electrodes_in_rect(rect)
+    assert electrode_id in in_rect
+    assert len(in_rect) < len(batched_layer.electrode_views)
+    assert set(batch_item.electrodes_in_rect(batch_item.boundingRect())) == set(batched_layer.electrode_views)
+
+
+def test_hit_test_matches_electrode_paths(batched_layer, qapp):
+    from pyface.qt.QtCore import QPointF
+    from pyface.qt.QtWidgets import QGraphicsScene
+
+    scene = QGraphicsScene()
+    batched_layer.add_all_items_to_scene(scene)
+
+    for electrode_id, view in batched_layer.electrode_views.items():
+        anchor = QPointF(view.label_anchor_x, view.label_anchor_y)
+        assert view.path.contains(anchor)
+        assert batched_layer.electrode_view_at(anchor) is view
+
+    outside = batched_layer.batch_item.boundingRect().bottomRight() + QPointF(10, 10)
+    assert batched_layer.electrode_view_at(outside) is None
+
+    batched_layer.remove_all_items_to_scene(scene)
+    assert batched_layer.batch_item.scene() is None
+
+
+def test_grid_lookups_match_a_full_scan(batched_layer):
+    import random
+    from pyface.qt.QtCore import QPointF, QRectF
+
+    batch_item = batched_layer.batch_item
+    bounds = batch_item.boundingRect()
+    rng = random.Random(7)
+    for _ in range(200):
+        pos = QPointF(rng.uniform(bounds.left(), bounds.right()), rng.uniform(bounds.top(), bounds.bottom()))
+        expected = next((electrode_id for electrode_id in batch_item.electrode_ids
+                         if batch_item._paths[electrode_id].contains(pos)), None)
+        assert batch_item.electrode_at(pos) == expected
+
+        rect = QRectF(pos, QPointF(pos.x() + rng.uniform(0, bounds.width() / 4),
+                                   pos.y() + rng.uniform(0, bounds.height() / 4)))
+        assert batch_item.electrodes_in_rect(rect) == [
+            electrode_id for electrode_id in batch_item.electrode_ids
+            if batch_item.electrode_rect(electrode_id).intersects(rect)
+        ]
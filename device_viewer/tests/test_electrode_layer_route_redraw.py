@@ -0,0 +1,88 @@
+"""ElectrodeLayer.redraw_connections_to_scene only restyles changed items."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from device_viewer.default_settings import connections_key, routes_key
+from device_viewer.models.route import Route, RouteLayerManager
+
+DEVICE_SVG = Path(__file__).parents[1] / "resources" / "devices" / "90_pin_array.svg"
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    from pyface.qt.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def layer_and_model(qapp):
+    from device_viewer.models.electrodes import Electrodes
+    from device_viewer.utils.dmf_utils import SvgUtil
+    from device_viewer.views.electrode_view.electrode_layer import ElectrodeLayer
+
+    electrodes = Electrodes()
+    electrodes.svg_model = SvgUtil(filename=str(DEVICE_SVG), use_geometry_cache=False)
+    alphas = {routes_key: 1.0, connections_key: 0.5}
+    model = SimpleNamespace(routes=RouteLayerManager(), get_alpha=lambda key: alphas[key], alphas=alphas)
+    return ElectrodeLayer(electrodes, default_alphas={}), model
+
+
+def _route_through(neighbours, start, length):
+    route = [start]
+    while len(route) < length:
+        route.append(next(n for n in neighbours[route[-1]] if n not in route))
+    return route
+
+
+def _count_restyles(layer, model):
+    from device_viewer.views.electrode_view.electrodes_view_base import ElectrodeConnectionItem
+    with patch.object(ElectrodeConnectionItem, "set_active", autospec=True) as active, \
+            patch.object(ElectrodeConnectionItem, "set_inactive", autospec=True) as inactive:
+        layer.redraw_connections_to_scene(model)
+    return active.call_count + inactive.call_count
+
+
+def test_first_redraw_styles_every_connection(layer_and_model):
+    layer, model = layer_and_model
+    assert _count_restyles(layer, model) == len(layer.connection_items)
+
+
+def test_extending_route_restyles_only_new_segment(layer_and_model):
+    layer, model = layer_and_model
+    neighbours = layer.svg.neighbours
+    path = _route_through(neighbours, next(iter(neighbours)), 4)
+
+    model.routes.add_layer(Route(route=path[:3]))
+    model.routes.selected_layer = None
+    layer.redraw_connections_to_scene(model)
+    assert _count_restyles(layer, model) == 0
+
+    model.routes.layers[0].route.route.append(path[3])
+    assert _count_restyles(layer, model) == 1
+    assert layer._connection_styles[(path[2], path[3])][0] == "route"
+
+
+def test_removing_route_restores_base_layer(layer_and_model):
+    layer, model = layer_and_model
+    neighbours = layer.svg.neighbours
+    path = _route_through(neighbours, next(iter(neighbours)), 3)
+
+    model.routes.add_layer(Route(route=path))
+    layer.redraw_connections_to_scene(model)
+    model.routes.clear_routes()
+
+    assert _count_restyles(layer, model) == 2
+    assert layer._connection_styles[(path[0], path[1])] == ("base", 0.5)
+
+
+def test_alpha_change_restyles_everything(layer_and_model):
+    layer, model = layer_and_model
+    layer.redraw_connections_to_scene(model)
+    model.alphas[connections_key] = 0.0
+
+    assert _count_restyles(layer, model) == len(layer.connection_items)
+    assert set(layer._connection_styles.values()) == {None}
@@ -0,0 +1,71 @@
+"""Autoroute BFS helpers in device_viewer.utils.electrode_route_helpers."""
+
+from device_viewer.models.route import Route
+from device_viewer.utils.electrode_route_helpers import (
+    find_shortest_path_tree, find_shortest_paths,
+    generate_blocked_nodes_map,
+)
+
+
+def grid(width, height):
+    """4-connected grid of electrode ids "x,y"."""
+    neighbours = {}
+    for x in range(width):
+        for y in range(height):
+            node = f"{x},{y}"
+            neighbours[node] = [f"{nx},{ny}" for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+                                if 0 <= nx < width and 0 <= ny < height]
+    return neighbours
+
+
+def test_paths_are_shortest_and_connected():
+    neighbours = grid(6, 4)
+    tree = find_shortest_path_tree("0,0", neighbours)
+
+    assert len(tree) == 24
+    for node in neighbours:
+        path = tree.path_to(node)
+        x, y = map(int, node.split(","))
+        assert path[0] == "0,0" and path[-1] == node
+        assert len(path) == x + y + 1
+        assert all(b in neighbours[a] for a, b in zip(path, path[1:]))
+
+
+def test_unreachable_electrode_has_no_path():
+    neighbours = grid(2, 1)
+    neighbours["island"] = []
+    tree = find_shortest_path_tree("0,0", neighbours)
+
+    assert "island" not in tree
+    assert tree.path_to("island") == []
+
+
+def test_blocked_electrodes_get_partial_path():
+    # Existing route down column 3 blocks columns 2-4 entirely.
+    neighbours = grid(7, 3)
+    existing = [Route(route=["3,0", "3,1", "3,2"])]
+    tree = find_shortest_path_tree("0,1", neighbours, existing)
+
+    assert tree.path_to("1,1") == ["0,1", "1,1"]
+    for node in ("2,1", "4,1", "6,2"):
+        partial = tree.path_to(node)
+        assert partial[0] == "0,1"
+        assert partial[-1].startswith("1,")  # stops one electrode short of the obstruction
+        assert not set(partial) & generate_blocked_nodes_map(existing, neighbours).keys()
+
+
+def test_avoid_collisions_disabled_ignores_routes():
+    neighbours = grid(7, 1)
+    existing = [Route(route=["3,0"])]
+    tree = find_shortest_path_tree("0,0", neighbours, existing, avoid_collisions=False)
+
+    assert tree.path_to("6,0") == [f"{x},0" for x in range(7)]
+
+
+def test_materialized_paths_match_tree():
+    neighbours = grid(5, 5)
+    existing = [Route(route=["2,2"])]
+    tree = find_shortest_path_tree("0,0", neighbours, existing)
+
+    assert find_shortest_paths("0,0", neighbours, existing) == {node: tree.path_to(node) for node in tree}
+
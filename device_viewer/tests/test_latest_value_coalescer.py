@@ -0,0 +1,69 @@
+"""LatestValueCoalescer: latest-wins, rate-capped hand-off to the GUI thread."""
+
+import threading
+import time
+
+import pytest
+
+from device_viewer.utils.latest_value_coalescer import LatestValueCoalescer
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    from pyface.qt.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def process_until(qapp, predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.001)
+    return predicate()
+
+
+def test_burst_from_worker_thread_applies_latest_per_key(qapp):
+    applied = []
+    coalescer = LatestValueCoalescer(lambda key, value: applied.append((key, value)))
+
+    def burst():
+        for i in range(200):
+            coalescer.submit("tree", f"state-{i}")
+        coalescer.submit("grid", "only")
+
+    worker = threading.Thread(target=burst)
+    worker.start()
+    worker.join()
+
+    assert process_until(qapp, lambda: not coalescer.has_pending)
+    assert applied == [("tree", "state-199"), ("grid", "only")]
+    assert coalescer.dropped_count == 199
+
+
+def test_applies_are_rate_capped(qapp):
+    applied = []
+    coalescer = LatestValueCoalescer(lambda key, value: applied.append((value, time.monotonic())),
+                                     max_rate_hz=20)
+
+    coalescer.submit("tree", 1)
+    assert process_until(qapp, lambda: len(applied) == 1)
+    coalescer.submit("tree", 2)
+    coalescer.submit("tree", 3)
+    assert process_until(qapp, lambda: len(applied) == 2)
+
+    assert [value for value, _ in applied] == [1, 3]
+    assert applied[1][1] - applied[0][1] >= 0.04
+
+
+def test_callback_error_does_not_block_later_states(qapp):
+    applied = []
+
+    def callback(key, value):
+        if value == "bad":
+            raise ValueError(value)
+        applied.append(value)
+
+    coalescer = LatestValueCoalescer(callback, max_rate_hz=0)
+    coalescer.submit("a", "bad")
+    coalescer.submit("b", "good")
+    assert process_until(qapp, lambda: applied == ["good"])
@@ -0,0 +1,94 @@
+"""Space-time multi-droplet route planner."""
+
+import pytest
+
+from device_viewer.models.route import RouteLayerManager
+from device_viewer.services.multi_droplet_route_planner import (
+    MultiDropletRoutePlanner, RoutePlanningError,
+)
+
+
+def grid(width, height):
+    """4-connected grid of electrode ids "x,y"."""
+    return {
+        f"{x},{y}": [f"{nx},{ny}" for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1))
+                     if 0 <= nx < width and 0 <= ny < height]
+        for x in range(width) for y in range(height)
+    }
+
+
+def assert_conflict_free(paths, neighbours):
+    """Independent check of the planner's rules: consecutive electrodes are neighbours or equal, and no two
+    droplets are ever on the same/adjacent electrodes, including across one phase transition."""
+    for path in paths:
+        for a, b in zip(path, path[1:]):
+            assert a == b or b in neighbours[a]
+
+    def at(path, t):
+        return path[min(t, len(path) - 1)]
+
+    def touching(a, b):
+        return a == b or b in neighbours[a]
+
+    horizon = max(map(len, paths))
+    for t in range(horizon):
+        for i, p in enumerate(paths):
+            for q in paths[i + 1:]:
+                assert not touching(at(p, t), at(q, t)), f"phase {t}: {at(p, t)} / {at(q, t)}"
+                if t:
+                    assert not touching(at(p, t), at(q, t - 1))
+                    assert not touching(at(p, t - 1), at(q, t))
+
+
+def test_single_droplet_takes_shortest_route():
+    neighbours = grid(5, 1)
+    [path] = MultiDropletRoutePlanner(neighbours).plan([("0,0", "4,0")])
+    assert path == ["0,0", "1,0", "2,0", "3,0", "4,0"]
+
+
+def test_crossing_droplets_are_kept_apart():
+    neighbours = grid(7, 7)
+    pairs = [("0,3", "6,3"), ("3,0", "3,6")]
+    paths = MultiDropletRoutePlanner(neighbours).plan(pairs)
+
+    assert [(p[0], p[-1]) for p in paths] == pairs
+    assert_conflict_free(paths, neighbours)
+
+
+def test_swap_needs_room_to_pass():
+    with pytest.raises(RoutePlanningError, match="No conflict-free routes"):
+        MultiDropletRoutePlanner(grid(9, 1)).plan([("0,0", "8,0"), ("8,0", "0,0")])
+
+    wide = grid(9, 5)
+    paths = MultiDropletRoutePlanner(wide).plan([("0,2", "8,2"), ("8,2", "0,2")])
+    assert_conflict_free(paths, wide)
+
+
+def test_many_droplets_on_array():
+    neighbours = grid(10, 10)
+    pairs = [("0,0", "9,9"), ("9,0", "0,9"), ("0,9", "9,0"), ("9,9", "0,0"), ("4,4", "4,8")]
+    paths = MultiDropletRoutePlanner(neighbours).plan(pairs)
+
+    assert [(p[0], p[-1]) for p in paths] == pairs
+    assert_conflict_free(paths, neighbours)
+
+
+def test_adjacent_goals_rejected():
+    with pytest.raises(RoutePlanningError, match="too close"):
+        MultiDropletRoutePlanner(grid(5, 5)).plan([("0,0", "2,2"), ("4,4", "2,3")])
+
+
+def test_unreachable_goal_rejected():
+    neighbours = grid(3, 1)
+    neighbours["island"] = []
+    with pytest.raises(RoutePlanningError, match="not reachable"):
+        MultiDropletRoutePlanner(neighbours).plan([("0,0", "island")])
+
+
+def test_apply_to_replaces_layers_with_single_electrode_trail():
+    manager = RouteLayerManager(trail_length=3, trail_overlay=2)
+    routes = MultiDropletRoutePlanner(grid(7, 7)).apply_to(manager, [("0,0", "6,0"), ("0,6", "6,6")])
+
+    assert [layer.route for layer in manager.layers] == routes
+    assert manager.trail_length == 1
+    assert manager.trail_overlay == 0
@@ -0,0 +1,76 @@
+"""PreviewFrameProcessor: worker-thread downscale of camera preview frames, latest frame wins."""
+
+import time
+
+import pytest
+
+from device_viewer.utils.preview_frame_processor import PreviewFrameProcessor, preview_size
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    from pyface.qt.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def process_until(qapp, predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        qapp.processEvents()
+        time.sleep(0.001)
+    return predicate()
+
+
+def solid_image(width, height, value=128):
+    from PySide6.QtGui import QColor, QImage
+    image = QImage(width, height, QImage.Format.Format_RGBA8888)
+    image.fill(QColor(value, value, value))
+    return image
+
+
+def test_preview_size_covers_target_and_never_upscales():
+    from PySide6.QtCore import QSize
+
+    assert preview_size(QSize(3840, 2160), QSize(800, 600)) == QSize(1066, 600)
+    # Close to the on-screen size already: not worth a conversion.
+    assert preview_size(QSize(1920, 1080), QSize(1800, 1000)) == QSize(1920, 1080)
+    assert preview_size(QSize(640, 480), QSize(1920, 1440)) == QSize(640, 480)
+    assert preview_size(QSize(640, 480), QSize()) == QSize(640, 480)
+
+
+def test_large_frame_is_downscaled_off_the_gui_thread(qapp):
+    from PySide6.QtCore import QSize
+
+    shown = []
+    processor = PreviewFrameProcessor(shown.append, max_rate_hz=0)
+    try:
+        processor.submit(solid_image(1600, 1200), QSize(400, 300))
+        assert process_until(qapp, lambda: shown)
+        assert shown[0].size() == QSize(400, 300)
+        assert shown[0].toImage().pixelColor(10, 10).red() == 128
+    finally:
+        processor.stop()
+
+
+def test_small_frame_is_forwarded_and_bursts_keep_the_latest(qapp):
+    from PySide6.QtCore import QSize
+
+    shown = []
+    processor = PreviewFrameProcessor(shown.append, max_rate_hz=0)
+    try:
+        for value in range(50):
+            processor.submit(solid_image(64, 48, value), QSize(64, 48))
+        assert process_until(qapp, lambda: not processor.has_pending and shown)
+        assert shown[-1].size() == QSize(64, 48)
+        assert shown[-1].toImage().pixelColor(0, 0).red() == 49
+        assert len(shown) + processor.dropped_count + processor._output.dropped_count == 50
+    finally:
+        processor.stop()
+
+
+def test_stop_ends_the_worker_thread(qapp):
+    processor = PreviewFrameProcessor(lambda frame: None)
+    assert processor._thread.is_alive()
+    processor.stop()
+    assert not processor._thread.is_alive()
+    processor.stop()  # teardown may run more than once
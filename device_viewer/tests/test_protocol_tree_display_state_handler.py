@@ -16,11 +16,28 @@ def test_topic_in_actor_topic_dict():
     assert PROTOCOL_TREE_DISPLAY_STATE in ACTOR_TOPIC_DICT[listener_name]
 
 
-def test_handler_emits_adapted_message_via_display_state_signal():
+def test_handler_queues_raw_message_on_coalescer():
     from device_viewer.views.device_view_dock_pane import (
         DeviceViewerDockPane,
     )
     pane = MagicMock()
+    serial = ProtocolTreeDisplayMessage(step_id="uuid-abc").serialize()
+    DeviceViewerDockPane._on_protocol_tree_display_state_triggered(pane, serial)
+
+    pane._display_state_coalescer.submit.assert_called_once_with(
+        PROTOCOL_TREE_DISPLAY_STATE, serial,
+    )
+    pane.device_view.display_state_signal.emit.assert_not_called()
+
+
+def test_coalesced_apply_emits_adapted_message_via_display_state_signal():
+    from device_viewer.views.device_view_dock_pane import (
+        DeviceViewerDockPane,
+    )
+    pane = MagicMock()
+    pane._adapt_protocol_tree_display_state.side_effect = (
+        lambda serial: DeviceViewerDockPane._adapt_protocol_tree_display_state(pane, serial)
+    )
     # The handler reads the real electrodes Property `electrode_ids_channels_map`
     # and asks the routes model for a layer color via get_available_color().
     pane.model.electrodes.electrode_ids_channels_map = {
@@ -33,8 +50,8 @@ def test_handler_emits_adapted_message_via_display_state_signal():
         step_id="uuid-abc", step_label="Wash",
         free_mode=False, editable=True,
     )
-    DeviceViewerDockPane._on_protocol_tree_display_state_triggered(
-        pane, msg.serialize(),
+    DeviceViewerDockPane._apply_coalesced_display_state(
+        pane, PROTOCOL_TREE_DISPLAY_STATE, msg.serialize(),
     )
 
     pane.device_view.display_state_signal.emit.assert_called_once()
@@ -55,11 +72,9 @@ def test_free_mode_payload_clears_display():
     pane = MagicMock()
     pane.model.electrodes.electrode_ids_channels_map = {"e00": 0, "e01": 1}
     msg = ProtocolTreeDisplayMessage(free_mode=True)
-    DeviceViewerDockPane._on_protocol_tree_display_state_triggered(
+    rich = DeviceViewerDockPane._adapt_protocol_tree_display_state(
         pane, msg.serialize(),
     )
-    serial = pane.device_view.display_state_signal.emit.call_args.args[0]
-    rich = DeviceViewerMessageModel.deserialize(serial)
     assert rich.channels_activated == set()
     assert rich.routes == []
     assert rich.step_info == {
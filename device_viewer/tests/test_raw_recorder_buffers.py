@@ -0,0 +1,94 @@
+"""RawFFMPEGVideoRecorder frame buffer pool and frame accounting."""
+
+import subprocess
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from device_viewer.models.media import RecorderStats
+from device_viewer.utils import camera
+from device_viewer.utils.camera import FrameBufferPool, RawFFMPEGVideoRecorder, _write_all
+from microdrop_utils.frame_timestamps import FrameTimestampLog
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    from pyface.qt.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def rgba_frame(width, height, value):
+    from PySide6.QtCore import QSize
+    from PySide6.QtMultimedia import QVideoFrame, QVideoFrameFormat
+
+    frame = QVideoFrame(QVideoFrameFormat(QSize(width, height), QVideoFrameFormat.PixelFormat.Format_RGBA8888))
+    frame.map(QVideoFrame.MapMode.WriteOnly)
+    bits = frame.bits(0)
+    bits[:] = bytes([value]) * len(bits)
+    frame.unmap()
+    return frame
+
+
+def test_pool_recycles_buffers_and_tracks_high_water():
+    pool = FrameBufferPool(buffer_bytes=16, capacity=2)
+
+    first, second = pool.acquire(), pool.acquire()
+    assert pool.acquire() is None  # exhausted: the recorder drops the frame
+    assert pool.high_water == 2
+
+    pool.array(first)[:] = 7
+    assert bytes(pool.view(first)) == bytes([7]) * 16
+
+    pool.release(first)
+    assert pool.acquire() == first  # reused, not reallocated
+    assert len(pool._buffers) == 2
+
+
+def test_write_all_resumes_short_writes():
+    written = bytearray()
+    stream = MagicMock()
+    stream.write.side_effect = lambda view: written.extend(view[:3]) or min(3, len(view))
+
+    _write_all(stream, memoryview(b"0123456789"))
+    assert bytes(written) == b"0123456789"
+
+
+def test_recorder_counts_written_and_dropped_frames(qapp):
+    recorder = RawFFMPEGVideoRecorder(MagicMock(), frame_sink=MagicMock())
+    recorder._output_path = "capture.mkv"
+    recorder._recording_active = True
+    # Consumer standing in for ffmpeg: counts the bytes it receives.
+    recorder._process = subprocess.Popen(
+        [sys.executable, "-c", "import sys; print(len(sys.stdin.buffer.read()))"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0)
+    recorder._layout = camera._plane_layout("rgba", 8, 4)
+    recorder._frame_payload_bytes = 8 * 4 * 4
+    recorder._pool = FrameBufferPool(recorder._frame_payload_bytes, capacity=3)
+    recorder._frame_log = FrameTimestampLog(nominal_fps=30)
+
+    # No IO thread yet: the encoder is "behind", so frames beyond the pool are dropped.
+    for value in range(5):
+        recorder._on_frame_arrived(rgba_frame(8, 4, value))
+    assert (recorder.frames_captured, recorder.frames_dropped) == (5, 2)
+    assert recorder._pool.high_water == 3
+
+    consumer = recorder._process
+    recorder._io_thread = threading.Thread(target=recorder._io_writer)
+    recorder._io_thread.start()
+    with patch.object(camera, "device_viewer_recorder_stats_publisher") as publisher, \
+            patch.object(RawFFMPEGVideoRecorder, "_finalize_recording"):
+        recorder.stop()
+
+    assert recorder.frames_written == 3
+    assert int(consumer.stdout.read()) == 3 * recorder._frame_payload_bytes
+    # Only frames that reached the file are timestamped.
+    assert len(recorder._frame_log) == 3
+    stats = publisher.publish.call_args.args[0]
+    assert stats == {
+        "output_path": "capture.mkv", "recording": False,
+        "frames_captured": 5, "frames_written": 3, "frames_dropped": 2,
+        "queue_high_water": 3, "queue_capacity": 3,
+    }
+    RecorderStats.model_validate(stats)
@@ -0,0 +1,104 @@
+"""Segment planning and the precomputed warp/crop grid of the parallel export."""
+
+import numpy as np
+import pytest
+
+from device_viewer.views.video_viewer.segmented_export import (
+    WarpGeometry, build_remap_grid, plan_segments,
+)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    from pyface.qt.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def gradient_frame(width, height):
+    y, x = np.mgrid[0:height, 0:width]
+    frame = np.empty((height, width, 4), dtype=np.uint8)
+    frame[..., 0] = x * 255 // (width - 1)
+    frame[..., 1] = y * 255 // (height - 1)
+    frame[..., 2] = (x + y) % 256
+    frame[..., 3] = 255
+    return frame
+
+
+def test_segments_follow_keyframes_and_cover_every_frame():
+    keyframes = [(0, (0, 0, 10, 10)), (1000, (5, 5, 10, 10)), (2000, (5, 5, 10, 10))]
+    segments = plan_segments(3000, 30.0, keyframes, workers=1, min_segment_frames=10_000)
+
+    # The repeated region at 2 s does not start a new segment.
+    assert [(s.start_frame, s.end_frame, s.region) for s in segments] == [
+        (0, 30, (0, 0, 10, 10)), (30, 3000, (5, 5, 10, 10)),
+    ]
+
+
+def test_long_spans_are_split_for_the_workers():
+    frame_times = [i / 30.0 for i in range(9000)]
+    segments = plan_segments(9000, 30.0, [], workers=4, frame_times_s=frame_times,
+                             min_segment_frames=300)
+
+    assert len(segments) == 8
+    assert segments[0].start_frame == 0 and segments[-1].end_frame == 9000
+    assert all(a.end_frame == b.start_frame for a, b in zip(segments, segments[1:]))
+    for segment in segments[1:]:
+        # Seek lands between the previous frame and the segment's first one.
+        assert frame_times[segment.start_frame - 1] < segment.seek_s < frame_times[segment.start_frame]
+
+
+def test_raw_full_frame_is_identity():
+    geometry = WarpGeometry(source_size=(64, 48), scene_rect=(0, 0, 64, 48),
+                            bounding_rect=(0, 0, 64, 48), warp_size=(64, 48))
+    frame = gradient_frame(64, 48)
+    assert build_remap_grid(geometry, None, (64, 48)).apply(frame) is frame
+
+
+def test_raw_crop_matches_slice():
+    geometry = WarpGeometry(source_size=(64, 48), scene_rect=(0, 0, 64, 48),
+                            bounding_rect=(0, 0, 64, 48), warp_size=(64, 48))
+    frame = gradient_frame(64, 48)
+    out = build_remap_grid(geometry, (10, 6, 20, 16), (20, 16)).apply(frame)
+    np.testing.assert_array_equal(out, frame[6:22, 10:30])
+
+
+def test_region_outside_canvas_is_rejected():
+    geometry = WarpGeometry(source_size=(64, 48), scene_rect=(0, 0, 64, 48),
+                            bounding_rect=(0, 0, 64, 48), warp_size=(64, 48))
+    with pytest.raises(RuntimeError, match="outside"):
+        build_remap_grid(geometry, (100, 100, 10, 10), (10, 10))
+
+
+def test_aligned_grid_matches_qpainter_warp(qapp):
+    from pyface.qt.QtCore import QPointF, QRectF
+    from pyface.qt.QtGui import QImage, QPolygonF, QTransform
+    from device_viewer.utils.camera import get_transformed_frame
+
+    width, height = 80, 60
+    frame = gradient_frame(width, height)
+    bounding = QRectF(0, 0, 160, 120)
+    transform = QTransform()
+    QTransform.quadToQuad(
+        QPolygonF([QPointF(0, 0), QPointF(160, 0), QPointF(160, 120), QPointF(0, 120)]),
+        QPolygonF([QPointF(12, 8), QPointF(150, 20), QPointF(140, 115), QPointF(5, 100)]),
+        transform)
+    scene_rect = QRectF(0, 0, 160, 120)
+
+    image = QImage(frame.data, width, height, QImage.Format_RGBA8888)
+    expected_image = get_transformed_frame(image, scene_rect, bounding, transform, (160, 120))
+    expected = np.frombuffer(expected_image.constBits(), dtype=np.uint8).reshape(120, 160, 4)
+
+    geometry = WarpGeometry(
+        source_size=(width, height), scene_rect=scene_rect.getRect(), bounding_rect=bounding.getRect(),
+        warp_size=(160, 120),
+        matrix=(transform.m11(), transform.m12(), transform.m13(), transform.m21(), transform.m22(),
+                transform.m23(), transform.m31(), transform.m32(), transform.m33()))
+    out = build_remap_grid(geometry, None, (160, 120)).apply(frame)
+
+    # Compare away from the warped quad's antialiased edges.
+    interior = (slice(30, 90), slice(40, 120))
+    difference = np.abs(out[interior].astype(int) - expected[interior].astype(int))
+    assert difference[..., :3].mean() < 2
+    assert difference[..., :3].max() <= 12
+    # Outside the warped source the canvas stays black, like the QPainter fill.
+    np.testing.assert_array_equal(out[2, 2], [0, 0, 0, 255])
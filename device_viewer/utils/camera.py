@@ -4,6 +4,7 @@ import shutil
 import subprocess
 import tempfile
 import threading
+import time
 from pathlib import Path
 from typing import List, Tuple
 import queue
@@ -19,10 +20,12 @@ from device_viewer.consts import (FFMPEG_DEFAULT_CRF, FFMPEG_PRESETS,
                                   FFMPEG_VIDEO_CODECS,
                                   QT_RECORDER_FORMAT_MKV,
                                   QT_RECORDER_FORMAT_MP4,
-                                  RECORDING_TRANSFORM_SIDECAR_SUFFIX)
+                                  RECORDING_TRANSFORM_SIDECAR_SUFFIX,
+                                  device_viewer_recorder_stats_publisher)
 from device_viewer.models.media import MediaType
 from device_viewer.views.camera_control_view.utils import _cache_media_capture
 from logger.logger_service import get_logger, debug_throttled
+from microdrop_utils.frame_timestamps import FLAG_CONSTANT_RATE, FrameTimestampLog
 logger = get_logger(__name__)
 
 #: Bound on frames buffered between the GUI thread and the raw recorder's
@@ -30,6 +33,9 @@ logger = get_logger(__name__)
 #: frames are dropped so the GUI thread never stalls.
 RAW_RECORDER_QUEUE_MAX_FRAMES = 60
 
+#: Seconds between RecorderStats publishes while a raw recording runs.
+RAW_RECORDER_STATS_INTERVAL_S = 2.0
+
 def qtransform_serialize(transform: QTransform) -> str:
     return json.dumps([transform.m11(), transform.m12(), transform.m13(),
                         transform.m21(), transform.m22(), transform.m23(),
@@ -87,23 +93,29 @@ class SaveSignals(QObject):
 
 
 class ImageSaver(QRunnable):
-    """PNG-encode + write ``image`` to ``save_path``; run it on a QThreadPool
+    """Encode + write ``image`` to ``save_path``; run it on a QThreadPool
     (encoding a full-resolution frame takes long enough to visibly freeze the
     GUI when run inline). Callers must hand over an image they will not paint
     into afterwards (pass ``image.copy()`` if unsure) — QImage is implicitly
     shared, so holding the reference is enough and copying here would put a
-    second full-frame memcpy on the caller's (GUI) thread."""
+    second full-frame memcpy on the caller's (GUI) thread.
+
+    ``image_format`` is a Qt writer format ("PNG", "JPEG"); ``quality`` is
+    passed to QImage.save (-1 = the writer's default; see
+    png_quality_for_compression for PNG)."""
 
-    def __init__(self, image, save_path):
+    def __init__(self, image, save_path, image_format="PNG", quality=-1):
         super().__init__()
         self.image = image
         self.save_path = save_path
+        self.image_format = image_format
+        self.quality = quality
         self.signals = SaveSignals()
 
     def run(self):
         try:
-            # 1. Heavy PNG encode + disk I/O happens here.
-            if self.image.save(self.save_path, "PNG"):
+            # 1. Heavy encode + disk I/O happens here.
+            if self.image.save(self.save_path, self.image_format, self.quality):
                 logger.info(f"Saved image to: {self.save_path}")
                 # 2. Tell the UI we are done (queued back to the GUI thread).
                 self.signals.save_complete.emit(self.save_path)
@@ -115,6 +127,14 @@ class ImageSaver(QRunnable):
             self.signals.save_failed.emit(self.save_path)
 
 
+def png_quality_for_compression(level: int) -> int:
+    """QImage.save quality for a zlib compression ``level`` (0-9): Qt's PNG
+    writer takes a 0-100 "quality" and derives the level as
+    (100 - quality) * 9 / 91."""
+    level = min(max(int(level), 0), 9)
+    return 100 - (level * 91 + 8) // 9
+
+
 class VideoRecorderBase(QObject):
     """Common surface of the interchangeable video recorders
     (NativeVideoRecorder, RawFFMPEGVideoRecorder), so call sites can swap
@@ -129,7 +149,10 @@ class VideoRecorderBase(QObject):
 
     Subclasses call ``_finalize_recording`` when a recording lands on disk;
     it performs the shared stop-side bookkeeping (alignment-transform
-    sidecar, capture cache, ``recording_stopped``).
+    sidecar, per-frame timestamp sidecar, capture cache,
+    ``recording_stopped``). A subclass that knows exactly which frames went
+    into the file logs them to ``_frame_log`` (a FrameTimestampLog); with
+    no log, no timestamp sidecar is written.
     """
 
     recording_started = Signal(str)  # Emits path when started
@@ -140,6 +163,7 @@ class VideoRecorderBase(QObject):
         super().__init__(parent)
         self._video_item = video_item
         self.current_image = None  # screenshots fall back to the live sink
+        self._frame_log = None  # capture times of this recording's frames
 
     @property
     def is_recording(self) -> bool:
@@ -157,8 +181,11 @@ class VideoRecorderBase(QObject):
 
     def _finalize_recording(self, output_path):
         """Shared stop-side bookkeeping: persist the alignment geometry
-        sidecar, cache the capture, announce the recording."""
+        sidecar and the frame capture times, cache the capture, announce
+        the recording."""
         write_transform_sidecar(self._video_item, output_path)
+        if self._frame_log is not None:
+            self._frame_log.write_sidecar(output_path)
         _cache_media_capture.send(MediaType.VIDEO, output_path)
         self.recording_stopped.emit(output_path)
 
@@ -202,6 +229,12 @@ class NativeVideoRecorder(VideoRecorderBase):
     aligned view can be reproduced offline on demand (same parameters
     ``get_transformed_frame`` consumes per frame).
 
+    No ``<video>.frames.bin`` timestamp sidecar is written: QMediaRecorder
+    does not report which camera frames its muxer kept, and frames seen on
+    the session's sink from the (asynchronous) recording state change on
+    would not line up with the file. Use the FFmpeg backend when recordings
+    must be matched frame-exactly with logged data.
+
     Public surface: see VideoRecorderBase.
     """
 
@@ -362,6 +395,65 @@ def _plane_layout(pix_fmt, width, height):
     raise ValueError(f"Unhandled pixel format {pix_fmt}")
 
 
+class FrameBufferPool:
+    """Reusable, fixed-size frame payload buffers for the raw recorder.
+
+    Buffers are allocated on first use, up to ``capacity``, and then recycled
+    through a free list. A recording at steady state therefore allocates
+    nothing per frame, and memory is bounded by capacity x frame size.
+    ``acquire`` returns None when every buffer is queued for the encoder, which
+    is the recorder's signal to drop the frame.
+    Thread safe: the GUI thread acquires and the IO thread releases.
+    """
+
+    def __init__(self, buffer_bytes, capacity):
+        self.buffer_bytes = buffer_bytes
+        self.capacity = capacity
+        self._buffers = []   # bytearrays, owned for the pool's lifetime
+        self._arrays = []    # numpy uint8 views of them (copy targets)
+        self._views = []     # memoryviews of them (handed to the pipe)
+        self._free = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self.high_water = 0  # most buffers ever in use at once
+
+    @property
+    def in_use(self):
+        return len(self._buffers) - self._free.qsize()
+
+    def acquire(self):
+        """Index of a free buffer, or None when all ``capacity`` are in use."""
+        try:
+            index = self._free.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if len(self._buffers) >= self.capacity:
+                    return None
+                buffer = bytearray(self.buffer_bytes)
+                self._buffers.append(buffer)
+                self._arrays.append(np.frombuffer(buffer, np.uint8))
+                self._views.append(memoryview(buffer))
+                index = len(self._buffers) - 1
+        self.high_water = max(self.high_water, self.in_use)
+        return index
+
+    def release(self, index):
+        self._free.put(index)
+
+    def array(self, index) -> np.ndarray:
+        return self._arrays[index]
+
+    def view(self, index) -> memoryview:
+        return self._views[index]
+
+
+def _write_all(stream, view: memoryview):
+    """Write ``view`` to an unbuffered binary stream, resuming after short
+    writes (raw pipe writes may return early when interrupted)."""
+    while view:
+        written = stream.write(view)
+        view = view[written:]
+
+
 class RawFFMPEGVideoRecorder(VideoRecorderBase):
     """Records the RAW camera frames to H.264 via an ffmpeg subprocess,
     with NO device-alignment perspective warp AND without a per-frame color
@@ -377,9 +469,16 @@ class RawFFMPEGVideoRecorder(VideoRecorderBase):
     ``<video>.transform.json`` sidecar so the aligned view can be
     reproduced offline.
 
-    Frames are handed to a background IO thread that writes to ffmpeg's
-    stdin; the queue drops frames when the encoder falls behind so the GUI
-    thread never stalls. ffmpeg's stderr goes to a temp file (never a pipe
+    Planes are copied into recycled buffers from a FrameBufferPool, and the
+    buffer's memoryview goes to an unbuffered stdin (no per-frame allocation
+    and no second copy). A background IO thread does the write. When every
+    buffer is waiting for the encoder, new frames are dropped so the GUI thread
+    never stalls. Captured, written and dropped frame counts and the queue
+    high-water mark are published as RecorderStats
+    (DEVICE_VIEWER_RECORDER_STATS) while recording and at stop. The
+    capture time of every queued frame is logged and written to a
+    ``<video>.frames.bin`` sidecar: the file is muxed at the constant
+    nominal rate, so the sidecar is what ties each frame to real time. ffmpeg's stderr goes to a temp file (never a pipe
     nobody drains — a full pipe would block the encoder). The ffmpeg
     pipeline starts lazily on the first frame, because the pixel format and
     size aren't known until then.
@@ -414,15 +513,51 @@ class RawFFMPEGVideoRecorder(VideoRecorderBase):
         self._process = None
         self._stderr_file = None
         self._io_thread = None
-        self._queue = queue.Queue(maxsize=RAW_RECORDER_QUEUE_MAX_FRAMES)
+        self._queue = queue.Queue()  # pool buffer indices, None = stop
+        self._pool = None
         self._layout = None
         self._frame_payload_bytes = 0
         self._fps = 30.0
+        self._reset_stats()
 
     @property
     def is_recording(self) -> bool:
         return self._recording_active
 
+    def _reset_stats(self):
+        self.frames_captured = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self._last_stats_publish = time.monotonic()
+
+    def stats(self) -> dict:
+        """Snapshot of this recording's frame accounting (RecorderStats)."""
+        return {
+            "output_path": str(self._output_path or ""),
+            "recording": self.is_recording,
+            "frames_captured": self.frames_captured,
+            "frames_written": self.frames_written,
+            "frames_dropped": self.frames_dropped,
+            "queue_high_water": self._pool.high_water if self._pool else 0,
+            "queue_capacity": (self._pool.capacity if self._pool
+                               else RAW_RECORDER_QUEUE_MAX_FRAMES),
+        }
+
+    def _publish_stats(self):
+        self._last_stats_publish = time.monotonic()
+        try:
+            device_viewer_recorder_stats_publisher.publish(self.stats())
+        except Exception as e:
+            logger.debug(f"Raw recorder stats publish failed: {e}")
+
+    def _drop_frame(self):
+        if not self.frames_dropped:
+            logger.warning("Raw recorder encoder fell behind; dropping frames "
+                           "(see recorder stats for the count)")
+        self.frames_dropped += 1
+        debug_throttled(logger, "raw_recorder_queue_full",
+                        "Raw recorder encoder behind; dropping frame")
+
     def _stop_ffmpeg(self):
         """Cleanly close ffmpeg: drain the IO thread, EOF stdin, wait."""
         if self._io_thread:
@@ -443,7 +578,7 @@ class RawFFMPEGVideoRecorder(VideoRecorderBase):
             self._stderr_file.close()
             self._stderr_file = None
         self._process = None
-        self._queue = queue.Queue(maxsize=RAW_RECORDER_QUEUE_MAX_FRAMES)
+        self._queue = queue.Queue()
 
     def start(self, output_path, resolution, fps):
         if self.is_recording:
@@ -457,7 +592,11 @@ class RawFFMPEGVideoRecorder(VideoRecorderBase):
         # Deferred until the first frame reveals the pixel format/size.
         self._process = None
         self._layout = None
-        self._queue = queue.Queue(maxsize=RAW_RECORDER_QUEUE_MAX_FRAMES)
+        self._pool = None
+        self._queue = queue.Queue()
+        self._reset_stats()
+        self._frame_log = FrameTimestampLog(nominal_fps=self._fps,
+                                            flags=FLAG_CONSTANT_RATE)
 
         self._recording_active = True
         self._frame_sink.videoFrameChanged.connect(self._on_frame_arrived)
@@ -468,25 +607,27 @@ class RawFFMPEGVideoRecorder(VideoRecorderBase):
 
     @Slot(QVideoFrame)
     def _on_frame_arrived(self, frame):
-        """GUI thread: memcpy the native pixel planes, queue for ffmpeg."""
+        """GUI thread: memcpy the native pixel planes into a pooled buffer,
+        queue it for ffmpeg."""
         if not self.is_recording or not frame.isValid():
             return
 
         if self._process is None and not self._start_native_ffmpeg(frame):
             return
 
-        if self._queue.full():
-            debug_throttled(logger, "raw_recorder_queue_full",
-                            "Raw recorder encoder behind; dropping frame")
+        self.frames_captured += 1
+        index = self._pool.acquire()
+        if index is None:
+            self._drop_frame()
             return
 
         if not frame.map(QVideoFrame.MapMode.ReadOnly):
+            self._pool.release(index)
             return
         try:
             # ONE copy per plane: each plane lands directly in its final
             # position in the payload (no intermediate chunks, no join).
-            payload = bytearray(self._frame_payload_bytes)
-            payload_np = np.frombuffer(payload, np.uint8)
+            payload_np = self._pool.array(index)
             offset = 0
             for plane, (row_bytes, rows) in enumerate(self._layout):
                 plane_bytes = row_bytes * rows
@@ -502,14 +643,15 @@ class RawFFMPEGVideoRecorder(VideoRecorderBase):
                         plane_data[:bytes_per_line * rows]
                         .reshape(rows, bytes_per_line)[:, :row_bytes])
                 offset += plane_bytes
+        except Exception:
+            self._pool.release(index)
+            raise
         finally:
             frame.unmap()
 
-        try:
-            self._queue.put_nowait(payload)
-        except queue.Full:
-            debug_throttled(logger, "raw_recorder_queue_full",
-                            "Raw recorder encoder behind; dropping frame")
+        if self._frame_log is not None:
+            self._frame_log.add(frame.startTime())
+        self._queue.put_nowait(index)
 
     def _disconnect_frame_sink(self):
         try:
@@ -533,6 +675,8 @@ class RawFFMPEGVideoRecorder(VideoRecorderBase):
         self._layout = _plane_layout(pix_fmt, width, height)
         self._frame_payload_bytes = sum(
             row_bytes * rows for row_bytes, rows in self._layout)
+        self._pool = FrameBufferPool(self._frame_payload_bytes,
+                                     RAW_RECORDER_QUEUE_MAX_FRAMES)
         command = [
             self.ffmpeg_binary, "-y", "-hide_banner", "-loglevel", "error",
             "-f", "rawvideo", "-pix_fmt", pix_fmt,
@@ -546,8 +690,10 @@ class RawFFMPEGVideoRecorder(VideoRecorderBase):
         # while recording, and a full pipe would block the encoder.
         self._stderr_file = tempfile.TemporaryFile()
         try:
+            # Unbuffered stdin: pooled buffers are written straight to
+            # the pipe, not copied through a BufferedWriter first.
             self._process = subprocess.Popen(
-                command, stdin=subprocess.PIPE,
+                command, stdin=subprocess.PIPE, bufsize=0,
                 stdout=subprocess.DEVNULL, stderr=self._stderr_file)
         except Exception as e:
             self._recording_active = False
@@ -567,22 +713,30 @@ class RawFFMPEGVideoRecorder(VideoRecorderBase):
         return True
 
     def _io_writer(self):
-        """Write raw plane bytes straight to ffmpeg stdin. A None payload
-        is the stop sentinel: everything queued before it gets written."""
+        """Write pooled frame buffers straight to ffmpeg stdin and recycle
+        them. A None index is the stop sentinel: everything queued before
+        it gets written."""
+        pool = self._pool
         while self._process and self._process.poll() is None:
             try:
-                payload = self._queue.get(timeout=0.1)
+                index = self._queue.get(timeout=0.1)
             except queue.Empty:
                 if not self.is_recording and self._queue.empty():
                     break
                 continue
-            if payload is None:
+            if index is None:
                 break
             try:
-                self._process.stdin.write(payload)
+                _write_all(self._process.stdin, pool.view(index))
             except (BrokenPipeError, ValueError, OSError):
                 logger.info("Raw recorder ffmpeg pipe closed")
                 break
+            finally:
+                pool.release(index)
+            self.frames_written += 1
+            if (time.monotonic() - self._last_stats_publish
+                    >= RAW_RECORDER_STATS_INTERVAL_S):
+                self._publish_stats()
 
     def stop(self):
         if not self.is_recording:
@@ -595,11 +749,18 @@ class RawFFMPEGVideoRecorder(VideoRecorderBase):
 
         path = self._output_path
         if self._process is not None:
-            try:
-                self._queue.put_nowait(None)  # stop sentinel
-            except queue.Full:
-                pass  # _io_writer falls back to the is_recording check
+            self._queue.put_nowait(None)  # stop sentinel
             self._stop_ffmpeg()
+            self._publish_stats()
+            if self._frame_log is not None:
+                # Frames queued but never written (ffmpeg died) aren't in the file.
+                self._frame_log.truncate(self.frames_written)
+            stats = self.stats()
+            logger.info(f"Raw recording frames: {stats['frames_captured']} "
+                        f"captured, {stats['frames_written']} written, "
+                        f"{stats['frames_dropped']} dropped (queue high-water "
+                        f"{stats['queue_high_water']}/"
+                        f"{stats['queue_capacity']})")
             self._finalize_recording(path)
         else:
             logger.warning("Raw recording stopped with no frames")
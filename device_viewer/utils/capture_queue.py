@@ -0,0 +1,141 @@
+import time
+from collections import deque
+
+from PySide6.QtCore import QCoreApplication, QObject, QThreadPool, QTimer
+
+from device_viewer.consts import (
+    CAPTURE_ENCODER_THREADS, CAPTURE_METADATA_FLUSH_DELAY_MS, CAPTURE_QUEUE_MAX_PENDING,
+)
+from device_viewer.models.media import MediaType
+from logger.logger_service import get_logger
+
+from .camera import ImageSaver
+
+logger = get_logger(__name__)
+
+#: Capture latencies kept for the running summary.
+CAPTURE_LATENCY_WINDOW = 100
+
+
+class CaptureQueue(QObject):
+    """
+    Bounded queue of still captures, encoded on a dedicated thread pool.
+
+    submit() hands a grabbed image to one of ``encoder_threads`` ImageSaver workers (a private QThreadPool, so a burst
+    of captures neither waits behind nor starves other users of the global pool). At most ``max_pending`` captures
+    may be waiting or encoding at once; further ones are refused with a warning rather than piling up full-resolution
+    frames in memory.
+
+    Saved captures are not recorded one by one: they are batched and handed to ``record_captures(captures)`` (a list
+    of (media type, path) pairs) in one call when a capture for another protocol step arrives, or once no capture has
+    completed for ``flush_delay_ms``. A protocol capturing every step therefore costs one metadata write per step.
+    finish() records whatever is still pending straight away (at protocol end and at shutdown), optionally through a
+    synchronous ``record_captures`` so the captures are stored by the time it returns.
+
+    Capture latency (from the grab to the file on disk) is kept for the last CAPTURE_LATENCY_WINDOW captures; see
+    latency_summary().
+    """
+
+    def __init__(self, record_captures, encoder_threads=CAPTURE_ENCODER_THREADS,
+                 max_pending=CAPTURE_QUEUE_MAX_PENDING, flush_delay_ms=CAPTURE_METADATA_FLUSH_DELAY_MS, parent=None):
+        super().__init__(parent)
+        self._record_captures = record_captures
+        self.max_pending = max_pending
+
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(encoder_threads)
+        # In-flight workers, referenced so a worker (and its signals QObject) cannot be garbage-collected before
+        # its completion signal is delivered back to this thread.
+        self._in_flight = set()
+
+        self._batch = []
+        self._batch_step_id = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(flush_delay_ms)
+        self._flush_timer.timeout.connect(self.flush_metadata)
+
+        self.latencies_ms = deque(maxlen=CAPTURE_LATENCY_WINDOW)
+        self.refused_count = 0
+
+    @property
+    def pending(self) -> int:
+        """Captures waiting for or being encoded."""
+        return len(self._in_flight)
+
+    def submit(self, image, save_path, image_format="PNG", quality=-1, step_id=None,
+               on_saved=None, on_failed=None, requested_at=None) -> bool:
+        """Queue ``image`` for encoding to ``save_path``. ``on_saved``/``on_failed`` are called with the path on this
+        object's thread. ``requested_at`` (time.monotonic()) is when the capture was asked for; defaults to now.
+        Returns False when the queue is full and the capture was refused."""
+        if len(self._in_flight) >= self.max_pending:
+            self.refused_count += 1
+            logger.warning(f"Capture queue full ({self.max_pending} pending); dropped capture {save_path}")
+            return False
+
+        if self._batch and step_id != self._batch_step_id:
+            self.flush_metadata()
+        self._batch_step_id = step_id
+
+        requested_at = time.monotonic() if requested_at is None else requested_at
+        worker = ImageSaver(image, str(save_path), image_format, quality)
+        self._in_flight.add(worker)
+        worker.signals.save_complete.connect(
+            lambda path: self._on_saved(worker, path, requested_at, on_saved))
+        worker.signals.save_failed.connect(
+            lambda path: self._on_failed(worker, path, on_failed))
+        self._pool.start(worker)
+        return True
+
+    def _on_saved(self, worker, path, requested_at, callback):
+        self._in_flight.discard(worker)
+        latency_ms = (time.monotonic() - requested_at) * 1000
+        self.latencies_ms.append(latency_ms)
+        logger.debug(f"Capture saved in {latency_ms:.0f} ms: {path}")
+
+        self._batch.append((MediaType.IMAGE.value, path))
+        self._flush_timer.start()
+        if callback is not None:
+            callback(path)
+
+    def _on_failed(self, worker, path, callback):
+        self._in_flight.discard(worker)
+        if callback is not None:
+            callback(path)
+
+    def flush_metadata(self, record_captures=None):
+        """Record every saved capture not yet recorded, in one call to ``record_captures`` (default: the queue's
+        own)."""
+        self._flush_timer.stop()
+        if not self._batch:
+            return
+        batch, self._batch = self._batch, []
+        try:
+            (record_captures or self._record_captures)(batch)
+        except Exception as e:
+            logger.error(f"Could not record {len(batch)} capture(s): {e}", exc_info=True)
+            return
+        summary = self.latency_summary()
+        logger.info(f"Recorded {len(batch)} capture(s); capture latency over the last {summary['count']}: "
+                    f"mean {summary['mean_ms']:.0f} ms, max {summary['max_ms']:.0f} ms")
+
+    def latency_summary(self) -> dict:
+        """Count, mean and max of the recent capture latencies (ms)."""
+        latencies = list(self.latencies_ms)
+        if not latencies:
+            return {"count": 0, "mean_ms": 0.0, "max_ms": 0.0}
+        return {"count": len(latencies), "mean_ms": sum(latencies) / len(latencies), "max_ms": max(latencies)}
+
+    def wait_for_done(self, timeout_ms=-1) -> bool:
+        """Block until every queued capture is encoded (e.g. at shutdown)."""
+        return self._pool.waitForDone(timeout_ms)
+
+    def finish(self, record_captures=None, timeout_ms=-1) -> bool:
+        """Wait up to ``timeout_ms`` for queued captures to be encoded, deliver their completions, and flush the batch
+        now through ``record_captures`` (default: the queue's own). Must run on this object's thread. Returns False
+        when encoding timed out; captures saved so far are recorded either way."""
+        done = self.wait_for_done(timeout_ms)
+        # Workers report back through queued signals; deliver them so their captures join the batch.
+        QCoreApplication.sendPostedEvents()
+        self.flush_metadata(record_captures)
+        return done
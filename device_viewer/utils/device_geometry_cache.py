@@ -0,0 +1,130 @@
+"""On-disk cache of processed device geometry.
+
+Loading a device SVG flattens every electrode path, repairs invalid rings,
+builds shapely polygons, and then derives areas, centroids and the
+neighbour graph. None of that depends on anything but the SVG bytes and
+the geometry code itself, so the result is stored once as a binary
+artifact under ETSConfig.application_home and read back on later opens of
+the same chip.
+
+Artifacts are keyed by a SHA-256 of the SVG content plus
+GEOMETRY_CACHE_VERSION, so editing the file (e.g. saving new channel
+assignments) or changing the geometry code naturally misses the cache.
+Cache problems are never fatal: a missing, stale or unreadable artifact
+just falls back to computing the geometry from the SVG.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from traits.etsconfig.api import ETSConfig
+
+from device_viewer.utils.dmf_utils_helpers import CURVE_SEGMENT_SAMPLES
+from logger.logger_service import get_logger
+
+logger = get_logger(__name__)
+
+#: Bump whenever the SVG -> geometry pipeline (path flattening, ring
+#: repair, neighbour finding) or the artifact layout changes, so
+#: artifacts written by older code are ignored instead of reused.
+GEOMETRY_CACHE_VERSION = 1
+
+GEOMETRY_CACHE_DIRNAME = "device_geometry_cache"
+GEOMETRY_CACHE_SUFFIX = ".geometry.pkl"
+
+
+def geometry_cache_dir() -> Path:
+    """App-data directory holding cached device geometry artifacts.
+    Lives under ETSConfig.application_home; the dir is created if missing."""
+    cache_dir = Path(ETSConfig.application_home) / GEOMETRY_CACHE_DIRNAME
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def svg_geometry_key(filename) -> str:
+    """Cache key for ``filename``: hash of its bytes and the code version."""
+    digest = hashlib.sha256()
+    digest.update(f"v{GEOMETRY_CACHE_VERSION}:s{CURVE_SEGMENT_SAMPLES}:".encode())
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def geometry_cache_path(filename, cache_dir: Optional[Path] = None) -> Path:
+    """Path of the artifact that would hold ``filename``'s geometry."""
+    cache_dir = geometry_cache_dir() if cache_dir is None else Path(cache_dir)
+    return cache_dir / f"{svg_geometry_key(filename)}{GEOMETRY_CACHE_SUFFIX}"
+
+
+def load_device_geometry(filename, cache_dir: Optional[Path] = None) -> Optional[dict]:
+    """Return the cached geometry for ``filename``, or None on a cache miss.
+
+    Any failure to hash, read or unpickle the artifact is logged and
+    treated as a miss; a corrupt artifact is removed so it is rebuilt.
+    """
+    try:
+        path = geometry_cache_path(filename, cache_dir)
+    except OSError as e:
+        logger.warning(f"Device geometry cache unavailable for {filename}: {e}")
+        return None
+
+    if not path.exists():
+        logger.debug(f"Device geometry cache miss for {filename}")
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            geometry = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"Discarding unreadable device geometry cache {path}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+
+    if not isinstance(geometry, dict) or geometry.get("version") != GEOMETRY_CACHE_VERSION:
+        logger.info(f"Discarding stale device geometry cache {path}")
+        path.unlink(missing_ok=True)
+        return None
+
+    logger.info(f"Loaded device geometry for {filename} from cache {path.name}")
+    return geometry
+
+
+def save_device_geometry(filename, geometry: dict, cache_dir: Optional[Path] = None) -> Optional[Path]:
+    """Write ``geometry`` as the artifact for ``filename``.
+
+    The artifact is written to a temp file and moved into place, so a
+    concurrent reader never sees a partial file. Returns the artifact path,
+    or None if it could not be written.
+    """
+    try:
+        path = geometry_cache_path(filename, cache_dir)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({**geometry, "version": GEOMETRY_CACHE_VERSION}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except Exception as e:
+        logger.warning(f"Could not write device geometry cache for {filename}: {e}")
+        return None
+
+    logger.debug(f"Cached device geometry for {filename} at {path}")
+    return path
+
+
+def clear_geometry_cache(cache_dir: Optional[Path] = None) -> int:
+    """Delete every cached artifact. Returns the number of files removed."""
+    cache_dir = geometry_cache_dir() if cache_dir is None else Path(cache_dir)
+    removed = 0
+    for path in cache_dir.glob(f"*{GEOMETRY_CACHE_SUFFIX}"):
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
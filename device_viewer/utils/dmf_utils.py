@@ -8,6 +8,7 @@ from traits.api import HasTraits, Float, Dict, Str, Bool, File, observe, List, I
 
 from device_viewer.utils.dmf_utils_helpers import PolygonNeighborFinder, create_adjacency_dict, ElectrodeData, \
     SVGProcessor, AlgorithmError
+from device_viewer.utils.device_geometry_cache import load_device_geometry, save_device_geometry
 
 from logger.logger_service import get_logger
 logger = get_logger(__name__, "DEBUG")
@@ -48,6 +49,9 @@ class SvgUtil(HasTraits):
 
     svg_processor = Instance(SVGProcessor)
 
+    use_geometry_cache = Bool(True, desc='whether processed geometry is read from / written to the on-disk cache')
+    loaded_from_cache = Bool(False, desc='whether the geometry was restored from the on-disk cache')
+
     def traits_init(self):
         logger.debug("File changed")
         self.get_device_paths(self.filename)
@@ -70,6 +74,13 @@ class SvgUtil(HasTraits):
 
         self.svg_processor = svg_processor = SVGProcessor(filename=filename)
 
+        if self.use_geometry_cache:
+            cached_geometry = load_device_geometry(filename)
+            if cached_geometry is not None:
+                self.set_geometry_snapshot(cached_geometry)
+                self.loaded_from_cache = True
+                return
+
         ################################################
         ## Load Data from svg file
         ################################################
@@ -113,6 +124,42 @@ class SvgUtil(HasTraits):
                 logger.warning(f"{self.filename} does not have extractable connection elements. Will auto find the connections")
                 self.generate_connections_from_neighbouring_electrodes()
 
+        # Devices with unloadable paths are not cached so their errors are reported on every open.
+        if self.use_geometry_cache and not self.svg_error_paths:
+            save_device_geometry(filename, self.get_geometry_snapshot())
+
+    def get_geometry_snapshot(self) -> dict:
+        """
+        Everything computed from the SVG file, in a picklable form suitable for the device geometry cache.
+        """
+        return {
+            "electrodes": {k: (v.channel, v.path) for k, v in self.electrodes.items()},
+            "polygons": dict(self.polygons),
+            "electrode_centers": dict(self.electrode_centers),
+            "electrode_areas": dict(self.electrode_areas),
+            "neighbours": dict(self.neighbours),
+            "auto_found_connections": self.auto_found_connections,
+            "area_scale": self.area_scale,
+            "bounding_box": self.svg_processor.get_bounding_box(),
+        }
+
+    def set_geometry_snapshot(self, geometry: dict):
+        """
+        Restore the state produced by get_geometry_snapshot without re-processing the SVG file.
+        """
+        svg_processor = self.svg_processor
+        svg_processor.min_x, svg_processor.min_y, svg_processor.max_x, svg_processor.max_y = geometry["bounding_box"]
+
+        self.area_scale = geometry["area_scale"]
+        self.electrodes = {k: ElectrodeData(channel=channel, path=path)
+                           for k, (channel, path) in geometry["electrodes"].items()}
+        self.polygons = geometry["polygons"]
+        self.electrode_centers = geometry["electrode_centers"]
+        self.electrode_areas = geometry["electrode_areas"]
+        self.auto_found_connections = geometry["auto_found_connections"]
+        # Set last: the neighbours observer needs the centroids to build the connections.
+        self.neighbours = geometry["neighbours"]
+
     def generate_connections_from_neighbouring_electrodes(self):
         self.neighbours = self.find_neighbours_all()
         self.auto_found_connections = True
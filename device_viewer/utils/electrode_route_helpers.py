@@ -1,70 +1,107 @@
-from queue import Queue
-from typing import Any
+from collections import deque
+from typing import Any, Hashable
 
 from device_viewer.models.route import Route
 
 
-def find_shortest_paths(from_id, neighbors: dict,existing_routes: list["Route"]=None, avoid_collisions=True) -> dict[Any, list]:
-    # Run BFS using the stored neighbors/coordinates to get the shortest path (in terms of nodes) from from_id to all other nodes
+class ShortestPathTree:
+    """
+    Result of a single-source autoroute search, stored as parent pointers.
+
+    Electrodes reachable without touching a blocked electrode get a parent pointer back towards the source.
+    Blocked electrodes, and anything only reachable through them, get an anchor instead: the reachable
+    electrode whose path should be shown when hovering them (the partial path up to the obstruction).
+    Paths are rebuilt on demand, so the search itself costs O(V) memory instead of one list per electrode.
+    """
+
+    def __init__(self, source, parents: dict, anchors: dict):
+        self.source = source
+        self.parents = parents
+        self.anchors = anchors
+
+    def __contains__(self, electrode_id) -> bool:
+        return electrode_id in self.parents or electrode_id in self.anchors
+
+    def __len__(self) -> int:
+        return len(self.parents) + len(self.anchors)
+
+    def __iter__(self):
+        yield from self.parents
+        yield from self.anchors
+
+    def path_to(self, to_id) -> list:
+        """The (possibly partial) shortest path from the source to to_id, or [] if to_id is unreachable."""
+        node = self.anchors.get(to_id, to_id)
+        if node not in self.parents:
+            return []
+
+        path = []
+        while node is not None:
+            path.append(node)
+            node = self.parents[node]
+        path.reverse()
+        return path
+
+
+def find_shortest_path_tree(from_id, neighbors: dict, existing_routes: list["Route"] = None,
+                            avoid_collisions=True) -> ShortestPathTree:
+    # Run BFS using the stored neighbors to get the shortest path (in terms of nodes) from from_id to all other nodes
     # Under the constraints that all nodes in valid paths are at least one neighbor away from any existing routes
 
-    if avoid_collisions:
+    if avoid_collisions and existing_routes:
         blocked = generate_blocked_nodes_map(existing_routes, neighbors)
     else:
         blocked = {}
 
-    # Now we do BFS from from_id, keeping track of path info too
-    q = Queue()
-    q.put(from_id)
-
-    q2_set = set()
-
-    visited = {from_id: True}
-    paths = {from_id: [from_id]}  # Only contains valid paths. Not complete for all electrode ids, so used get()
+    parents = {from_id: None}  # Only contains valid paths: doubles as the visited set of the first pass
+    anchors = {}
 
     # First pass - Generate all possible valid paths
-    while not q.empty():
-        current = q.get()
-        for neighbor in neighbors[current]:
-            if not visited.get(neighbor, False):
-                neighbor_blocked = blocked.get(neighbor, False)
-                if not neighbor_blocked:
-                    paths[neighbor] = paths[current] + [neighbor]
-                    q.put(neighbor)
-                    visited[neighbor] = True
-                else:
-                    paths[neighbor] = paths[current]  # Given boundary blocked nodes an initial path
-                    # paths is expected to get assigned multiple times, and thus at the end gives us the longest optimal path 1 away from the boundry
-                    # which is a good approxmiation 
-                    q2_set.add(neighbor)  # add them for the next pass
-
-    # Second pass - Propogate partial paths
+    q = deque([from_id])
+    while q:
+        current = q.popleft()
+        for neighbor in neighbors.get(current, ()):
+            if neighbor in parents:
+                continue
+            if neighbor not in blocked:
+                parents[neighbor] = current
+                q.append(neighbor)
+            else:
+                anchors[neighbor] = current  # Given boundary blocked nodes an initial path
+                # anchors is expected to get assigned multiple times, and thus at the end gives us the longest optimal
+                # path 1 away from the boundary which is a good approximation
+
+    # Second pass - Propagate partial paths
     # This should touch all reachable nodes from from_id, assigning a partial path for when hovering on that node
     # The difference here is that we don't care about whether a found node is blocked anymore
-    # Note that from the above loop, no blocked node is visited, so we can use 'visited' just fine
-    q2 = Queue()
-    for electrode_id in q2_set:  # We use a set since each blocked node can be 'add'ed many times (since its never marked as visited in first pass)
-        q2.put(electrode_id)
-        visited[electrode_id] = True
+    # Note that from the above loop, no blocked node is in parents, so parents + anchors is the visited set
+    q = deque(anchors)
+    while q:
+        current = q.popleft()
+        for neighbor in neighbors.get(current, ()):
+            if neighbor not in parents and neighbor not in anchors:
+                anchors[neighbor] = anchors[current]  # Propagate current partial path
+                q.append(neighbor)
+
+    return ShortestPathTree(from_id, parents, anchors)
 
-    while not q2.empty():
-        current = q2.get()
-        for neighbor in neighbors[current]:
-            if not visited.get(neighbor, False):
-                paths[neighbor] = paths[current]  # Propogate current partial path
-                q2.put(neighbor)
-                visited[neighbor] = True
 
-    return paths
+def find_shortest_paths(from_id, neighbors: dict, existing_routes: list["Route"] = None, avoid_collisions=True) -> dict[Any, list]:
+    """
+    Materialized form of find_shortest_path_tree: maps every reachable electrode to its (partial) path.
+    Prefer the tree and ShortestPathTree.path_to when only a few paths are looked up.
+    """
+    tree = find_shortest_path_tree(from_id, neighbors, existing_routes, avoid_collisions)
+    return {electrode_id: tree.path_to(electrode_id) for electrode_id in tree}
 
 
-def generate_blocked_nodes_map(existing_routes: list[Route], neighbors: dict) -> dict[Any, Any]:
+def generate_blocked_nodes_map(existing_routes: list[Route], neighbors: dict) -> dict[Hashable, bool]:
     # First, we generate the map of nodes we cannot visit.
     blocked = {}
 
     for route in existing_routes:
         for electrode_id in route.route:
             blocked[electrode_id] = True  # Every node
-            for neighbor in neighbors[electrode_id]:
+            for neighbor in neighbors.get(electrode_id, ()):
                 blocked[neighbor] = True  # ...and its neighbors
-    return blocked
\ No newline at end of file
+    return blocked
@@ -0,0 +1,76 @@
+import threading
+import time
+
+from pyface.qt.QtCore import QObject, QTimer, Signal
+
+from logger.logger_service import get_logger
+
+logger = get_logger(__name__)
+
+
+class LatestValueCoalescer(QObject):
+    """
+    Latest-wins, rate-capped hand-off of values from any thread to the GUI thread.
+
+    submit(key, value) may be called from any thread (e.g. a Dramatiq listener worker). Only the most recent value
+    per key is kept; a superseded value is dropped without ever reaching the callback. Pending values are applied on
+    the thread this object lives on (create it on the GUI thread), at most once every 1 / max_rate_hz seconds, by
+    calling callback(key, value) for each pending key in order of its latest submission.
+
+    A burst of messages therefore costs one apply per refresh tick instead of a queued signal (and repaint) per
+    message that the GUI thread would otherwise work through one by one.
+    """
+
+    # Cross-thread wake-up: emitted from submit(), delivered queued on this object's thread.
+    _wake = Signal()
+
+    def __init__(self, callback, max_rate_hz: float = 60.0, parent=None):
+        super().__init__(parent)
+        self._callback = callback
+        self._interval = 1.0 / max_rate_hz if max_rate_hz > 0 else 0.0
+
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._scheduled = False
+        self._last_flush = float("-inf")
+        self.dropped_count = 0  # superseded values that were never applied
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        self._wake.connect(self._schedule_flush)
+
+    def submit(self, key, value):
+        """Replace the pending value for ``key`` and make sure a flush is scheduled. Thread safe."""
+        with self._lock:
+            if key in self._pending:
+                del self._pending[key]
+                self.dropped_count += 1
+            self._pending[key] = value
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._wake.emit()
+
+    @property
+    def has_pending(self) -> bool:
+        with self._lock:
+            return bool(self._pending)
+
+    def _schedule_flush(self):
+        delay = max(0.0, self._last_flush + self._interval - time.monotonic())
+        self._timer.start(int(delay * 1000))
+
+    def flush(self):
+        """Apply every pending value now (GUI thread)."""
+        with self._lock:
+            pending = list(self._pending.items())
+            self._pending.clear()
+            self._scheduled = False
+            self._last_flush = time.monotonic()
+
+        for key, value in pending:
+            try:
+                self._callback(key, value)
+            except Exception as e:
+                logger.error(f"Error applying coalesced value for {key}: {e}", exc_info=True)
@@ -0,0 +1,110 @@
+import threading
+
+from PySide6.QtCore import QObject, QSize, Qt
+from PySide6.QtGui import QImage
+from PySide6.QtMultimedia import QVideoFrame
+
+from logger.logger_service import get_logger
+
+from .latest_value_coalescer import LatestValueCoalescer
+
+logger = get_logger(__name__)
+
+#: Frames at most this much larger than the on-screen size go to the
+#: display untouched: a small downscale isn't worth a colour conversion.
+PREVIEW_DOWNSCALE_MIN_RATIO = 1.25
+
+
+def preview_size(source: QSize, target: QSize) -> QSize:
+    """Size to downscale a ``source`` frame to so it still covers ``target``
+    pixels (aspect kept, never upscaled). Returns ``source`` when the
+    reduction isn't worth it."""
+    if target.isEmpty() or source.isEmpty():
+        return source
+    scaled = source.scaled(target, Qt.AspectRatioMode.KeepAspectRatioByExpanding)
+    if (source.width() < scaled.width() * PREVIEW_DOWNSCALE_MIN_RATIO
+            and source.height() < scaled.height() * PREVIEW_DOWNSCALE_MIN_RATIO):
+        return source
+    return scaled
+
+
+class PreviewFrameProcessor(QObject):
+    """
+    Prepares camera preview frames off the GUI thread.
+
+    submit(frame, target_size) hands a QVideoFrame (or QImage, from provider feeds) to a worker thread, latest frame
+    wins: a frame still waiting when the next one arrives is dropped unseen. The worker converts it to an image and
+    downscales it to ``target_size`` (the display item's size in device pixels), then passes the small frame back to
+    the GUI thread through a LatestValueCoalescer, where ``callback(frame)`` only has to hand it to the display sink.
+    Frames already close to the on-screen size are forwarded as they are, without a conversion.
+
+    The GUI thread therefore never converts or rescales a full-resolution camera frame for the preview, and the
+    display item's (perspective) paint works on a viewport-sized texture.
+    """
+
+    def __init__(self, callback, max_rate_hz: float = 60.0, parent=None):
+        super().__init__(parent)
+        self._callback = callback
+        self._output = LatestValueCoalescer(lambda _key, frame: self._callback(frame), max_rate_hz, parent=self)
+
+        self._condition = threading.Condition()
+        self._pending = None  # (frame, target_size) awaiting the worker
+        self._stopped = False
+        self.dropped_count = 0  # frames superseded before the worker got to them
+
+        self._thread = threading.Thread(target=self._run, daemon=True, name="camera-preview")
+        self._thread.start()
+
+    @property
+    def has_pending(self) -> bool:
+        with self._condition:
+            return self._pending is not None or self._output.has_pending
+
+    def submit(self, frame, target_size: QSize = None):
+        """Queue ``frame`` for the preview, replacing any frame not yet picked up. Thread safe."""
+        with self._condition:
+            if self._pending is not None:
+                self.dropped_count += 1
+            self._pending = (frame, QSize(target_size) if target_size is not None else QSize())
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._pending = None
+            self._condition.notify()
+        self._thread.join(timeout=1.0)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+                frame, target_size = self._pending
+                self._pending = None
+            try:
+                self._output.submit("preview", self._prepare(frame, target_size))
+            except Exception as e:
+                logger.error(f"Preview frame preparation failed: {e}", exc_info=True)
+
+    @staticmethod
+    def _prepare(frame, target_size: QSize) -> QVideoFrame:
+        """Worker thread: the display-ready frame for ``frame``."""
+        if isinstance(frame, QImage):
+            image, frame = frame, None
+            source_size = image.size()
+        else:
+            image = None
+            source_size = frame.size()
+
+        size = preview_size(source_size, target_size)
+        if size == source_size:
+            return frame if frame is not None else QVideoFrame(image)
+
+        if image is None:
+            image = frame.toImage()
+        scaled = image.scaled(size, Qt.AspectRatioMode.IgnoreAspectRatio,
+                              Qt.TransformationMode.SmoothTransformation)
+        return QVideoFrame(scaled)
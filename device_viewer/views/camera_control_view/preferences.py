@@ -5,12 +5,16 @@ from traitsui.api import View, Item, Group, EnumEditor
 from apptools.preferences.api import PreferencesHelper
 from traits.api import Str, Bool, Enum, List, Range, observe
 
-from device_viewer.utils.camera import supported_qt_video_codec_names
+from device_viewer.utils.camera import (png_quality_for_compression,
+                                       supported_qt_video_codec_names)
 from logger.logger_service import get_logger
 
 logger = get_logger(__name__)
 
 from device_viewer.consts import (
+    CAPTURE_DEFAULT_JPEG_QUALITY,
+    CAPTURE_DEFAULT_PNG_COMPRESSION,
+    CAPTURE_IMAGE_FORMATS,
     FFMPEG_CONTAINERS,
     FFMPEG_DEFAULT_CRF,
     FFMPEG_PRESETS,
@@ -103,6 +107,13 @@ class CameraPreferences(PreferencesHelper):
     qt_bitrate_4k30_tier = Enum(*RECORDING_BITRATE_TIERS)
     qt_bitrate_4k60_tier = Enum(*RECORDING_BITRATE_TIERS)
 
+    #### Still capture preferences ############################################
+    capture_image_format = Enum(*CAPTURE_IMAGE_FORMATS)
+    capture_png_compression = Range(low=0, high=9,
+                                    value=CAPTURE_DEFAULT_PNG_COMPRESSION)
+    capture_jpeg_quality = Range(low=1, high=100,
+                                 value=CAPTURE_DEFAULT_JPEG_QUALITY)
+
     def _qt_video_codec_default(self):
         if self.qt_video_format == QT_RECORDER_FORMAT_MP4:
             return "H264"
@@ -137,6 +148,18 @@ class CameraPreferences(PreferencesHelper):
     def _strict_video_format_default(self):
         return strict_video_format
 
+    #### Capture helpers ######################################################
+
+    def capture_file_extension(self) -> str:
+        return f".{self.capture_image_format}"
+
+    def capture_encoder_settings(self) -> tuple[str, int]:
+        """(Qt writer format, QImage.save quality) for still captures."""
+        if self.capture_image_format == "jpg":
+            return CAPTURE_IMAGE_FORMATS["jpg"], self.capture_jpeg_quality
+        return (CAPTURE_IMAGE_FORMATS["png"],
+                png_quality_for_compression(self.capture_png_compression))
+
     #### Recording helpers ####################################################
 
     def recording_file_extension(self) -> str:
@@ -289,6 +312,36 @@ qt_recorder_settings_group = Group(
     visible_when=f'recorder_backend == "{RECORDER_BACKEND_QT}"',
 )
 
+capture_settings_group = Group(
+    create_item_label_group(
+        "capture_image_format",
+        label_text="Image Format",
+        item_tooltip=(
+            "png: lossless; the default for measurements.\n"
+            "jpg: much smaller and faster to write, but lossy."
+        ),
+    ),
+    create_item_label_group(
+        "capture_png_compression",
+        label_text="PNG Compression",
+        item_tooltip=(
+            "zlib level, 0-9. Every level is lossless: higher levels only "
+            "trade encoding time for smaller files."
+        ),
+        group_visible_when='capture_image_format == "png"',
+    ),
+    create_item_label_group(
+        "capture_jpeg_quality",
+        label_text="JPEG Quality",
+        item_tooltip="1 = smallest file, 100 = best quality.",
+        group_visible_when='capture_image_format == "jpg"',
+    ),
+    label="Image Capture",
+    show_labels=False,
+    show_border=True,
+    style_sheet=preferences_group_style_sheet,
+)
+
 
 video_settings_tab = PreferencesCategory(
     id="microdrop.video_settings.preferences",
@@ -333,4 +386,6 @@ class CameraPreferencesPane(PreferencesPane):
             style_sheet=preferences_group_style_sheet,
         ),
         Item("_"),  # Separator
+        capture_settings_group,
+        Item("_"),  # Separator
     )
\ No newline at end of file
@@ -16,19 +16,28 @@ logger = get_logger(__name__)
 
 @dramatiq.actor
 def _cache_media_capture(name: MediaType, save_path: str):
-    media_capture_message = MediaCaptureMessageModel(
-        path=Path(save_path), type=name.lower()
-    )
+    _append_media_captures([(name, save_path)])
+
+
+@dramatiq.actor
+def _cache_media_captures(captures: list):
+    """Batched _cache_media_capture: ``captures`` is a list of
+    (media type, save path) pairs, recorded with one read and one write of
+    the captures list however many there are."""
+    _append_media_captures(captures)
 
-    message=media_capture_message.model_dump_json()
 
-    if not app_globals.get(MEDIA_CAPTURES_KEY):
-        app_globals[MEDIA_CAPTURES_KEY] = [message]
+def _append_media_captures(captures):
+    messages = [
+        MediaCaptureMessageModel(path=Path(save_path), type=name.lower()).model_dump_json()
+        for name, save_path in captures
+    ]
+    if not messages:
+        return
 
-    else:
-        app_globals[MEDIA_CAPTURES_KEY] += [message]
+    app_globals[MEDIA_CAPTURES_KEY] = list(app_globals.get(MEDIA_CAPTURES_KEY) or []) + messages
 
-    logger.info(app_globals[MEDIA_CAPTURES_KEY])
+    logger.info(f"Recorded {len(messages)} media capture(s): {[path for _, path in captures]}")
 
 def _show_media_capture_dialog(
     name: MediaType, save_path: str, status_bar_manager=None
@@ -1,10 +1,11 @@
+import math
 import time
 from pathlib import Path
 
 from PySide6.QtCore import (
+    QSize,
     Signal,
     Slot,
-    QThreadPool,
     QTimer,
 )
 from PySide6.QtGui import QImage
@@ -31,6 +32,7 @@ from microdrop_utils.pyside_helpers import MarqueeComboBox
 from microdrop_utils.v4l2_fps_getter import get_video_inputs, LinuxCameraDeviceContainer
 from ...consts import (
     CAMERA_PREVIEW_MAX_FPS,
+    CAPTURE_FINISH_TIMEOUT_MS,
     CAPTURES_DIR_NAME,
     RECORDER_BACKEND_FFMPEG,
     RECORDINGS_DIR_NAME,
@@ -42,15 +44,17 @@ from ...consts import (
 from device_viewer.views.camera_control_view.preferences import CameraPreferences
 from microdrop_style.helpers import get_complete_stylesheet, is_dark_mode
 from microdrop_utils.datetime_helpers import get_current_utc_datetime
-from .utils import _cache_media_capture, _show_media_capture_dialog
+from .utils import _append_media_captures, _cache_media_captures, _show_media_capture_dialog
 from ..electrode_view.electrode_scene import ElectrodeScene
 from ...default_settings import video_key
 
 from ...utils.camera import (
     NativeVideoRecorder,
     get_transformed_frame,
-    ImageSaver, RawFFMPEGVideoRecorder
+    RawFFMPEGVideoRecorder
 )
+from ...utils.capture_queue import CaptureQueue
+from ...utils.preview_frame_processor import PreviewFrameProcessor
 from ...models.media import MediaType
 
 from logger.logger_service import get_logger
@@ -64,6 +68,7 @@ class CameraControlWidget(QWidget):
     camera_active_signal = Signal(bool)
     screen_capture_signal = Signal(object)
     screen_recording_signal = Signal(object)
+    protocol_finished_signal = Signal()
 
     def __init__(
         self,
@@ -111,20 +116,30 @@ class CameraControlWidget(QWidget):
         self.available_cameras = None
         self.available_formats = None
         self.show_media_capture_dialog_for_video = True
-        # In-flight ImageSaver workers, referenced so a pool worker (and its
-        # signals QObject) cannot be garbage-collected before its completion
-        # signal is delivered back to the GUI thread.
-        self._pending_image_savers = set()
+        # Still captures are encoded on a dedicated, bounded encoder pool;
+        # saved captures are recorded in app globals in one batched write
+        # per protocol step (sent to a worker). When the protocol finishes,
+        # and at shutdown, the last batch is written from here synchronously
+        # (see finish_captures) so the run's log report sees every capture.
+        self._capture_queue = CaptureQueue(_cache_media_captures.send, parent=self)
+        self._shut_down = False
 
         self.scene.addItem(self.video_item)
         # The session delivers to our own sink at full camera rate; frames
         # are forwarded to the DISPLAY item capped at CAMERA_PREVIEW_MAX_FPS
         # (every frame under the electrodes is a full-scene composite, and
-        # the preview doesn't need camera rate to be useful).
+        # the preview doesn't need camera rate to be useful). Forwarded
+        # frames are converted and downscaled to the on-screen size on a
+        # worker thread; the GUI thread only hands the result to the item.
         self._camera_sink = QVideoSink(self)
         self._camera_sink.videoFrameChanged.connect(self._forward_preview_frame)
         self.session.setVideoSink(self._camera_sink)
         self._last_preview_frame_time = 0.0
+        self._preview_processor = PreviewFrameProcessor(
+            self._show_preview_frame, CAMERA_PREVIEW_MAX_FPS, parent=self)
+        # Latest full-resolution provider-feed image, for screenshots (the
+        # display item only holds the downscaled preview).
+        self._last_feed_image = None
 
         # 1. Initialize Recorder. The backend (Qt MediaRecorder vs FFmpeg
         # process) and its encoding settings come from the camera
@@ -138,6 +153,8 @@ class CameraControlWidget(QWidget):
         self.camera_active_signal.connect(self.on_camera_active)
         self.screen_capture_signal.connect(self.capture_button_handler)
         self.screen_recording_signal.connect(self.on_recording_active)
+        self.protocol_finished_signal.connect(self.finish_captures)
+        QApplication.instance().aboutToQuit.connect(self.shutdown)
 
         # UI Initialization
         self._init_ui()
@@ -405,6 +422,31 @@ class CameraControlWidget(QWidget):
         if self.model.mode == "camera-edit":
             self.model.mode = "camera-place"
 
+    @Slot()
+    def finish_captures(self):
+        """Record every still capture of the run now: wait briefly for
+        captures still being encoded, then write the pending batch to app
+        globals directly instead of through the idle timer and a worker,
+        so it is stored before the protocol's log report reads it."""
+        if not self._capture_queue.finish(_append_media_captures, CAPTURE_FINISH_TIMEOUT_MS):
+            logger.warning(f"Captures still encoding after {CAPTURE_FINISH_TIMEOUT_MS} ms "
+                           f"were not recorded with the protocol run")
+
+    @Slot()
+    def shutdown(self):
+        """Teardown on close, dock pane destruction or application quit:
+        stop the preview worker thread and flush pending captures."""
+        if self._shut_down:
+            return
+        self._shut_down = True
+        self._camera_sink.videoFrameChanged.disconnect(self._forward_preview_frame)
+        self._preview_processor.stop()
+        self.finish_captures()
+
+    def closeEvent(self, event):
+        self.shutdown()
+        super().closeEvent(event)
+
     def _get_camera_from_available_cameras(self, selected_device):
         """Create a QCamera from either a LinuxCameraDeviceContainer or QCameraDevice.
 
@@ -513,6 +555,7 @@ class CameraControlWidget(QWidget):
             self._feed_controls.deleteLater()
             self._feed_controls = None
         self._active_feed = None
+        self._last_feed_image = None
         # Recording stays unavailable while a provider source is selected
         # (provider feeds bypass the QtMultimedia session the recorder taps).
         self.record_toggle_button.setDisabled(self._provider_selected())
@@ -530,13 +573,46 @@ class CameraControlWidget(QWidget):
         self._last_preview_frame_time = now
         return True
 
+    def _preview_target_size(self) -> QSize:
+        """Device-pixel size the video item covers in the (first) view —
+        what a preview frame has to fill. Empty when the item isn't shown."""
+        views = self.scene.views()
+        item_size = self.video_item.size()
+        if not views or item_size.isEmpty():
+            return QSize()
+        view = views[0]
+        on_screen = view.mapFromScene(
+            self.video_item.sceneBoundingRect()).boundingRect()
+        local = self.video_item.boundingRect()
+        if local.isEmpty():
+            return QSize()
+        # Largest scale the (perspective) transform and zoom apply.
+        scale = max(on_screen.width() / local.width(),
+                    on_screen.height() / local.height()) * view.devicePixelRatioF()
+        return QSize(math.ceil(local.width() * scale),
+                     math.ceil(local.height() * scale))
+
     def _forward_preview_frame(self, frame):
         if self._preview_frame_due():
-            self.video_item.videoSink().setVideoFrame(frame)
+            self._preview_processor.submit(frame, self._preview_target_size())
 
     def _on_feed_frame(self, image):
+        self._last_feed_image = image
         if self._preview_frame_due():
-            self.video_item.videoSink().setVideoFrame(QVideoFrame(image))
+            self._preview_processor.submit(image, self._preview_target_size())
+
+    def _show_preview_frame(self, frame):
+        """GUI thread: a display-ready frame from the preview worker."""
+        self.video_item.videoSink().setVideoFrame(frame)
+
+    def _full_resolution_frame(self) -> QVideoFrame:
+        """Latest source frame at full camera resolution — the display
+        item only holds the downscaled preview."""
+        if self._provider_selected():
+            if self._last_feed_image is not None:
+                return QVideoFrame(self._last_feed_image)
+            return self.video_item.videoSink().videoFrame()
+        return self._camera_sink.videoFrame()
 
     def _on_feed_streaming(self, active):
         """Provider feeds own their preview state (e.g. the fluorescence
@@ -805,6 +881,7 @@ class CameraControlWidget(QWidget):
             self.camera.start()
 
     def _capture_image_routine(self, capture_data=None):
+        requested_at = time.monotonic()
         directory, step_description, step_id, show_dialog = None, None, None, True
         if isinstance(capture_data, dict):
             directory = capture_data.get("directory")
@@ -820,9 +897,10 @@ class CameraControlWidget(QWidget):
         # sensor captures are the owning plugin's concern — the
         # fluorescence capture chain writes its own per-burst folders —
         # so this pipeline no longer special-cases raw-capable feeds.
-        self._capture_display_image(save_path, show_dialog)
+        self._capture_display_image(save_path, show_dialog, step_id, requested_at)
 
-    def _capture_display_image(self, save_path, show_dialog):
+    def _capture_display_image(self, save_path, show_dialog, step_id=None,
+                               requested_at=None):
         # Capture Pixels (Must happen on UI thread)
         image = self.get_screen_shot()
 
@@ -832,7 +910,6 @@ class CameraControlWidget(QWidget):
         save_path.parent.mkdir(parents=True, exist_ok=True)
 
         def _post_image_capture(saved_path):
-            _cache_media_capture(MediaType.IMAGE, saved_path)
             media_capture_event_model.captured = saved_path
             if show_dialog:
                 _show_media_capture_dialog(
@@ -840,27 +917,10 @@ class CameraControlWidget(QWidget):
 
         # get_screen_shot may return the recorder's live current_image, which
         # the recorder keeps painting into — snapshot it before handing off.
-        self._start_image_saver(image.copy(), str(save_path), _post_image_capture)
-
-    def _start_image_saver(self, image, save_path, on_saved, on_failed=None):
-        """Run an ImageSaver on the global thread pool — PNG-encoding a
-        full-resolution frame inline visibly freezes the GUI. The worker is
-        kept referenced until one of its completion signals (delivered queued
-        on the GUI thread) has fired; ``on_saved``/``on_failed`` then run on
-        the GUI thread."""
-        worker = ImageSaver(image, save_path)
-        self._pending_image_savers.add(worker)
-
-        def _finish(saved_path, callback):
-            self._pending_image_savers.discard(worker)
-            if callback is not None:
-                callback(saved_path)
-
-        worker.signals.save_complete.connect(
-            lambda saved_path: _finish(saved_path, on_saved))
-        worker.signals.save_failed.connect(
-            lambda saved_path: _finish(saved_path, on_failed))
-        QThreadPool.globalInstance().start(worker)
+        image_format, quality = self.preferences.capture_encoder_settings()
+        self._capture_queue.submit(
+            image.copy(), save_path, image_format, quality, step_id=step_id,
+            on_saved=_post_image_capture, requested_at=requested_at)
 
     def _capture_image_and_close(self, capture_data):
         self._capture_image_routine(capture_data)
@@ -894,7 +954,8 @@ class CameraControlWidget(QWidget):
             return f"free_mode_{timestamp}{file_extension}"
 
     def _generate_capture_filename(self, step_description=None, step_id=None):
-        return self._generate_media_filename(step_description, step_id, ".png")
+        return self._generate_media_filename(
+            step_description, step_id, self.preferences.capture_file_extension())
 
     def _generate_recording_filename(self, step_description=None, step_id=None):
         return self._generate_media_filename(
@@ -927,7 +988,7 @@ class CameraControlWidget(QWidget):
             if self.recorder.current_image:
                 return self.recorder.current_image
 
-        frame = self.video_item.videoSink().videoFrame()
+        frame = self._full_resolution_frame()
 
         # 1. Image and Scene Data
         source_image = frame.toImage()
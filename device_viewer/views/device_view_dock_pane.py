@@ -56,6 +56,7 @@ from microdrop_style.helpers import (
     get_complete_stylesheet,
     is_dark_mode,
 )
+from microdrop_utils import startup_profiler
 from microdrop_utils.datetime_helpers import TimestampedMessage
 from microdrop_utils.dramatiq_controller_base import (
     basic_listener_actor_routine,
@@ -74,7 +75,7 @@ from microdrop_utils.pyside_helpers import (
 from microdrop_utils.trait_change_commands import SetChangeCommand
 from ..consts import DEVICE_VIEWER_STATE_CHANGED, DEVICE_VIEWER_GEOMETRY_CHANGED, FILLER_CAPACITANCE_KEY, \
     LIQUID_CAPACITANCE_KEY, CALIBRATION_DATA, STEP_PARAMS_COMMIT, \
-    PHASE_NAVIGATION_MODE
+    PHASE_NAVIGATION_MODE, PROTOCOL_GRID_DISPLAY_STATE, PROTOCOL_TREE_DISPLAY_STATE, DISPLAY_STATE_MAX_APPLY_HZ
 from ..models.step_params_commit import StepParamsCommitMessage
 
 from ..consts import (
@@ -102,6 +103,7 @@ from ..services.electrode_interaction_service import (
 )
 from ..utils.auto_fit_graphics_view import AutoFitGraphicsView
 from ..utils.commands import DictChangeCommand, ListChangeCommand, TraitChangeCommand
+from ..utils.latest_value_coalescer import LatestValueCoalescer
 from ..utils.message_utils import gui_models_to_message_model
 
 # For sidebar
@@ -156,6 +158,7 @@ class DeviceViewerDockPane(TraitsDockPane):
     _last_published_id_to_channel = Instance(dict, allow_none=True, desc="None means geometry never published yet")
     message_buffer = Str(desc="Buffer to hold the message to be sent when the debounce timer expires")
     video_item = Instance(QGraphicsVideoItem, allow_none=True, desc="The video item for the camera feed")
+    _display_state_coalescer = Instance(LatestValueCoalescer, desc="Latest-wins, rate-capped hand-off of inbound display states to the GUI thread")
     # _electrode_publish_timer = None  # Debounce timer for electrode state publish (e.g. arrow-key navigation)
 
     ###################################################################################
@@ -230,6 +233,11 @@ class DeviceViewerDockPane(TraitsDockPane):
         )
         self.device_view.setObjectName("device_view")
 
+        # Created here, on the GUI thread, so coalesced display states are applied there.
+        self._display_state_coalescer = LatestValueCoalescer(
+            self._apply_coalesced_display_state, max_rate_hz=DISPLAY_STATE_MAX_APPLY_HZ
+        )
+
     ################################################################################################
     # ------- Dramatiq handlers ---------------------------
     ################################################################################################
@@ -359,11 +367,24 @@ class DeviceViewerDockPane(TraitsDockPane):
             self.device_view.setInteractive(False)
 
     def _on_display_state_triggered(self, message_model_serial: str):
-        # We send the message through a signal since Dramatiq runs the callbacks in a separate thread
-        # Which has weird side effects on QtGraphicsObject calls
-        self.device_view.display_state_signal.emit(message_model_serial)
+        # Dramatiq runs the callbacks in a separate thread, which has weird side effects on QtGraphicsObject calls:
+        # the coalescer hands the state to the GUI thread, keeping only the latest one while a repaint is pending.
+        self._display_state_coalescer.submit(PROTOCOL_GRID_DISPLAY_STATE, message_model_serial)
 
     def _on_protocol_tree_display_state_triggered(self, message_serial: str):
+        """Queue a ProtocolTreeDisplayMessage for the GUI thread. It is only
+        adapted (see _adapt_protocol_tree_display_state) if it is not
+        superseded before the next display refresh."""
+        self._display_state_coalescer.submit(PROTOCOL_TREE_DISPLAY_STATE, message_serial)
+
+    def _apply_coalesced_display_state(self, topic: str, message_serial: str):
+        """LatestValueCoalescer callback, on the GUI thread: feed the latest display state for ``topic`` into the
+        display_state_signal pipeline."""
+        if topic == PROTOCOL_TREE_DISPLAY_STATE:
+            message_serial = self._adapt_protocol_tree_display_state(message_serial).serialize()
+        self.device_view.display_state_signal.emit(message_serial)
+
+    def _adapt_protocol_tree_display_state(self, message_serial: str) -> DeviceViewerMessageModel:
         """Adapter for ProtocolTreeDisplayMessage -> DeviceViewerMessageModel.
         The downstream display_state_signal pipeline reuses what already
         works for the legacy widget."""
@@ -377,7 +398,7 @@ class DeviceViewerDockPane(TraitsDockPane):
             for eid in msg.electrodes
             if id_to_channel.get(eid) is not None
         }
-        rich = DeviceViewerMessageModel(
+        return DeviceViewerMessageModel(
             channels_activated=channels_activated,
             routes=[(route, self.model.routes.get_available_color())
                     for route in msg.routes],
@@ -389,13 +410,15 @@ class DeviceViewerDockPane(TraitsDockPane):
             editable=msg.editable,
             execution_params=msg.execution_params,
         )
-        self.device_view.display_state_signal.emit(rich.serialize())
 
     def _on_protocol_running_triggered(self, message: TimestampedMessage):
 
         logger.debug(f"Protocol running is {message}")
         if self.model:
             self.model.protocol_running = True if message.lower() == "true" else False
+        if message.lower() != "true" and getattr(self, "camera_control_widget", None) is not None:
+            # Queued to the GUI thread: record the run's last captures now.
+            self.camera_control_widget.protocol_finished_signal.emit()
 
     def _on_advanced_mode_change_triggered(self, message: TimestampedMessage):
         """Operator toggled Advanced Mode. While a protocol is running, this
@@ -887,8 +910,9 @@ class DeviceViewerDockPane(TraitsDockPane):
         logger.info(f"Selected SVG file: {svg_file}")
         # create model using svg data
         try:
-            self._set_svg_model(svg_file=svg_file)
-            self._initialize_svg_view(svg_file=svg_file)
+            with startup_profiler.span("load device svg", "device", svg_file=svg_file):
+                self._set_svg_model(svg_file=svg_file)
+                self._initialize_svg_view(svg_file=svg_file)
             # if model and view can be set, change default svg file
             self.device_viewer_preferences.DEFAULT_SVG_FILE = svg_file
 
@@ -930,6 +954,12 @@ class DeviceViewerDockPane(TraitsDockPane):
                 self.device_viewer_preferences.LAYERS_VIEW_MIN_HEIGHT
             )
 
+    def destroy(self):
+        """Stop the camera widget's worker thread and flush its captures before the controls go away."""
+        if getattr(self, "camera_control_widget", None) is not None:
+            self.camera_control_widget.shutdown()
+        super().destroy()
+
     def create_contents(self, parent):
         """Called when the task is activated."""
         logger.debug("creating device viewer dock pane contents")
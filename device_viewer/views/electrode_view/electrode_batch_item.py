@@ -0,0 +1,161 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+from pyface.qt.QtCore import Qt, QPointF, QRectF
+from pyface.qt.QtGui import QColor, QPainterPath, QPen, QGraphicsItem, QStyleOptionGraphicsItem
+
+from logger.logger_service import get_logger
+from ...default_settings import ELECTRODE_LINE
+
+logger = get_logger(__name__)
+
+
+class ElectrodeBatchItem(QGraphicsItem):
+    """
+    Single scene item drawing the fills and outlines of every electrode in a layer.
+
+    With one ElectrodeView per electrode, a large array means thousands of items for the scene to index, cache and
+    composite, and a recolor pass that invalidates each of them separately. This item keeps the electrode paths (and
+    their inner actuation paths) from the ElectrodeViews plus one colour stack per electrode, and paints them all
+    in a single pass.
+
+    - Recolouring an electrode only marks that electrode's bounding rect dirty (update(rect)); with the device
+      coordinate cache only the dirty region of the cached pixmap is repainted, and paint() skips every electrode
+      outside the exposed rect.
+    - electrode_at() and electrodes_in_rect() look electrodes up in a uniform grid of cells about one electrode
+      wide, each listing the electrodes whose bounding rect overlaps it, so a hover or a partial repaint only tests
+      the few electrodes near the point instead of the whole array (then the exact path, for hit-tests).
+
+    The ElectrodeViews stay in the scene (without painting) for hover, tooltips, labels and mouse handling.
+    """
+
+    def __init__(self, paths: Dict[str, QPainterPath], inner_paths: Dict[str, QPainterPath], parent=None):
+        super().__init__(parent)
+
+        self._paths = dict(paths)
+        self._inner_paths = dict(inner_paths)
+        self._rects = {electrode_id: path.boundingRect() for electrode_id, path in self._paths.items()}
+        self._color_stacks: Dict[str, List[QColor]] = {}
+
+        self._bounding_rect = QRectF()
+        for rect in self._rects.values():
+            self._bounding_rect = self._bounding_rect.united(rect)
+
+        # Insertion index of each electrode, so grid lookups return electrodes in paint order.
+        self._order = {electrode_id: index for index, electrode_id in enumerate(self._paths)}
+        self._cell_size = self._grid_cell_size(self._rects.values())
+        self._grid: Dict[Tuple[int, int], List[str]] = {}
+        for electrode_id, rect in self._rects.items():
+            for cell in self._cells(rect):
+                self._grid.setdefault(cell, []).append(electrode_id)
+
+        self._pen = QPen(QColor(ELECTRODE_LINE), 1)
+        # Half the outline width sticks out of each path.
+        self._pen_margin = self._pen.widthF() / 2
+
+        # exposedRect is only filled in with this flag set.
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption, True)
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        # Interaction goes through the ElectrodeViews above this item.
+        self.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
+        self.setAcceptHoverEvents(False)
+
+    #################################################################################
+    # QGraphicsItem interface
+    ##################################################################################
+
+    def boundingRect(self) -> QRectF:
+        margin = self._pen_margin
+        return self._bounding_rect.adjusted(-margin, -margin, margin, margin)
+
+    def paint(self, painter, option: QStyleOptionGraphicsItem, widget=None):
+        exposed = option.exposedRect if option is not None else self.boundingRect()
+        pen = self._pen
+        for electrode_id in self.electrodes_in_rect(exposed):
+            color_stack = self._color_stacks.get(electrode_id)
+            path = self._paths[electrode_id]
+            if color_stack:
+                # if only one element, then only base color given
+                painter.fillPath(path, color_stack[0])
+                # second element should be the actuation color.
+                if len(color_stack) > 1:
+                    painter.fillPath(self._inner_paths[electrode_id], color_stack[1])
+            painter.strokePath(path, pen)
+
+    #################################################################################
+    # Public methods
+    ##################################################################################
+
+    @property
+    def electrode_ids(self):
+        return self._paths.keys()
+
+    def color_stack(self, electrode_id) -> Optional[List[QColor]]:
+        return self._color_stacks.get(electrode_id)
+
+    def set_color_stack(self, electrode_id, colors: List[QColor]):
+        """Set one electrode's colour stack and repaint only its bounding rect."""
+        if electrode_id not in self._paths or self._color_stacks.get(electrode_id) == colors:
+            return
+        self._color_stacks[electrode_id] = colors
+        self.update(self.electrode_rect(electrode_id))
+
+    def set_outline_pen(self, pen: QPen):
+        if pen == self._pen:
+            return
+        self.prepareGeometryChange()
+        self._pen = QPen(pen)
+        self._pen_margin = self._pen.widthF() / 2
+        self.update()
+
+    def electrode_rect(self, electrode_id) -> QRectF:
+        """Bounding rect of one electrode, including its outline."""
+        margin = self._pen_margin
+        return self._rects[electrode_id].adjusted(-margin, -margin, margin, margin)
+
+    def electrodes_in_rect(self, rect: QRectF):
+        """Ids of the electrodes whose outlined bounding rect intersects ``rect`` (item coordinates), in paint
+        order."""
+        margin = self._pen_margin
+        query = rect.adjusted(-margin, -margin, margin, margin)
+        if self._cell_count(query) >= len(self._rects):
+            # Covers most of the device (e.g. a full repaint): a plain scan is cheaper than visiting the cells.
+            candidates = self._rects
+        else:
+            candidates = sorted({electrode_id for cell in self._cells(query)
+                                 for electrode_id in self._grid.get(cell, ())}, key=self._order.__getitem__)
+        return [electrode_id for electrode_id in candidates if self._rects[electrode_id].intersects(query)]
+
+    def electrode_at(self, pos: QPointF) -> Optional[str]:
+        """Id of the electrode containing ``pos`` (item coordinates), or None."""
+        cell = (math.floor(pos.x() / self._cell_size), math.floor(pos.y() / self._cell_size))
+        for electrode_id in self._grid.get(cell, ()):
+            if self._rects[electrode_id].contains(pos) and self._paths[electrode_id].contains(pos):
+                return electrode_id
+        return None
+
+    #################################################################################
+    # Spatial index
+    ##################################################################################
+
+    @staticmethod
+    def _grid_cell_size(rects) -> float:
+        """Grid cell edge: the mean electrode extent, so an electrode spans a few cells and a cell lists a few
+        electrodes."""
+        extents = [max(rect.width(), rect.height()) for rect in rects]
+        size = sum(extents) / len(extents) if extents else 0.0
+        return size if size > 0 else 1.0
+
+    def _cell_range(self, rect: QRectF):
+        size = self._cell_size
+        return (math.floor(rect.left() / size), math.floor(rect.right() / size),
+                math.floor(rect.top() / size), math.floor(rect.bottom() / size))
+
+    def _cell_count(self, rect: QRectF) -> int:
+        left, right, top, bottom = self._cell_range(rect)
+        return (right - left + 1) * (bottom - top + 1)
+
+    def _cells(self, rect: QRectF):
+        """Grid cells overlapped by ``rect``."""
+        left, right, top, bottom = self._cell_range(rect)
+        return [(column, row) for column in range(left, right + 1) for row in range(top, bottom + 1)]
@@ -5,6 +5,7 @@ from pyface.qt.QtCore import QPointF
 
 from microdrop_utils.pyside_helpers import get_qcolor_lighter_percent_from_factor
 from .electrodes_view_base import ElectrodeView, ElectrodeConnectionItem, ElectrodeEndpointItem
+from .electrode_batch_item import ElectrodeBatchItem
 from .electrode_view_helpers import loop_is_ccw
 from ...default_settings import ROUTE_CW_LOOP, ROUTE_CCW_LOOP, ROUTE_SELECTED, ELECTRODE_CHANNEL_EDITING, ELECTRODE_OFF, \
     ELECTRODE_ON, ELECTRODE_NO_CHANNEL, ELECTRODE_DISABLED, PERSPECTIVE_RECT_COLOR, PERSPECTIVE_RECT_COLOR_EDITING, \
@@ -12,6 +13,7 @@ from ...default_settings import ROUTE_CW_LOOP, ROUTE_CCW_LOOP, ROUTE_SELECTED, E
     routes_key, connections_key, hovered_actuation_key, hovered_electrode_key
 from logger.logger_service import get_logger
 from device_viewer.models.main_model import DeviceViewMainModel
+from device_viewer.consts import BATCHED_RENDER_MIN_ELECTRODES
 
 logger = get_logger(__name__)
 
@@ -22,15 +24,25 @@ class ElectrodeLayer():
 
     - This view contains a group of electrode view objects
     - The view is responsible for updating the properties of all the electrode views contained in bulk.
+    - With batched rendering (default for devices with at least BATCHED_RENDER_MIN_ELECTRODES electrodes), a single
+      ElectrodeBatchItem paints every electrode and the electrode views only handle interaction and labels.
     """
 
-    def __init__(self, electrodes, default_alphas: dict[int, float]):
+    def __init__(self, electrodes, default_alphas: dict[int, float], batched: bool = None):
         # Create the connection and electrode items
         self.connection_items = {}
         self.electrode_views = {}
         self.electrode_endpoints = {}
         self.reference_rect_item = None
         self.reference_rect_path_item = None
+        self.batch_item = None
+
+        # Last applied route overlay, so redraws only restyle what changed (see redraw_connections_to_scene)
+        self._applied_alphas = None
+        self._applied_connection_map = {}
+        self._applied_endpoint_map = {}
+        self._connection_styles = {} # Items start inactive (style None)
+        self._endpoint_styles = {}
 
         self.svg = electrodes.svg_model
 
@@ -54,8 +66,22 @@ class ElectrodeLayer():
         for key, (src, dst) in connections.items():
             self.connection_items[key] = ElectrodeConnectionItem(key, src, dst)
 
+        if batched is None:
+            batched = len(self.electrode_views) >= BATCHED_RENDER_MIN_ELECTRODES
+        if batched and self.electrode_views:
+            self.batch_item = ElectrodeBatchItem(
+                {electrode_id: view.path for electrode_id, view in self.electrode_views.items()},
+                {electrode_id: view._inner_path for electrode_id, view in self.electrode_views.items()},
+            )
+            self.batch_item.set_outline_pen(next(iter(self.electrode_views.values())).pen())
+            for electrode_view in self.electrode_views.values():
+                electrode_view.attach_to_batch(self.batch_item)
+
     ################# add electrodes/connections from scene ############################################
     def add_electrodes_to_scene(self, parent_scene: 'QGraphicsScene'):
+        # Added first so it stacks below the (non-painting) electrode views, connections and labels.
+        if self.batch_item is not None:
+            parent_scene.addItem(self.batch_item)
         for electrode_id, electrode_view in self.electrode_views.items():
             parent_scene.addItem(electrode_view)
         # Promote labels to top-level items above every electrode: as
@@ -83,6 +109,8 @@ class ElectrodeLayer():
         for electrode_id, electrode_view in self.electrode_views.items():
             parent_scene.removeItem(electrode_view.text_path)
             parent_scene.removeItem(electrode_view)
+        if self.batch_item is not None:
+            parent_scene.removeItem(self.batch_item)
 
     def remove_connections_to_scene(self, parent_scene: 'QGraphicsScene'):
         """
@@ -155,8 +183,33 @@ class ElectrodeLayer():
         alpha = model.get_alpha(routes_key)
         connection_alpha = model.get_alpha(connections_key)
 
-        for key, connection_item in self.connection_items.items():
+        # Only items whose look can have changed are touched: those in the previous or the new route maps. Every
+        # other item still shows the base layer, unless the alphas changed, which restyles everything once.
+        if (alpha, connection_alpha) != self._applied_alphas:
+            connection_keys = self.connection_items.keys()
+            endpoint_ids = self.electrode_endpoints.keys()
+            self._applied_alphas = (alpha, connection_alpha)
+        else:
+            connection_keys = self._applied_connection_map.keys() | connection_map.keys()
+            endpoint_ids = self._applied_endpoint_map.keys() | endpoint_map.keys()
+
+        for key in connection_keys:
+            connection_item = self.connection_items.get(key)
+            if connection_item is None: # Not a neighbour pair, e.g. a planned wait repeating one electrode
+                continue
+
             (color, z) = connection_map.get(key, (None, None))
+            if color:
+                style = ("route", color.rgba(), alpha, z)
+            elif connection_alpha > 0:
+                style = ("base", connection_alpha)
+            else:
+                style = None
+
+            if self._connection_styles.get(key, None) == style:
+                continue
+            self._connection_styles[key] = style
+
             if color:
                 connection_item.set_active(color, alpha)
                 connection_item.setZValue(z) # We want to make sure the whole route is on the same z value
@@ -170,13 +223,26 @@ class ElectrodeLayer():
             else:
                 connection_item.set_inactive()
         
-        for endpoint_id, endpoint_view in self.electrode_endpoints.items():
+        for endpoint_id in endpoint_ids:
+            endpoint_view = self.electrode_endpoints.get(endpoint_id)
+            if endpoint_view is None:
+                continue
+
             (color, z) = endpoint_map.get(endpoint_id, (None, None))
+            style = (color.rgba(), alpha, z) if color else None
+
+            if self._endpoint_styles.get(endpoint_id, None) == style:
+                continue
+            self._endpoint_styles[endpoint_id] = style
+
             if color:
                 endpoint_view.set_active(color, alpha)
                 endpoint_view.setZValue(z)
             else:
                 endpoint_view.set_inactive()
+
+        self._applied_connection_map = connection_map
+        self._applied_endpoint_map = endpoint_map
     
     def redraw_electrode_lines(self, model: DeviceViewMainModel):
         """
@@ -185,6 +251,8 @@ class ElectrodeLayer():
         alpha = model.get_alpha(electrode_outline_key)
         for electrode_id, electrode_view in self.electrode_views.items():
             electrode_view.update_line_alpha(alpha)
+        if self.batch_item is not None and self.electrode_views:
+            self.batch_item.set_outline_pen(next(iter(self.electrode_views.values())).pen())
 
     def recolor_electrode(self, model: DeviceViewMainModel,
                           electrode_view: ElectrodeView,
@@ -254,6 +322,12 @@ class ElectrodeLayer():
                 if electrode_view is not None:
                     self.recolor_electrode(model, electrode_view, electrode_hovered)
 
+    def electrode_view_at(self, scene_pos: QPointF):
+        """Electrode view under ``scene_pos`` found through the batch item's cached geometry, or None.
+        Only available with batched rendering."""
+        electrode_id = self.batch_item.electrode_at(self.batch_item.mapFromScene(scene_pos))
+        return self.electrode_views.get(electrode_id)
+
     def redraw_electrode_labels(self, model: DeviceViewMainModel):
         alpha = model.get_alpha(electrode_text_key)
         for electrode_id, electrode_view in self.electrode_views.items():
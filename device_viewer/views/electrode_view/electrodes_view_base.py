@@ -254,6 +254,7 @@ class ElectrodeView(QGraphicsPathItem):
 
         self.color_stack = None # only supports two right now: base, and actuation/disabled layer color
         self._disabled = False  # Whether this electrode's channel is disabled
+        self.batch_item = None  # ElectrodeBatchItem painting this electrode instead of the view, if any
 
         self.electrode = electrode
         self.id = id_
@@ -358,6 +359,17 @@ class ElectrodeView(QGraphicsPathItem):
         # anchor — load-time and refresh placement must match.
         self.text_path.setTransformOriginPoint(self.text_path.boundingRect().center())
 
+    def attach_to_batch(self, batch_item):
+        """
+        Hand fill/outline painting over to an ElectrodeBatchItem. The view keeps its path for hit testing, hover,
+        tooltips and its label but no longer paints or caches anything itself.
+        """
+        self.batch_item = batch_item
+        self.setCacheMode(QGraphicsItem.CacheMode.NoCache)
+        if self.color_stack is not None:
+            batch_item.set_color_stack(self.id, self.color_stack)
+        self.update()
+
     def rotate_electrode_text(self, angle=0):
         self.text_path.setTransformOriginPoint(self.text_path.boundingRect().center())
         self.text_path.setRotation(self.text_path.rotation() + angle)
@@ -384,9 +396,14 @@ class ElectrodeView(QGraphicsPathItem):
             return
         # set the color stack: supports only two elements right now.
         self.color_stack = colors
-        self.update()
+        if self.batch_item is not None:
+            self.batch_item.set_color_stack(self.id, colors)
+        else:
+            self.update()
 
     def paint(self, painter, option, widget):
+        if self.batch_item is not None:
+            return
 
         # if only one element, then only base color given
         painter.fillPath(self.path, self.color_stack[0])
@@ -416,7 +433,7 @@ class ElectrodeView(QGraphicsPathItem):
             # One shared key: a redraw touches every electrode at once, so
             # per-id keys would still emit one line per electrode.
             debug_throttled(logger, "tooltip_redraw",
-                            f"{self.id}: Redrew electrode tooltip")
+                            "%s: Redrew electrode tooltip", self.id)
 
     def toggle_tooltip(self, checked: bool):
         if checked:
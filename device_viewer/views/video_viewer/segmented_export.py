@@ -0,0 +1,359 @@
+"""Qt-free building blocks of the parallel, segmented video export.
+
+``AlignedVideoExporter`` splits the recording's timeline into segments that
+each hold ONE region of interest (ROI keyframes bound them; long spans are
+further cut so every worker has something to do), and runs
+``export_segment`` for each in a process pool. Every segment worker owns a
+full ffmpeg decode -> numpy warp -> ffmpeg encode pipeline, so decoding,
+warping and x264 encoding scale with the cores instead of running through
+one process each. The segment files share codec parameters, so
+``concat_segments`` joins them with a stream copy (no re-encode).
+
+Because the region is constant within a segment, the whole per-pixel
+mapping -- alignment warp, crop and scale to the output size -- is
+precomputed once per segment as a ``RemapGrid`` (bilinear source indices
+and fixed-point weights); each frame is then a handful of numpy gathers.
+
+Nothing here imports Qt: the module is what spawned workers import.
+"""
+import os
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+#: Shortest segment worth a separate ffmpeg pipeline (and concat entry).
+MIN_SEGMENT_FRAMES = 300
+
+#: Segments per worker; a little over one keeps workers busy when
+#: keyframe-bounded segments have uneven lengths.
+SEGMENTS_PER_WORKER = 2
+
+#: Opaque black, like the fill of ``get_transformed_frame``.
+_BLACK = np.array([0, 0, 0, 255], dtype=np.uint8)
+
+
+def default_export_workers():
+    """Half the cores: each worker's x264 encoder is multithreaded too."""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def roi_at(roi_keyframes, position_ms):
+    """The region holding at ``position_ms`` (stepwise: latest keyframe at
+    or before it; times before the first keyframe use the first keyframe's
+    region). Mirrors VideoViewerModel.roi_at for use off the GUI thread."""
+    if not roi_keyframes:
+        return None
+    active = roi_keyframes[0][1]
+    for keyframe_ms, region in roi_keyframes:
+        if keyframe_ms > position_ms:
+            break
+        active = region
+    return active
+
+
+@dataclass
+class WarpGeometry:
+    """Where decoded frames land in the export canvas. ``matrix`` is the
+    alignment QTransform as a row-vector 3x3 (m11..m33, Qt's layout) mapping
+    ``bounding_rect`` coordinates to scene coordinates; None for raw-space
+    exports, where the canvas IS the decoded frame."""
+    source_size: Tuple[int, int]
+    scene_rect: Tuple[float, float, float, float]
+    bounding_rect: Tuple[float, float, float, float]
+    warp_size: Tuple[int, int]
+    matrix: Optional[Tuple[float, ...]] = None
+
+
+@dataclass
+class ExportSegment:
+    """Frames ``[start_frame, end_frame)`` of the recording, all cropped to
+    ``region`` (scene coordinates; None = whole canvas). ``seek_s`` is an
+    input seek landing just before the first frame."""
+    index: int
+    start_frame: int
+    end_frame: int
+    region: Optional[Tuple[float, float, float, float]]
+    seek_s: float = 0.0
+
+    @property
+    def frame_count(self):
+        return self.end_frame - self.start_frame
+
+
+@dataclass
+class SegmentJob:
+    """Everything one worker process needs (picklable)."""
+    ffmpeg: str
+    input_path: str
+    output_path: str
+    segment: ExportSegment
+    geometry: WarpGeometry
+    output_size: Tuple[int, int]
+    fps: float
+
+
+@dataclass
+class RemapGrid:
+    """Precomputed bilinear sampling of a source frame into the output:
+    four flat source pixel indices and 8-bit fixed-point weights (summing to
+    256) per output pixel, plus the output pixels that fall outside the
+    source and stay black. ``identity`` skips sampling altogether."""
+    output_size: Tuple[int, int]
+    indices: Optional[np.ndarray] = None   # (4, oh * ow) int32
+    weights: Optional[np.ndarray] = None   # (4, oh * ow, 1) uint16
+    outside: Optional[np.ndarray] = None   # flat output indices
+    identity: bool = False
+
+    def apply(self, frame: np.ndarray) -> np.ndarray:
+        """(h, w, 4) uint8 RGBA source -> (oh, ow, 4) uint8 RGBA output."""
+        if self.identity:
+            return frame
+        ow, oh = self.output_size
+        pixels = frame.reshape(-1, 4)
+        # Products stay below 255 * 256, so the sum fits uint16.
+        out = pixels[self.indices[0]].astype(np.uint16) * self.weights[0]
+        for corner in range(1, 4):
+            out += pixels[self.indices[corner]].astype(np.uint16) * self.weights[corner]
+        out = (out >> 8).astype(np.uint8)
+        if self.outside.size:
+            out[self.outside] = _BLACK
+        return out.reshape(oh, ow, 4)
+
+
+def region_pixel_rect(region, geometry: WarpGeometry):
+    """The ROI in canvas pixels (x, y, w, h), clipped to the canvas — the
+    crop ``AlignedVideoExporter`` always applied. Raises for a region that
+    lies entirely outside the canvas (it must not silently become the whole
+    frame)."""
+    ww, wh = geometry.warp_size
+    if region is None:
+        return 0, 0, ww, wh
+    sx, sy, sw, sh = geometry.scene_rect
+    scale_x = ww / sw
+    scale_y = wh / sh
+    x = int((region[0] - sx) * scale_x)
+    y = int((region[1] - sy) * scale_y)
+    w = max(1, int(region[2] * scale_x))
+    h = max(1, int(region[3] * scale_y))
+    left, top = max(x, 0), max(y, 0)
+    right, bottom = min(x + w, ww), min(y + h, wh)
+    if right <= left or bottom <= top:
+        raise RuntimeError(
+            f"Region of interest {tuple(region)} lies outside the "
+            "aligned frame — redraw it in the viewer")
+    return left, top, right - left, bottom - top
+
+
+def build_remap_grid(geometry: WarpGeometry, region, output_size) -> RemapGrid:
+    """Sampling grid for output pixel -> crop rect -> canvas -> scene ->
+    (inverse alignment transform) -> source pixel, evaluated at pixel
+    centres."""
+    ow, oh = output_size
+    src_w, src_h = geometry.source_size
+    px, py, pw, ph = region_pixel_rect(region, geometry)
+
+    if (geometry.matrix is None and (px, py, pw, ph) == (0, 0, src_w, src_h)
+            and (ow, oh) == (src_w, src_h)):
+        return RemapGrid(output_size=(ow, oh), identity=True)
+
+    # Output pixel centres in canvas pixels, then scene coordinates.
+    ww, wh = geometry.warp_size
+    sx, sy, sw, sh = geometry.scene_rect
+    u = px + (np.arange(ow, dtype=np.float64) + 0.5) * (pw / ow)
+    v = py + (np.arange(oh, dtype=np.float64) + 0.5) * (ph / oh)
+    scene_x, scene_y = np.meshgrid(sx + u * (sw / ww), sy + v * (sh / wh))
+
+    # Scene -> bounding-rect coordinates through the inverse transform
+    # (projective: divide by w).
+    if geometry.matrix is not None:
+        inverse = np.linalg.inv(np.asarray(geometry.matrix, dtype=np.float64).reshape(3, 3))
+        points = np.stack([scene_x, scene_y, np.ones_like(scene_x)], axis=-1) @ inverse
+        local_x = points[..., 0] / points[..., 2]
+        local_y = points[..., 1] / points[..., 2]
+    else:
+        local_x, local_y = scene_x, scene_y
+
+    # Bounding rect -> source pixels; shift to pixel-centre sampling.
+    bx, by, bw, bh = geometry.bounding_rect
+    source_x = (local_x - bx) * (src_w / bw) - 0.5
+    source_y = (local_y - by) * (src_h / bh) - 0.5
+
+    inside = ((source_x >= -0.5) & (source_x <= src_w - 0.5)
+              & (source_y >= -0.5) & (source_y <= src_h - 0.5)).ravel()
+
+    x0 = np.floor(source_x)
+    y0 = np.floor(source_y)
+    fx = (source_x - x0).ravel()
+    fy = (source_y - y0).ravel()
+    x0 = x0.astype(np.int64).ravel()
+    y0 = y0.astype(np.int64).ravel()
+    x1 = np.clip(x0 + 1, 0, src_w - 1)
+    y1 = np.clip(y0 + 1, 0, src_h - 1)
+    x0 = np.clip(x0, 0, src_w - 1)
+    y0 = np.clip(y0, 0, src_h - 1)
+
+    indices = np.stack([y0 * src_w + x0, y0 * src_w + x1,
+                        y1 * src_w + x0, y1 * src_w + x1]).astype(np.int32)
+
+    # 8-bit fixed point; the top-left weight absorbs the rounding so the
+    # four sum to 256 (257 at worst where it clips, still within uint16).
+    w_right = np.rint(fx * 256)
+    w_bottom = np.rint(fy * 256)
+    w11 = np.rint(fx * fy * 256)
+    w01 = w_right - w11
+    w10 = w_bottom - w11
+    w00 = np.maximum(256 - w01 - w10 - w11, 0)
+    weights = np.stack([w00, w01, w10, w11]).astype(np.uint16)[..., np.newaxis]
+
+    return RemapGrid(output_size=(ow, oh), indices=indices, weights=weights,
+                     outside=np.flatnonzero(~inside))
+
+
+def plan_segments(frame_count, fps, roi_keyframes, workers,
+                  frame_times_s: Optional[Sequence[float]] = None,
+                  min_segment_frames=MIN_SEGMENT_FRAMES) -> List[ExportSegment]:
+    """Cut ``[0, frame_count)`` into constant-region segments.
+
+    Frame ``i`` plays at ``i * 1000 / fps`` ms (the timing the serial export
+    used); a new segment starts wherever ``roi_at`` changes. Spans longer
+    than needed to give every worker ``SEGMENTS_PER_WORKER`` segments are
+    split evenly, never below ``min_segment_frames``. ``frame_times_s``
+    (seconds from the stream start, presentation order) sets each segment's
+    input seek; without it segments decode from the start."""
+    if frame_count <= 0:
+        return []
+
+    spans = []  # [start, end, region]
+    boundaries = sorted({
+        min(frame_count, max(0, int(np.ceil(keyframe_ms * fps / 1000.0))))
+        for keyframe_ms, _ in roi_keyframes
+    } | {0, frame_count})
+    for start, end in zip(boundaries, boundaries[1:]):
+        if end > start:
+            region = roi_at(roi_keyframes, start * 1000.0 / fps)
+            region = tuple(region) if region is not None else None
+            if spans and spans[-1][2] == region:
+                spans[-1][1] = end
+            else:
+                spans.append([start, end, region])
+
+    target = max(min_segment_frames, -(-frame_count // max(1, workers * SEGMENTS_PER_WORKER)))
+    segments = []
+    for start, end, region in spans:
+        pieces = max(1, (end - start) // target)
+        cuts = np.linspace(start, end, pieces + 1).round().astype(int)
+        for piece_start, piece_end in zip(cuts, cuts[1:]):
+            segments.append(ExportSegment(index=len(segments), start_frame=int(piece_start),
+                                          end_frame=int(piece_end), region=region))
+
+    if frame_times_s is not None and len(frame_times_s) >= frame_count:
+        for segment in segments:
+            if segment.start_frame:
+                # Halfway back to the previous frame: the accurate input
+                # seek then starts exactly at this segment's first frame.
+                previous, first = frame_times_s[segment.start_frame - 1:segment.start_frame + 1]
+                segment.seek_s = max(0.0, (previous + first) / 2)
+    return segments
+
+
+def _encoder_command(job: SegmentJob):
+    width, height = job.output_size
+    return [job.ffmpeg, "-y", "-hide_banner", "-loglevel", "error",
+            "-f", "rawvideo", "-vcodec", "rawvideo",
+            "-s", f"{width}x{height}",
+            "-pix_fmt", "rgba", "-r", f"{job.fps}", "-i", "-",
+            "-c:v", "libx264", "-pix_fmt", "yuv420p",
+            "-preset", "medium", "-crf", "18", job.output_path]
+
+
+def _decoder_command(job: SegmentJob):
+    segment = job.segment
+    seek = ["-ss", f"{segment.seek_s:.6f}"] if segment.seek_s > 0 else []
+    return [job.ffmpeg, "-hide_banner", "-loglevel", "error",
+            *seek, "-i", job.input_path,
+            # Emit each REAL frame exactly once: without passthrough,
+            # ffmpeg pads the VFR stream up to its (wrong) container
+            # rate hint with duplicates, stretching the export.
+            "-fps_mode", "passthrough",
+            "-frames:v", str(segment.frame_count),
+            "-f", "rawvideo", "-pix_fmt", "rgba", "-"]
+
+
+def export_segment(job: SegmentJob) -> int:
+    """Decode, warp and encode one segment (runs in a worker process).
+    Returns the number of frames written."""
+    segment = job.segment
+    grid = build_remap_grid(job.geometry, segment.region, job.output_size)
+    width, height = job.geometry.source_size
+    frame_bytes = width * height * 4
+
+    decode = encode = None
+    try:
+        decode = subprocess.Popen(_decoder_command(job), stdout=subprocess.PIPE,
+                                  stderr=subprocess.DEVNULL)
+        encode = subprocess.Popen(_encoder_command(job), stdin=subprocess.PIPE,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        buffer = bytearray(frame_bytes)
+        view = memoryview(buffer)
+        written = 0
+        while written < segment.frame_count:
+            if decode.stdout.readinto(view) < frame_bytes:
+                break
+            source = np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 4)
+            frame = grid.apply(source)
+            try:
+                encode.stdin.write(np.ascontiguousarray(frame).data)
+            except OSError:
+                # Windows reports a dead encoder pipe as EINVAL —
+                # surface ffmpeg's actual complaint instead.
+                try:
+                    encode.stdin.close()
+                    _, err = encode.communicate(timeout=5)
+                    detail = err.decode("utf-8", errors="ignore").strip()
+                except Exception:
+                    encode.kill()
+                    detail = ""
+                raise RuntimeError(
+                    f"Encoder exited at frame {segment.start_frame + written}"
+                    + (f": {detail}" if detail else " (no error output captured)"))
+            written += 1
+
+        decode.stdout.close()
+        encode.stdin.close()
+        encode.wait()
+        if encode.returncode != 0:
+            _, err = encode.communicate()
+            raise RuntimeError(err.decode("utf-8", errors="ignore")
+                               or "ffmpeg encode failed")
+        return written
+    finally:
+        for process in (decode, encode):
+            if process is not None and process.poll() is None:
+                process.kill()
+
+
+def concat_segments(ffmpeg, segment_paths, output_path):
+    """Join same-codec segment files into ``output_path`` without
+    re-encoding (ffmpeg concat demuxer, stream copy)."""
+    if len(segment_paths) == 1:
+        shutil.move(segment_paths[0], output_path)
+        return
+    fd, list_path = tempfile.mkstemp(suffix=".txt", dir=os.path.dirname(segment_paths[0]))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as list_file:
+            for path in segment_paths:
+                escaped = str(path).replace("'", "'\\''")
+                list_file.write(f"file '{escaped}'\n")
+        result = subprocess.run(
+            [ffmpeg, "-y", "-hide_banner", "-loglevel", "error",
+             "-f", "concat", "-safe", "0", "-i", list_path,
+             "-c", "copy", output_path],
+            capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or "ffmpeg concat failed")
+    finally:
+        os.remove(list_path)
@@ -1,25 +1,42 @@
 """Offline export of a recording's device-aligned and/or cropped rendition.
 
 Decodes the recording with ffmpeg, optionally warps every frame through
-the sidecar's alignment transform (the same ``get_transformed_frame`` the
-live pipeline used — skipped for raw-space exports and recordings with no
-sidecar), crops to the model's region-of-interest keyframes (stepwise
-over playback time, so the crop can follow the action), and re-encodes.
-Runs on a background thread; the GUI only receives progress strings.
+the sidecar's alignment transform (the mapping ``get_transformed_frame``
+applied in the live pipeline — skipped for raw-space exports and
+recordings with no sidecar), crops to the model's region-of-interest
+keyframes (stepwise over playback time, so the crop can follow the
+action), and re-encodes. The timeline is cut into constant-region
+segments exported in parallel worker processes and joined without
+re-encoding (see ``segmented_export``). Runs on a background thread; the
+GUI only receives progress strings.
+
+A recording's per-frame timestamp sidecar (``<video>.frames.bin``) is
+carried over to the export, whose frames match the source's one to one,
+and for constant-rate recordings it replaces the packet demux pass: the
+container time of every frame is already known.
 """
 import json
-import re
+import os
 import shutil
 import subprocess
+import tempfile
 import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
 from pathlib import Path
 
-from PySide6.QtCore import QObject, QRect, QRectF, Qt, Signal
-from PySide6.QtGui import QImage
+from PySide6.QtCore import QObject, QRectF, Signal
 
 from logger.logger_service import get_logger
+from microdrop_utils.frame_timestamps import (
+    FLAG_CONSTANT_RATE, frame_timestamps_path, load_frame_timestamps,
+)
 
-from ...utils.camera import get_transformed_frame, qtransform_deserialize
+from ...utils.camera import qtransform_deserialize
+from .segmented_export import (
+    SegmentJob, WarpGeometry, concat_segments, default_export_workers,
+    export_segment, plan_segments,
+)
 
 logger = get_logger(__name__)
 
@@ -31,20 +48,6 @@ ALIGNED_EXPORT_SUFFIX = "_aligned.mkv"
 CROPPED_EXPORT_SUFFIX = "_cropped.mkv"
 
 
-def roi_at(roi_keyframes, position_ms):
-    """The region holding at ``position_ms`` (stepwise: latest keyframe at
-    or before it; times before the first keyframe use the first keyframe's
-    region). Mirrors VideoViewerModel.roi_at for use off the GUI thread."""
-    if not roi_keyframes:
-        return None
-    active = roi_keyframes[0][1]
-    for keyframe_ms, region in roi_keyframes:
-        if keyframe_ms > position_ms:
-            break
-        active = region
-    return active
-
-
 def _even(value):
     """libx264 requires even dimensions."""
     value = max(2, int(round(value)))
@@ -63,7 +66,7 @@ class AlignedVideoExporter(QObject):
     failed = Signal(str)
 
     def __init__(self, input_path, sidecar, roi_keyframes, aligned=True,
-                 ffmpeg_binary="ffmpeg", parent=None):
+                 ffmpeg_binary="ffmpeg", workers=None, parent=None):
         super().__init__(parent)
         self._input_path = str(input_path)
         self._aligned = bool(aligned) and sidecar is not None
@@ -73,6 +76,7 @@ class AlignedVideoExporter(QObject):
         self._sidecar = sidecar
         self._roi_keyframes = sorted(roi_keyframes, key=lambda kf: kf[0])
         self._ffmpeg = ffmpeg_binary
+        self._workers = workers or default_export_workers()
 
     def start(self):
         if not shutil.which(self._ffmpeg):
@@ -84,169 +88,175 @@ class AlignedVideoExporter(QObject):
     # ------------------------------------------------------------------ #
     # Worker thread                                                        #
     # ------------------------------------------------------------------ #
-    def _probe(self):
-        """(width, height, fps) — fps is the TRUE average (exact decoded
-        frame count / duration). Qt's recorder muxes variable-frame-rate
+    def _probe(self, timestamps=None):
+        """(width, height, fps, frame_times_s) — fps is the TRUE average
+        (frame count / duration). Qt's recorder muxes variable-frame-rate
         streams whose container rate hints are wrong (a 30 fps recording
         advertises 62.5), so any header-derived rate mistimes the output;
         pairing this true average with a passthrough decode keeps the
-        export's duration equal to the source's."""
+        export's duration equal to the source's.
+
+        Frames are counted from the packet timestamps (demux only, no
+        decode); sorted into presentation order and made relative to the
+        stream start, they also tell each segment worker where to seek.
+        A constant-rate recording's ``timestamps`` sidecar already gives
+        every frame's container time, so its demux pass is skipped."""
         ffprobe = str(Path(shutil.which(self._ffmpeg)).with_name("ffprobe"))
         result = subprocess.run(
             [ffprobe, "-v", "error", "-select_streams", "v:0",
-             "-count_frames", "-show_entries",
-             "stream=width,height,nb_read_frames : format=duration",
+             "-show_entries",
+             "stream=width,height : format=duration,start_time",
              "-of", "default=noprint_wrappers=1", self._input_path],
             capture_output=True, text=True)
         values = dict(line.split("=", 1)
                       for line in result.stdout.splitlines() if "=" in line)
+        container_times = (timestamps.container_times_s()
+                           if timestamps is not None else None)
+        if container_times is not None and "width" in values:
+            try:
+                return (int(values["width"]), int(values["height"]),
+                        timestamps.nominal_fps, container_times.tolist())
+            except ValueError:
+                pass  # fall through to the full probe
+        packets = subprocess.run(
+            [ffprobe, "-v", "error", "-select_streams", "v:0",
+             "-show_entries", "packet=pts_time",
+             "-of", "csv=p=0", self._input_path],
+            capture_output=True, text=True)
         try:
             width = int(values["width"])
             height = int(values["height"])
-            frame_count = int(values["nb_read_frames"])
             duration_s = float(values["duration"])
+            start_s = float(values.get("start_time") or 0.0)
+            frame_times_s = sorted(
+                float(line.strip().rstrip(",")) - start_s
+                for line in packets.stdout.splitlines()
+                if line.strip().rstrip(",") not in ("", "N/A"))
         except (KeyError, ValueError) as e:
             raise RuntimeError(
                 f"Could not probe the recording ({e}): {result.stderr.strip()}")
-        fps = (frame_count / duration_s if duration_s > 0
+        if not frame_times_s:
+            raise RuntimeError(
+                f"Could not probe the recording (no video packets): "
+                f"{packets.stderr.strip()}")
+        fps = (len(frame_times_s) / duration_s if duration_s > 0
                else FALLBACK_EXPORT_FPS)
-        return width, height, fps
+        return width, height, fps, frame_times_s
+
+    def _geometry(self, width, height):
+        """The export canvas for this job as a Qt-free WarpGeometry."""
+        if not self._aligned:
+            # Raw space: no warp — regions are in frame pixels, the
+            # canvas IS the decoded frame.
+            frame_rect = (0.0, 0.0, float(width), float(height))
+            return WarpGeometry(source_size=(width, height),
+                                scene_rect=frame_rect,
+                                bounding_rect=frame_rect,
+                                warp_size=(width, height))
+        transform = qtransform_deserialize(
+            json.dumps(self._sidecar["transform"]))
+        bounding = QRectF(*self._sidecar["bounding_rect"])
+        scene_rect = QRectF(*self._sidecar["scene_bounding_rect"])
+        return WarpGeometry(
+            source_size=(width, height),
+            scene_rect=scene_rect.getRect(),
+            bounding_rect=bounding.getRect(),
+            # Warp canvas at 1:1 scene scale, so ROI scene coordinates
+            # map directly onto warped pixels (minus the scene origin).
+            warp_size=(_even(scene_rect.width()), _even(scene_rect.height())),
+            matrix=(transform.m11(), transform.m12(), transform.m13(),
+                    transform.m21(), transform.m22(), transform.m23(),
+                    transform.m31(), transform.m32(), transform.m33()))
 
     def _run(self):
-        decode = encode = None
+        segment_dir = None
         try:
-            width, height, fps = self._probe()
-            if self._aligned:
-                transform = qtransform_deserialize(
-                    json.dumps(self._sidecar["transform"]))
-                bounding = QRectF(*self._sidecar["bounding_rect"])
-                scene_rect = QRectF(*self._sidecar["scene_bounding_rect"])
-                # Warp canvas at 1:1 scene scale, so ROI scene coordinates
-                # map directly onto warped pixels (minus the scene origin).
-                warp_size = (_even(scene_rect.width()),
-                             _even(scene_rect.height()))
-            else:
-                # Raw space: no warp — regions are in frame pixels, the
-                # "warp" IS the decoded frame.
-                transform = bounding = None
-                scene_rect = QRectF(0, 0, width, height)
-                warp_size = (width, height)
+            timestamps = load_frame_timestamps(self._input_path)
+            width, height, fps, frame_times_s = self._probe(timestamps)
+            geometry = self._geometry(width, height)
             # Constant output size (a video can't change resolution):
             # the FIRST region's size, or the full frame when no regions.
             if self._roi_keyframes:
                 first_region = self._roi_keyframes[0][1]
                 output_size = (_even(first_region[2]), _even(first_region[3]))
             else:
-                output_size = (_even(warp_size[0]), _even(warp_size[1]))
-
-            decode = subprocess.Popen(
-                [self._ffmpeg, "-hide_banner", "-loglevel", "error",
-                 "-i", self._input_path,
-                 # Emit each REAL frame exactly once: without passthrough,
-                 # ffmpeg pads the VFR stream up to its (wrong) container
-                 # rate hint with duplicates, stretching the export.
-                 "-fps_mode", "passthrough",
-                 "-f", "rawvideo", "-pix_fmt", "rgba", "-"],
-                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
-            encode = subprocess.Popen(
-                [self._ffmpeg, "-y", "-hide_banner", "-loglevel", "error",
-                 "-f", "rawvideo", "-vcodec", "rawvideo",
-                 "-s", f"{output_size[0]}x{output_size[1]}",
-                 "-pix_fmt", "rgba", "-r", f"{fps}", "-i", "-",
-                 "-c:v", "libx264", "-pix_fmt", "yuv420p",
-                 "-preset", "medium", "-crf", "18", self._output_path],
-                stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE)
-
-            frame_bytes = width * height * 4
-            frame_index = 0
-            while True:
-                chunk = decode.stdout.read(frame_bytes)
-                if len(chunk) < frame_bytes:
-                    break
-                source = QImage(chunk, width, height,
-                                QImage.Format_RGBA8888)
-                if self._aligned:
-                    warped = get_transformed_frame(
-                        source, scene_rect, bounding, transform, warp_size)
-                else:
-                    warped = source
-                frame = self._crop_frame(warped, scene_rect, warp_size,
-                                         output_size,
-                                         frame_index * 1000.0 / fps)
-                frame_data = frame.constBits()
-                expected_bytes = output_size[0] * output_size[1] * 4
-                if frame_data is None or len(frame_data) != expected_bytes:
-                    raise RuntimeError(
-                        f"Frame {frame_index} produced "
-                        f"{0 if frame_data is None else len(frame_data)} "
-                        f"bytes (expected {expected_bytes})")
-                try:
-                    encode.stdin.write(frame_data)
-                except OSError:
-                    # Windows reports a dead encoder pipe as EINVAL —
-                    # surface ffmpeg's actual complaint instead.
-                    try:
-                        encode.stdin.close()
-                        _, err = encode.communicate(timeout=5)
-                        detail = err.decode("utf-8", errors="ignore").strip()
-                    except Exception:
-                        encode.kill()
-                        detail = ""
-                    raise RuntimeError(
-                        f"Encoder exited at frame {frame_index}"
-                        + (f": {detail}" if detail
-                           else " (no error output captured)"))
-                frame_index += 1
-                if frame_index % 60 == 0:
-                    self.progress.emit(
-                        f"Exporting… {frame_index / fps:.0f}s processed")
-
-            decode.stdout.close()
-            encode.stdin.close()
-            encode.wait()
-            if encode.returncode != 0:
-                _, err = encode.communicate()
-                raise RuntimeError(err.decode("utf-8", errors="ignore")
-                                   or "ffmpeg encode failed")
+                output_size = (_even(geometry.warp_size[0]),
+                               _even(geometry.warp_size[1]))
+
+            segments = plan_segments(len(frame_times_s), fps,
+                                     self._roi_keyframes, self._workers,
+                                     frame_times_s=frame_times_s)
+            # Segment files sit next to the output so the final concat is
+            # a same-disk stream copy.
+            segment_dir = tempfile.mkdtemp(
+                prefix=".export-", dir=str(Path(self._output_path).parent))
+            jobs = [SegmentJob(ffmpeg=self._ffmpeg,
+                               input_path=self._input_path,
+                               output_path=os.path.join(
+                                   segment_dir, f"segment_{seg.index:04d}.mkv"),
+                               segment=seg, geometry=geometry,
+                               output_size=output_size, fps=fps)
+                    for seg in segments]
+            logger.info(f"Exporting {len(frame_times_s)} frames in "
+                        f"{len(jobs)} segments on {self._workers} workers")
+
+            self._export_segments(jobs, fps)
+            concat_segments(self._ffmpeg, [job.output_path for job in jobs],
+                            self._output_path)
+            self._write_frame_timestamps(timestamps, len(frame_times_s), fps)
             logger.info(f"Export complete: {self._output_path}")
             self.finished.emit(self._output_path)
         except Exception as e:
             logger.error(f"Aligned export failed: {e}", exc_info=True)
             self.failed.emit(str(e))
         finally:
-            for process in (decode, encode):
-                if process is not None and process.poll() is None:
-                    process.kill()
-
-    def _crop_frame(self, warped, scene_rect, warp_size, output_size,
-                    position_ms):
-        """Crop the warped frame to the region holding at ``position_ms``
-        (scene coords -> warp pixels), scaled to the constant output size."""
-        region = roi_at(self._roi_keyframes, position_ms)
-        if region is None:
-            frame = warped
-        else:
-            scale_x = warp_size[0] / scene_rect.width()
-            scale_y = warp_size[1] / scene_rect.height()
-            pixel_rect = QRect(
-                int((region[0] - scene_rect.x()) * scale_x),
-                int((region[1] - scene_rect.y()) * scale_y),
-                max(1, int(region[2] * scale_x)),
-                max(1, int(region[3] * scale_y)),
-            ).intersected(QRect(0, 0, warp_size[0], warp_size[1]))
-            if pixel_rect.isEmpty():
-                # A region entirely outside the frame must not silently
-                # become "everything": QImage.copy(emptyRect) copies the
-                # WHOLE image.
-                raise RuntimeError(
-                    f"Region of interest {tuple(region)} lies outside the "
-                    "aligned frame — redraw it in the viewer")
-            frame = warped.copy(pixel_rect)
-        if (frame.width(), frame.height()) != output_size:
-            frame = frame.scaled(output_size[0], output_size[1],
-                                 Qt.AspectRatioMode.IgnoreAspectRatio,
-                                 Qt.TransformationMode.SmoothTransformation)
-        if frame.format() != QImage.Format_RGBA8888:
-            frame = frame.convertToFormat(QImage.Format_RGBA8888)
-        return frame
+            if segment_dir is not None:
+                shutil.rmtree(segment_dir, ignore_errors=True)
+
+    def _export_segments(self, jobs, fps):
+        """Run the segment jobs — in-process for a single segment, else in
+        a process pool — emitting progress as segments complete."""
+        if len(jobs) == 1:
+            self._check_segment(jobs[0], export_segment(jobs[0]))
+            return
+        frames_done = 0
+        with ProcessPoolExecutor(max_workers=min(self._workers, len(jobs))) as pool:
+            futures = {pool.submit(export_segment, job): job for job in jobs}
+            try:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    written = future.result()
+                    self._check_segment(futures[future], written)
+                    frames_done += written
+                    self.progress.emit(
+                        f"Exporting… {frames_done / fps:.0f}s processed "
+                        f"({done}/{len(jobs)} segments)")
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _write_frame_timestamps(self, timestamps, frame_count, fps):
+        """Give the export its source's capture times — but only when the
+        sidecar describes exactly the frames the export decoded. The export
+        itself is muxed at a constant ``fps``."""
+        if timestamps is None:
+            return
+        if timestamps.frame_count != frame_count:
+            logger.warning(
+                f"Frame timestamp sidecar lists {timestamps.frame_count} "
+                f"frames, the recording has {frame_count}; not carried over")
+            return
+        try:
+            replace(timestamps, nominal_fps=fps, flags=FLAG_CONSTANT_RATE).write(
+                frame_timestamps_path(self._output_path))
+        except OSError as e:
+            logger.warning(f"Could not write the export's frame timestamps: {e}")
+
+    @staticmethod
+    def _check_segment(job, written):
+        """A short segment means the seek or the decode went wrong; the
+        concatenated export would silently lose frames."""
+        if written != job.segment.frame_count:
+            raise RuntimeError(
+                f"Segment {job.segment.index} decoded {written} of "
+                f"{job.segment.frame_count} frames")
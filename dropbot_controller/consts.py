@@ -6,6 +6,12 @@ PKG_name = PKG.title().replace("_", " ")
 # dropbot DB3-120 hardware id
 DROPBOT_DB3_120_HWID = 'VID:PID=16C0:0483'
 
+# Seconds between DropBot port scans while disconnected. With serial hotplug
+# events available (udev) a plugged-in DropBot is picked up as its port
+# appears, and the scan only backs the events up at the slower rate.
+DROPBOT_PORT_SCAN_INTERVAL_S = 2
+DROPBOT_PORT_EVENT_BACKUP_SCAN_INTERVAL_S = 10
+
 # Chip may have been inserted before connecting, so `chip-inserted`
 # event may have been missed.
 # Explicitly check if chip is inserted by reading **active low**
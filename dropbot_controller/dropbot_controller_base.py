@@ -60,6 +60,7 @@ class DropbotControllerBase(HasTraits):
     def cleanup(self):
         """Cleanup resources when the controller is stopped."""
         logger.info("Cleaning up DropbotController resources")
+        self._stop_phase_schedule()
         if self.proxy is not None:
             try:
                 self.proxy.terminate()
@@ -214,6 +215,7 @@ class DropbotControllerBase(HasTraits):
 
             # reset to last known state
             self.proxy.turn_off_all_channels()
+            self.applied_channels = None
 
             # Publish disabled channels state so the device viewer syncs with the (now reset) hardware
             self._publish_disabled_channels_from_mask()
@@ -340,11 +342,22 @@ class DropbotControllerBase(HasTraits):
         except Exception as e:
             logger.error(f"Error publishing disabled channels from mask: {e}", exc_info=True)
 
+    def _stop_phase_schedule(self):
+        """Stop a phase schedule playing on the electrode controller service, when that mixin is loaded."""
+        stop_phase_schedule = getattr(self, "stop_phase_schedule", None)
+        if stop_phase_schedule is not None:
+            stop_phase_schedule()
+
     def on_refresh_channels_request(self):
+        # A playing phase schedule would re-actuate channels right after they are turned off below (halt path).
+        self._stop_phase_schedule()
         # XXX Reassign channel states to trigger a `channels-updated`
         # message since actuated channel states may have changed based
         # on the channels that were disabled.
         self.proxy.turn_off_all_channels()
+        # Channels are all off now, so the re-published request below must actuate even though it repeats
+        # the last one (see ElectrodeStateChangeMixinService.applied_channels).
+        self.applied_channels = None
 
         publish_message(topic=ELECTRODES_STATE_CHANGE, message=app_globals.get("last_channels_requested", []))
 
@@ -1,9 +1,11 @@
 import time
 import functools
+from datetime import datetime
 
 import dropbot
 from traits.api import provides, HasTraits, Bool, Instance, Str
 from apscheduler.events import EVENT_JOB_EXECUTED
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.schedulers.base import STATE_STOPPED, STATE_RUNNING, STATE_PAUSED
@@ -11,11 +13,14 @@ from apscheduler.schedulers.base import STATE_STOPPED, STATE_RUNNING, STATE_PAUS
 from microdrop_utils.dramatiq_pub_sub_helpers import publish_message
 from logger.logger_service import get_logger
 from microdrop_utils.dramatiq_dropbot_serial_proxy import DramatiqDropbotSerialProxy
-from microdrop_utils.hardware_device_monitoring_helpers import check_devices_available
+from microdrop_utils.hardware_device_monitoring_helpers import (
+    SerialPortWatcher, check_devices_available, port_matches_hwids,
+)
 from ..interfaces.i_dropbot_control_mixin_service import IDropbotControlMixinService
 
 from ..consts import NO_DROPBOT_AVAILABLE, SHORTS_DETECTED, NO_POWER, DROPBOT_DB3_120_HWID, RETRY_CONNECTION, \
-    OUTPUT_ENABLE_PIN, CHIP_INSERTED, DROPBOT_CONNECTED, DROPBOT_ERROR, DROPBOT_DISCONNECTED, REALTIME_MODE_UPDATED
+    OUTPUT_ENABLE_PIN, CHIP_INSERTED, DROPBOT_CONNECTED, DROPBOT_ERROR, DROPBOT_DISCONNECTED, REALTIME_MODE_UPDATED, \
+    DROPBOT_PORT_SCAN_INTERVAL_S, DROPBOT_PORT_EVENT_BACKUP_SCAN_INTERVAL_S
 
 logger = get_logger(__name__)
 
@@ -52,6 +57,11 @@ class DropbotMonitorMixinService(HasTraits):
     monitor_scheduler = Instance(BackgroundScheduler,
                                  desc="An AP scheduler job to periodically look for dropbot connected ports."
                                  )
+    port_watcher = Instance(SerialPortWatcher,
+                            desc="Serial hotplug watcher checking a DropBot port as soon as it appears; "
+                                 "None where hotplug events are unavailable (periodic scans only)."
+                            )
+    use_port_events = Bool(True, desc="Watch serial hotplug events where the platform supports them")
     _error_shown = Bool(False)  # Track if we've shown the error for current disconnection
     _no_power = Bool(False) 
 
@@ -105,15 +115,27 @@ class DropbotMonitorMixinService(HasTraits):
                     self._error_shown = True
                 return None
 
-        scheduler = BackgroundScheduler()
+        watcher = None
+        if self.use_port_events:
+            watcher = SerialPortWatcher(hwids_to_check, on_port_added=self._on_dropbot_port_added)
+        scan_interval = DROPBOT_PORT_SCAN_INTERVAL_S
+
+        # One worker: scans and hotplug checks run one at a time, so they never race to connect.
+        scheduler = BackgroundScheduler(executors={"default": ThreadPoolExecutor(max_workers=1)})
+        self.monitor_scheduler = scheduler
+        if watcher is not None and watcher.start():
+            self.port_watcher = watcher
+            scan_interval = DROPBOT_PORT_EVENT_BACKUP_SCAN_INTERVAL_S
         scheduler.add_job(
             func=check_devices_with_error_handling,
-            trigger=IntervalTrigger(seconds=2),
+            trigger=IntervalTrigger(seconds=scan_interval),
+            # scan right away: an already plugged-in DropBot raises no hotplug event
+            next_run_time=datetime.now(),
         )
         scheduler.add_listener(self._on_dropbot_port_found, EVENT_JOB_EXECUTED)
-        self.monitor_scheduler = scheduler
 
-        logger.info("DropBot monitor created and started")
+        logger.info(f"DropBot monitor created and started "
+                    f"({'hotplug events + ' if self.port_watcher else ''}scan every {scan_interval} s)")
         # self._error_shown = False  # Reset error state when starting monitoring
         self.monitor_scheduler.start()
 
@@ -174,7 +196,31 @@ class DropbotMonitorMixinService(HasTraits):
         except Exception as e:
             logger.warning(f"Could not read hardware limits from proxy config: {e}")
 
+    def cleanup(self):
+        """Stop watching serial hotplug events before the base cleanup terminates the proxy."""
+        if self.port_watcher is not None:
+            self.port_watcher.stop()
+            self.port_watcher = None
+        super().cleanup()
+
     ################################# Protected methods ######################################
+    def _on_dropbot_port_added(self, port):
+        """
+        Port watcher thread: a port with a DropBot hwid appeared. Check just that port now, as a one-off job on the
+        monitor's (single) worker, so the result goes through _on_dropbot_port_found like a scan's would.
+        Ignored unless the monitor is searching (it is paused while connected).
+        """
+        scheduler = self.monitor_scheduler
+        if scheduler is None or scheduler.state != STATE_RUNNING:
+            return
+        logger.info(f"DropBot port {port} appeared; checking it now")
+        scheduler.add_job(func=self._check_added_port, args=[port, self.port_watcher.hwids])
+
+    @staticmethod
+    def _check_added_port(port, hwids):
+        """The port, if it is still there (it may have bounced while the job was queued)."""
+        return port if port_matches_hwids(port, hwids) else None
+
     def _on_dropbot_port_found(self, event):
         """
         Method defining what to do when dropbot has been found on a port.
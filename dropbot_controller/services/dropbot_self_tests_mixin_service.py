@@ -125,8 +125,14 @@ class DropbotSelfTestsMixinService(HasTraits):
 
             logger.info(f"Running test: {test_name}, with output path in: {report_path}")
             self._self_test_cancelled = False
-            with self.proxy.signals.signal('shorts-detected').muted():
-                result = self._self_test(self.proxy, tests=tests, report_path=report_path)
+            # The tests switch channels directly, so the last actuation the electrode state service remembers no
+            # longer describes the hardware (see ElectrodeStateChangeMixinService.applied_channels).
+            self.applied_channels = None
+            try:
+                with self.proxy.signals.signal('shorts-detected').muted():
+                    result = self._self_test(self.proxy, tests=tests, report_path=report_path)
+            finally:
+                self.applied_channels = None
 
             if report_path is not None:
                 logger.info(f"Report generating in the file {report_path}")
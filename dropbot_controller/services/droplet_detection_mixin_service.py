@@ -72,6 +72,9 @@ class DropletDetectionMixinService(HasTraits):
         last_error: Optional[Exception] = None
         total_attempts = self._max_detection_retries + 1
 
+        # Capacitance measurements switch channels: the next actuation request must not be skipped as unchanged
+        # (see ElectrodeStateChangeMixinService.applied_channels).
+        self.applied_channels = None
         with self._detection_context(self.proxy) as proxy:
             for attempt in range(total_attempts):
                 try:
@@ -0,0 +1,40 @@
+"""Self-tests switch channels directly: the electrode state service's record
+of the last actuation (applied_channels) must be cleared around them, or the
+next actuation request repeating it would be skipped as unchanged."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+self_tests_module = pytest.importorskip("dropbot_controller.services.dropbot_self_tests_mixin_service")
+
+
+def _make_service():
+    svc = self_tests_module.DropbotSelfTestsMixinService()
+    svc.proxy = MagicMock()
+    svc.applied_channels = frozenset({1, 2})
+    return svc
+
+
+def test_self_test_clears_applied_channels_before_and_after():
+    svc = _make_service()
+    seen = []
+
+    def fake_self_test(proxy, tests=None, report_path=None):
+        seen.append(svc.applied_channels)
+        svc.applied_channels = frozenset({1, 2})  # e.g. an actuation racing the test
+        svc.cancel_self_test()
+        return {}
+
+    with patch.object(svc, "_self_test", side_effect=fake_self_test):
+        svc.on_test_channels_request("unused")
+
+    assert seen == [None]
+    assert svc.applied_channels is None
+
+
+def test_failed_self_test_still_clears_applied_channels():
+    svc = _make_service()
+    with patch.object(svc, "_self_test", side_effect=RuntimeError("board unplugged")):
+        with pytest.raises(RuntimeError):
+            svc.on_test_channels_request("unused")
+    assert svc.applied_channels is None
@@ -2,13 +2,23 @@
 PKG = '.'.join(__name__.split('.')[:-1])
 PKG_name = PKG.title().replace("_", " ")
 
-from electrode_controller.models import ElectrodeStateChangePublisher, ElectrodeDisableRequestPublisher, DisabledChannelsChangedPublisher
+from electrode_controller.models import ElectrodeStateChangePublisher, ElectrodeDisableRequestPublisher, DisabledChannelsChangedPublisher, \
+    ElectrodePhaseSchedulePublisher, ElectrodePhaseScheduleControlPublisher, ElectrodePhaseProgressPublisher
 from dropbot_controller.consts import DISABLED_CHANNELS_CHANGED
 
 ELECTRODES_STATE_CHANGE = 'hardware/requests/electrodes_state_change'
 ELECTRODES_DISABLE_REQUEST = 'hardware/requests/electrodes_disable'
 ELECTRODES_STATE_APPLIED = 'hardware/electrodes_state_applied'
 
+# A whole step's phases (channel sets + durations) played back by the electrode controller with local timing;
+# progress is streamed back per phase. The control topic stops / pauses / resumes the playing schedule.
+ELECTRODES_PHASE_SCHEDULE_REQUEST = 'hardware/requests/electrodes_phase_schedule'
+ELECTRODES_PHASE_SCHEDULE_CONTROL = 'hardware/requests/electrodes_phase_schedule_control'
+ELECTRODES_PHASE_PROGRESS = 'hardware/electrodes_phase_progress'
+
 electrode_state_change_publisher = ElectrodeStateChangePublisher(topic=ELECTRODES_STATE_CHANGE)
 electrode_disable_request_publisher = ElectrodeDisableRequestPublisher(topic=ELECTRODES_DISABLE_REQUEST)
-disabled_channels_changed_publisher = DisabledChannelsChangedPublisher(topic=DISABLED_CHANNELS_CHANGED)
\ No newline at end of file
+disabled_channels_changed_publisher = DisabledChannelsChangedPublisher(topic=DISABLED_CHANNELS_CHANGED)
+electrode_phase_schedule_publisher = ElectrodePhaseSchedulePublisher(topic=ELECTRODES_PHASE_SCHEDULE_REQUEST)
+electrode_phase_schedule_control_publisher = ElectrodePhaseScheduleControlPublisher(topic=ELECTRODES_PHASE_SCHEDULE_CONTROL)
+electrode_phase_progress_publisher = ElectrodePhaseProgressPublisher(topic=ELECTRODES_PHASE_PROGRESS)
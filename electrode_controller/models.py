@@ -1,4 +1,6 @@
-from pydantic import BaseModel, StrictInt, field_validator
+from typing import Literal
+
+from pydantic import BaseModel, NonNegativeFloat, StrictInt, field_validator, model_validator
 from pydantic_core.core_schema import ValidationInfo
 from microdrop_utils.dramatiq_pub_sub_helpers import ValidatedTopicPublisher
 
@@ -36,6 +38,62 @@ class ElectrodeChannelsRequest(BaseModel):
 
         return values
 
+class ElectrodePhaseScheduleRequest(BaseModel):
+    """
+    A whole step's phase schedule, played back by the electrode controller.
+
+    ``phases[i]`` is the set of channels actuated during phase i and
+    ``durations_s[i]`` how long that phase is held. Channel bounds are
+    checked against the ``max_channels`` context like ElectrodeChannelsRequest.
+
+    Examples:
+        >>> request = ElectrodePhaseScheduleRequest.model_validate(
+        ...     {"schedule_id": "a", "phases": [[1], [2]], "durations_s": [0.1, 0.1]},
+        ...     context={'max_channels': 5}
+        ... )
+        >>> request.phases
+        [{1}, {2}]
+    """
+    schedule_id: str
+    phases: list[set[StrictInt]]
+    durations_s: list[NonNegativeFloat]
+
+    @field_validator("phases")
+    @classmethod
+    def validate_channel_bounds(cls, values: list[set[int]], info: ValidationInfo):
+        for channels in values:
+            ElectrodeChannelsRequest.validate_channel_bounds(channels, info)
+        return values
+
+    @model_validator(mode="after")
+    def validate_lengths(self):
+        if len(self.phases) != len(self.durations_s):
+            raise ValueError(f"{len(self.phases)} phases but {len(self.durations_s)} durations.")
+        return self
+
+
+class ElectrodePhaseScheduleControl(BaseModel):
+    """Stop, pause or resume the schedule ``schedule_id`` while it plays."""
+    schedule_id: str
+    action: Literal["stop", "pause", "resume"]
+
+
+class ElectrodePhaseProgress(BaseModel):
+    """
+    Progress of a playing phase schedule.
+
+    ``state`` is "phase" each time phase ``phase_index`` (0-based) has been
+    actuated (``actuated``: channels the hardware accepted), then one of
+    "done", "stopped" or "error" (with ``detail``) when playback ends.
+    """
+    schedule_id: str
+    state: Literal["phase", "done", "stopped", "error"]
+    phase_index: int = -1
+    phase_total: int = 0
+    actuated: int = 0
+    detail: str = ""
+
+
 class ElectrodeStateChangePublisher(ValidatedTopicPublisher):
     validator_class = ElectrodeChannelsRequest
 
@@ -73,3 +131,28 @@ class DisabledChannelsChangedPublisher(ValidatedTopicPublisher):
         Construct payload for publisher using the disabled channels set.
         """
         super().publish({"channels": disabled_channels}, *args, **kwargs)
+
+
+class ElectrodePhaseSchedulePublisher(ValidatedTopicPublisher):
+    validator_class = ElectrodePhaseScheduleRequest
+
+    def publish(self, schedule_id: str, phases: list[set[int]], durations_s: list[float], *args, **kwargs):
+        super().publish({"schedule_id": schedule_id, "phases": phases, "durations_s": durations_s},
+                        *args, **kwargs)
+
+
+class ElectrodePhaseScheduleControlPublisher(ValidatedTopicPublisher):
+    validator_class = ElectrodePhaseScheduleControl
+
+    def publish(self, schedule_id: str, action: str, *args, **kwargs):
+        super().publish({"schedule_id": schedule_id, "action": action}, *args, **kwargs)
+
+
+class ElectrodePhaseProgressPublisher(ValidatedTopicPublisher):
+    validator_class = ElectrodePhaseProgress
+
+    def publish(self, schedule_id: str, state: str, *args, phase_index: int = -1, phase_total: int = 0,
+                actuated: int = 0, detail: str = "", **kwargs):
+        super().publish({"schedule_id": schedule_id, "state": state, "phase_index": phase_index,
+                         "phase_total": phase_total, "actuated": actuated, "detail": detail},
+                        *args, **kwargs)
@@ -56,6 +56,8 @@ class ElectrodeDisableMixinService(HasTraits):
                 mask[disabled_channels] = 1
 
                 self.proxy.disabled_channels_mask = mask
+                # The hardware may now actuate a different subset of the requested channels.
+                self.applied_channels = None
 
                 logger.info(f"Disabled channels mask updated: {len(disabled_channels)} channels disabled: {disabled_channels}")
 
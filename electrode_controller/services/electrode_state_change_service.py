@@ -1,6 +1,11 @@
 # library imports
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from traits.api import provides, HasTraits, Str, Int, Dict
+from traits.api import provides, HasTraits, Str, Int, Dict, Instance, Any, observe
+from traits.observation.api import trait
 
 # interface imports from microdrop plugins
 from dropbot_controller.interfaces.i_dropbot_control_mixin_service import IDropbotControlMixinService
@@ -8,8 +13,9 @@ from dropbot_controller.interfaces.i_dropbot_control_mixin_service import IDropb
 from dropbot.threshold import actuate_channels
 
 from microdrop_utils.dramatiq_pub_sub_helpers import publish_message
-from ..models import ElectrodeChannelsRequest
-from ..consts import disabled_channels_changed_publisher, ELECTRODES_STATE_APPLIED
+from ..models import ElectrodeChannelsRequest, ElectrodePhaseScheduleRequest, ElectrodePhaseScheduleControl
+from ..consts import disabled_channels_changed_publisher, ELECTRODES_STATE_APPLIED, electrode_phase_progress_publisher
+from .phase_sequencer import PhaseSequencer
 # microdrop utils imports
 from logger.logger_service import get_logger
 
@@ -19,9 +25,12 @@ from microdrop_application.helpers import get_microdrop_redis_globals_manager
 app_globals = get_microdrop_redis_globals_manager()
 
 from pydantic import (
-    ValidationError
+    TypeAdapter, ValidationError
 )
 
+# Built once: every state change request is validated by the same compiled validator.
+_channels_request_adapter = TypeAdapter(ElectrodeChannelsRequest)
+
 
 @provides(IDropbotControlMixinService)
 class ElectrodeStateChangeMixinService(HasTraits):
@@ -35,6 +44,34 @@ class ElectrodeStateChangeMixinService(HasTraits):
     id = Str('electrode_state_change_mixin_service')
     name = Str('Electrode state change Mixin')
     message_context = Dict(Str, Int, desc="Context for message context. Max channels index for instance")
+    phase_sequencer = Instance(PhaseSequencer, desc="Plays phase schedules requested on ELECTRODES_PHASE_SCHEDULE_REQUEST")
+    applied_channels = Any(None, desc="frozenset of the channels last requested and actuated, or None when the "
+                                      "hardware state is unknown (forces the next request to actuate). Anything "
+                                      "switching channels on the proxy directly must reset it to None")
+    applied_count = Int(0, desc="Number of channels the hardware accepted for applied_channels")
+
+    # Latest-wins store of last_channels_requested into the Redis globals, off the acknowledgement path.
+    _globals_writer = Instance(ThreadPoolExecutor)
+    _globals_lock = Instance(threading.Lock, ())
+    _pending_last_request = Any(None)
+
+    def __globals_writer_default(self):
+        return ThreadPoolExecutor(max_workers=1, thread_name_prefix="electrode-globals")
+
+    @observe(trait("realtime_mode", optional=True) | trait("dropbot_connection_active", optional=True)
+             | trait("proxy", optional=True))
+    def _hardware_state_changed(self, event):
+        self.applied_channels = None
+        # Realtime mode off, a disconnect or a new proxy ends the playing schedule. Not waited for: this can run
+        # under proxy.transaction_lock, which the sequencer thread may be waiting on (it then refuses to actuate,
+        # see _actuate_phase).
+        self.stop_phase_schedule(timeout_s=0)
+
+    def stop_phase_schedule(self, timeout_s: float = 5.0):
+        """Stop the playing phase schedule, if any, waiting up to ``timeout_s`` for its thread."""
+        if self.phase_sequencer is not None and self.phase_sequencer.running:
+            logger.info(f"Stopping phase schedule {self.phase_sequencer.schedule_id}")
+            self.phase_sequencer.stop(timeout_s=timeout_s)
 
     ######################################## Methods to Expose #############################################
 
@@ -48,30 +85,41 @@ class ElectrodeStateChangeMixinService(HasTraits):
                 logger.warning("Cannot process actuations since realtime mode is disabled. Will process message when realtime mode on")
                 return
 
-            # Use safe proxy access for electrode state changes
-            with self.proxy.transaction_lock:
+            # A direct actuation request takes over from a playing phase schedule.
+            if self.phase_sequencer is not None and self.phase_sequencer.running:
+                self.phase_sequencer.stop()
 
-                if not self.message_context:
+            if not self.message_context:
+                with self.proxy.transaction_lock:
                     self.message_context = {"max_channels": self.proxy.number_of_channels}
 
-                # Validate message
-                model = ElectrodeChannelsRequest.model_validate_json(
-                    message,
-                    context=self.message_context,
-                )
-
-                actuated_channels = actuate_channels(self.proxy, list(model.channels), timeout=5, allow_disabled=True)
+            # Validate message
+            model = _channels_request_adapter.validate_json(message, context=self.message_context)
+            channels = frozenset(model.channels)
 
-                app_globals["last_channels_requested"] = message
-
-                active_channels = self.proxy.state_of_channels.sum()
-                logger.info(f"{active_channels} channels actuated: {actuated_channels}")
-                logger.debug(f"{self.proxy.state_of_channels}")
+            # Use safe proxy access for electrode state changes. The unchanged-channels check runs under the same
+            # lock, so it cannot pass while another holder of the lock is switching channels.
+            with self.proxy.transaction_lock:
+                if channels == self.applied_channels:
+                    # Same channels as the last actuation (e.g. consecutive phases sharing electrodes): nothing to
+                    # change on the hardware or in the globals, just acknowledge.
+                    logger.debug(f"Channels unchanged, skipping actuation: {sorted(channels)}")
+                    publish_message(str(self.applied_count), topic=ELECTRODES_STATE_APPLIED)
+                    return
+
+                self.applied_channels = None
+                actuated_channels = actuate_channels(self.proxy, list(channels), timeout=5, allow_disabled=True)
+                self.applied_channels = channels
+                self.applied_count = len(actuated_channels)
+
+                logger.info(f"{len(actuated_channels)} channels actuated: {actuated_channels}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"{self.proxy.state_of_channels}")
 
                 # If requested vs actuated channel counts differ, some channels were disabled by the hardware
-                if len(model.channels) != len(actuated_channels):
+                if len(channels) != len(actuated_channels):
                     logger.warning(
-                        f"Actuation discrepancy: requested {len(model.channels)} channels, "
+                        f"Actuation discrepancy: requested {len(channels)} channels, "
                         f"but only {len(actuated_channels)} were actuated. Checking disabled channels mask."
                     )
                     mask = np.array(self.proxy.disabled_channels_mask)
@@ -81,6 +129,8 @@ class ElectrodeStateChangeMixinService(HasTraits):
             # sending ack
             publish_message(str(len(actuated_channels)), topic=ELECTRODES_STATE_APPLIED)
 
+            self._store_last_request(message)
+
         except TimeoutError:
             logger.error("Timeout waiting for proxy access for electrode state change", exc_info=True)
         except RuntimeError as e:
@@ -89,3 +139,92 @@ class ElectrodeStateChangeMixinService(HasTraits):
             logger.error(f"Actuated channels message should be list of int between 0 and {self.message_context["max_channels"]}: {e}", exc_info=True)
         except Exception as e:
             logger.error(f"Error processing electrode state change: {e}", exc_info=True)
+
+    def _store_last_request(self, message: str):
+        """Record ``message`` as last_channels_requested in the globals on the writer thread. Requests arriving
+        while a write is queued replace it, so only the latest one is written."""
+        with self._globals_lock:
+            queued = self._pending_last_request is not None
+            self._pending_last_request = message
+        if not queued:
+            self._globals_writer.submit(self._flush_last_request)
+
+    def _flush_last_request(self):
+        with self._globals_lock:
+            message, self._pending_last_request = self._pending_last_request, None
+        try:
+            app_globals["last_channels_requested"] = message
+        except Exception as e:
+            logger.error(f"Could not store last channels requested: {e}", exc_info=True)
+
+    def on_electrodes_phase_schedule_request(self, message: str):
+        """Play a whole step's phases locally (see PhaseSequencer), streaming ELECTRODES_PHASE_PROGRESS back. A
+        schedule still playing is stopped first."""
+        try:
+            if not hasattr(self, 'proxy') or self.proxy is None:
+                logger.error("Proxy not available for phase schedule")
+                return
+
+            elif not self.realtime_mode:
+                logger.warning("Cannot play phase schedule since realtime mode is disabled")
+                return
+
+            if not self.message_context:
+                self.message_context = {"max_channels": self.proxy.number_of_channels}
+
+            model = ElectrodePhaseScheduleRequest.model_validate_json(message, context=self.message_context)
+
+            if self.phase_sequencer is None:
+                self.phase_sequencer = PhaseSequencer(self._actuate_phase, self._publish_phase_progress)
+
+            logger.info(f"Playing phase schedule {model.schedule_id}: {len(model.phases)} phases, "
+                        f"{sum(model.durations_s):.3f} s")
+            self.phase_sequencer.start(model.schedule_id, model.phases, model.durations_s)
+
+        except ValidationError as e:
+            logger.error(f"Invalid phase schedule: {e}", exc_info=True)
+        except Exception as e:
+            logger.error(f"Error starting phase schedule: {e}", exc_info=True)
+
+    def on_electrodes_phase_schedule_control_request(self, message: str):
+        """Stop, pause or resume the playing phase schedule."""
+        try:
+            model = ElectrodePhaseScheduleControl.model_validate_json(message)
+            if self.phase_sequencer is None:
+                return
+            getattr(self.phase_sequencer, model.action)(model.schedule_id)
+
+        except ValidationError as e:
+            logger.error(f"Invalid phase schedule control message: {e}", exc_info=True)
+        except Exception as e:
+            logger.error(f"Error controlling phase schedule: {e}", exc_info=True)
+
+    ######################################## Phase sequencer callbacks #############################################
+
+    def _actuate_phase(self, channels) -> int:
+        """Sequencer thread: actuate one phase. Returns the number of channels actuated. Raises (ending the
+        schedule in "error") once realtime mode is off or the device is disconnected, like a refused per-phase
+        request."""
+        with self.proxy.transaction_lock:
+            if not self.realtime_mode or not getattr(self, "dropbot_connection_active", True):
+                raise RuntimeError("Realtime mode is off or the device is disconnected; phase not actuated")
+            self.applied_channels = None
+            actuated_channels = actuate_channels(self.proxy, list(channels), timeout=5, allow_disabled=True)
+            self.applied_channels = frozenset(channels)
+            self.applied_count = len(actuated_channels)
+
+            if len(channels) != len(actuated_channels):
+                logger.warning(
+                    f"Actuation discrepancy: requested {len(channels)} channels, "
+                    f"but only {len(actuated_channels)} were actuated. Checking disabled channels mask."
+                )
+                mask = np.array(self.proxy.disabled_channels_mask)
+                disabled_indices = set(int(i) for i in np.where(mask != 0)[0])
+                disabled_channels_changed_publisher.publish(disabled_indices)
+
+        return len(actuated_channels)
+
+    def _publish_phase_progress(self, schedule_id, state, phase_index, phase_total, actuated, detail):
+        logger.debug(f"Phase schedule {schedule_id}: {state} {phase_index + 1}/{phase_total}")
+        electrode_phase_progress_publisher.publish(
+            schedule_id, state, phase_index=phase_index, phase_total=phase_total, actuated=actuated, detail=detail)
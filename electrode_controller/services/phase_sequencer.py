@@ -0,0 +1,132 @@
+"""
+Local playback of a step's electrode phase schedule.
+
+The protocol sends a whole step's phases (channel sets and durations) in one
+request; the PhaseSequencer then actuates them on its own thread against
+absolute deadlines, so phase timing depends on neither the broker round-trip
+nor the time an actuation takes. Progress is reported per phase through a
+callback, and the playing schedule can be stopped, paused and resumed.
+"""
+import threading
+import time
+from typing import Callable, Optional, Sequence
+
+from logger.logger_service import get_logger
+
+logger = get_logger(__name__)
+
+
+class PhaseSequencer:
+    """
+    Plays one phase schedule at a time on a daemon thread.
+
+    ``actuate(channels)`` applies one phase and returns the number of channels
+    the hardware accepted. ``on_progress(schedule_id, state, phase_index,
+    phase_total, actuated, detail)`` is called on the sequencer thread with
+    state "phase" after every actuation, then once with "done", "stopped" or
+    "error".
+
+    Phase i ends at the schedule's start time plus the durations of phases
+    0..i (plus any time spent paused), so a slow actuation shortens its own
+    phase instead of delaying every phase after it. While paused the current
+    phase's channels stay actuated and its remaining time is kept for resume.
+    """
+
+    def __init__(self, actuate: Callable[[Sequence[int]], int], on_progress: Callable[..., None]):
+        self._actuate = actuate
+        self._on_progress = on_progress
+
+        self._condition = threading.Condition()
+        self._thread = None
+        self._schedule_id = None
+        self._stop_requested = False
+        self._paused = False
+
+    @property
+    def schedule_id(self) -> Optional[str]:
+        """Id of the schedule playing now, or None."""
+        with self._condition:
+            return self._schedule_id if self.running else None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, schedule_id: str, phases: Sequence[Sequence[int]], durations_s: Sequence[float]):
+        """Play ``phases``; a schedule still playing is stopped first."""
+        self.stop()
+        with self._condition:
+            self._schedule_id = schedule_id
+            self._stop_requested = False
+            self._paused = False
+        self._thread = threading.Thread(
+            target=self._run, args=(schedule_id, [sorted(p) for p in phases], [float(d) for d in durations_s]),
+            daemon=True, name="electrode-phase-sequencer")
+        self._thread.start()
+
+    def stop(self, schedule_id: str = None, timeout_s: float = 5.0):
+        """Stop the playing schedule (only if it is ``schedule_id``, when given) and wait for its thread."""
+        with self._condition:
+            if schedule_id is not None and schedule_id != self._schedule_id:
+                return
+            self._stop_requested = True
+            self._condition.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout_s)
+
+    def pause(self, schedule_id: str = None):
+        self._set_paused(True, schedule_id)
+
+    def resume(self, schedule_id: str = None):
+        self._set_paused(False, schedule_id)
+
+    def _set_paused(self, paused: bool, schedule_id: Optional[str]):
+        with self._condition:
+            if schedule_id is not None and schedule_id != self._schedule_id:
+                return
+            self._paused = paused
+            self._condition.notify_all()
+
+    def _wait_until(self, deadline: float) -> Optional[float]:
+        """Sleep until ``deadline`` (time.monotonic()), holding still while paused. Returns the deadline moved by
+        the time spent paused, or None when a stop was requested."""
+        with self._condition:
+            while not self._stop_requested:
+                if self._paused:
+                    paused_at = time.monotonic()
+                    while self._paused and not self._stop_requested:
+                        self._condition.wait()
+                    deadline += time.monotonic() - paused_at
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return deadline
+                self._condition.wait(remaining)
+            return None
+
+    def _run(self, schedule_id, phases, durations_s):
+        phase_total = len(phases)
+        state, detail = "done", ""
+        deadline = time.monotonic()
+        try:
+            for phase_index, (channels, duration_s) in enumerate(zip(phases, durations_s)):
+                # Phase boundaries honour a pause requested during the previous phase.
+                deadline = self._wait_until(deadline)
+                if deadline is None:
+                    state = "stopped"
+                    break
+                actuated = self._actuate(channels)
+                self._on_progress(schedule_id, "phase", phase_index, phase_total, actuated, "")
+                deadline += duration_s
+            else:
+                if self._wait_until(deadline) is None:
+                    state = "stopped"
+        except Exception as e:
+            logger.error(f"Phase schedule {schedule_id} failed: {e}", exc_info=True)
+            state, detail = "error", str(e)
+
+        with self._condition:
+            if self._schedule_id == schedule_id:
+                self._schedule_id = None
+        self._on_progress(schedule_id, state, -1, phase_total, 0, detail)
@@ -0,0 +1,73 @@
+"""A phase schedule playing on the electrode controller must not outlive
+realtime mode: switching it off (what a halt does) ends the schedule in
+"stopped" or "error", never "done", and no phase is actuated after it."""
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from traits.api import Any, Bool
+
+service_module = pytest.importorskip("electrode_controller.services.electrode_state_change_service")
+
+
+class FakeController(service_module.ElectrodeStateChangeMixinService):
+    proxy = Any()
+    realtime_mode = Bool(True)
+    dropbot_connection_active = Bool(True)
+
+
+@pytest.fixture
+def controller():
+    proxy = MagicMock()
+    proxy.transaction_lock = threading.RLock()
+    proxy.number_of_channels = 120
+    actuations, progress = [], []
+    finished = threading.Event()
+
+    def actuate(proxy, channels, timeout=5, allow_disabled=True):
+        actuations.append(list(channels))
+        return list(channels)
+
+    def publish(schedule_id, state, **kwargs):
+        progress.append(state)
+        if state != "phase":
+            finished.set()
+
+    with patch.object(service_module, "actuate_channels", side_effect=actuate), \
+            patch.object(service_module.electrode_phase_progress_publisher, "publish", side_effect=publish):
+        svc = FakeController(proxy=proxy)
+        svc.actuations, svc.progress, svc.finished = actuations, progress, finished
+        yield svc
+
+
+def _schedule(phases, durations_s):
+    return json.dumps({"schedule_id": "s1", "phases": phases, "durations_s": durations_s})
+
+
+def test_realtime_off_mid_schedule_stops_it(controller):
+    controller.on_electrodes_phase_schedule_request(_schedule([[1], [2], [3]], [0.2, 0.2, 0.2]))
+    deadline = time.monotonic() + 2
+    while not controller.actuations and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+    controller.realtime_mode = False
+
+    assert controller.finished.wait(2)
+    assert controller.progress[-1] in ("stopped", "error")
+    assert controller.actuations == [[1]]
+
+
+def test_phase_waiting_on_the_lock_is_refused_after_realtime_off(controller):
+    lock = controller.proxy.transaction_lock
+    with lock:
+        # The sequencer thread blocks on the lock in its first actuation...
+        controller.on_electrodes_phase_schedule_request(_schedule([[1], [2]], [0.0, 0.0]))
+        time.sleep(0.1)
+        # ...while realtime mode is switched off under that lock (as the realtime-mode handler does).
+        controller.realtime_mode = False
+
+    assert controller.finished.wait(2)
+    assert controller.progress[-1] == "error"
+    assert controller.actuations == []
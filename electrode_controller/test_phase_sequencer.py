@@ -0,0 +1,122 @@
+import threading
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from electrode_controller.models import ElectrodePhaseScheduleRequest
+from electrode_controller.services.phase_sequencer import PhaseSequencer
+
+
+class Recorder:
+    """Collects actuations and progress reports from a PhaseSequencer."""
+
+    def __init__(self, actuation_delay_s=0.0):
+        self.actuation_delay_s = actuation_delay_s
+        self.actuations = []  # (time.monotonic(), channels)
+        self.progress = []
+        self.finished = threading.Event()
+
+    def actuate(self, channels):
+        self.actuations.append((time.monotonic(), list(channels)))
+        time.sleep(self.actuation_delay_s)
+        return len(channels)
+
+    def on_progress(self, schedule_id, state, phase_index, phase_total, actuated, detail):
+        self.progress.append((schedule_id, state, phase_index, actuated))
+        if state != "phase":
+            self.finished.set()
+
+
+# --- Schedule model ---
+
+def test_schedule_request_validates_bounds_and_lengths():
+    request = ElectrodePhaseScheduleRequest.model_validate(
+        {"schedule_id": "s", "phases": [[1, 2], [3]], "durations_s": [0.1, 0.2]},
+        context={"max_channels": 5},
+    )
+    assert request.phases == [{1, 2}, {3}]
+
+    with pytest.raises(ValidationError):
+        ElectrodePhaseScheduleRequest.model_validate(
+            {"schedule_id": "s", "phases": [[9]], "durations_s": [0.1]}, context={"max_channels": 5})
+    with pytest.raises(ValidationError):
+        ElectrodePhaseScheduleRequest.model_validate(
+            {"schedule_id": "s", "phases": [[1], [2]], "durations_s": [0.1]})
+
+
+# --- Playback ---
+
+def test_phases_play_in_order_on_absolute_deadlines():
+    # Each actuation takes 20 ms of its 50 ms phase: phase starts must stay on the 50 ms grid, not drift by 20 ms
+    # per phase.
+    recorder = Recorder(actuation_delay_s=0.02)
+    sequencer = PhaseSequencer(recorder.actuate, recorder.on_progress)
+
+    sequencer.start("s1", [[3, 1], [2], [4]], [0.05, 0.05, 0.05])
+    assert recorder.finished.wait(2)
+
+    assert [channels for _, channels in recorder.actuations] == [[1, 3], [2], [4]]
+    starts = [t - recorder.actuations[0][0] for t, _ in recorder.actuations]
+    assert starts[1] == pytest.approx(0.05, abs=0.015)
+    assert starts[2] == pytest.approx(0.10, abs=0.015)
+    assert recorder.progress == [
+        ("s1", "phase", 0, 2), ("s1", "phase", 1, 1), ("s1", "phase", 2, 1), ("s1", "done", -1, 0),
+    ]
+    assert sequencer.schedule_id is None
+
+
+def test_pause_holds_the_phase_and_resume_keeps_its_remaining_time():
+    recorder = Recorder()
+    sequencer = PhaseSequencer(recorder.actuate, recorder.on_progress)
+
+    sequencer.start("s1", [[1], [2]], [0.1, 0.05])
+    time.sleep(0.03)
+    sequencer.pause("s1")
+    time.sleep(0.2)
+    assert len(recorder.actuations) == 1  # still holding phase 0
+    sequencer.resume("s1")
+    assert recorder.finished.wait(2)
+
+    gap = recorder.actuations[1][0] - recorder.actuations[0][0]
+    assert gap == pytest.approx(0.3, abs=0.03)  # 0.1 s phase + 0.2 s paused
+
+
+def test_stop_ends_playback_and_ignores_other_schedule_ids():
+    recorder = Recorder()
+    sequencer = PhaseSequencer(recorder.actuate, recorder.on_progress)
+
+    sequencer.start("s1", [[1], [2]], [5.0, 5.0])
+    time.sleep(0.02)
+    sequencer.stop("other")
+    assert sequencer.schedule_id == "s1"
+    sequencer.stop("s1")
+
+    assert recorder.finished.is_set()
+    assert recorder.progress[-1][:2] == ("s1", "stopped")
+    assert len(recorder.actuations) == 1
+
+
+def test_new_schedule_supersedes_the_playing_one():
+    recorder = Recorder()
+    sequencer = PhaseSequencer(recorder.actuate, recorder.on_progress)
+
+    sequencer.start("s1", [[1]], [5.0])
+    time.sleep(0.02)
+    sequencer.start("s2", [[2]], [0.0])
+    sequencer.stop()  # joins s2's thread once it has finished or been stopped
+
+    states = [(schedule_id, state) for schedule_id, state, _, _ in recorder.progress if state != "phase"]
+    assert states[0] == ("s1", "stopped")
+
+
+def test_actuation_error_is_reported():
+    def actuate(channels):
+        raise RuntimeError("proxy gone")
+
+    progress = []
+    sequencer = PhaseSequencer(actuate, lambda *args: progress.append(args))
+    sequencer.start("s1", [[1]], [0.01])
+    sequencer._thread.join(2)
+
+    assert progress == [("s1", "error", -1, 1, 0, "proxy gone")]
@@ -1,35 +1,13 @@
-from dropbot_preferences_ui.plugin import DropbotPreferencesPlugin
-from dropbot_protocol_controls.plugin import DropbotProtocolControlsPlugin
-from dropbot_status_and_controls.plugin import DropbotStatusAndControlsPlugin
-from logger.plugin import LoggerPlugin
-from logger_ui.plugin import LoggerUIPlugin
-from manual_controls.plugin import ManualControlsPlugin
-from microdrop_application.application import MicrodropApplication
-from microdrop_application.backend_application import MicrodropBackendApplication
-from microdrop_application.plugin import MicrodropPlugin
-from microdrop_status_bar.plugin import StatusBarPlugin
-from dropbot_tools_menu.plugin import DropbotToolsMenuPlugin
-from opendrop_status_and_controls.plugin import OpendropStatusAndControlsPlugin
-from pluggable_protocol_tree.plugin import PluggableProtocolTreePlugin
-from plugin_management.plugin import PluginManagementPlugin
-from dropbot_controller.plugin import DropbotControllerPlugin
-from electrode_controller.plugin import ElectrodeControllerPlugin
-from envisage.api import CorePlugin
-from envisage.ui.tasks.api import TasksPlugin
-from message_router.plugin import MessageRouterPlugin
 from microdrop_utils.broker_server_helpers import (
     dramatiq_workers_context, load_dramatiq_worker_settings,
     redis_server_context)
-from device_viewer.plugin import DeviceViewerPlugin
-from protocol_quick_action_tools.plugin import ProtocolQuickActionToolsPlugin
-from volume_threshold_protocol_controls.plugin import VolumeThresholdProtocolControlsPlugin
-from video_protocol_controls.plugin import VideoProtocolControlsPlugin
-from opendrop_controller.plugin import OpenDropControllerPlugin
-from mock_dropbot_controller.plugin import MockDropbotControllerPlugin
-from mock_dropbot_status.plugin import MockDropbotStatusPlugin
-from ssh_controls.plugin import SSHControlsPlugin
-from ssh_controls_ui.plugin import SSHUIPlugin
-from user_help_plugin.plugin import UserHelpPlugin
+
+# Plugins and applications are listed as dotted "module:Class" specs (the same
+# form plugin groups and manifests use). They are imported only when a run
+# script starts them (load_plugin_classes in microdrop_utils.app_setup_helpers,
+# which also records each plugin's import time), so a headless backend never
+# imports the Qt/plotting stacks of the UI plugins, and a plugin left out of a
+# run is never imported at all.
 
 # The order of plugins matters. This determines whose start routine will be run first,
 # and whose contributions will be prioritized
@@ -61,16 +39,16 @@ from user_help_plugin.plugin import UserHelpPlugin
 # ---------------------------------------------------------------------------
 
 FRONTEND_PLUGINS = [
-    MicrodropPlugin,
-    TasksPlugin,
-    StatusBarPlugin,
-    LoggerUIPlugin,
-    PluginManagementPlugin,
-    DeviceViewerPlugin,
-    UserHelpPlugin,
-    SSHUIPlugin,
-    PluggableProtocolTreePlugin,
-    DropbotProtocolControlsPlugin,
+    "microdrop_application.plugin:MicrodropPlugin",
+    "envisage.ui.tasks.api:TasksPlugin",
+    "microdrop_status_bar.plugin:StatusBarPlugin",
+    "logger_ui.plugin:LoggerUIPlugin",
+    "plugin_management.plugin:PluginManagementPlugin",
+    "device_viewer.plugin:DeviceViewerPlugin",
+    "user_help_plugin.plugin:UserHelpPlugin",
+    "ssh_controls_ui.plugin:SSHUIPlugin",
+    "pluggable_protocol_tree.plugin:PluggableProtocolTreePlugin",
+    "dropbot_protocol_controls.plugin:DropbotProtocolControlsPlugin",
     # The Z-Stage/magnet and heater stacks are standalone installable plugin
     # packages now (magnet-microdrop-plugin, heater-microdrop-plugin): their
     # groups are discovered from the installed packages' manifests and
@@ -78,56 +56,55 @@ FRONTEND_PLUGINS = [
     # Tools > Manage Plugins — never listed here (double-loading a plugin
     # duplicates its service offers and panes). The protocol tree hot-swaps
     # their protocol columns when PROTOCOL_COLUMNS contributions change.
-    ProtocolQuickActionToolsPlugin,
-    VolumeThresholdProtocolControlsPlugin,
-    VideoProtocolControlsPlugin,
-
+    "protocol_quick_action_tools.plugin:ProtocolQuickActionToolsPlugin",
+    "volume_threshold_protocol_controls.plugin:VolumeThresholdProtocolControlsPlugin",
+    "video_protocol_controls.plugin:VideoProtocolControlsPlugin",
 ]
 
 DROPBOT_FRONTEND_PLUGINS = [
-    DropbotPreferencesPlugin,
-    DropbotStatusAndControlsPlugin,
-    DropbotToolsMenuPlugin,
+    "dropbot_preferences_ui.plugin:DropbotPreferencesPlugin",
+    "dropbot_status_and_controls.plugin:DropbotStatusAndControlsPlugin",
+    "dropbot_tools_menu.plugin:DropbotToolsMenuPlugin",
 ]
 
 OPENDROP_FRONTEND_PLUGINS = [
-    OpendropStatusAndControlsPlugin
+    "opendrop_status_and_controls.plugin:OpendropStatusAndControlsPlugin"
 ]
 
 
 BACKEND_PLUGINS = [
-    ElectrodeControllerPlugin,
+    "electrode_controller.plugin:ElectrodeControllerPlugin",
 ]
 
 OPENDROP_BACKEND_PLUGINS = [
-    OpenDropControllerPlugin,
+    "opendrop_controller.plugin:OpenDropControllerPlugin",
 ]
 
 DROPBOT_BACKEND_PLUGINS = [
     # PeripheralControllerPlugin / HeaterControllerPlugin are group-managed —
     # see the note in FRONTEND_PLUGINS.
-    DropbotControllerPlugin
+    "dropbot_controller.plugin:DropbotControllerPlugin"
 ]
 
 # Mock DropBot plugins — swap these in place of DROPBOT_BACKEND_PLUGINS
 # and DROPBOT_FRONTEND_PLUGINS to use the mock controller (no hardware needed).
 MOCK_DROPBOT_BACKEND_PLUGINS = [
-    MockDropbotControllerPlugin,
+    "mock_dropbot_controller.plugin:MockDropbotControllerPlugin",
 ]
 
 MOCK_DROPBOT_FRONTEND_PLUGINS = [
-    MockDropbotStatusPlugin,
+    "mock_dropbot_status.plugin:MockDropbotStatusPlugin",
 ]
 
 # Host-bound-by-trust plugins. See the category comment above.
 SERVICE_PLUGINS = [
-    SSHControlsPlugin,
+    "ssh_controls.plugin:SSHControlsPlugin",
 ]
 
 REQUIRED_PLUGINS = [
-    CorePlugin,
-    MessageRouterPlugin,
-    LoggerPlugin
+    "envisage.api:CorePlugin",
+    "message_router.plugin:MessageRouterPlugin",
+    "logger.plugin:LoggerPlugin"
 ]
 
 # Worker kwargs come from redis_settings.json when present (e.g. written by
@@ -140,8 +117,21 @@ SERVER_CONTEXT = [
     (redis_server_context, {})
 ]
 
-BACKEND_APPLICATION = MicrodropBackendApplication
+BACKEND_APPLICATION = "microdrop_application.backend_application:MicrodropBackendApplication"
+
+FRONTEND_APPLICATION = "microdrop_application.application:MicrodropApplication"
+
+DEFAULT_APPLICATION = "microdrop_application.application:MicrodropApplication"
 
-FRONTEND_APPLICATION = MicrodropApplication
 
-DEFAULT_APPLICATION = MicrodropApplication
+def plugin_modules():
+    """Every module named by the specs above — the hidden imports a frozen
+    build must bundle, since nothing imports them statically any more."""
+    specs = [
+        *REQUIRED_PLUGINS, *FRONTEND_PLUGINS, *DROPBOT_FRONTEND_PLUGINS,
+        *OPENDROP_FRONTEND_PLUGINS, *BACKEND_PLUGINS, *OPENDROP_BACKEND_PLUGINS,
+        *DROPBOT_BACKEND_PLUGINS, *MOCK_DROPBOT_BACKEND_PLUGINS,
+        *MOCK_DROPBOT_FRONTEND_PLUGINS, *SERVICE_PLUGINS,
+        BACKEND_APPLICATION, FRONTEND_APPLICATION,
+    ]
+    return list(dict.fromkeys(spec.partition(":")[0] for spec in specs))
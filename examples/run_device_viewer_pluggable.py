@@ -8,9 +8,11 @@ from functools import partial
 from envisage.ui.tasks.tasks_application import TasksApplication
 from pyface.qt.QtWidgets import QApplication
 
-from microdrop_utils.app_setup_helpers import microdrop_runner_setup
+from microdrop_utils.app_setup_helpers import microdrop_runner_setup, load_plugin_classes, import_spec
 microdrop_runner_setup()
 
+from microdrop_utils import startup_profiler
+
 from examples.plugin_consts import REQUIRED_PLUGINS, FRONTEND_PLUGINS, BACKEND_PLUGINS, DROPBOT_BACKEND_PLUGINS, \
     DROPBOT_FRONTEND_PLUGINS, OPENDROP_FRONTEND_PLUGINS, OPENDROP_BACKEND_PLUGINS, FRONTEND_APPLICATION, \
     BACKEND_APPLICATION, SERVER_CONTEXT, \
@@ -49,23 +51,31 @@ def main(plugins, contexts, application, persist):
 
     """
 
-    app_instance = QApplication.instance() or QApplication(sys.argv)
+    with startup_profiler.span("create QApplication"):
+        app_instance = QApplication.instance() or QApplication(sys.argv)
 
-    style_app(app_instance)
+        style_app(app_instance)
 
     print(f"Instantiating application {application} with plugins {plugins}")
 
-    # Instantiate plugins
-    plugin_instances = [plugin() for plugin in plugins]
+    # Import (lazily listed plugins are only imported now) and instantiate plugins
+    plugin_classes = load_plugin_classes(plugins)
+    with startup_profiler.span("construct plugins"):
+        plugin_instances = [plugin() for plugin in plugin_classes]
+    with startup_profiler.span(f"import {application}", "import"):
+        application = import_spec(application)
 
     #### Startup application with context
 
     with contextlib.ExitStack() as stack:  # contextlib.ExitStack is a context manager that allows you to stack multiple context managers
         for context, kwargs in contexts:
-            stack.enter_context(context(**kwargs))
+            with startup_profiler.span(f"enter {context.__name__}"):
+                stack.enter_context(context(**kwargs))
 
         # Instantiate application
-        app = application(plugins=plugin_instances)
+        with startup_profiler.span("construct application"):
+            app = application(plugins=plugin_instances)
+        startup_profiler.profile_application(app)
 
         # Register signal handlers
         stop_app_func = partial(stop_app, app)
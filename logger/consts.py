@@ -53,3 +53,11 @@ THIRD_PARTY_LOGGER_NAMES = (
     "dramatiq", "apscheduler", "envisage", "traits", "pyface",
     "asyncio", "PIL", "matplotlib", "urllib3", "base_node_rpc",
 )
+
+# Records the async logging queue (init_logger(async_logging=True)) holds
+# before new ones are dropped; about a few MB of pending records.
+LOG_QUEUE_MAX_RECORDS = 10000
+
+# Throttle windows debug_throttled remembers (one per logger + key); the least
+# recently used are forgotten beyond this.
+THROTTLE_STATE_MAX_KEYS = 1024
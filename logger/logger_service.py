@@ -1,9 +1,15 @@
+import atexit
+import copy
 import logging
+import queue
 import threading
 import time
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
 
 from .consts import (LOGGER_COLORS, LEVEL_COLORS, COLORS, MIN_APP_LOGLEVEL,
-                     DEV_MODE, LEVELS, THIRD_PARTY_LOGGER_NAMES)
+                     DEV_MODE, LEVELS, THIRD_PARTY_LOGGER_NAMES, LOG_QUEUE_MAX_RECORDS,
+                     THROTTLE_STATE_MAX_KEYS)
 
 class ColoredFormatter(logging.Formatter):
     def __init__(self, fmt=None, datefmt=None):
@@ -60,9 +66,129 @@ def get_logger(name, level=MIN_APP_LOGLEVEL, dev_mode=DEV_MODE):
 
     return logger
 
+# ---------------------------------------------------------------------------
+# Asynchronous logging: the root logger only enqueues records; one listener
+# thread formats them and does the terminal / file / log-pane I/O.
+# ---------------------------------------------------------------------------
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler onto a bounded queue that never blocks the logging thread.
+
+    When the queue is full the record is dropped and counted in
+    ``dropped_count``; the next record that fits is preceded by a WARNING
+    saying how many were lost.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped_count = 0
+        self._unreported_drops = 0
+        self._drops_lock = threading.Lock()
+
+    def prepare(self, record):
+        # Merge the args and render the traceback now, on the logging thread:
+        # args may be mutated, and exc_info freed, before the listener runs.
+        # Unlike the base class, keep record.msg to the message alone so every
+        # handler formats it (and the traceback) as it would synchronously.
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = file_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        with self._drops_lock:
+            unreported = self._unreported_drops
+            try:
+                if unreported:
+                    self.queue.put_nowait(logging.makeLogRecord({
+                        "name": __name__, "levelno": logging.WARNING, "levelname": "WARNING",
+                        "msg": f"Log queue full: dropped {unreported} log record(s)"}))
+                    self._unreported_drops = 0
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped_count += 1
+                self._unreported_drops += 1
+
+
+class _LogQueueListener(QueueListener):
+    """QueueListener whose handlers can be swapped while it runs, and whose
+    stop() waits for room in a full queue instead of raising."""
+
+    def add_handler(self, handler):
+        if handler not in self.handlers:
+            self.handlers = self.handlers + (handler,)
+
+    def remove_handler(self, handler):
+        self.handlers = tuple(h for h in self.handlers if h is not handler)
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+_log_listener = None
+
+
+def _stop_log_listener():
+    """Flush the queued records and stop the listener thread (if running)."""
+    global _log_listener
+    listener, _log_listener = _log_listener, None
+    if listener is not None:
+        listener.stop()
+
+
+atexit.register(_stop_log_listener)
+
+
+def get_log_handlers():
+    """The handlers that actually emit records: the listener's when logging
+    asynchronously, else the root logger's."""
+    if _log_listener is not None:
+        return list(_log_listener.handlers)
+    return list(logging.getLogger().handlers)
+
+
+def add_log_handler(handler):
+    """Attach ``handler`` to the root logging pipeline (the listener thread
+    when logging asynchronously)."""
+    if _log_listener is not None:
+        _log_listener.add_handler(handler)
+    else:
+        logging.getLogger().addHandler(handler)
+
+
+def remove_log_handler(handler):
+    """Detach ``handler`` from the root logging pipeline."""
+    if _log_listener is not None:
+        _log_listener.remove_handler(handler)
+    else:
+        logging.getLogger().removeHandler(handler)
+
+
+def dropped_log_records() -> int:
+    """Records dropped because the async log queue was full (0 when synchronous)."""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, DroppingQueueHandler):
+            return handler.dropped_count
+    return 0
+
+
 def init_logger(preferred_log_level=LEVELS["INFO"],
                 file_handler=None,
-                console_handler=None, console_handler_formatter=None):
+                console_handler=None, console_handler_formatter=None,
+                async_logging=False, queue_size=LOG_QUEUE_MAX_RECORDS):
+    """Configure the root logger with a console handler and, if given, a file handler.
+
+    With ``async_logging`` the root logger only gets a DroppingQueueHandler
+    onto a queue of at most ``queue_size`` records, and a single background
+    listener thread owns the console/file handlers (and any added later via
+    add_log_handler), so a log call on a hot path costs an enqueue rather than
+    formatting plus terminal and disk I/O. Records are dropped, and counted,
+    when the listener falls that far behind.
+    """
+    global _log_listener
 
     # setup console handler
     if not console_handler:
@@ -85,14 +211,25 @@ def init_logger(preferred_log_level=LEVELS["INFO"],
         logging.getLogger(third_party_name).setLevel(
             max(logging.INFO, preferred_log_level))
     ROOT_LOGGER.handlers = []  # Clear existing handlers
+    _stop_log_listener()
 
+    handlers = []
     # if file handler provided, add to root logger.
     if file_handler:
         file_handler.setFormatter(file_formatter)
         file_handler.addFilter(RepoOnlyDebugFilter())
-        ROOT_LOGGER.addHandler(file_handler)
+        handlers.append(file_handler)
 
-    ROOT_LOGGER.addHandler(console_handler)
+    handlers.append(console_handler)
+
+    if async_logging:
+        log_queue = queue.Queue(maxsize=queue_size)
+        ROOT_LOGGER.addHandler(DroppingQueueHandler(log_queue))
+        _log_listener = _LogQueueListener(log_queue, *handlers, respect_handler_level=True)
+        _log_listener.start()
+    else:
+        for handler in handlers:
+            ROOT_LOGGER.addHandler(handler)
 
 # ---------------------------------------------------------------------------
 # Throttled debug: for log sites on hot message paths (router fan-out, actor
@@ -100,25 +237,41 @@ def init_logger(preferred_log_level=LEVELS["INFO"],
 # identical lines per second.
 # ---------------------------------------------------------------------------
 _throttle_lock = threading.Lock()
-_throttle_state = {}
+# (logger name, key) -> (last emit time, suppressed count), least recently
+# used first; bounded so per-topic / per-actor keys can't grow it forever.
+_throttle_state = OrderedDict()
+
 
+def debug_throttled(logger, key, message, *args, min_interval_s=2.0):
+    """``logger.debug`` rate-limited per ``key``, formatted lazily.
 
-def debug_throttled(logger, key, message, min_interval_s=2.0):
-    """``logger.debug`` rate-limited per ``key``.
+    ``message`` is a %-format string for ``args`` (as in ``logger.debug``) or a
+    callable returning the text. Nothing is formatted unless the logger is
+    enabled for DEBUG and the key's window allows an emission, so pass the
+    parts as args — and ``key`` as a tuple, e.g. ``("router_rx", topic)`` —
+    rather than building f-strings at the call site.
 
-    Messages sharing a key (e.g. one key per topic) are emitted at most once
-    per ``min_interval_s``; repeats in between are counted and reported on
-    the next emission as ``(+N similar suppressed)``.
+    Messages sharing a key are emitted at most once per ``min_interval_s``;
+    repeats in between are counted and reported on the next emission as
+    ``(+N similar suppressed)``. State is kept for the THROTTLE_STATE_MAX_KEYS
+    most recently used keys.
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     now = time.monotonic()
     state_key = (logger.name, key)
     with _throttle_lock:
         last_emit, suppressed = _throttle_state.get(state_key, (0.0, 0))
         if now - last_emit < min_interval_s:
             _throttle_state[state_key] = (last_emit, suppressed + 1)
+            _throttle_state.move_to_end(state_key)
             return
         _throttle_state[state_key] = (now, 0)
+        _throttle_state.move_to_end(state_key)
+        while len(_throttle_state) > THROTTLE_STATE_MAX_KEYS:
+            _throttle_state.popitem(last=False)
+    text = message() if callable(message) else (message % args if args else message)
     if suppressed:
-        message = f"{message} (+{suppressed} similar suppressed)"
+        text = f"{text} (+{suppressed} similar suppressed)"
     # stacklevel=2: attribute the record to the caller, not this helper.
-    logger.debug(message, stacklevel=2)
+    logger.debug(text, stacklevel=2)
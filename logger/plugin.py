@@ -9,7 +9,8 @@ from envisage.api import Plugin
 from traits.api import  observe
 
 # Local imports
-from .logger_service import init_logger, LEVELS
+from .logger_service import (init_logger, LEVELS, get_log_handlers, add_log_handler,
+                             remove_log_handler)
 from .consts import PKG, PKG_name
 from .preferences import LoggerPreferences
 
@@ -28,26 +29,27 @@ class LoggerPlugin(Plugin):
 
     def start(self):
         """Starts the plugin."""
-        init_logger(preferred_log_level=LEVELS.get(LoggerPreferences().level, logging.INFO),
-                    file_handler=self.get_file_handler())
+        preferences = LoggerPreferences()
+        init_logger(preferred_log_level=LEVELS.get(preferences.level, logging.INFO),
+                    file_handler=self.get_file_handler(),
+                    async_logging=preferences.async_logging)
 
     @observe("application:experiment_changed")
     def _current_exp_dir_changed(self, event):
         print("Changing Log File")
-        ROOT_LOGGER = logging.getLogger()
-
         old_formatter = None
         old_level = None
 
-        for handler in ROOT_LOGGER.handlers[:]:  # Iterate on a copy!
+        # The root logger's handlers, or the async log listener's.
+        for handler in get_log_handlers():
             if isinstance(handler, logging.FileHandler):
                 # Save its settings
                 old_formatter = handler.formatter
                 old_level = handler.level
 
-                # Close and remove it
+                # Remove and close it
+                remove_log_handler(handler)
                 handler.close()
-                ROOT_LOGGER.removeHandler(handler)
 
                 print(f"Log File detached: {handler.baseFilename}")
                 break  # Stop after finding the first one
@@ -60,7 +62,7 @@ class LoggerPlugin(Plugin):
             new_file_h.setFormatter(old_formatter)
             new_file_h.setLevel(old_level)  # Ensure logging level is preserved
 
-            ROOT_LOGGER.addHandler(new_file_h)
+            add_log_handler(new_file_h)
             print(f"Log File Attached: {new_file_h.baseFilename}")
         else:
             print("Warning: No FileHandler was found to replace.")
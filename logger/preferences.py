@@ -1,5 +1,5 @@
 from apptools.preferences.api import PreferencesHelper
-from traits.api import Enum
+from traits.api import Bool, Enum
 
 class LoggerPreferences(PreferencesHelper):
     """The preferences helper, inspired by envisage one for the Attractors application.
@@ -16,4 +16,8 @@ class LoggerPreferences(PreferencesHelper):
     level = Enum("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
 
     def _level_default(self):
-        return "INFO"
\ No newline at end of file
+        return "INFO"
+
+    # Hand log records to a background thread (bounded queue) instead of
+    # formatting and writing them on the logging thread. Applies at startup.
+    async_logging = Bool(False)
@@ -0,0 +1,85 @@
+import logging
+import queue
+
+import pytest
+
+from logger import logger_service
+from logger.logger_service import (DroppingQueueHandler, add_log_handler, dropped_log_records,
+                                   get_log_handlers, init_logger, remove_log_handler)
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    yield root
+    logger_service._stop_log_listener()
+    root.handlers = saved_handlers
+    root.setLevel(saved_level)
+
+
+def _flush():
+    """Stop the listener, which drains every queued record first."""
+    logger_service._stop_log_listener()
+
+
+def test_async_logging_routes_records_through_the_listener(restore_root_logger):
+    console, extra = ListHandler(), ListHandler()
+    init_logger(logging.INFO, console_handler=console, async_logging=True)
+    add_log_handler(extra)
+
+    assert [type(h) for h in restore_root_logger.handlers] == [DroppingQueueHandler]
+    assert console in get_log_handlers() and extra in get_log_handlers()
+
+    items = ["a"]
+    logging.getLogger("test.async").info("value %s", items)
+    items.append("b")  # mutated after the call: the record must keep the old value
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logging.getLogger("test.async").exception("failed")
+    logger_service._log_listener.queue.join()  # both handlers have emitted
+    remove_log_handler(extra)
+    assert extra not in get_log_handlers()
+    logging.getLogger("test.async").info("after removal")
+    _flush()
+
+    messages = [r.getMessage() for r in console.records]
+    assert messages == ["value ['a']", "failed", "after removal"]
+    assert "ValueError: boom" in logger_service.file_formatter.format(console.records[1])
+    assert [r.getMessage() for r in extra.records] == messages[:2]
+
+
+def test_full_queue_drops_and_reports(restore_root_logger):
+    handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+    record = logging.makeLogRecord({"msg": "x"})
+    for _ in range(5):
+        handler.handle(record)
+    assert handler.dropped_count == 3
+
+    handler.queue.get_nowait()
+    handler.queue.get_nowait()
+    handler.handle(record)
+    report = handler.queue.get_nowait()
+    assert report.levelno == logging.WARNING and "dropped 3" in report.getMessage()
+    assert handler.queue.get_nowait().getMessage() == "x"
+
+
+def test_synchronous_logging_is_unchanged(restore_root_logger):
+    console = ListHandler()
+    init_logger(logging.INFO, console_handler=console)
+
+    assert restore_root_logger.handlers == [console]
+    assert get_log_handlers() == [console]
+    logging.getLogger("test.sync").info("now")
+    assert [r.getMessage() for r in console.records] == ["now"]
+    assert dropped_log_records() == 0
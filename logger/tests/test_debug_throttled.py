@@ -0,0 +1,81 @@
+import logging
+from collections import OrderedDict
+
+import pytest
+
+from logger import logger_service
+from logger.logger_service import debug_throttled
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class Loud:
+    """Counts how often it is rendered."""
+
+    def __init__(self):
+        self.renders = 0
+
+    def __str__(self):
+        self.renders += 1
+        return "loud"
+
+
+@pytest.fixture
+def debug_logger(monkeypatch):
+    monkeypatch.setattr(logger_service, "_throttle_state", OrderedDict())
+    logger = logging.getLogger("test.debug_throttled")
+    handler = ListHandler()
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    yield logger, handler
+    logger.removeHandler(handler)
+    logger.setLevel(logging.NOTSET)
+    logger.propagate = True
+
+
+def test_formats_only_what_is_emitted(debug_logger):
+    logger, handler = debug_logger
+    value = Loud()
+    for _ in range(5):
+        debug_throttled(logger, ("topic", "a"), "got %s", value, min_interval_s=60)
+    assert handler.messages == ["got loud"]
+    assert value.renders == 1
+
+
+def test_disabled_level_skips_formatting_and_state(debug_logger):
+    logger, handler = debug_logger
+    logger.setLevel(logging.INFO)
+    calls = []
+    debug_throttled(logger, "k", lambda: calls.append(1) or "text")
+    assert calls == [] and handler.messages == []
+    assert not logger_service._throttle_state
+
+
+def test_suppressed_count_reported_on_next_emission(debug_logger, monkeypatch):
+    logger, handler = debug_logger
+    now = [100.0]
+    monkeypatch.setattr(logger_service.time, "monotonic", lambda: now[0])
+    debug_throttled(logger, "k", lambda: "tick")
+    debug_throttled(logger, "k", lambda: "tick")
+    debug_throttled(logger, "k", "100%")  # no args: not %-formatted
+    now[0] += 5
+    debug_throttled(logger, "k", "100%")
+    assert handler.messages == ["tick", "100% (+2 similar suppressed)"]
+
+
+def test_state_is_bounded_lru(debug_logger, monkeypatch):
+    logger, _ = debug_logger
+    monkeypatch.setattr(logger_service, "THROTTLE_STATE_MAX_KEYS", 3)
+    for key in ("a", "b", "c"):
+        debug_throttled(logger, key, "x")
+    debug_throttled(logger, "a", "x")  # refreshes "a"
+    debug_throttled(logger, "d", "x")  # evicts the least recently used: "b"
+    assert [k for _, k in logger_service._throttle_state] == ["c", "a", "d"]
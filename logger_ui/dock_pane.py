@@ -25,7 +25,7 @@ from .consts import LEVEL_COLORS, COLORS, LOGGER_COLORS, PKG
 from .model import LogModel
 
 import logging
-from logger.logger_service import get_logger
+from logger.logger_service import get_logger, get_log_handlers
 logger = get_logger(__name__)
 
 from microdrop_utils.file_handler import open_file
@@ -256,6 +256,6 @@ class LogPane(TraitsDockPane):
         self.model.reset()
 
     def _show_button_fired(self):
-        for handler in logging.getLogger().handlers[:]:  # Iterate on a copy!
+        for handler in get_log_handlers():
             if isinstance(handler, logging.FileHandler):
                 open_file(handler.baseFilename)
\ No newline at end of file
@@ -1,6 +1,3 @@
-# Standard library imports.
-import logging
-
 # Enthought library imports.
 from envisage.api import Plugin
 from envisage.ids import PREFERENCES_PANES, TASK_EXTENSIONS
@@ -8,6 +5,7 @@ from envisage.ui.tasks.task_extension import TaskExtension
 from traits.api import List
 from traits.trait_types import Str
 
+from logger.logger_service import add_log_handler
 from microdrop_application.consts import PKG as microdrop_application_PKG
 
 from .consts import PKG, PKG_name
@@ -60,8 +58,7 @@ class LoggerUIPlugin(Plugin):
         )
         _handler = EnvisageLogHandler(_log_model_instance=self._logger_model)
 
-        root_logger = logging.getLogger()
-        root_logger.addHandler(_handler)
+        add_log_handler(_handler)
 
     def _dock_pane_factory(self, *args, **kwargs):
         from .dock_pane import LogPane
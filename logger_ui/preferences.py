@@ -63,6 +63,9 @@ class LoggerPreferencesPane(PreferencesPane):
     traits_view = View(
             Group(
                 logger_view,
+                Item(name="async_logging", label="Background logging (on restart)",
+                     tooltip="Write log records from a background thread so logging never "
+                             "waits on the terminal or the log file."),
                 label="Logger Settings",
                 show_border=True,
                 style_sheet=preferences_group_style_sheet,
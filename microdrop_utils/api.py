@@ -177,6 +177,7 @@ class UITopics:
     DEVICE_VIEWER_CAMERA_ACTIVE     = _device_viewer.DEVICE_VIEWER_CAMERA_ACTIVE
     DEVICE_VIEWER_MEDIA_CAPTURED    = _device_viewer.DEVICE_VIEWER_MEDIA_CAPTURED
     DEVICE_VIEWER_RECORDING_STATE   = device_viewer.consts.DEVICE_VIEWER_RECORDING_STATE
+    DEVICE_VIEWER_RECORDER_STATS    = device_viewer.consts.DEVICE_VIEWER_RECORDER_STATS
     ROUTES_EXECUTING                = _device_viewer.ROUTES_EXECUTING
     VOLTAGE_FREQUENCY_RANGE_CHANGED = _prefs_ui.VOLTAGE_FREQUENCY_RANGE_CHANGED
 
@@ -1,10 +1,16 @@
+import atexit
+import importlib
+import json
 import multiprocessing
 import os
 import shutil
 import subprocess
 import sys
+import threading
+import time
 from pathlib import Path
 
+from microdrop_utils import startup_profiler
 from microdrop_utils.broker_server_helpers import configure_dramatiq_broker
 from logger.logger_service import get_logger
 
@@ -16,14 +22,23 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 #: developer machines where the IDE or the launcher scripts manage the repo.
 SKIP_GIT_UPDATE_ENV_VAR = "MICRODROP_SKIP_GIT_UPDATE"
 
-#: Per-command timeout for the startup self-update, so a flaky network can
-#: delay app startup by at most this long.
+#: Per-command timeout for the self-update's git commands. They run on a
+#: background thread, so a flaky network never delays app startup.
 GIT_SELF_UPDATE_TIMEOUT_S = 30
 
+#: Seconds after startup before the background update check begins, so its
+#: git/network traffic doesn't compete with the app (and UI) coming up.
+GIT_SELF_UPDATE_START_DELAY_S = 15
+
 #: The branch the self-update checks out when none is checked out (a freshly
 #: initialized submodule sits on a detached HEAD, where `git pull` refuses).
 SOURCE_DEFAULT_BRANCH = "main"
 
+#: Topic the background update check publishes its result on: a JSON object
+#: with ``state`` ("up_to_date", "available" or "failed"), ``behind`` (commits
+#: available), ``current`` / ``latest`` (commit hashes) and ``detail``.
+SOURCE_UPDATE_STATUS = "microdrop/source_update_status"
+
 
 def _git(repo_root, *args):
     """Run a git command in ``repo_root``, captured, with the update timeout."""
@@ -32,43 +47,61 @@ def _git(repo_root, *args):
         timeout=GIT_SELF_UPDATE_TIMEOUT_S)
 
 
-def self_update_source_repo(repo_root=PROJECT_ROOT,
-                            default_branch=SOURCE_DEFAULT_BRANCH):
-    """Best-effort git self-update of the MicroDrop source repo — a backstop
-    so the app keeps itself current even when launched without the launcher
-    scripts (IDE, custom shortcut, `pixi run microdrop` directly).
+def _update_upstream(repo_root, default_branch):
+    """The ref the source follows: the current branch's upstream, or
+    ``origin/<default_branch>`` when no branch is checked out."""
+    branch = _git(repo_root, "branch", "--show-current").stdout.strip()
+    if not branch:
+        return f"origin/{default_branch}"
+    upstream = _git(repo_root, "rev-parse", "--abbrev-ref", "@{u}")
+    return upstream.stdout.strip() if upstream.returncode == 0 else None
+
+
+def check_source_update(repo_root=PROJECT_ROOT,
+                        default_branch=SOURCE_DEFAULT_BRANCH) -> dict:
+    """Fetch the source repo's remote and compare it with HEAD, without
+    touching the working tree (the running app keeps importing from it).
+
+    Returns the status published on SOURCE_UPDATE_STATUS.
+    """
+    status = {"state": "failed", "behind": 0, "current": "", "latest": "",
+              "detail": ""}
+    try:
+        upstream = _update_upstream(repo_root, default_branch)
+        if upstream is None:
+            status["detail"] = "current branch has no upstream"
+            return status
+        remote = upstream.split("/", 1)[0]
+        fetch = _git(repo_root, "fetch", remote)
+        if fetch.returncode != 0:
+            status["detail"] = (f"fetch failed (offline?): "
+                                f"{fetch.stderr.strip() or fetch.stdout.strip()}")
+            return status
+        status["current"] = _git(repo_root, "rev-parse", "HEAD").stdout.strip()
+        status["latest"] = _git(repo_root, "rev-parse", upstream).stdout.strip()
+        behind = _git(repo_root, "rev-list", "--count", f"HEAD..{upstream}")
+        status["behind"] = int(behind.stdout.strip() or 0)
+        status["state"] = "available" if status["behind"] else "up_to_date"
+    except Exception as e:
+        status["detail"] = str(e)
+    return status
 
-    The running process already imported its modules, so a pull cannot change
-    THIS session — when the pull moves HEAD, a warning tells the user the
-    updates take effect the next time they start the app.
+
+def apply_source_update(repo_root=PROJECT_ROOT,
+                        default_branch=SOURCE_DEFAULT_BRANCH) -> bool:
+    """Fast-forward the source repo to the commits check_source_update
+    fetched. Local only (no network); meant for process exit, so the update
+    takes effect the next time the app starts. Returns True when HEAD moved.
 
     Mirrors the launcher scripts' semantics:
 
     - no branch checked out (detached HEAD — every freshly initialized
       submodule) -> check out ``default_branch`` first;
-    - ``pull --ff-only --autostash`` — never starts a merge the user would
+    - ``merge --ff-only --autostash`` — never starts a merge the user would
       have to resolve, and carries legitimately-dirty tracked files (the
-      installed-plugin pins in the parent's pyproject) across the pull;
-    - every failure is a logged warning, never a blocked launch.
-
-    Skipped when ``MICRODROP_SKIP_GIT_UPDATE`` is set, when git or the
-    ``.git`` link is absent (frozen/tarball installs), in a spawned
-    worker process, or on any error.
+      installed-plugin pins in the parent's pyproject) across the update;
+    - every failure is a logged warning.
     """
-    if multiprocessing.parent_process() is not None:
-        # A spawned child re-imports the launcher, so without this every
-        # worker in a pool would run its own git pull — the app's own
-        # ROI batch once produced one per CPU.
-        logger.debug("source self-update skipped: worker process")
-        return
-    if os.environ.get(SKIP_GIT_UPDATE_ENV_VAR):
-        logger.info(f"source self-update skipped ({SKIP_GIT_UPDATE_ENV_VAR} is set)")
-        return
-    # A submodule's .git is a FILE pointing at the real git dir — exists(),
-    # not is_dir().
-    if shutil.which("git") is None or not (Path(repo_root) / ".git").exists():
-        logger.debug("source self-update skipped: no git or not a checkout")
-        return
     try:
         branch = _git(repo_root, "branch", "--show-current").stdout.strip()
         if not branch:
@@ -78,24 +111,128 @@ def self_update_source_repo(repo_root=PROJECT_ROOT,
             if checkout.returncode != 0:
                 logger.warning(f"could not check out {default_branch}: "
                                f"{checkout.stderr.strip()}")
-                return
+                return False
         before = _git(repo_root, "rev-parse", "HEAD").stdout.strip()
-        pull = _git(repo_root, "pull", "--ff-only", "--autostash")
-        if pull.returncode != 0:
-            logger.warning(f"source self-update pull failed (offline, or "
-                           f"local changes/diverged history): "
-                           f"{pull.stderr.strip() or pull.stdout.strip()}")
-            return
+        merge = _git(repo_root, "merge", "--ff-only", "--autostash", "@{u}")
+        if merge.returncode != 0:
+            logger.warning(f"source self-update failed (local changes or "
+                           f"diverged history): "
+                           f"{merge.stderr.strip() or merge.stdout.strip()}")
+            return False
         after = _git(repo_root, "rev-parse", "HEAD").stdout.strip()
         if before != after:
             logger.warning(
                 f"MicroDrop source updated ({before[:8]} -> {after[:8]}). "
                 f"You will receive the updates the next time you start the "
                 f"app.")
-        else:
-            logger.info("MicroDrop source is up to date")
+        return before != after
     except Exception as e:
         logger.warning(f"source self-update failed: {e}")
+        return False
+
+
+def _publish_source_update_status(status):
+    try:
+        from microdrop_utils.dramatiq_pub_sub_helpers import publish_message
+        publish_message(topic=SOURCE_UPDATE_STATUS, message=json.dumps(status))
+    except Exception as e:
+        logger.debug(f"could not publish source update status: {e}")
+
+
+def _background_source_update(repo_root, default_branch, delay_s):
+    if delay_s > 0:
+        time.sleep(delay_s)
+    status = check_source_update(repo_root, default_branch)
+    if status["state"] == "available":
+        logger.info(f"MicroDrop source update available ({status['behind']} "
+                    f"commit(s)); it will be applied when the app exits")
+        atexit.register(apply_source_update, repo_root, default_branch)
+    elif status["state"] == "up_to_date":
+        logger.info("MicroDrop source is up to date")
+    else:
+        logger.warning(f"source self-update check failed: {status['detail']}")
+    _publish_source_update_status(status)
+
+
+def self_update_source_repo(repo_root=PROJECT_ROOT,
+                            default_branch=SOURCE_DEFAULT_BRANCH,
+                            delay_s=GIT_SELF_UPDATE_START_DELAY_S):
+    """Best-effort git self-update of the MicroDrop source repo — a backstop
+    so the app keeps itself current even when launched without the launcher
+    scripts (IDE, custom shortcut, `pixi run microdrop` directly).
+
+    Never blocks startup: after ``delay_s`` a daemon thread fetches the
+    remote (check_source_update) and publishes the result on
+    SOURCE_UPDATE_STATUS. The running process already imported its modules
+    (and imports more lazily), so the working tree is left alone while the
+    app runs; an available update is fast-forwarded when the process exits
+    (apply_source_update) and takes effect the next time the app starts.
+
+    Skipped when ``MICRODROP_SKIP_GIT_UPDATE`` is set, when git or the
+    ``.git`` link is absent (frozen/tarball installs), in a spawned
+    worker process, or on any error. Returns the background thread, or None
+    when skipped.
+    """
+    if multiprocessing.parent_process() is not None:
+        # A spawned child re-imports the launcher, so without this every
+        # worker in a pool would run its own git fetch — the app's own
+        # ROI batch once produced one per CPU.
+        logger.debug("source self-update skipped: worker process")
+        return None
+    if os.environ.get(SKIP_GIT_UPDATE_ENV_VAR):
+        logger.info(f"source self-update skipped ({SKIP_GIT_UPDATE_ENV_VAR} is set)")
+        return None
+    # A submodule's .git is a FILE pointing at the real git dir — exists(),
+    # not is_dir().
+    if shutil.which("git") is None or not (Path(repo_root) / ".git").exists():
+        logger.debug("source self-update skipped: no git or not a checkout")
+        return None
+    thread = threading.Thread(
+        target=_background_source_update,
+        args=(repo_root, default_branch, delay_s),
+        daemon=True, name="source-self-update")
+    thread.start()
+    return thread
+
+
+#: Seconds spent importing each plugin (by "module:Class" spec) in this
+#: process, in load order — see load_plugin_classes.
+PLUGIN_IMPORT_TIMES_S = {}
+
+
+def import_spec(spec):
+    """Import a dotted "module:Class" spec and return the class. A class
+    passed instead of a spec is returned as is."""
+    if not isinstance(spec, str):
+        return spec
+    module_path, _, class_name = spec.partition(":")
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+def load_plugin_classes(specs):
+    """Import the plugin classes for ``specs`` ("module:Class" strings, or
+    classes), recording each one's import time in PLUGIN_IMPORT_TIMES_S.
+
+    Modules shared between plugins are charged to the first plugin that
+    imports them, so the times show what each plugin added to startup.
+    """
+    classes = []
+    with startup_profiler.span("plugin imports"):
+        for spec in specs:
+            started = time.perf_counter()
+            with startup_profiler.span(f"import {spec}", "import"):
+                classes.append(import_spec(spec))
+            if isinstance(spec, str):
+                PLUGIN_IMPORT_TIMES_S[spec] = time.perf_counter() - started
+    timed = [(PLUGIN_IMPORT_TIMES_S[s], s) for s in specs if isinstance(s, str)]
+    if timed:
+        logger.info(f"Imported {len(timed)} plugins in "
+                    f"{sum(t for t, _ in timed):.2f} s; slowest: " + ", ".join(
+                        f"{s.partition(':')[2]} {t:.2f} s"
+                        for t, s in sorted(timed, reverse=True)[:5]))
+        for t, s in timed:
+            logger.debug(f"plugin import {s}: {t * 1000:.0f} ms")
+    return classes
 
 
 def microdrop_runner_setup():
@@ -103,13 +240,18 @@ def microdrop_runner_setup():
     Common setup for all MicroDrop runner scripts.
 
     Configures the Dramatiq broker from redis_settings.json, adds the project
-    root to sys.path so submodules are importable, and runs the best-effort
-    git self-update (see :func:`self_update_source_repo` — updates apply on
-    the NEXT launch, this one is already imported).
+    root to sys.path so submodules are importable, and starts the best-effort
+    background git self-update (see :func:`self_update_source_repo` —
+    updates apply on the NEXT launch, this one is already imported).
+
+    Also starts startup profiling when MICRODROP_PROFILE_STARTUP is set (see
+    :mod:`microdrop_utils.startup_profiler`).
 
     Must be called before importing any modules that use dramatiq.get_broker().
     """
-    configure_dramatiq_broker()
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
-    self_update_source_repo()
+    startup_profiler.enable_from_environment()
+    with startup_profiler.span("runner setup"):
+        configure_dramatiq_broker()
+        if str(PROJECT_ROOT) not in sys.path:
+            sys.path.insert(0, str(PROJECT_ROOT))
+        self_update_source_repo()
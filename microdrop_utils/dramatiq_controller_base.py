@@ -109,12 +109,12 @@ class DramatiqControllerBase(HasTraits):
                     msg_proxy._message.message_timestamp if msg_proxy is not None
                     else None
                 )
-                debug_throttled(logger, f"to_router:{topic}",
-                                f"Message going to message_router: {message} at {msg_timestamp}")
+                debug_throttled(logger, ("to_router", topic),
+                                "Message going to message_router: %s at %s", message, msg_timestamp)
             else: # This is the message *from* the message_router (since message_router is the only publish_message that adds a timestamp)
                 msg_timestamp = timestamp
-                debug_throttled(logger, f"from_router:{topic}",
-                                f"Message received from message_router: {message} at {msg_timestamp}")
+                debug_throttled(logger, ("from_router", topic),
+                                "Message received from message_router: %s at %s", message, msg_timestamp)
 
             timestamped_message = TimestampedMessage( # Convert the message to a TimestampedMessage and propagate it to the listener_actor_method
                 content=message,
@@ -206,9 +206,9 @@ def basic_listener_actor_routine(
     # hand-excluded the two chattiest topics; at debug no exclusion needed).
     # Throttled per (listener, topic): streaming topics fire many times a second.
     debug_throttled(
-        logger, f"listener_rx:{parent_obj.name}:{topic}",
-        f"{parent_obj.name}: Received message: '{timestamped_message}' "
-        f"from topic: {topic} at {timestamped_message.timestamp}"
+        logger, ("listener_rx", parent_obj.name, topic),
+        "%s: Received message: '%s' from topic: %s at %s",
+        parent_obj.name, timestamped_message, topic, timestamped_message.timestamp
     )
 
     # Split the topic into parts and take the last segment as the key.
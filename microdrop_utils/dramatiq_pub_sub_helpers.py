@@ -71,8 +71,8 @@ def publish_message(message: str, topic: str, actor_to_send: str = "message_rout
     """
     Publish a message to a given actor with a certain topic
     """
-    debug_throttled(logger, f"publish:{topic}:{actor_to_send}",
-                    f"Publishing message: {message} to actor: {actor_to_send} on topic: {topic}")
+    debug_throttled(logger, ("publish", topic, actor_to_send),
+                    "Publishing message: %s to actor: %s on topic: %s", message, actor_to_send, topic)
 
     broker = dramatiq.get_broker()
 
@@ -398,19 +398,21 @@ class MessageRouterActor(DramatiqControllerBase):
         """returns a default listener actor method for message routing"""
 
         def listener_actor_method(timestamped_message: TimestampedMessage, topic: Str):
-            debug_throttled(logger, f"router_rx:{topic}",
-                            f"MESSAGE_ROUTER: Received message: {timestamped_message} on topic: {topic}")
+            debug_throttled(logger, ("router_rx", topic),
+                            "MESSAGE_ROUTER: Received message: %s on topic: %s", timestamped_message, topic)
 
             subscribing_actor_queue_info = self.message_router_data.get_subscribers_for_topic(topic)
 
             for subscribing_actor, queue in subscribing_actor_queue_info:
-                debug_throttled(logger, f"router_tx:{topic}:{subscribing_actor}",
-                                f"MESSAGE_ROUTER: Publishing message: {timestamped_message} to actor: {subscribing_actor}")
+                debug_throttled(logger, ("router_tx", topic, subscribing_actor),
+                                "MESSAGE_ROUTER: Publishing message: %s to actor: %s",
+                                timestamped_message, subscribing_actor)
 
                 publish_message(str(timestamped_message), topic, subscribing_actor, queue_name=queue, message_kwargs={"timestamp": timestamped_message._timestamp_ms})
 
             debug_throttled(
-                logger, f"router_done:{topic}",
-                f"MESSAGE_ROUTER: Message: {timestamped_message} on topic {topic} published to {len(subscribing_actor_queue_info)} subscribers")
+                logger, ("router_done", topic),
+                "MESSAGE_ROUTER: Message: %s on topic %s published to %d subscribers",
+                timestamped_message, topic, len(subscribing_actor_queue_info))
 
         return listener_actor_method
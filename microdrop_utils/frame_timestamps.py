@@ -0,0 +1,220 @@
+"""Per-frame capture timestamps of a recorded video, kept in a compact
+binary sidecar next to the recording (``<video>.frames.bin``).
+
+A container only carries its nominal frame rate (or, for Qt's recorder,
+pts that drift from the wall clock), and webcams rarely deliver a constant
+rate. The sidecar records WHEN each frame that went into the file was
+captured, so a frame can be matched exactly with logged data (which is
+stamped in UTC seconds) and a logged time can be turned into a frame index
+without decoding anything.
+
+Layout (little-endian):
+
+    header  magic b"MDFT", u16 version, u16 flags, f64 nominal fps,
+            i64 UTC of the first frame (us), u64 frame count
+    body    i64[frame count] capture offsets from the first frame (us)
+
+``FLAG_CONSTANT_RATE`` marks files whose container timestamps are exactly
+``index / nominal_fps`` (the raw ffmpeg recorder), so the container time of
+every frame is known without demuxing the file.
+
+Qt-free: the logging report and the offline exporter read it too.
+"""
+
+import struct
+import time
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from logger.logger_service import get_logger
+
+logger = get_logger(__name__)
+
+#: Sidecar suffix, replacing the recording's own (capture.mkv -> capture.frames.bin).
+FRAME_TIMESTAMPS_SIDECAR_SUFFIX = ".frames.bin"
+
+FRAME_TIMESTAMPS_MAGIC = b"MDFT"
+FRAME_TIMESTAMPS_VERSION = 1
+
+#: Container pts are index / nominal_fps (constant-rate mux).
+FLAG_CONSTANT_RATE = 0x1
+
+_HEADER = struct.Struct("<4sHHdqQ")
+
+
+def frame_timestamps_path(video_path) -> Path:
+    return Path(video_path).with_suffix(FRAME_TIMESTAMPS_SIDECAR_SUFFIX)
+
+
+@dataclass(frozen=True)
+class FrameTimestamps:
+    """Capture times of every frame of one recording."""
+
+    start_utc_us: int
+    offsets_us: np.ndarray  # int64, one per frame, non-decreasing
+    nominal_fps: float = 0.0
+    flags: int = 0
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.offsets_us)
+
+    @property
+    def constant_rate(self) -> bool:
+        return bool(self.flags & FLAG_CONSTANT_RATE)
+
+    @property
+    def start_utc_s(self) -> float:
+        return self.start_utc_us / 1e6
+
+    @property
+    def duration_s(self) -> float:
+        return float(self.offsets_us[-1]) / 1e6 if self.frame_count else 0.0
+
+    @property
+    def measured_fps(self) -> float:
+        """Average delivered rate (frames / capture span)."""
+        if self.frame_count < 2 or self.offsets_us[-1] <= 0:
+            return 0.0
+        return (self.frame_count - 1) / self.duration_s
+
+    def capture_time_s(self, index) -> float:
+        """Seconds since the first frame at which frame ``index`` was captured."""
+        return float(self.offsets_us[index]) / 1e6
+
+    def frame_index_at(self, offset_s) -> int:
+        """Index of the frame on screen ``offset_s`` seconds after the first
+        frame: the last frame captured at or before that time (clamped to
+        the recording)."""
+        index = int(np.searchsorted(self.offsets_us, round(offset_s * 1e6),
+                                    side="right")) - 1
+        return min(max(index, 0), self.frame_count - 1)
+
+    def frame_index_at_utc(self, utc_s) -> Optional[int]:
+        """Frame on screen at UTC time ``utc_s`` (seconds since the epoch),
+        or None when that time falls outside the recording."""
+        offset_s = utc_s - self.start_utc_s
+        if not self.frame_count or offset_s < 0 or offset_s * 1e6 > self.offsets_us[-1]:
+            return None
+        return self.frame_index_at(offset_s)
+
+    def container_times_s(self) -> Optional[np.ndarray]:
+        """Presentation time of every frame in the container, when the file
+        was muxed at a constant rate (else None: probe the container)."""
+        if not self.constant_rate or self.nominal_fps <= 0:
+            return None
+        return np.arange(self.frame_count) / self.nominal_fps
+
+    def slice(self, start, stop) -> "FrameTimestamps":
+        """Timestamps of frames ``start:stop`` (e.g. an export's frames)."""
+        offsets = self.offsets_us[start:stop]
+        base = int(offsets[0]) if len(offsets) else 0
+        return FrameTimestamps(start_utc_us=self.start_utc_us + base,
+                               offsets_us=offsets - base,
+                               nominal_fps=self.nominal_fps, flags=self.flags)
+
+    def write(self, path) -> Path:
+        path = Path(path)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(FRAME_TIMESTAMPS_MAGIC, FRAME_TIMESTAMPS_VERSION,
+                                 self.flags, float(self.nominal_fps),
+                                 int(self.start_utc_us), self.frame_count))
+            f.write(np.ascontiguousarray(self.offsets_us, dtype="<i8").tobytes())
+        return path
+
+
+def read_frame_timestamps(path) -> FrameTimestamps:
+    """Parse a sidecar; raises ValueError when it is not one or is truncated."""
+    data = Path(path).read_bytes()
+    if len(data) < _HEADER.size:
+        raise ValueError(f"{path}: too short for a frame timestamp sidecar")
+    magic, version, flags, fps, start_utc_us, count = _HEADER.unpack_from(data)
+    if magic != FRAME_TIMESTAMPS_MAGIC:
+        raise ValueError(f"{path}: not a frame timestamp sidecar")
+    if version > FRAME_TIMESTAMPS_VERSION:
+        raise ValueError(f"{path}: unsupported sidecar version {version}")
+    if len(data) < _HEADER.size + count * 8:
+        raise ValueError(f"{path}: truncated ({count} frames declared)")
+    offsets = np.frombuffer(data, dtype="<i8", count=count, offset=_HEADER.size)
+    return FrameTimestamps(start_utc_us=start_utc_us, offsets_us=offsets.astype(np.int64),
+                           nominal_fps=fps, flags=flags)
+
+
+def load_frame_timestamps(video_path) -> Optional[FrameTimestamps]:
+    """The recording's timestamp sidecar, or None when it has none (older
+    recordings, imported videos) or it can't be read."""
+    path = frame_timestamps_path(video_path)
+    if not path.exists():
+        return None
+    try:
+        return read_frame_timestamps(path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Unreadable frame timestamp sidecar {path}: {e}")
+        return None
+
+
+class FrameTimestampLog:
+    """Collects capture times while recording, one ``add`` per frame that
+    goes into the file.
+
+    The first frame anchors the UTC start. Offsets come from the frames' own
+    start times (``QVideoFrame.startTime()``, microseconds on the camera
+    clock) when the backend provides them, else from the monotonic clock at
+    arrival; a frame without a start time in a frame-clocked recording falls
+    back to the monotonic clock. Appends go to a typed array (8 bytes per
+    frame, no per-frame objects), so the log costs next to nothing on the
+    GUI thread.
+    """
+
+    def __init__(self, nominal_fps=0.0, flags=0):
+        self.nominal_fps = float(nominal_fps or 0.0)
+        self.flags = flags
+        self._offsets = array("q")
+        self._start_utc_us = 0
+        self._first_frame_us = None    # frame clock origin, None = monotonic
+        self._first_monotonic_us = 0
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def add(self, frame_start_us=-1):
+        now_us = time.monotonic_ns() // 1000
+        if not self._offsets:
+            self._start_utc_us = time.time_ns() // 1000
+            self._first_monotonic_us = now_us
+            self._first_frame_us = frame_start_us if frame_start_us >= 0 else None
+        if self._first_frame_us is not None and frame_start_us >= 0:
+            offset = frame_start_us - self._first_frame_us
+        else:
+            offset = now_us - self._first_monotonic_us
+        # Keep the series non-decreasing (searchsorted relies on it).
+        if self._offsets and offset < self._offsets[-1]:
+            offset = self._offsets[-1]
+        self._offsets.append(offset)
+
+    def truncate(self, frame_count):
+        """Keep the first ``frame_count`` entries (frames that reached the file)."""
+        del self._offsets[frame_count:]
+
+    def timestamps(self) -> FrameTimestamps:
+        return FrameTimestamps(start_utc_us=self._start_utc_us,
+                               offsets_us=np.frombuffer(self._offsets, dtype=np.int64).copy(),
+                               nominal_fps=self.nominal_fps, flags=self.flags)
+
+    def write_sidecar(self, video_path) -> Optional[Path]:
+        """Write ``<video>.frames.bin``; None (and a warning) on failure or
+        when no frame was logged."""
+        if not self._offsets:
+            return None
+        path = frame_timestamps_path(video_path)
+        try:
+            self.timestamps().write(path)
+        except OSError as e:
+            logger.warning(f"Could not write frame timestamp sidecar: {e}")
+            return None
+        logger.info(f"Wrote frame timestamp sidecar: {path} ({len(self)} frames)")
+        return path
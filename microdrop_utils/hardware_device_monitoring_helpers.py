@@ -1,11 +1,24 @@
 import json
+import os
 import re
+import sys
+import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import NamedTuple
 
 import serial
-from serial.tools.list_ports import grep
+from serial.tools.list_ports import comports, grep
 from traits.api import Any, HasTraits, Str
+from traits.etsconfig.api import ETSConfig
+
+try:
+    import pyudev
+except ImportError:
+    # Optional (Linux): without it, monitors keep scanning periodically.
+    pyudev = None
 
 from logger.logger_service import get_logger
 
@@ -17,12 +30,19 @@ logger = get_logger(__name__)
 #: legacy Identify feature's 0.7 s delay.
 WHOAMI_PROBE_WAIT_S = 1.5
 
-#: Serializes whoami probes within this process: the heater and fluorescence
-#: monitors run in the same backend, and concurrent probes of the same port
-#: would make it look busy to one of them. Across processes the OS-exclusive
+#: Per-port locks serializing whoami probes of the SAME port within this
+#: process: the heater and fluorescence monitors run in the same backend, and
+#: concurrent probes of one port would make it look busy to one of them.
+#: Different ports are probed in parallel. Across processes the OS-exclusive
 #: serial open provides the equivalent guarantee (the loser skips the port
 #: until its next scan).
-_probe_lock = threading.Lock()
+_port_probe_locks = {}
+_port_probe_locks_lock = threading.Lock()
+
+
+def _port_probe_lock(port) -> threading.Lock:
+    with _port_probe_locks_lock:
+        return _port_probe_locks.setdefault(port, threading.Lock())
 
 #: Sentinel: the port could not be opened (busy — possibly the other
 #: plugin's board or a probe in flight). Distinct from "opened but no
@@ -69,6 +89,146 @@ def check_devices_available(hwids_to_check):
             raise Exception(f'No device for hwids {hwids_to_check} found')
 
 
+def port_matches_hwids(port, hwids) -> bool:
+    """Whether the currently enumerated serial ``port`` has a hardware id
+    matching one of ``hwids`` (False when the port is not present)."""
+    for port_info in comports():
+        if port_info.device == port:
+            return any(re.search(hwid, port_info.hwid) for hwid in hwids)
+    return False
+
+
+#: SerialPortEvent actions (the kernel's own uevent action names).
+PORT_ADDED = "add"
+PORT_REMOVED = "remove"
+
+
+class SerialPortEvent(NamedTuple):
+    action: str  # PORT_ADDED / PORT_REMOVED
+    port: str    # device name, e.g. /dev/ttyACM0
+
+
+class PortEventSource:
+    """Source of serial port hotplug events: start(callback) has it call
+    ``callback(SerialPortEvent)``, from its own thread, until stop()."""
+
+    def start(self, callback):
+        raise NotImplementedError
+
+    def stop(self):
+        pass
+
+
+class UdevPortEventSource(PortEventSource):
+    """tty add/remove events from udev (kernel netlink) via pyudev."""
+
+    def __init__(self):
+        self._observer = None
+
+    @staticmethod
+    def available() -> bool:
+        return pyudev is not None and sys.platform.startswith("linux")
+
+    def start(self, callback):
+        monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+        monitor.filter_by(subsystem="tty")
+
+        def on_device(device):
+            if device.action in (PORT_ADDED, PORT_REMOVED) and device.device_node:
+                callback(SerialPortEvent(device.action, device.device_node))
+
+        self._observer = pyudev.MonitorObserver(
+            monitor, callback=on_device, name="serial-port-events")
+        self._observer.start()
+
+    def stop(self):
+        if self._observer is not None:
+            self._observer.send_stop()
+            self._observer = None
+
+
+def default_port_event_source() -> PortEventSource | None:
+    """This platform's hotplug event source, or None when it has none
+    (not Linux, or pyudev missing): callers keep scanning periodically."""
+    if UdevPortEventSource.available():
+        return UdevPortEventSource()
+    return None
+
+
+class SerialPortWatcher:
+    """Reports hotplug of the serial ports matching ``hwids`` as it happens.
+
+    ``on_port_added(port)`` is called for each matching port that appears
+    and ``on_port_removed(port)`` for a matching port that goes away, on the
+    event source's thread. Only the port an event names is looked at —
+    nothing is scanned or probed for events about other devices.
+    ``event_source`` defaults to default_port_event_source(); pass a
+    PortEventSource to drive the watcher from elsewhere (e.g. tests).
+    """
+
+    def __init__(self, hwids, on_port_added, on_port_removed=None,
+                 event_source=None):
+        self.hwids = list(hwids)
+        self.on_port_added = on_port_added
+        self.on_port_removed = on_port_removed
+        self._event_source = event_source
+        self._matched_ports = set()
+        self._lock = threading.Lock()
+        self.active = False
+
+    def start(self) -> bool:
+        """Start watching. False (and nothing started) when there is no
+        event source on this platform."""
+        if self.active:
+            return True
+        if self._event_source is None:
+            self._event_source = default_port_event_source()
+        if self._event_source is None:
+            return False
+        with self._lock:
+            self._matched_ports = {
+                port_info.device for port_info in comports()
+                if any(re.search(hwid, port_info.hwid) for hwid in self.hwids)}
+        try:
+            self._event_source.start(self._on_event)
+        except Exception as e:
+            logger.warning(f"Serial port events unavailable ({e}); "
+                           f"falling back to periodic scans")
+            return False
+        self.active = True
+        logger.info(f"Watching serial port events for hwids {self.hwids}")
+        return True
+
+    def stop(self):
+        if self.active:
+            self._event_source.stop()
+            self.active = False
+
+    def _on_event(self, event: SerialPortEvent):
+        if event.action == PORT_ADDED:
+            if not port_matches_hwids(event.port, self.hwids):
+                return
+            with self._lock:
+                self._matched_ports.add(event.port)
+            callback = self.on_port_added
+        elif event.action == PORT_REMOVED:
+            with self._lock:
+                if event.port not in self._matched_ports:
+                    return
+                self._matched_ports.discard(event.port)
+            callback = self.on_port_removed
+        else:
+            return
+        logger.debug(f"Serial port {event.action}: {event.port}")
+        if callback is None:
+            return
+        try:
+            callback(event.port)
+        except Exception as e:
+            logger.error(f"Serial port {event.action} handler failed for "
+                         f"{event.port}: {e}", exc_info=True)
+
+
 #: Prefix of a board's identity frame line: ``§WHOAMI{json}``.
 WHOAMI_MARKER = "§WHOAMI"
 
@@ -130,14 +290,14 @@ def _probe_port(port, baudrate, timeout_s=WHOAMI_PROBE_WAIT_S,
     """``(result, handle)``: result is a ``device_id`` string, ``None``
     (opened, no identity — older firmware), or ``PORT_BUSY`` (could not
     open). ``handle`` is the still-open serial port when ``keep_open`` and
-    the board identified, else None (port closed). Probes are serialized
-    in-process.
+    the board identified, else None (port closed). Probes of one port are
+    serialized in-process; different ports may be probed concurrently.
 
     Reads line by line until a WHOAMI frame parses or ``timeout_s`` elapses,
     so a reply that arrives late (board busy streaming) or lands split
     across reads is not lost the way a single fixed-delay read_all() loses
     a line truncated mid-JSON."""
-    with _probe_lock:
+    with _port_probe_lock(port):
         try:
             probe = serial.Serial(port, baudrate, timeout=0.2, write_timeout=2)
         except Exception as e:
@@ -185,7 +345,7 @@ def probe_port_device_id(port, baudrate=115200) -> str | None:
 #: keyed (device_id_fragment, port). Lets the unidentified-port fallback in
 #: find_port_by_device_id demand several misses in a row before claiming a
 #: port: one missed probe window (board busy streaming) must not hand a
-#: board to the wrong plugin. Process-local like _probe_lock.
+#: board to the wrong plugin. Process-local like _port_probe_locks.
 _unidentified_miss_counts = {}
 _unidentified_state_lock = threading.Lock()
 
@@ -216,8 +376,204 @@ def _prune_unidentified_state(device_id_fragment, seen_ports):
             del _unidentified_miss_counts[key]
 
 
+#: Whoami probes one discovery pass may run at once (on different ports).
+DISCOVERY_MAX_PARALLEL_PROBES = 8
+
+DEVICE_IDENTITY_CACHE_FILENAME = "serial_device_identities.json"
+
+
+def device_identity_cache_file() -> Path:
+    """App-data file remembering which board (whoami ``device_id``) each
+    USB serial device is. Lives under ETSConfig.application_home; the dir
+    is created if missing."""
+    home = Path(ETSConfig.application_home)
+    home.mkdir(parents=True, exist_ok=True)
+    return home / DEVICE_IDENTITY_CACHE_FILENAME
+
+
+def usb_identity_key(port_info) -> str | None:
+    """``VID:PID:serial`` of a listed port, stable across replugs, COM/tty
+    renumbering and app runs; None when the device reports no serial
+    number (it then can't be told apart from its twins)."""
+    vid = getattr(port_info, "vid", None)
+    pid = getattr(port_info, "pid", None)
+    serial_number = getattr(port_info, "serial_number", None)
+    if vid is None or pid is None or not serial_number:
+        return None
+    return f"{vid:04X}:{pid:04X}:{serial_number}"
+
+
+class PortDiscoveryService:
+    """Whoami-based port discovery shared by every monitor in the process.
+
+    probe_ports() probes candidate ports concurrently (each probe bounded by
+    its own timeout; one port is never probed twice at once), so a pass
+    takes about one probe time however many USB-serial devices are
+    attached. Identities learnt are kept per USB device (usb_identity_key)
+    and persisted in ``cache_file`` between runs: a port whose device is
+    known to be the wanted board is probed first and alone, ports known to
+    be other boards are only probed when nothing else matched (the cache
+    may be stale, e.g. after a reflash), so a monitor normally never opens
+    another board's port.
+    """
+
+    def __init__(self, cache_file=None,
+                 max_parallel_probes=DISCOVERY_MAX_PARALLEL_PROBES):
+        self._cache_file = cache_file
+        self._identities = None  # usb identity key -> device_id, loaded lazily
+        self._cache_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_parallel_probes, thread_name_prefix="port-probe")
+
+    # ---- identity cache ---------------------------------------------------
+
+    def _cache_path(self) -> Path:
+        if self._cache_file is None:
+            self._cache_file = device_identity_cache_file()
+        return Path(self._cache_file)
+
+    def _load_identities(self) -> dict:
+        """Caller holds _cache_lock."""
+        if self._identities is None:
+            self._identities = {}
+            try:
+                path = self._cache_path()
+                if path.exists():
+                    data = json.loads(path.read_text())
+                    if isinstance(data, dict):
+                        self._identities = {str(k): str(v) for k, v in data.items()}
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable device identity cache: {e}")
+        return self._identities
+
+    def cached_device_id(self, port_info) -> str | None:
+        key = usb_identity_key(port_info)
+        if key is None:
+            return None
+        with self._cache_lock:
+            return self._load_identities().get(key)
+
+    def remember(self, port_info, device_id):
+        """Record the probe's answer for ``port_info``'s device (a
+        ``device_id``, or None to forget it)."""
+        key = usb_identity_key(port_info)
+        if key is None:
+            return
+        with self._cache_lock:
+            identities = self._load_identities()
+            if identities.get(key) == device_id:
+                return
+            if device_id is None:
+                identities.pop(key, None)
+            else:
+                identities[key] = device_id
+            self._save_identities(dict(identities))
+
+    def _save_identities(self, identities):
+        """Temp file + replace, so another process never reads a partial file."""
+        try:
+            path = self._cache_path()
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(identities, f, indent=1, sort_keys=True)
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except Exception as e:
+            logger.warning(f"Could not write device identity cache: {e}")
+
+    # ---- probing ------------------------------------------------------------
+
+    def probe_ports(self, port_infos, accept, baudrate=115200):
+        """
+        Probe ``port_infos`` (listed ports) for a board whose ``device_id``
+        satisfies ``accept(device_id)``.
+
+        Returns ``(match, results)``: ``match`` is ``(port_info, device_id,
+        handle)`` for the first accepted board — its probe handle still
+        open — or None; ``results`` maps each port name probed to its probe
+        result (a ``device_id``, None or PORT_BUSY). Probes still running
+        when a match is found are finished (and their handles closed) in the
+        background.
+        """
+        preferred, unknown, deferred = [], [], []
+        for port_info in port_infos:
+            cached = self.cached_device_id(port_info)
+            if cached is None:
+                unknown.append(port_info)
+            elif accept(cached):
+                preferred.append(port_info)
+            else:
+                deferred.append(port_info)
+
+        results = {}
+        for group in (preferred, unknown, deferred):
+            match = self._probe_group(group, accept, baudrate, results)
+            if match is not None:
+                return match, results
+        return None, results
+
+    def _probe_group(self, port_infos, accept, baudrate, results):
+        if not port_infos:
+            return None
+        futures = {
+            self._executor.submit(_probe_port, str(port_info.device), baudrate,
+                                  keep_open=True): port_info
+            for port_info in port_infos}
+        pending = set(futures)
+        match = None
+        try:
+            for future in as_completed(futures):
+                pending.discard(future)
+                port_info = futures[future]
+                result, handle = self._collect(future, port_info)
+                results[str(port_info.device)] = result
+                if isinstance(result, str) and accept(result):
+                    match = (port_info, result, handle)
+                    return match
+                if handle is not None:
+                    handle.close()
+        finally:
+            for future in pending:
+                future.add_done_callback(
+                    lambda f, info=futures[future]: self._discard(f, info))
+        return match
+
+    def _collect(self, future, port_info):
+        try:
+            result, handle = future.result()
+        except Exception as e:
+            logger.debug(f"whoami probe of {port_info.device} failed: {e}")
+            return None, None
+        if isinstance(result, str):
+            self.remember(port_info, result)
+        return result, handle
+
+    def _discard(self, future, port_info):
+        """Finish a probe that lost the race: keep what it learnt, free the port."""
+        _, handle = self._collect(future, port_info)
+        if handle is not None:
+            handle.close()
+
+
+_discovery_service = None
+_discovery_service_lock = threading.Lock()
+
+
+def get_port_discovery_service() -> PortDiscoveryService:
+    """The process-wide PortDiscoveryService."""
+    global _discovery_service
+    with _discovery_service_lock:
+        if _discovery_service is None:
+            _discovery_service = PortDiscoveryService()
+        return _discovery_service
+
+
 def claim_port_by_device_id(hwids, device_id_fragment, *,
-                            min_unidentified_scans=1) -> ClaimedPort:
+                            min_unidentified_scans=1,
+                            discovery=None) -> ClaimedPort:
     """Claim the port of the board whose whoami ``device_id`` contains
     ``device_id_fragment``, searching all ports matching ``hwids`` by
     VID:PID. Returns a ClaimedPort whose serial handle has been open since
@@ -238,31 +594,41 @@ def claim_port_by_device_id(hwids, device_id_fragment, *,
     this ``device_id_fragment``. The default of 1 keeps one-shot semantics;
     the periodic peripheral monitors pass a higher value so one missed
     probe window on a busy board doesn't hand it to the wrong plugin.
+
+    Candidates are probed concurrently, known boards first, through
+    ``discovery`` (default: the process-wide PortDiscoveryService).
     """
-    unidentified = []
-    seen_ports = set()
+    discovery = get_port_discovery_service() if discovery is None else discovery
+    candidates = {}
     for hwid in hwids:
         for port_info in grep(hwid):
-            port = str(port_info.device)
-            seen_ports.add(port)
-            result, handle = _probe_port(port, 115200, keep_open=True)
-            if result is PORT_BUSY:
-                logger.debug(f"Port {port} busy; skipping this scan")
-            elif result is None:
-                unidentified.append(port)
-            elif device_id_fragment in result:
-                _note_port_identified(device_id_fragment, port)
-                logger.info(f"Board '{result}' matched on port {port}")
-                return ClaimedPort(port=port, serial=handle)
-            else:
-                _note_port_identified(device_id_fragment, port)
+            candidates.setdefault(str(port_info.device), port_info)
+    seen_ports = set(candidates)
+
+    match, results = discovery.probe_ports(
+        candidates.values(), lambda device_id: device_id_fragment in device_id)
+
+    unidentified = []
+    for port in candidates:  # enumeration order
+        if port not in results:
+            continue
+        result = results[port]
+        if result is PORT_BUSY:
+            logger.debug(f"Port {port} busy; skipping this scan")
+        elif result is None:
+            unidentified.append(port)
+        else:
+            _note_port_identified(device_id_fragment, port)
+            if match is None or port != str(match[0].device):
                 logger.debug(
                     f"Port {port} identifies as '{result}' — not a "
                     f"'{device_id_fragment}' board; skipping")
-                try:
-                    handle.close()
-                except Exception:
-                    pass
+    if match is not None:
+        port_info, device_id, handle = match
+        port = str(port_info.device)
+        logger.info(f"Board '{device_id}' matched on port {port}")
+        return ClaimedPort(port=port, serial=handle)
+
     _prune_unidentified_state(device_id_fragment, seen_ports)
     for port in unidentified:
         misses = _note_port_unidentified(device_id_fragment, port)
@@ -0,0 +1,201 @@
+"""
+Startup profiling: nested timing spans written as a Chrome trace.
+
+Set MICRODROP_PROFILE_STARTUP before launching a run_device_viewer_pluggable*.py
+runner — to an output file path, or to 1 for ``startup_trace_<pid>.json`` in
+the working directory. Every span() entered until finish() is recorded, on any
+thread, and finish() writes them in Chrome trace-event format: open the file in
+https://ui.perfetto.dev, chrome://tracing or speedscope for a flame graph of
+where the seconds between launch and the first usable window went (runner
+setup, Redis server and worker start, plugin imports, per-plugin start(),
+window creation, device SVG load, ...). The runner finishes the trace once the
+application is initialized (first window up and the event loop running) or,
+for a headless backend, once every plugin has started.
+
+Profiling is off unless the variable is set; span() then costs one check.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from logger.logger_service import get_logger
+
+logger = get_logger(__name__)
+
+STARTUP_PROFILE_ENV = "MICRODROP_PROFILE_STARTUP"
+
+_lock = threading.Lock()
+_events = None  # list of trace events while recording, else None
+_output_path = None
+_thread_names = {}
+
+
+def _now_us() -> float:
+    return time.perf_counter_ns() / 1000
+
+
+def enable(path=None):
+    """Start recording; finish() writes to ``path`` (default
+    ``startup_trace_<pid>.json`` in the working directory)."""
+    global _events, _output_path
+    with _lock:
+        if _events is None:
+            _events = []
+        _output_path = Path(path) if path else Path(f"startup_trace_{os.getpid()}.json")
+
+
+def enable_from_environment() -> bool:
+    """enable() when MICRODROP_PROFILE_STARTUP is set. Returns whether profiling is on."""
+    value = os.environ.get(STARTUP_PROFILE_ENV, "").strip()
+    if value and value.lower() not in ("0", "false", "no"):
+        enable(None if value.lower() in ("1", "true", "yes") else value)
+    return is_enabled()
+
+
+def is_enabled() -> bool:
+    return _events is not None
+
+
+def record(name, start_us, end_us, category="startup", **args):
+    """Record a completed span that ran on the calling thread."""
+    if _events is None:
+        return
+    thread = threading.current_thread()
+    event = {"name": name, "cat": category, "ph": "X", "ts": start_us,
+             "dur": max(end_us - start_us, 0), "pid": os.getpid(), "tid": thread.ident}
+    if args:
+        event["args"] = {k: str(v) for k, v in args.items()}
+    with _lock:
+        if _events is not None:
+            _events.append(event)
+            _thread_names.setdefault(thread.ident, thread.name)
+
+
+@contextmanager
+def span(name, category="startup", **args):
+    """Time the ``with`` block as a span. Spans nest by time on each thread."""
+    if _events is None:
+        yield
+        return
+    start = _now_us()
+    try:
+        yield
+    finally:
+        record(name, start, _now_us(), category, **args)
+
+
+def mark(name, category="startup", **args):
+    """Record an instant event (e.g. "window opened")."""
+    if _events is None:
+        return
+    event = {"name": name, "cat": category, "ph": "i", "s": "p", "ts": _now_us(),
+             "pid": os.getpid(), "tid": threading.get_ident()}
+    if args:
+        event["args"] = {k: str(v) for k, v in args.items()}
+    with _lock:
+        if _events is not None:
+            _events.append(event)
+
+
+def trace() -> dict:
+    """The events recorded so far as a Chrome trace-event document."""
+    with _lock:
+        events = list(_events or ())
+        names = dict(_thread_names)
+    pid = os.getpid()
+    metadata = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                 "args": {"name": "microdrop"}}]
+    metadata += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                 for tid, name in names.items()]
+    return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+
+def top_level_spans(events) -> list:
+    """``(name, duration_ms)`` of the spans not nested in another span on
+    their thread, in start order."""
+    spans = sorted((e for e in events if e.get("ph") == "X"),
+                   key=lambda e: (e["tid"], e["ts"], -e["dur"]))
+    top, end_by_tid = [], {}
+    for e in spans:
+        if e["ts"] < end_by_tid.get(e["tid"], float("-inf")):
+            continue
+        end_by_tid[e["tid"]] = e["ts"] + e["dur"]
+        top.append(e)
+    top.sort(key=lambda e: e["ts"])
+    return [(e["name"], e["dur"] / 1000) for e in top]
+
+
+def finish(name="startup complete") -> Optional[Path]:
+    """Mark ``name``, write the trace, log a per-phase summary and stop
+    recording. Returns the trace file, or None when profiling was off or the
+    file could not be written."""
+    global _events
+    if _events is None:
+        return None
+    mark(name)
+    document = trace()
+    with _lock:
+        _events = None
+        _thread_names.clear()
+        path = _output_path
+
+    events = document["traceEvents"]
+    stamps = [e["ts"] for e in events if "ts" in e]
+    total_ms = (max(stamps) - min(stamps)) / 1000 if stamps else 0.0
+    logger.info(f"Startup profile: {total_ms:.0f} ms until {name}; " + ", ".join(
+        f"{span_name} {ms:.0f} ms" for span_name, ms in top_level_spans(events)))
+    try:
+        path.write_text(json.dumps(document), encoding="utf-8")
+    except OSError as e:
+        logger.warning(f"Could not write startup trace {path}: {e}")
+        return None
+    logger.info(f"Startup trace written to {path.resolve()}")
+    return path
+
+
+def profile_application(app):
+    """Record an Envisage application's start: one span per plugin start()
+    (through a timing plugin activator), the whole application start, and for
+    a Tasks application the window creation up to ``application_initialized``,
+    where the trace is finished (after the application's own initialized
+    handlers, so a first-run dialog shown there counts). A plain Application
+    is finished once started."""
+    if _events is None:
+        return
+    from envisage.plugin_activator import PluginActivator
+
+    class _SpanPluginActivator(PluginActivator):
+        def start_plugin(self, plugin):
+            with span(f"start {plugin.id or type(plugin).__name__}", "plugin"):
+                super().start_plugin(plugin)
+
+    for plugin in app.plugin_manager:
+        plugin.activator = _SpanPluginActivator()
+
+    is_tasks_app = app.trait("application_initialized") is not None
+    started_at = {}
+
+    def on_starting(event):
+        started_at["start"] = _now_us()
+
+    def on_started(event):
+        now = _now_us()
+        record("application start", started_at.get("start", now), now)
+        started_at["started"] = now
+        if not is_tasks_app:
+            finish("application started")
+
+    def on_initialized(event):
+        now = _now_us()
+        record("create windows", started_at.get("started", now), now)
+        finish("application initialized")
+
+    app.observe(on_starting, "starting")
+    app.observe(on_started, "started")
+    if is_tasks_app:
+        app.observe(on_initialized, "application_initialized")
+        app.observe(lambda event: mark("window opened"), "window_opened")
@@ -0,0 +1,69 @@
+"""Per-frame capture timestamp sidecar: format round trip and frame lookup."""
+
+import numpy as np
+import pytest
+
+from microdrop_utils.frame_timestamps import (
+    FLAG_CONSTANT_RATE, FrameTimestampLog, FrameTimestamps,
+    frame_timestamps_path, load_frame_timestamps, read_frame_timestamps,
+)
+
+
+def make_timestamps(offsets_ms, **kwargs):
+    return FrameTimestamps(start_utc_us=1_700_000_000_000_000,
+                           offsets_us=np.array(offsets_ms, dtype=np.int64) * 1000, **kwargs)
+
+
+def test_sidecar_round_trip(tmp_path):
+    timestamps = make_timestamps([0, 33, 70, 100], nominal_fps=30.0, flags=FLAG_CONSTANT_RATE)
+    path = timestamps.write(frame_timestamps_path(tmp_path / "capture.mkv"))
+
+    assert path.name == "capture.frames.bin"
+    loaded = load_frame_timestamps(tmp_path / "capture.mkv")
+    assert loaded.start_utc_us == timestamps.start_utc_us
+    np.testing.assert_array_equal(loaded.offsets_us, timestamps.offsets_us)
+    assert loaded.constant_rate and loaded.nominal_fps == 30.0
+    np.testing.assert_allclose(loaded.container_times_s(), [0, 1 / 30, 2 / 30, 3 / 30])
+
+
+def test_truncated_or_foreign_sidecar_is_rejected(tmp_path):
+    path = make_timestamps([0, 33, 70]).write(tmp_path / "capture.frames.bin")
+    path.write_bytes(path.read_bytes()[:-4])
+    with pytest.raises(ValueError, match="truncated"):
+        read_frame_timestamps(path)
+
+    path.write_bytes(b"not a sidecar at all, just some bytes")
+    assert load_frame_timestamps(tmp_path / "capture.mkv") is None
+    assert load_frame_timestamps(tmp_path / "missing.mkv") is None
+
+
+def test_frame_lookup_uses_real_capture_times():
+    # Irregular delivery: a 200 ms stall after the second frame.
+    timestamps = make_timestamps([0, 33, 233, 266])
+
+    assert timestamps.frame_index_at(0.1) == 1    # still frame 1 during the stall
+    assert timestamps.frame_index_at(0.233) == 2
+    assert timestamps.frame_index_at(-1) == 0
+    assert timestamps.frame_index_at(10) == 3
+    assert timestamps.frame_index_at_utc(timestamps.start_utc_s + 0.25) == 2
+    assert timestamps.frame_index_at_utc(timestamps.start_utc_s - 1) is None
+    assert timestamps.measured_fps == pytest.approx(3 / 0.266)
+
+
+def test_log_prefers_frame_clock_and_truncates():
+    log = FrameTimestampLog(nominal_fps=30)
+    for start_us in (5_000_000, 5_033_000, 5_066_000, 5_100_000):
+        log.add(start_us)
+    log.truncate(3)
+
+    timestamps = log.timestamps()
+    np.testing.assert_array_equal(timestamps.offsets_us, [0, 33_000, 66_000])
+    assert timestamps.start_utc_us > 0
+
+
+def test_log_falls_back_to_monotonic_clock():
+    log = FrameTimestampLog()
+    log.add()
+    log.add()
+    offsets = log.timestamps().offsets_us
+    assert offsets[0] == 0 and offsets[1] >= 0
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from microdrop_utils.app_setup_helpers import PLUGIN_IMPORT_TIMES_S, import_spec, load_plugin_classes
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_import_spec_resolves_module_and_class():
+    from collections import OrderedDict
+    assert import_spec("collections:OrderedDict") is OrderedDict
+    assert import_spec(OrderedDict) is OrderedDict
+
+
+def test_load_plugin_classes_keeps_order_and_records_times():
+    from collections import OrderedDict
+    from json import JSONDecoder
+
+    specs = ["json:JSONDecoder", OrderedDict]
+    assert load_plugin_classes(specs) == [JSONDecoder, OrderedDict]
+    assert PLUGIN_IMPORT_TIMES_S["json:JSONDecoder"] >= 0
+
+
+def test_import_spec_missing_class_raises():
+    with pytest.raises(AttributeError):
+        import_spec("collections:NoSuchClass")
+
+
+def test_plugin_consts_imports_no_plugin_modules():
+    code = (
+        "import sys\n"
+        "from examples import plugin_consts\n"
+        "loaded = [m for m in plugin_consts.plugin_modules() if m in sys.modules]\n"
+        "print(','.join(loaded))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == ""
+
+
+def test_plugin_consts_specs_are_module_class_strings():
+    from examples import plugin_consts
+
+    for module in plugin_consts.plugin_modules():
+        assert module and ":" not in module
+    for spec in plugin_consts.REQUIRED_PLUGINS + plugin_consts.FRONTEND_PLUGINS + plugin_consts.BACKEND_PLUGINS:
+        module, sep, name = spec.partition(":")
+        assert sep and module and name.isidentifier()
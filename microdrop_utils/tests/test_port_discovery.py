@@ -0,0 +1,101 @@
+"""Parallel, cached whoami discovery against pty-backed fake boards."""
+
+import json
+import os
+import threading
+import time
+import tty
+from types import SimpleNamespace
+
+import pytest
+
+import microdrop_utils.hardware_device_monitoring_helpers as helpers
+from microdrop_utils.hardware_device_monitoring_helpers import PortDiscoveryService, claim_port_by_device_id
+
+HWIDS = ["VID:PID=2E8A:0005"]
+REPLY_DELAY_S = 0.4
+
+
+class FakeBoard:
+    """Answers ``whoami`` on a pty after REPLY_DELAY_S, like a board busy streaming."""
+
+    def __init__(self, device_id, serial_number):
+        self.master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        self.device_id = device_id
+        self.port_info = SimpleNamespace(device=self.port, vid=0x2E8A, pid=0x0005, serial_number=serial_number)
+        self.whoami_count = 0
+        self._stop = False
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        buffer = b""
+        while not self._stop:
+            try:
+                buffer += os.read(self.master, 256)
+            except OSError:
+                return
+            while b"\n" in buffer:
+                line, buffer = buffer.split(b"\n", 1)
+                if line.strip() == b"whoami":
+                    self.whoami_count += 1
+                    time.sleep(REPLY_DELAY_S)
+                    reply = json.dumps({"uid": self.port_info.serial_number, "device_id": self.device_id})
+                    os.write(self.master, f"§WHOAMI{reply}\n".encode())
+
+    def close(self):
+        self._stop = True
+        os.close(self.master)
+        os.close(self._slave)
+
+
+@pytest.fixture
+def boards(monkeypatch):
+    made = [FakeBoard("fluo_board", "F1"), FakeBoard("pump_board", "P1"), FakeBoard("heater_board", "H1")]
+    monkeypatch.setattr(helpers, "grep", lambda hwid: [board.port_info for board in made])
+    helpers._unidentified_miss_counts.clear()
+    yield made
+    for board in made:
+        board.close()
+
+
+def test_ports_are_probed_concurrently(boards, tmp_path):
+    discovery = PortDiscoveryService(cache_file=tmp_path / "identities.json")
+
+    started = time.monotonic()
+    claimed = claim_port_by_device_id(HWIDS, "heater", discovery=discovery)
+    elapsed = time.monotonic() - started
+    claimed.close()
+
+    assert claimed.port == boards[2].port
+    # One probe time, not one per board.
+    assert elapsed < 2 * REPLY_DELAY_S
+
+
+def test_identities_are_cached_between_runs(boards, tmp_path):
+    cache_file = tmp_path / "identities.json"
+    claim_port_by_device_id(HWIDS, "heater", discovery=PortDiscoveryService(cache_file=cache_file)).close()
+    time.sleep(REPLY_DELAY_S)  # let the probes that lost the race finish and record their boards
+
+    assert json.loads(cache_file.read_text()) == {
+        "2E8A:0005:F1": "fluo_board", "2E8A:0005:P1": "pump_board", "2E8A:0005:H1": "heater_board"}
+
+    # A new run (fresh service, same cache file) goes straight to the known board.
+    counts = [board.whoami_count for board in boards]
+    claimed = claim_port_by_device_id(HWIDS, "fluo", discovery=PortDiscoveryService(cache_file=cache_file))
+    claimed.close()
+    assert claimed.port == boards[0].port
+    assert [board.whoami_count - count for board, count in zip(boards, counts)] == [1, 0, 0]
+
+
+def test_stale_cache_entry_is_reprobed(boards, tmp_path):
+    cache_file = tmp_path / "identities.json"
+    # The heater board was reflashed as a pump board since the cache was written.
+    cache_file.write_text(json.dumps({"2E8A:0005:H1": "pump_board", "2E8A:0005:P1": "heater_board"}))
+    discovery = PortDiscoveryService(cache_file=cache_file)
+
+    claimed = claim_port_by_device_id(HWIDS, "heater", discovery=discovery)
+    claimed.close()
+    assert claimed.port == boards[2].port
+    assert discovery.cached_device_id(boards[2].port_info) == "heater_board"
@@ -0,0 +1,119 @@
+"""SerialPortWatcher driven by a fake hotplug event source.
+
+Port enumeration is monkeypatched; the watcher must react to the events
+alone, checking only the port each event names.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+import microdrop_utils.hardware_device_monitoring_helpers as helpers
+from microdrop_utils.hardware_device_monitoring_helpers import (
+    PORT_ADDED, PORT_REMOVED, PortEventSource, SerialPortEvent, SerialPortWatcher,
+)
+
+DROPBOT_HWID = "VID:PID=16C0:0483"
+DROPBOT_PORT_HWID = "USB VID:PID=16C0:0483 SER=1234 LOCATION=1-2:1.0"
+OTHER_PORT_HWID = "USB VID:PID=2E8A:0005 SER=e661 LOCATION=1-3:1.0"
+
+
+class FakePortEventSource(PortEventSource):
+    def __init__(self):
+        self.callback = None
+        self.stopped = False
+
+    def start(self, callback):
+        self.callback = callback
+
+    def stop(self):
+        self.stopped = True
+
+    def emit(self, action, port):
+        self.callback(SerialPortEvent(action, port))
+
+
+@pytest.fixture
+def ports(monkeypatch):
+    """Enumerated ports: name -> hwid. Counts enumerations."""
+    state = {"ports": {}, "enumerations": 0}
+
+    def fake_comports():
+        state["enumerations"] += 1
+        return [SimpleNamespace(device=name, hwid=hwid) for name, hwid in state["ports"].items()]
+
+    monkeypatch.setattr(helpers, "comports", fake_comports)
+    return state
+
+
+def make_watcher(on_added=None, on_removed=None):
+    source = FakePortEventSource()
+    watcher = SerialPortWatcher([DROPBOT_HWID], on_port_added=on_added, on_port_removed=on_removed,
+                                event_source=source)
+    assert watcher.start()
+    return watcher, source
+
+
+def test_matching_port_added_and_removed(ports):
+    added, removed = [], []
+    watcher, source = make_watcher(added.append, removed.append)
+
+    ports["ports"]["/dev/ttyACM0"] = DROPBOT_PORT_HWID
+    source.emit(PORT_ADDED, "/dev/ttyACM0")
+    assert added == ["/dev/ttyACM0"]
+
+    del ports["ports"]["/dev/ttyACM0"]
+    source.emit(PORT_REMOVED, "/dev/ttyACM0")
+    assert removed == ["/dev/ttyACM0"]
+
+    watcher.stop()
+    assert source.stopped and not watcher.active
+
+
+def test_other_devices_are_ignored(ports):
+    added, removed = [], []
+    watcher, source = make_watcher(added.append, removed.append)
+
+    ports["ports"]["/dev/ttyACM1"] = OTHER_PORT_HWID
+    source.emit(PORT_ADDED, "/dev/ttyACM1")
+    del ports["ports"]["/dev/ttyACM1"]
+    source.emit(PORT_REMOVED, "/dev/ttyACM1")
+    # A port that vanished again before its add event was handled.
+    source.emit(PORT_ADDED, "/dev/ttyACM2")
+
+    assert added == [] and removed == []
+
+
+def test_port_present_at_start_reports_its_removal(ports):
+    ports["ports"]["/dev/ttyACM0"] = DROPBOT_PORT_HWID
+    removed = []
+    watcher, source = make_watcher(on_removed=removed.append)
+
+    del ports["ports"]["/dev/ttyACM0"]
+    source.emit(PORT_REMOVED, "/dev/ttyACM0")
+    assert removed == ["/dev/ttyACM0"]
+
+
+def test_events_enumerate_only_on_add(ports):
+    watcher, source = make_watcher()
+    baseline = ports["enumerations"]
+
+    source.emit(PORT_REMOVED, "/dev/ttyUSB0")
+    assert ports["enumerations"] == baseline
+    source.emit(PORT_ADDED, "/dev/ttyUSB0")
+    assert ports["enumerations"] == baseline + 1
+
+
+def test_handler_errors_do_not_escape_to_the_event_source(ports):
+    def failing(port):
+        raise RuntimeError("connect failed")
+
+    watcher, source = make_watcher(failing)
+    ports["ports"]["/dev/ttyACM0"] = DROPBOT_PORT_HWID
+    source.emit(PORT_ADDED, "/dev/ttyACM0")  # logged, not raised
+
+
+def test_no_event_source_means_no_watcher(monkeypatch, ports):
+    monkeypatch.setattr(helpers, "pyudev", None)
+    watcher = SerialPortWatcher([DROPBOT_HWID], on_port_added=lambda port: None)
+    assert not watcher.start()
+    assert not watcher.active
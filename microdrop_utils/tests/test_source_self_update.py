@@ -0,0 +1,88 @@
+"""Background source self-update against a local bare repository remote.
+
+The check must fetch without touching the working tree; the update is only
+fast-forwarded by apply_source_update (run at process exit).
+"""
+import subprocess
+import time
+
+import pytest
+
+import microdrop_utils.app_setup_helpers as helpers
+from microdrop_utils.app_setup_helpers import apply_source_update, check_source_update
+
+pytestmark = pytest.mark.skipif(helpers.shutil.which("git") is None, reason="git not installed")
+
+
+def git(cwd, *args):
+    return subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t", *args], cwd=str(cwd),
+                          capture_output=True, text=True, check=True).stdout.strip()
+
+
+def commit(repo, name, text):
+    (repo / name).write_text(text)
+    git(repo, "add", name)
+    git(repo, "commit", "-q", "-m", f"add {name}")
+    return git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repos(tmp_path):
+    """(app checkout, upstream working clone) sharing a bare remote."""
+    remote = tmp_path / "remote.git"
+    git(tmp_path, "init", "-q", "--bare", "-b", "main", str(remote))
+    upstream = tmp_path / "upstream"
+    git(tmp_path, "clone", "-q", str(remote), str(upstream))
+    git(upstream, "checkout", "-q", "-b", "main")
+    commit(upstream, "a.py", "A = 1\n")
+    git(upstream, "push", "-q", "origin", "main")
+    app = tmp_path / "app"
+    git(tmp_path, "clone", "-q", str(remote), str(app))
+    return app, upstream
+
+
+def test_check_fetches_without_touching_the_checkout(repos):
+    app, upstream = repos
+    head = git(app, "rev-parse", "HEAD")
+    latest = commit(upstream, "b.py", "B = 2\n")
+    git(upstream, "push", "-q", "origin", "main")
+
+    status = check_source_update(app)
+
+    assert status["state"] == "available"
+    assert (status["behind"], status["current"], status["latest"]) == (1, head, latest)
+    assert git(app, "rev-parse", "HEAD") == head
+    assert not (app / "b.py").exists()
+
+    assert apply_source_update(app)
+    assert git(app, "rev-parse", "HEAD") == latest
+    assert (app / "b.py").exists()
+
+
+def test_check_reports_up_to_date_and_offline(repos, tmp_path):
+    app, _ = repos
+    assert check_source_update(app)["state"] == "up_to_date"
+
+    git(app, "remote", "set-url", "origin", str(tmp_path / "gone.git"))
+    status = check_source_update(app)
+    assert status["state"] == "failed"
+    assert "fetch failed" in status["detail"]
+
+
+def test_startup_only_starts_a_thread(repos, monkeypatch):
+    app, upstream = repos
+    commit(upstream, "b.py", "B = 2\n")
+    git(upstream, "push", "-q", "origin", "main")
+    published, registered = [], []
+    monkeypatch.delenv(helpers.SKIP_GIT_UPDATE_ENV_VAR, raising=False)
+    monkeypatch.setattr(helpers, "_publish_source_update_status", published.append)
+    monkeypatch.setattr(helpers.atexit, "register", lambda *args: registered.append(args))
+
+    started = time.monotonic()
+    thread = helpers.self_update_source_repo(app, delay_s=0.2)
+    assert time.monotonic() - started < 0.1
+
+    thread.join(10)
+    assert published[0]["state"] == "available"
+    assert registered == [(apply_source_update, app, helpers.SOURCE_DEFAULT_BRANCH)]
+    assert not (app / "b.py").exists()
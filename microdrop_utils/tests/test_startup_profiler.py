@@ -0,0 +1,74 @@
+import json
+import threading
+
+import pytest
+from envisage.api import Application, Plugin
+
+from microdrop_utils import startup_profiler
+
+
+@pytest.fixture
+def profiling(tmp_path, monkeypatch):
+    monkeypatch.setattr(startup_profiler, "_events", None)
+    monkeypatch.setattr(startup_profiler, "_thread_names", {})
+    path = tmp_path / "trace.json"
+    startup_profiler.enable(path)
+    return path
+
+
+def test_disabled_span_records_nothing(monkeypatch):
+    monkeypatch.setattr(startup_profiler, "_events", None)
+    with startup_profiler.span("ignored"):
+        pass
+    assert not startup_profiler.is_enabled()
+    assert startup_profiler.finish() is None
+
+
+def test_enable_from_environment(tmp_path, monkeypatch):
+    monkeypatch.setattr(startup_profiler, "_events", None)
+    monkeypatch.setenv(startup_profiler.STARTUP_PROFILE_ENV, "0")
+    assert not startup_profiler.enable_from_environment()
+    monkeypatch.setenv(startup_profiler.STARTUP_PROFILE_ENV, str(tmp_path / "t.json"))
+    assert startup_profiler.enable_from_environment()
+    assert startup_profiler._output_path == tmp_path / "t.json"
+
+
+def test_nested_spans_written_as_chrome_trace(profiling):
+    with startup_profiler.span("outer"):
+        with startup_profiler.span("inner", "import", spec="a:B"):
+            pass
+    worker = threading.Thread(target=lambda: startup_profiler.record("on worker", 0, 10), name="worker")
+    worker.start()
+    worker.join()
+
+    assert startup_profiler.finish("done") == profiling
+    assert not startup_profiler.is_enabled()
+
+    events = json.loads(profiling.read_text(encoding="utf-8"))["traceEvents"]
+    spans = {e["name"]: e for e in events if e["ph"] == "X"}
+    outer, inner = spans["outer"], spans["inner"]
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert inner["cat"] == "import" and inner["args"] == {"spec": "a:B"}
+    assert any(e["ph"] == "i" and e["name"] == "done" for e in events)
+    assert {"worker", threading.current_thread().name} <= {
+        e["args"]["name"] for e in events if e["name"] == "thread_name"}
+    assert [name for name, _ in startup_profiler.top_level_spans(events)] == ["on worker", "outer"]
+
+
+class _SlowPlugin(Plugin):
+    id = "test.slow"
+
+    def start(self):
+        with startup_profiler.span("slow work"):
+            pass
+
+
+def test_profile_application_times_each_plugin_and_finishes(profiling):
+    app = Application(plugins=[_SlowPlugin(), Plugin(id="test.other")])
+    startup_profiler.profile_application(app)
+    app.run()
+
+    events = json.loads(profiling.read_text(encoding="utf-8"))["traceEvents"]
+    names = [e["name"] for e in events if e["ph"] == "X"]
+    assert {"start test.slow", "start test.other", "slow work", "application start"} <= set(names)
+    assert any(e["name"] == "application started" for e in events)
@@ -107,6 +107,7 @@ def run_test(
             feedback_enabled=feedback_enabled,
             temperatures_c=temperatures_c,
             read_timeout_ms=read_timeout_ms,
+            wait=True,
         )
         if not t.get("connected"):
             print(
@@ -30,6 +30,8 @@ OPENDROP_TEMPERATURES_UPDATED = "opendrop/signals/temperatures_updated"
 OPENDROP_FEEDBACK_UPDATED = "opendrop/signals/feedback_updated"
 OPENDROP_BOARD_INFO = "opendrop/signals/board_info"
 REALTIME_MODE_UPDATED = "hardware/signals/realtime_mode_updated"
+# Channels actually written to the board (after write coalescing).
+OPENDROP_STATE_APPLIED = "opendrop/signals/state_applied"
 
 # OpenDrop request topics
 # START_DEVICE_MONITORING = "opendrop/requests/start_device_monitoring"
@@ -19,6 +19,7 @@ from .consts import (
     OPENDROP_CONNECTED,
     OPENDROP_DISCONNECTED,
     OPENDROP_FEEDBACK_UPDATED,
+    OPENDROP_STATE_APPLIED,
     OPENDROP_TEMPERATURES_UPDATED,
     PKG,
     REALTIME_MODE_UPDATED,
@@ -148,7 +149,26 @@ class OpenDropControllerBase(HasTraits):
                 message=json.dumps({"board_id": self.board_id}),
             )
 
+    def _publish_state_applied(self, applied_channels):
+        publish_message(
+            topic=OPENDROP_STATE_APPLIED,
+            message=json.dumps({
+                "channels": [int(ch) for ch in applied_channels.nonzero()[0]],
+                "coalesced_writes": self.proxy.coalesced_writes if self.proxy is not None else 0,
+            }),
+        )
+
+    def _proxy_changed(self, new):
+        # Trailing (coalesced) writes complete on the proxy's scheduler
+        # thread and report back through these.
+        if new is not None:
+            new.on_state_applied = self._handle_telemetry
+            new.on_write_error = self._on_deferred_write_error
+
     def _push_state_to_device(self, force: bool = False):
+        """Request a write of the current state. Returns the telemetry when
+        written now, None when skipped, failed, or coalesced into the
+        proxy's trailing write (which reports through _handle_telemetry)."""
         if self.proxy is None:
             return None
         if (not force) and (not self.realtime_mode):
@@ -160,31 +180,48 @@ class OpenDropControllerBase(HasTraits):
                 temperatures_c=self.set_temperatures,
                 read_timeout_ms=int(self.preferences.read_timeout_ms),
             )
-        except OSError as e:
+        except Exception as e:
+            if not self._handle_write_error(e):
+                raise
+            return None
+        if telemetry is None:
+            return None
+        return self._handle_telemetry(telemetry)
+
+    def _on_deferred_write_error(self, e):
+        if not self._handle_write_error(e):
+            logger.error(f"OpenDrop deferred write failed: {e}", exc_info=e)
+
+    def _handle_write_error(self, e) -> bool:
+        """Disconnect on I/O errors (device gone); True when handled."""
+        if isinstance(e, OSError):
             logger.warning(
                 "OpenDrop device disconnected (OSError errno=%s).",
                 getattr(e, "errno", e),
             )
             self.on_disconnected_signal("")
-            return None
-        except Exception as e:
-            if serial is not None and isinstance(e, serial.SerialException):
-                logger.warning(
-                    "OpenDrop device disconnected (SerialException: %s).", e
-                )
-                self.on_disconnected_signal("")
-                return None
-            raise
+            return True
+        if serial is not None and isinstance(e, serial.SerialException):
+            logger.warning(
+                "OpenDrop device disconnected (SerialException: %s).", e
+            )
+            self.on_disconnected_signal("")
+            return True
+        return False
 
+    def _handle_telemetry(self, telemetry: dict):
         if not telemetry.get("connected", False):
             logger.warning("OpenDrop response timeout/disconnect detected.")
             self._publish_disconnected()
             self.on_disconnected_signal("")
             return None
 
-        telemetry["feedback_mask"] = self.proxy.state_of_channels
+        # The state that actually reached the board (the requested one may
+        # have moved on since).
+        telemetry["feedback_mask"] = telemetry["applied_channels"]
 
         self._publish_telemetry(telemetry)
+        self._publish_state_applied(telemetry["applied_channels"])
         return telemetry
 
     def on_connected_signal(self, message):
@@ -5,23 +5,35 @@ from threading import RLock
 import numpy as np
 import serial
 
+from logger.logger_service import get_logger
+
 from .consts import (
     MAX_TEMPERATURE_C,
     MIN_TEMPERATURE_C,
     NUM_CONTROL_IN_BYTES,
     NUM_CONTROL_OUT_BYTES,
-    NUM_ELECTRODE_BYTES,
     NUM_ELECTRODES,
 )
+from .write_scheduler import CoalescingWriteScheduler
+
+logger = get_logger(__name__)
 
 
-# Minimum seconds between actual serial writes (throttle / debounce).
-WRITE_DEBOUNCE_S = 0.05
+# Minimum seconds between actual serial writes. Requests arriving sooner are
+# coalesced into one trailing write of the latest state.
+WRITE_MIN_INTERVAL_S = 0.05
 
 
 class OpenDropSerialProxy:
     """
     Thin serial proxy implementing the OpenDrop frame protocol
+
+    Writes go through a CoalescingWriteScheduler: the latest requested state
+    always reaches the board, at most once per WRITE_MIN_INTERVAL_S. The
+    telemetry of a trailing (deferred) write is delivered to
+    ``on_state_applied(telemetry)``, its errors to ``on_write_error(exc)``.
+    Every telemetry dict carries ``applied_channels``, the channel mask that
+    was actually written.
     """
 
     def __init__(self, port: str, baud_rate: int, serial_timeout_s: float):
@@ -35,8 +47,22 @@ class OpenDropSerialProxy:
         self.control_data_out = bytearray(NUM_CONTROL_OUT_BYTES)
         self.control_data_in = bytearray(NUM_CONTROL_IN_BYTES)
 
-        self._last_write_time = 0.0
         self._last_telemetry = None
+        self._rx_buffer = bytearray()
+
+        self.on_state_applied = None
+        self.on_write_error = None
+        self._write_scheduler = CoalescingWriteScheduler(
+            self._write_now,
+            WRITE_MIN_INTERVAL_S,
+            on_applied=self._on_deferred_write,
+            on_error=self._on_deferred_write_error,
+        )
+
+    @property
+    def coalesced_writes(self) -> int:
+        """Requested states superseded before they were written."""
+        return self._write_scheduler.coalesced_count
 
     @property
     def is_connected(self) -> bool:
@@ -73,6 +99,7 @@ class OpenDropSerialProxy:
         self.close()
     
     def close(self):
+        self._write_scheduler.cancel()
         if self.serial_port is not None:
             try:
                 self.serial_port.close()
@@ -81,13 +108,18 @@ class OpenDropSerialProxy:
             finally:
                 self.serial_port = None
                 self._last_telemetry = None
-                self._last_write_time = 0.0
+                self._rx_buffer.clear()
 
-    def write_state(self, feedback_enabled: bool, temperatures_c: list[int], read_timeout_ms: int) -> dict:
+    def write_state(self, feedback_enabled: bool, temperatures_c: list[int], read_timeout_ms: int,
+                    wait: bool = False) -> dict | None:
         """
         Send current channel state + control bytes and parse telemetry.
-        Debounced by WRITE_DEBOUNCE_S: calls within 0.05s skip the write and return last telemetry.
-        Returns parsed telemetry dict.
+        Within WRITE_MIN_INTERVAL_S of the previous write the request is
+        coalesced: None is returned and a trailing write sends the latest
+        state (channels as they are at that moment) once the interval has
+        elapsed, reporting through ``on_state_applied``. ``wait=True`` waits
+        the interval out instead and always writes.
+        Returns parsed telemetry dict, or None when coalesced.
         """
         if not self.is_connected:
             raise RuntimeError("OpenDrop serial port is not connected.")
@@ -95,62 +127,75 @@ class OpenDropSerialProxy:
         if len(temperatures_c) != 3:
             raise ValueError("temperatures_c must contain exactly 3 values.")
 
-        with self.transaction_lock:
-            now = time.monotonic()
-            if self._last_telemetry is not None and (now - self._last_write_time) < WRITE_DEBOUNCE_S:
-                return self._last_telemetry
+        request = (bool(feedback_enabled), tuple(int(t) for t in temperatures_c), int(read_timeout_ms))
+        return self._write_scheduler.submit(request, wait=wait)
 
-            tx_electrodes = self._encode_electrodes(self.state_of_channels)
+    def _on_deferred_write(self, telemetry):
+        if self.on_state_applied is not None:
+            self.on_state_applied(telemetry)
+
+    def _on_deferred_write_error(self, exc):
+        if self.on_write_error is not None:
+            self.on_write_error(exc)
+        else:
+            logger.error(f"Deferred OpenDrop write failed: {exc}")
+
+    def _write_now(self, request) -> dict:
+        feedback_enabled, temperatures_c, read_timeout_ms = request
+        if not self.is_connected:
+            raise serial.SerialException("OpenDrop serial port closed before a pending write.")
+
+        with self.transaction_lock:
+            applied_channels = np.array(self.state_of_channels, dtype=bool, copy=True)
             self.control_data_out[:] = bytes(NUM_CONTROL_OUT_BYTES)
             self.control_data_out[6] = 1 if bool(feedback_enabled) else 0
-            self.control_data_out[8] = int(np.clip(int(temperatures_c[0]), MIN_TEMPERATURE_C, MAX_TEMPERATURE_C))
-            self.control_data_out[9] = int(np.clip(int(temperatures_c[1]), MIN_TEMPERATURE_C, MAX_TEMPERATURE_C))
-            self.control_data_out[10] = int(np.clip(int(temperatures_c[2]), MIN_TEMPERATURE_C, MAX_TEMPERATURE_C))
+            for offset, temperature in enumerate(temperatures_c):
+                self.control_data_out[8 + offset] = min(max(int(temperature), MIN_TEMPERATURE_C), MAX_TEMPERATURE_C)
 
+            # One frame, one write call.
             self.serial_port.reset_input_buffer()
-            self.serial_port.write(tx_electrodes)
-            self.serial_port.write(self.control_data_out)
+            self._rx_buffer.clear()
+            self.serial_port.write(self._encode_electrodes(applied_channels) + self.control_data_out)
             self.serial_port.flush()
 
-            response = self._read_exact(NUM_CONTROL_IN_BYTES, read_timeout_ms / 1000.0)
+            response = self._read_frame(NUM_CONTROL_IN_BYTES, read_timeout_ms / 1000.0)
             self.control_data_in[:] = bytes(NUM_CONTROL_IN_BYTES)
             self.control_data_in[: len(response)] = response
 
-            self._last_write_time = now
-            self._last_telemetry = self._decode_telemetry(bytes(response))
-            return self._last_telemetry
+            telemetry = self._decode_telemetry(bytes(response))
+            telemetry["applied_channels"] = applied_channels
+            self._last_telemetry = telemetry
+            return telemetry
 
-    def _read_exact(self, n_bytes: int, timeout_s: float) -> bytes:
+    def _read_frame(self, n_bytes: int, timeout_s: float) -> bytes:
+        """
+        Next ``n_bytes`` frame from the receive buffer, blocking on the port
+        until it is complete or ``timeout_s`` has passed (a short frame is
+        returned then). Each read blocks in the driver for up to the port's
+        own timeout and takes everything already waiting, so there is no
+        polling loop; bytes past the frame stay buffered for the next one.
+        """
         deadline = time.monotonic() + float(timeout_s)
-        chunks = bytearray()
+        buffer = self._rx_buffer
 
-        while len(chunks) < n_bytes and time.monotonic() < deadline:
-            remaining = n_bytes - len(chunks)
-            chunk = self.serial_port.read(remaining)
-            if chunk:
-                chunks.extend(chunk)
-                continue
-            time.sleep(0.001)
+        while len(buffer) < n_bytes and time.monotonic() < deadline:
+            buffer += self.serial_port.read(max(n_bytes - len(buffer), self.serial_port.in_waiting))
 
-        return bytes(chunks)
+        frame = bytes(buffer[:n_bytes])
+        del buffer[:n_bytes]
+        return frame
 
     @staticmethod
     def _encode_electrodes(channel_mask: np.ndarray) -> bytes:
         """
         OpenDrop expects 18 bytes, each composed from 8 channels:
-        send_value = (send_value << 1) + channel[(7-y) + x*8].
+        send_value = (send_value << 1) + channel[(7-y) + x*8],
+        i.e. channel x*8 + b is bit b of byte x (little-endian bit order).
         """
         if channel_mask.shape[0] != NUM_ELECTRODES:
             raise ValueError(f"Expected {NUM_ELECTRODES} channels, got {channel_mask.shape[0]}.")
 
-        out = bytearray(NUM_ELECTRODE_BYTES)
-        for x in range(NUM_ELECTRODE_BYTES):
-            send_value = 0
-            for y in range(8):
-                idx = (7 - y) + x * 8
-                send_value = (send_value << 1) + int(bool(channel_mask[idx]))
-            out[x] = send_value
-        return bytes(out)
+        return np.packbits(np.asarray(channel_mask, dtype=bool), bitorder="little").tobytes()
 
     @staticmethod
     def _decode_telemetry(control_data_in: bytes) -> dict:
@@ -164,11 +209,13 @@ class OpenDropSerialProxy:
         feedback_mask = np.zeros(NUM_ELECTRODES, dtype=bool)
         feedback_bytes_count = min(16, n)
 
-        for x in range(feedback_bytes_count):
-            read_data = control_data_in[x]
-            for y in range(8):
-                idx = (7 - y) + x * 8
-                feedback_mask[idx] = bool((read_data >> y) & 0x01)
+        # Channel (7 - y) + x*8 is bit y of byte x: big-endian bit order
+        # (the reverse of the electrode bytes sent).
+        if feedback_bytes_count:
+            feedback_mask[: feedback_bytes_count * 8] = np.unpackbits(
+                np.frombuffer(control_data_in, dtype=np.uint8, count=feedback_bytes_count),
+                bitorder="big",
+            )
 
         temperature_1 = None
         temperature_2 = None
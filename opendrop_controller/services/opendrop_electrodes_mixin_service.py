@@ -44,5 +44,5 @@ class OpenDropElectrodesMixinService(HasTraits):
         active_channels = int(channel_mask.sum())
         logger.info(
             f"OpenDrop electrode update applied: {active_channels}/{NUM_ELECTRODES} active "
-            f"(telemetry={'ok' if telemetry is not None else 'skipped'})"
+            f"(telemetry={'ok' if telemetry is not None else 'pending/skipped'})"
         )
@@ -0,0 +1,88 @@
+"""OpenDrop electrode/telemetry bit packing and the proxy's buffered frame reads."""
+
+import numpy as np
+import pytest
+
+from opendrop_controller.consts import NUM_CONTROL_IN_BYTES, NUM_ELECTRODE_BYTES, NUM_ELECTRODES
+from opendrop_controller.opendrop_serial_proxy import OpenDropSerialProxy
+
+
+def encode_reference(channel_mask):
+    """The firmware's own byte composition (OpenDropController4_25.pde)."""
+    out = bytearray(NUM_ELECTRODE_BYTES)
+    for x in range(NUM_ELECTRODE_BYTES):
+        send_value = 0
+        for y in range(8):
+            send_value = (send_value << 1) + int(bool(channel_mask[(7 - y) + x * 8]))
+        out[x] = send_value
+    return bytes(out)
+
+
+def decode_reference(data):
+    mask = np.zeros(NUM_ELECTRODES, dtype=bool)
+    for x in range(min(16, len(data))):
+        for y in range(8):
+            mask[(7 - y) + x * 8] = bool((data[x] >> y) & 0x01)
+    return mask
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_encode_matches_firmware_bit_order(seed):
+    mask = np.random.default_rng(seed).random(NUM_ELECTRODES) < 0.5
+    assert OpenDropSerialProxy._encode_electrodes(mask) == encode_reference(mask)
+
+
+def test_encode_single_channels():
+    for channel in (0, 7, 8, NUM_ELECTRODES - 1):
+        mask = np.zeros(NUM_ELECTRODES, dtype=bool)
+        mask[channel] = True
+        assert OpenDropSerialProxy._encode_electrodes(mask) == encode_reference(mask)
+
+
+def test_encode_rejects_wrong_channel_count():
+    with pytest.raises(ValueError):
+        OpenDropSerialProxy._encode_electrodes(np.zeros(NUM_ELECTRODES - 1, dtype=bool))
+
+
+@pytest.mark.parametrize("length", [0, 5, 16, NUM_CONTROL_IN_BYTES])
+def test_decode_matches_firmware_bit_order(length):
+    data = np.random.default_rng(length).integers(0, 256, NUM_CONTROL_IN_BYTES, dtype=np.uint8).tobytes()[:length]
+    telemetry = OpenDropSerialProxy._decode_telemetry(data)
+    np.testing.assert_array_equal(telemetry["feedback_mask"], decode_reference(data))
+    assert telemetry["raw_response_len"] == length
+
+
+class ChunkedPort:
+    """Serial port stand-in delivering its data a few bytes per read."""
+
+    def __init__(self, data, chunk):
+        self.data = bytearray(data)
+        self.chunk = chunk
+        self.reads = 0
+
+    @property
+    def in_waiting(self):
+        return min(len(self.data), self.chunk)
+
+    def read(self, size):
+        self.reads += 1
+        out = bytes(self.data[:min(size, self.chunk)])
+        del self.data[:len(out)]
+        return out
+
+
+def test_read_frame_assembles_partial_reads_and_keeps_the_rest():
+    proxy = OpenDropSerialProxy("unused", 115200, serial_timeout_s=0.01)
+    proxy.serial_port = ChunkedPort(bytes(range(30)), chunk=7)
+
+    assert proxy._read_frame(NUM_CONTROL_IN_BYTES, timeout_s=1.0) == bytes(range(24))
+    assert proxy.serial_port.reads == 4
+    # Bytes past the frame stay buffered.
+    assert proxy._read_frame(6, timeout_s=1.0) == bytes(range(24, 30))
+
+
+def test_read_frame_returns_short_frame_on_timeout():
+    proxy = OpenDropSerialProxy("unused", 115200, serial_timeout_s=0.01)
+    proxy.serial_port = ChunkedPort(b"\x01\x02", chunk=2)
+
+    assert proxy._read_frame(NUM_CONTROL_IN_BYTES, timeout_s=0.05) == b"\x01\x02"
@@ -0,0 +1,133 @@
+"""Coalescing OpenDrop writes, exercised against a pty-backed fake board."""
+
+import os
+import threading
+import time
+import tty
+
+import numpy as np
+import pytest
+
+from opendrop_controller.consts import (
+    NUM_CONTROL_IN_BYTES, NUM_CONTROL_OUT_BYTES, NUM_ELECTRODE_BYTES, NUM_ELECTRODES,
+)
+from opendrop_controller.opendrop_serial_proxy import WRITE_MIN_INTERVAL_S, OpenDropSerialProxy
+from opendrop_controller.write_scheduler import CoalescingWriteScheduler
+
+FRAME_BYTES = NUM_ELECTRODE_BYTES + NUM_CONTROL_OUT_BYTES
+BOARD_ID = 42
+
+
+class FakeBoard:
+    """Answers every electrode + control frame on the pty master like the firmware does."""
+
+    def __init__(self):
+        self.master, slave = os.openpty()
+        tty.setraw(slave)
+        self.port = os.ttyname(slave)
+        self._slave = slave
+        self.frames = []  # (arrival time, channel mask)
+        self._stop = False
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        buffer = b""
+        while not self._stop:
+            try:
+                buffer += os.read(self.master, 256)
+            except OSError:
+                return
+            while len(buffer) >= FRAME_BYTES:
+                frame, buffer = buffer[:FRAME_BYTES], buffer[FRAME_BYTES:]
+                bits = np.unpackbits(np.frombuffer(frame[:NUM_ELECTRODE_BYTES], np.uint8), bitorder="little")
+                self.frames.append((time.monotonic(), bits.astype(bool)))
+                response = bytearray(NUM_CONTROL_IN_BYTES)
+                response[23] = BOARD_ID
+                os.write(self.master, bytes(response))
+
+    def close(self):
+        self._stop = True
+        os.close(self.master)
+        os.close(self._slave)
+
+
+@pytest.fixture
+def board_and_proxy():
+    board = FakeBoard()
+    proxy = OpenDropSerialProxy(board.port, 115200, serial_timeout_s=0.05)
+    proxy.connect()
+    yield board, proxy
+    proxy.close()
+    board.close()
+
+
+def mask(*channels):
+    out = np.zeros(NUM_ELECTRODES, dtype=bool)
+    out[list(channels)] = True
+    return out
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_burst_writes_first_and_last_state(board_and_proxy):
+    board, proxy = board_and_proxy
+    applied = []
+    proxy.on_state_applied = applied.append
+
+    results = []
+    for channel in range(10):
+        proxy.state_of_channels = mask(channel, 100 + channel)
+        results.append(proxy.write_state(False, [25, 25, 25], read_timeout_ms=500))
+
+    # The first request is written at once; the rest of the burst is coalesced.
+    assert results[0]["board_id"] == BOARD_ID
+    assert all(result is None for result in results[1:])
+    assert wait_for(lambda: applied)
+
+    # Trailing flush: exactly one more write, carrying the LAST requested state.
+    assert len(board.frames) == 2
+    np.testing.assert_array_equal(board.frames[-1][1], mask(9, 109))
+    np.testing.assert_array_equal(applied[0]["applied_channels"], mask(9, 109))
+    assert proxy.coalesced_writes == 8
+
+
+def test_writes_respect_the_minimum_interval(board_and_proxy):
+    board, proxy = board_and_proxy
+    for channel in range(6):
+        proxy.state_of_channels = mask(channel)
+        proxy.write_state(False, [25, 25, 25], read_timeout_ms=500, wait=True)
+
+    assert [int(frame.nonzero()[0][0]) for _, frame in board.frames] == list(range(6))
+    gaps = np.diff([t for t, _ in board.frames])
+    assert gaps.min() >= WRITE_MIN_INTERVAL_S * 0.9
+
+
+def test_trailing_write_error_is_reported():
+    errors = []
+
+    def failing_write(request):
+        if request == "second":
+            raise OSError("unplugged")
+        return request
+
+    scheduler = CoalescingWriteScheduler(failing_write, 0.02, on_error=errors.append)
+    assert scheduler.submit("first") == "first"
+    assert scheduler.submit("second") is None
+    assert wait_for(lambda: errors)
+    assert isinstance(errors[0], OSError) and not scheduler.has_pending
+
+
+def test_cancel_drops_the_pending_state():
+    written = []
+    scheduler = CoalescingWriteScheduler(written.append, 0.02)
+    scheduler.submit("first")
+    scheduler.submit("second")
+    scheduler.cancel()
+    time.sleep(0.05)
+    assert written == ["first"]
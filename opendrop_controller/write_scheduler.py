@@ -0,0 +1,104 @@
+import threading
+import time
+
+from logger.logger_service import get_logger
+
+logger = get_logger(__name__)
+
+
+class CoalescingWriteScheduler:
+    """
+    Latest-wins scheduling of device writes with a minimum interval between them.
+
+    submit(request) writes immediately when the last write started at least ``min_interval_s`` ago. Otherwise the
+    request is parked as the pending one (replacing, i.e. coalescing, any request still pending) and a trailing
+    flush is armed for the moment the interval has elapsed, so the LAST request of a burst always reaches the
+    device. Requests superseded before they were written are counted in ``coalesced_count``.
+
+    ``write(request)`` performs the actual I/O and returns its result. Writes are serialized and happen in
+    submission order. A result produced by the trailing flush (on the scheduler's timer thread) is reported through
+    ``on_applied(result)``; an exception raised by it through ``on_error(exc)``.
+    """
+
+    def __init__(self, write, min_interval_s, on_applied=None, on_error=None):
+        self._write = write
+        self.min_interval_s = float(min_interval_s)
+        self.on_applied = on_applied
+        self.on_error = on_error
+
+        self._lock = threading.Lock()        # pending request / timer bookkeeping
+        self._write_lock = threading.Lock()  # one write at a time, in order
+        self._pending = None
+        self._has_pending = False
+        self._last_write = float("-inf")
+        self._timer = None
+        self.coalesced_count = 0
+        self.writes_count = 0
+
+    @property
+    def has_pending(self) -> bool:
+        with self._lock:
+            return self._has_pending
+
+    def submit(self, request, wait=False):
+        """Request a write of ``request``. Returns the write's result when it was written now; None when it was
+        left to the trailing flush. ``wait=True`` sleeps out the remaining interval instead and always writes."""
+        with self._lock:
+            if self._has_pending:
+                self.coalesced_count += 1
+            self._pending = request
+            self._has_pending = True
+            delay = self._last_write + self.min_interval_s - time.monotonic()
+            if delay > 0 and not wait:
+                self._arm(delay)
+                return None
+        if delay > 0:
+            time.sleep(delay)
+        return self._write_pending()
+
+    def cancel(self):
+        """Drop the pending request and disarm the trailing flush."""
+        with self._lock:
+            self._pending = None
+            self._has_pending = False
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._last_write = float("-inf")
+
+    def _arm(self, delay):
+        """Caller holds self._lock."""
+        if self._timer is not None:
+            return
+        self._timer = threading.Timer(delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+        try:
+            result = self._write_pending()
+        except Exception as e:
+            if self.on_error is None:
+                logger.error(f"Deferred device write failed: {e}", exc_info=True)
+            else:
+                self.on_error(e)
+            return
+        if result is not None and self.on_applied is not None:
+            self.on_applied(result)
+
+    def _write_pending(self):
+        with self._write_lock:
+            with self._lock:
+                if not self._has_pending:
+                    return None  # already written by a concurrent submit
+                request = self._pending
+                self._pending = None
+                self._has_pending = False
+                self._last_write = time.monotonic()
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            self.writes_count += 1
+            return self._write(request)
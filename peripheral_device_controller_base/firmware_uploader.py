@@ -3,22 +3,21 @@
 Shared by every Pico-based peripheral (heater, fluorescence, ...): the raw
 per-board upload scripts were identical bar the default device id, so the
 logic lives here once. Only the firmware SOURCE (a folder or a .zip bundle)
-stays external (the request points at it). Files are pushed with mpremote,
-one command per ``python -m mpremote`` subprocess: that keeps mpremote's
-sys.argv/SystemExit machinery out of the backend process and lets each
-command's output be captured for the caller's log.
+stays external (the request points at it). The whole upload runs in one
+raw-REPL session on the open port (RawReplSession): the board's files are
+hashed on the board, and only files whose sha256 differs from the local copy
+are transferred (and, when formatting, only stale entries removed), so a
+re-flash of mostly unchanged firmware costs a few round-trips.
 
 Every function takes a ``log`` callable for progress lines (the firmware
 upload service publishes them to the device's FIRMWARE_UPLOAD_LOG topic) and
 ``upload_firmware`` honours a ``cancel_event`` between steps — mid-command
-cancellation is bounded by MPREMOTE_COMMAND_TIMEOUT_S.
+cancellation is bounded by RAW_REPL_COMMAND_TIMEOUT_S.
 """
 
+import hashlib
 import json
-import os
 import shutil
-import subprocess
-import sys
 import tempfile
 import time
 import zipfile
@@ -40,9 +39,19 @@ PICO_USB_VENDOR_ID = 0x2E8A
 PICO_RP2040_HWID = "VID:PID=2E8A:0005"
 BOARD_BAUDRATE = 115200
 
-#: Hard ceiling per mpremote command so one wedged copy can't hang an upload
-#: forever (the full-filesystem wipe is the slowest single command).
-MPREMOTE_COMMAND_TIMEOUT_S = 120
+#: Hard ceiling per raw-REPL command so a wedged board can't hang an upload
+#: forever (hashing the whole filesystem is the slowest single command).
+RAW_REPL_COMMAND_TIMEOUT_S = 60
+#: Entering the raw REPL from an idle REPL takes well under a second.
+RAW_REPL_ENTER_TIMEOUT_S = 5
+#: File bytes sent per write round-trip (as a bytes literal, up to 4x larger
+#: on the wire; well within the raw REPL's input buffer).
+RAW_REPL_WRITE_CHUNK_BYTES = 1024
+#: Attempts per upload command (hash, remove, mkdir, write) before the upload
+#: is abandoned — one glitch on the USB serial link shouldn't cost the whole
+#: upload. Backoff between attempts is RAW_REPL_RETRY_DELAY_S * attempt.
+RAW_REPL_COMMAND_ATTEMPTS = 3
+RAW_REPL_RETRY_DELAY_S = 0.5
 
 #: The boot window is only open for ~3s after the board re-enumerates; the
 #: Ctrl-C burst is bounded so a MISSED window doesn't keep firing Ctrl-C into
@@ -57,99 +66,201 @@ FIRMWARE_RUNNING_MARKERS = (
 
 
 # ------------------------------------------------------------------ #
-# mpremote plumbing                                                   #
+# Raw-REPL session                                                    #
 # ------------------------------------------------------------------ #
 
-def _run_mpremote_subprocess(cmd):
-    """One ``python -m mpremote <cmd...>`` run with captured, merged output."""
-    return subprocess.run(
-        [sys.executable, "-m", "mpremote"] + cmd,
-        stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-        text=True, encoding="utf-8", errors="replace",
-        timeout=MPREMOTE_COMMAND_TIMEOUT_S,
-        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
-    )
-
-
-def run_mpremote(cmd, log, retries=3):
-    """Run a single mpremote command with retry, streaming its output through
-    ``log``. Assumes the board is already at the REPL (see
-    ensure_repl_via_window), so no per-command Ctrl-C is sent."""
-    for attempt in range(1, retries + 1):
-        try:
-            completed = _run_mpremote_subprocess(cmd)
-        except Exception as e:
-            log(f"WARNING: mpremote attempt {attempt}/{retries} raised: {e}")
-            time.sleep(0.5 * attempt)
-            continue
-        for line in completed.stdout.splitlines():
-            if line.strip():
-                log(f"  {line}")
-        if completed.returncode == 0:
-            return True
-        log(f"WARNING: mpremote attempt {attempt}/{retries} failed "
-            f"(exit {completed.returncode}): {' '.join(cmd)}")
-        time.sleep(0.5 * attempt)
-    log(f"ERROR: mpremote command failed after {retries} attempts: "
-        f"{' '.join(cmd)}")
-    return False
+class RawReplError(Exception):
+    """The board raised while running a command, or the raw REPL protocol
+    broke down (no banner, no reply within the timeout)."""
+
+
+#: Device-side script listing every filesystem entry: ``D <path>`` for a
+#: directory, ``F <path> <sha256 hex>`` for a file.
+_HASH_TREE_SCRIPT = """\
+import os, hashlib, binascii
+def _w(d):
+    for e in os.ilistdir(d):
+        p = d + e[0] if d == '/' else d + '/' + e[0]
+        if e[1] == 0x4000:
+            print('D', p)
+            _w(p)
+        else:
+            h = hashlib.sha256()
+            with open(p, 'rb') as f:
+                while True:
+                    b = f.read(512)
+                    if not b:
+                        break
+                    h.update(b)
+            print('F', p, binascii.hexlify(h.digest()).decode())
+_w('/')
+"""
 
+_READ_FILE_SCRIPT = """\
+import binascii
+with open({path!r}, 'rb') as f:
+    while True:
+        b = f.read(512)
+        if not b:
+            break
+        print(binascii.hexlify(b).decode())
+"""
 
-def _wipe_filesystem(port, log):
-    """Wipe the board's filesystem contents WITHOUT touching the root itself.
+_REMOVE_SCRIPT = """\
+import os
+def _rm(p):
+    try:
+        for e in os.ilistdir(p):
+            _rm(p + '/' + e[0])
+        os.rmdir(p)
+    except OSError:
+        os.remove(p)
+_rm({path!r})
+"""
+
+
+class RawReplSession:
+    """One raw-REPL session on a MicroPython board, held open for a whole
+    upload.
 
-    ``rm -rv :/`` removes every child but then tries to rmdir the root,
-    which the board refuses (EPERM) — mpremote reports ``rm -r: cannot
-    remove :/ Operation not permitted`` and exits non-zero on every retry
-    even though the wipe actually happened (the standalone upload script
-    had the same noise, its format step's result was just never checked).
-    Removing each top-level entry instead ends clean.
+    Every operation is one exec round-trip on the same open port: no
+    interpreter start-up or serial reconnect per file. The board must
+    already be at an idle REPL (ensure_repl_via_window) — the one Ctrl-C
+    sent on entry only clears a half-typed line.
+
+    Remote paths are relative to the filesystem root, with forward slashes.
     """
-    try:
-        listing = _run_mpremote_subprocess(["connect", port, "fs", "ls", ":/"])
-    except Exception as e:
-        listing = None
-        logger.debug(f"Filesystem listing raised: {e}")
-    if listing is None or listing.returncode != 0:
-        log("WARNING: could not list the filesystem before the wipe; "
-            "falling back to rm -r :/")
-        run_mpremote(["connect", port, "rm", "-rv", ":/"], log)
-        return
-    # `fs ls :/` lines are "<size> <name>" (directories keep a trailing /),
-    # preceded by an "ls :/" header — keep only the size-prefixed entries.
-    entries = []
-    for line in listing.stdout.splitlines():
-        parts = line.split(None, 1)
-        if len(parts) == 2 and parts[0].isdigit():
-            entries.append(parts[1].strip().rstrip("/"))
-    if not entries:
-        log("Filesystem already empty.")
-        return
-    for entry in entries:
-        run_mpremote(["connect", port, "rm", "-rv", f":/{entry}"], log)
-
-
-def _pull_device_config(port):
-    """Best-effort single-attempt pull of the device's current config.json to
-    a local temp file. Returns the temp Path on success, or None if the
-    device has no config.json right now (a fresh board, or one already
-    wiped) — that's an expected outcome, not an error, so no retries and no
-    logging here; the caller decides what to report."""
-    tmp_fd, tmp_name = tempfile.mkstemp(
-        prefix="fluorescence_config_backup_", suffix=".json")
-    os.close(tmp_fd)
-    tmp_path = Path(tmp_name)
-    try:
-        completed = _run_mpremote_subprocess(
-            ["connect", port, "cp", ":config.json", str(tmp_path)])
-        pulled = completed.returncode == 0
-    except Exception as e:
-        logger.debug(f"config.json pull failed: {e}")
-        pulled = False
-    if not pulled or not tmp_path.exists() or tmp_path.stat().st_size == 0:
-        tmp_path.unlink(missing_ok=True)
-        return None
-    return tmp_path
+
+    RAW_REPL_BANNER = b"raw REPL; CTRL-B to exit\r\n>"
+
+    def __init__(self, port, baudrate=BOARD_BAUDRATE,
+                 command_timeout_s=RAW_REPL_COMMAND_TIMEOUT_S):
+        self.port = port
+        self.baudrate = baudrate
+        self.command_timeout_s = command_timeout_s
+        self._serial = None
+        self._rx = bytearray()
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def open(self):
+        self._serial = serial.Serial(self.port, self.baudrate, timeout=0.05,
+                                     write_timeout=RAW_REPL_COMMAND_TIMEOUT_S)
+        self._rx.clear()
+        self._serial.write(b"\r\x03")
+        self._serial.write(b"\r\x01")
+        self._read_until(self.RAW_REPL_BANNER, RAW_REPL_ENTER_TIMEOUT_S,
+                         "entering the raw REPL")
+
+    def close(self):
+        if self._serial is None:
+            return
+        try:
+            self._serial.write(b"\r\x02")  # back to the friendly REPL
+            self._serial.close()
+        except Exception:
+            pass
+        self._serial = None
+
+    def _read_until(self, ending, timeout_s, what):
+        """Bytes received before ``ending`` (consumed); anything read past it
+        stays buffered for the next call."""
+        deadline = time.monotonic() + timeout_s
+        while (index := self._rx.find(ending)) < 0:
+            if time.monotonic() > deadline:
+                raise RawReplError(f"timed out {what} on {self.port} "
+                                   f"(got {bytes(self._rx[-80:])!r})")
+            self._rx += self._serial.read(max(1, self._serial.in_waiting))
+        data = bytes(self._rx[:index])
+        del self._rx[:index + len(ending)]
+        return data
+
+    def exec(self, code, timeout_s=None) -> str:
+        """Run ``code`` on the board; returns what it printed. Raises
+        RawReplError with the board's traceback if it raised."""
+        timeout_s = self.command_timeout_s if timeout_s is None else timeout_s
+        self._serial.write(code.encode() + b"\x04")
+        self._read_until(b"OK", timeout_s, "waiting for the command to start")
+        out = self._read_until(b"\x04", timeout_s, "running a command")
+        err = self._read_until(b"\x04>", timeout_s, "reading a command's result")
+        if err:
+            raise RawReplError(err.decode(errors="replace").strip())
+        return out.decode(errors="replace")
+
+    def file_hashes(self) -> dict:
+        """Every entry on the board: {remote path: sha256 hex, or None for a
+        directory}."""
+        entries = {}
+        for line in self.exec(_HASH_TREE_SCRIPT).splitlines():
+            # Paths may contain spaces: split the kind off the front and the
+            # hash off the back, never on every space.
+            kind, _, rest = line.partition(" ")
+            if kind == "D" and rest:
+                entries[rest.lstrip("/")] = None
+            elif kind == "F":
+                path, _, digest = rest.rpartition(" ")
+                if path and digest:
+                    entries[path.lstrip("/")] = digest
+        return entries
+
+    def recover(self):
+        """Get back to a clean raw-REPL prompt after a failed command: drop
+        whatever is buffered, interrupt anything still running and re-enter
+        the raw REPL."""
+        self._rx.clear()
+        self._serial.reset_input_buffer()
+        self._serial.write(b"\r\x03")
+        self._serial.write(b"\r\x01")
+        self._read_until(self.RAW_REPL_BANNER, RAW_REPL_ENTER_TIMEOUT_S,
+                         "re-entering the raw REPL")
+
+    def read_file(self, remote_path) -> bytes:
+        out = self.exec(_READ_FILE_SCRIPT.format(path="/" + remote_path))
+        return b"".join(bytes.fromhex(line.strip())
+                        for line in out.splitlines() if line.strip())
+
+    def write_file(self, remote_path, data: bytes):
+        """Write ``data`` to ``remote_path`` (its directory must exist),
+        RAW_REPL_WRITE_CHUNK_BYTES per round-trip."""
+        self.exec(f"f = open({'/' + remote_path!r}, 'wb')\nw = f.write")
+        try:
+            for offset in range(0, len(data), RAW_REPL_WRITE_CHUNK_BYTES):
+                self.exec(f"w({data[offset:offset + RAW_REPL_WRITE_CHUNK_BYTES]!r})")
+        finally:
+            self.exec("f.close()")
+
+    def mkdir(self, remote_path):
+        self.exec(f"import os\ntry:\n    os.mkdir({'/' + remote_path!r})\n"
+                  f"except OSError:\n    pass")
+
+    def remove(self, remote_path):
+        """Remove a file, or a directory and everything in it."""
+        self.exec(_REMOVE_SCRIPT.format(path="/" + remote_path))
+
+    def reset(self):
+        """Hard-reset the board, ending the session (the port drops)."""
+        try:
+            self._serial.write(b"import machine\nmachine.reset()\x04")
+            self._serial.flush()
+        finally:
+            try:
+                self._serial.close()
+            except Exception:
+                pass
+            self._serial = None
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 # ------------------------------------------------------------------ #
@@ -265,14 +376,14 @@ def _flatten_json(d, prefix=""):
     return out
 
 
-def _diff_configs(device_config_path, repo_config_path, log):
+def _diff_configs(device_config, repo_config_path, log):
     """Log a read-only, key-by-key diff between the device's current
-    config.json and the repo's copy. Purely informational — this never
-    merges or resolves anything; telling a stale placeholder apart from an
-    intentional per-board tuning value isn't something code can safely
-    judge, so that call is always left to the human running this."""
+    config.json (its bytes) and the repo's copy. Purely informational — this
+    never merges or resolves anything; telling a stale placeholder apart
+    from an intentional per-board tuning value isn't something code can
+    safely judge, so that call is always left to the human running this."""
     try:
-        device_cfg = json.loads(Path(device_config_path).read_text())
+        device_cfg = json.loads(device_config)
     except Exception as e:
         log(f"WARNING: could not parse device's config.json for diff: {e}")
         return
@@ -385,6 +496,142 @@ def _cleanup_extracted_dir(temp_dir: Path, log):
         log(f"WARNING: could not delete unzipped copy {temp_dir}: {e}")
 
 
+# ------------------------------------------------------------------ #
+# Hash-diffed sync                                                    #
+# ------------------------------------------------------------------ #
+
+def _retrying(session, what, log, command, *args):
+    """Run ``session.<command>(*args)``, retrying a failed command up to
+    RAW_REPL_COMMAND_ATTEMPTS times (recovering the raw REPL in between);
+    the last failure propagates."""
+    for attempt in range(1, RAW_REPL_COMMAND_ATTEMPTS + 1):
+        try:
+            return getattr(session, command)(*args)
+        except (RawReplError, serial.SerialException) as e:
+            if attempt == RAW_REPL_COMMAND_ATTEMPTS:
+                raise
+            log(f"WARNING: {what}: attempt {attempt}/"
+                f"{RAW_REPL_COMMAND_ATTEMPTS} failed: {e}")
+        time.sleep(RAW_REPL_RETRY_DELAY_S * attempt)
+        try:
+            session.recover()
+        except (RawReplError, serial.SerialException) as e:
+            log(f"WARNING: {what}: could not recover the raw REPL: {e}")
+
+
+def _sync_files(session, files, fw_path, single_file, will_format,
+                update_config, need_restore, reset_device, log, cancel_event):
+    """Bring the board's filesystem in line with ``files`` over one session.
+    Returns success."""
+    log("Hashing files on the device...")
+    device_entries = _retrying(session, "hashing files", log, "file_hashes")
+
+    # Read the device's current config.json (best-effort) before changing
+    # anything: it drives the diff-vs-repo report.
+    if not single_file:
+        repo_config_path = fw_path / "config.json"
+        device_config = None
+        if device_entries.get("config.json"):
+            try:
+                device_config = session.read_file("config.json")
+            except RawReplError as e:
+                log(f"WARNING: could not read the device's config.json: {e}")
+        if device_config is not None:
+            if repo_config_path.exists():
+                _diff_configs(device_config, repo_config_path, log)
+            if update_config:
+                log("config.json: overwriting with repo version "
+                    "(update_config); see diff above for what changes")
+            else:
+                log("config.json: keeping the device's own copy")
+        else:
+            log("config.json: device currently has none (fresh board, or "
+                "previously wiped) — nothing to diff")
+            if need_restore:
+                if repo_config_path.exists():
+                    log("WARNING: config.json: nothing on the device to "
+                        "keep, so pushing the repo's copy instead of "
+                        "leaving the device with none. Enable "
+                        "update_config to do this intentionally and skip "
+                        "this warning.")
+                    files.append(repo_config_path)
+                else:
+                    log("WARNING: the repo has no config.json either — the "
+                        "device will have NO config.json until you add one "
+                        "manually.")
+
+    # The device's filesystem always uses forward slashes, regardless of the
+    # host OS. str(Path) would use "\" on Windows, which the Pico treats as
+    # a literal filename character rather than a directory separator —
+    # nested files would land flat on the device instead of inside their
+    # subdirectory.
+    wanted = {f.relative_to(fw_path).as_posix(): f for f in files}
+    wanted_dirs = {remote for remote, f in wanted.items() if f.is_dir()}
+    for remote in wanted:
+        parent = remote.rpartition("/")[0]
+        while parent:
+            wanted_dirs.add(parent)
+            parent = parent.rpartition("/")[0]
+
+    uploads = []
+    unchanged = 0
+    for remote, f in wanted.items():
+        if f.is_dir():
+            continue
+        if device_entries.get(remote) == _sha256_file(f):
+            unchanged += 1
+        else:
+            uploads.append((remote, f))
+
+    stale = []
+    if will_format:
+        keep = set(wanted) | wanted_dirs
+        if not update_config:
+            keep.add("config.json")
+        # Deepest first; a removed directory takes its contents with it.
+        for remote in sorted(device_entries, key=lambda r: -r.count("/")):
+            if remote in keep or any(remote.startswith(s + "/") for s in stale):
+                continue
+            stale.append(remote)
+        stale = [r for r in stale
+                 if not any(r.startswith(s + "/") for s in stale if s != r)]
+
+    log(f"{unchanged} file(s) unchanged on the device, {len(uploads)} to "
+        f"upload, {len(stale)} stale entr{'y' if len(stale) == 1 else 'ies'} "
+        f"to remove")
+
+    all_successful = True
+    try:
+        for remote in stale:
+            if _cancelled(cancel_event, log):
+                return False
+            log(f"Removing stale :{remote}")
+            _retrying(session, f"removing :{remote}", log, "remove", remote)
+
+        for remote in sorted(wanted_dirs, key=lambda r: r.count("/")):
+            if remote not in device_entries:
+                _retrying(session, f"creating :{remote}", log, "mkdir",
+                          remote)
+
+        for i, (remote, f) in enumerate(uploads):
+            if _cancelled(cancel_event, log):
+                all_successful = False
+                break
+            log(f"Uploading file {i + 1}/{len(uploads)}: {f}")
+            _retrying(session, f"uploading {f}", log, "write_file", remote,
+                      f.read_bytes())
+            log(f"Successfully uploaded {f}")
+    except (RawReplError, serial.SerialException, OSError) as e:
+        log(f"ERROR: upload failed: {e}")
+        return False
+
+    if reset_device and all_successful:
+        log("Resetting device...")
+        session.reset()
+
+    return all_successful
+
+
 # ------------------------------------------------------------------ #
 # Main entry point                                                    #
 # ------------------------------------------------------------------ #
@@ -416,19 +663,21 @@ def upload_firmware(
         reset_device: Reset the device after a fully successful upload.
         single_file: Upload only this file (absolute, or relative to
             firmware_path).
-        no_format: Skip formatting the filesystem first.
-        update_config: If True, wipe everything including config.json and
-            push the repo's copy (no backup kept). If False (default), the
-            device's current config.json is backed up before the wipe and
-            restored afterward, so per-board tuned values survive a routine
-            full reflash. Either way a key-by-key diff between the device's
-            and repo's config.json is logged before anything is touched.
-            Ignored when single_file is set.
+        no_format: Keep files on the board that the firmware doesn't have.
+            By default the board ends up holding exactly the firmware tree:
+            stale entries are removed (the equivalent of formatting first,
+            without rewriting unchanged files).
+        update_config: If True, config.json is treated like any other file
+            and the repo's copy pushed. If False (default), the device's own
+            config.json is left in place, so per-board tuned values survive
+            a routine full reflash. Either way a key-by-key diff between the
+            device's and repo's config.json is logged before anything is
+            touched. Ignored when single_file is set.
         dry_run: Log what would happen and return without touching the
             device.
         log: Callable receiving one progress line per call.
         cancel_event: threading.Event checked between steps; setting it
-            aborts the upload (bounded by MPREMOTE_COMMAND_TIMEOUT_S while a
+            aborts the upload (bounded by RAW_REPL_COMMAND_TIMEOUT_S while a
             command is in flight).
     """
     fw_path = Path(firmware_path)
@@ -473,19 +722,18 @@ def upload_firmware(
 
         if dry_run:
             log(f"[dry-run] Firmware source: {fw_path}")
-            log(f"[dry-run] Format filesystem: {will_format}")
+            log(f"[dry-run] Remove stale files from the device: {will_format}")
+            log("[dry-run] Files whose hash already matches the device are "
+                "skipped on a real run")
             if update_config:
                 log("[dry-run] config.json: OVERWRITE with repo version "
                     "(update_config)")
             elif need_restore:
-                log("[dry-run] config.json: back up device's current copy "
-                    "before the wipe, then restore it afterward (default — "
-                    "device keeps its own config). If the device has no "
-                    "config.json to back up, the repo's copy is pushed "
-                    "instead of leaving the device with none.")
+                log("[dry-run] config.json: keep the device's own copy "
+                    "(default). If the device has none, the repo's copy is "
+                    "pushed instead of leaving the device with none.")
             else:
-                log("[dry-run] config.json: left untouched (no format, no "
-                    "wipe happening)")
+                log("[dry-run] config.json: left untouched")
             if not single_file:
                 log("[dry-run] config.json diff vs repo: only shown on a "
                     "real run (requires reading the device)")
@@ -509,12 +757,12 @@ def upload_firmware(
         if _cancelled(cancel_event, log):
             return False
 
-        # Get the board to a quiescent REPL first. Do this ONCE; all the
-        # mpremote ops below then run against an idle REPL. The port name can
+        # Get the board to a quiescent REPL first. Do this ONCE; the raw-REPL
+        # session below then runs against an idle REPL. The port name can
         # change after the reset's USB re-enumeration, so adopt whatever
         # ensure_repl_via_window reports back. If the REPL can't be
-        # confirmed, ABORT rather than let mpremote hammer Ctrl-C at a
-        # running loop (which would wedge the board).
+        # confirmed, ABORT rather than send Ctrl-C at a running loop (which
+        # would wedge the board).
         port, at_repl = ensure_repl_via_window(port, log)
         if not at_repl:
             log("ERROR: could not drop the board to its REPL. It may be "
@@ -525,104 +773,10 @@ def upload_firmware(
         if _cancelled(cancel_event, log):
             return False
 
-        # Read the device's current config.json (best-effort) before doing
-        # anything destructive: drives both the diff-vs-repo report and, when
-        # not update_config, gives us something to restore after a full wipe.
-        device_config_backup = None
-        if not single_file:
-            pulled = _pull_device_config(port)
-            repo_config_path = fw_path / "config.json"
-            if pulled is not None:
-                if repo_config_path.exists():
-                    _diff_configs(pulled, repo_config_path, log)
-                if need_restore:
-                    log("config.json: will be backed up and restored after "
-                        "the reflash (device keeps its own copy)")
-                    device_config_backup = pulled
-                else:
-                    if update_config:
-                        log("config.json: overwriting with repo version "
-                            "(update_config); see diff above for what "
-                            "changes")
-                    pulled.unlink(missing_ok=True)
-            else:
-                log("config.json: device currently has none (fresh board, or "
-                    "previously wiped) — nothing to diff or back up")
-                if need_restore:
-                    if repo_config_path.exists():
-                        log("WARNING: config.json: nothing on the device to "
-                            "back up, so pushing the repo's copy instead of "
-                            "leaving the device with none after the wipe. "
-                            "Enable update_config to do this intentionally "
-                            "and skip this warning.")
-                        files.append(repo_config_path)
-                    else:
-                        log("WARNING: filesystem will be formatted and there "
-                            "is no existing config.json to restore, and the "
-                            "repo has no config.json either — the device "
-                            "will have NO config.json until you add one "
-                            "manually.")
-
-        if will_format:
-            if _cancelled(cancel_event, log):
-                if device_config_backup is not None:
-                    device_config_backup.unlink(missing_ok=True)
-                return False
-            log("Formatting device filesystem...")
-            _wipe_filesystem(port, log)
-        elif no_format:
-            log("Skipping filesystem format")
-
-        all_successful = True
-        for i, filename in enumerate(files):
-            if _cancelled(cancel_event, log):
-                all_successful = False
-                break
-            log(f"Uploading file {i + 1}/{len(files)}: {filename}")
-
-            local_path = str(filename.absolute())
-            # The device's filesystem always uses forward slashes, regardless
-            # of the host OS. str(Path) would use "\" on Windows, which the
-            # Pico treats as a literal filename character rather than a
-            # directory separator — nested files would land flat on the
-            # device instead of inside their subdirectory.
-            remote_path = filename.relative_to(fw_path).as_posix()
-
-            if filename.is_dir():
-                # Best-effort: mkdir fails when the dir already exists (e.g.
-                # on no-format re-uploads), which is fine — don't abort on it.
-                run_mpremote(["connect", port, "mkdir", remote_path],
-                             log, retries=1)
-                continue
-
-            if run_mpremote(["connect", port, "cp", local_path,
-                             f":{remote_path}"], log):
-                log(f"Successfully uploaded {filename}")
-            else:
-                log(f"ERROR: failed to upload {filename} after retries")
-                all_successful = False
-                break
-
-        # Restore the device's original config.json if we backed one up. This
-        # runs regardless of all_successful — the wipe already happened, so
-        # leaving the device without its config would be strictly worse than
-        # a partial upload.
-        if device_config_backup is not None:
-            log("Restoring device's original config.json...")
-            if run_mpremote(["connect", port, "cp",
-                             str(device_config_backup), ":config.json"], log):
-                log("config.json restored.")
-            else:
-                log("ERROR: failed to restore config.json backup after "
-                    "wipe! Device has NO config.json now.")
-                all_successful = False
-            device_config_backup.unlink(missing_ok=True)
-
-        if reset_device and all_successful:
-            log("Resetting device...")
-            run_mpremote(["connect", port, "reset"], log, retries=1)
-
-        return all_successful
+        with RawReplSession(port) as session:
+            return _sync_files(session, files, fw_path, single_file,
+                               will_format, update_config, need_restore,
+                               reset_device, log, cancel_event)
 
     except Exception as e:
         logger.exception("Error during firmware upload")
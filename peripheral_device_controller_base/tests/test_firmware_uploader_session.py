@@ -0,0 +1,217 @@
+"""Hash-diffed firmware upload over one raw-REPL session.
+
+The board is an in-memory fake session; upload_firmware must only write the
+files whose hash differs, remove what the firmware no longer has, and leave
+the device's config.json alone unless update_config is set.
+"""
+import hashlib
+import json
+
+import pytest
+
+import peripheral_device_controller_base.firmware_uploader as uploader
+from peripheral_device_controller_base.firmware_uploader import RawReplError, RawReplSession
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class FakeSession:
+    """A board filesystem: {path: bytes, or None for a directory}."""
+
+    def __init__(self, entries):
+        self.entries = dict(entries)
+        self.written = []
+        self.removed = []
+        self.recovered = 0
+        self.was_reset = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    def file_hashes(self):
+        return {path: None if data is None else sha256(data) for path, data in self.entries.items()}
+
+    def read_file(self, remote_path):
+        return self.entries[remote_path]
+
+    def write_file(self, remote_path, data):
+        assert self.entries.get(remote_path.rpartition("/")[0] or "", None) is None
+        self.entries[remote_path] = data
+        self.written.append(remote_path)
+
+    def mkdir(self, remote_path):
+        self.entries.setdefault(remote_path, None)
+
+    def remove(self, remote_path):
+        self.removed.append(remote_path)
+        for path in list(self.entries):
+            if path == remote_path or path.startswith(remote_path + "/"):
+                del self.entries[path]
+
+    def recover(self):
+        self.recovered += 1
+
+    def reset(self):
+        self.was_reset = True
+
+
+class FlakySession(FakeSession):
+    """Fails the first ``failures`` writes of each file, as a glitching
+    serial link would."""
+
+    def __init__(self, entries, failures):
+        super().__init__(entries)
+        self.failures = failures
+        self.attempts = {}
+
+    def write_file(self, remote_path, data):
+        self.attempts[remote_path] = self.attempts.get(remote_path, 0) + 1
+        if self.attempts[remote_path] <= self.failures:
+            raise RawReplError("timed out running a command on /dev/fake")
+        super().write_file(remote_path, data)
+
+
+@pytest.fixture
+def firmware(tmp_path):
+    fw = tmp_path / "fw"
+    (fw / "lib").mkdir(parents=True)
+    (fw / "main.py").write_bytes(b"print('main v2')\n")
+    (fw / "boot.py").write_bytes(b"# boot\n")
+    (fw / "lib" / "driver.py").write_bytes(b"DRIVER = 2\n")
+    (fw / "config.json").write_text(json.dumps({"gain": 1}))
+    return fw
+
+
+def run_upload(monkeypatch, session, firmware, **kwargs):
+    monkeypatch.setattr(uploader, "ensure_repl_via_window", lambda port, log: (port, True))
+    monkeypatch.setattr(uploader, "RAW_REPL_RETRY_DELAY_S", 0)
+    monkeypatch.setattr(uploader, "RawReplSession", lambda port: session)
+    lines = []
+    ok = uploader.upload_firmware(firmware, port="/dev/fake", log=lines.append, **kwargs)
+    return ok, lines
+
+
+def test_only_changed_files_are_written_and_stale_ones_removed(monkeypatch, firmware):
+    device_config = json.dumps({"gain": 7}).encode()
+    session = FakeSession({
+        "boot.py": b"# boot\n",
+        "main.py": b"print('main v1')\n",
+        "lib": None,
+        "lib/driver.py": b"DRIVER = 2\n",
+        "lib/old_driver.py": b"gone\n",
+        "old": None,
+        "old/thing.py": b"gone\n",
+        "config.json": device_config,
+    })
+
+    ok, lines = run_upload(monkeypatch, session, firmware)
+
+    assert ok
+    assert session.written == ["main.py"]
+    assert sorted(session.removed) == ["lib/old_driver.py", "old"]
+    assert session.entries["config.json"] == device_config  # tuned values kept
+    assert session.was_reset
+    assert any("2 file(s) unchanged" in line for line in lines)
+
+
+def test_update_config_pushes_the_repo_config(monkeypatch, firmware):
+    session = FakeSession({"config.json": b'{"gain": 7}'})
+
+    ok, _ = run_upload(monkeypatch, session, firmware, update_config=True, reset_device=False)
+
+    assert ok
+    assert json.loads(session.entries["config.json"]) == {"gain": 1}
+    assert not session.was_reset
+
+
+def test_board_without_config_gets_the_repo_copy(monkeypatch, firmware):
+    session = FakeSession({})
+
+    ok, lines = run_upload(monkeypatch, session, firmware)
+
+    assert ok
+    assert set(session.written) == {"boot.py", "main.py", "lib/driver.py", "config.json"}
+    assert session.entries["lib"] is None
+    assert any("WARNING: config.json" in line for line in lines)
+
+
+def test_no_format_keeps_extra_files(monkeypatch, firmware):
+    session = FakeSession({"notes.txt": b"keep me"})
+
+    ok, _ = run_upload(monkeypatch, session, firmware, no_format=True)
+
+    assert ok
+    assert session.removed == []
+    assert session.entries["notes.txt"] == b"keep me"
+
+
+def test_failed_command_is_retried_after_recovering_the_repl(monkeypatch, firmware):
+    session = FlakySession({"config.json": b'{"gain": 7}'}, failures=1)
+
+    ok, lines = run_upload(monkeypatch, session, firmware)
+
+    assert ok
+    assert set(session.written) == {"boot.py", "main.py", "lib/driver.py"}
+    assert session.recovered == 3
+    assert session.was_reset
+    assert any("attempt 1/3 failed" in line for line in lines)
+
+
+def test_upload_fails_once_the_retries_are_spent(monkeypatch, firmware):
+    session = FlakySession({}, failures=uploader.RAW_REPL_COMMAND_ATTEMPTS)
+
+    ok, lines = run_upload(monkeypatch, session, firmware)
+
+    assert not ok
+    assert session.written == []
+    assert set(session.attempts.values()) == {uploader.RAW_REPL_COMMAND_ATTEMPTS}
+    assert not session.was_reset
+    assert any("ERROR: upload failed" in line for line in lines)
+
+
+class ScriptedSerial:
+    """Serial port replaying canned raw-REPL replies, one per write."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.rx = bytearray()
+        self.tx = []
+
+    @property
+    def in_waiting(self):
+        return len(self.rx)
+
+    def write(self, data):
+        self.tx.append(data)
+        if data.endswith(b"\x04") and self.replies:
+            self.rx += self.replies.pop(0)
+
+    def read(self, n):
+        data, self.rx[:] = bytes(self.rx[:n]), self.rx[n:]
+        return data
+
+
+def test_exec_returns_output_and_raises_board_errors():
+    session = RawReplSession("/dev/fake", command_timeout_s=0.5)
+    session._serial = ScriptedSerial([
+        b"OKD /lib\r\nF /main.py " + b"ab" * 32 + b"\r\n\x04\x04>",
+        b"OK\x04Traceback (most recent call last):\r\nOSError: 28\r\n\x04>",
+    ])
+
+    assert session.file_hashes() == {"lib": None, "main.py": "ab" * 32}
+    with pytest.raises(RawReplError, match="OSError: 28"):
+        session.exec("w(b'x')")
+
+
+def test_file_hashes_keeps_paths_with_spaces():
+    session = RawReplSession("/dev/fake", command_timeout_s=0.5)
+    session._serial = ScriptedSerial([
+        b"OKD /my lib\r\nF /my lib/cal data.json " + b"cd" * 32 + b"\r\n\x04\x04>",
+    ])
+
+    assert session.file_hashes() == {"my lib": None, "my lib/cal data.json": "cd" * 32}
@@ -2,10 +2,14 @@
 Ethernet communication service for Festo PGVA device.
 Handles Modbus TCP communication with the PGVA pressure/vacuum generator.
 """
+import threading
 import time
-from typing import Dict
+from typing import Dict, Iterable, List, Tuple
 from logger.logger_service import get_logger
 from .pgva_status_parser import PGVAStatusParser
+from .pgva_status_poller import (
+    PGVA_STATUS_POLL_INTERVAL_S, PGVAStatusPoller, PGVAStatusSnapshot,
+)
 from pymodbus.client import ModbusTcpClient
 from pymodbus.exceptions import ModbusException
 from ..consts import (
@@ -21,14 +25,60 @@ from ..consts import (
 
 logger = get_logger(__name__)
 
+# Modbus limit on the registers one read request may return.
+MODBUS_MAX_REGISTERS_PER_READ = 125
+# Unrequested registers a block read may span rather than splitting in two:
+# a few extra bytes cost less than another round-trip.
+PGVA_BLOCK_READ_MAX_GAP = 8
+
+# Input registers of one status poll: process values and status words.
+PGVA_POLL_REGISTERS = (
+    PGVA_PRESSURE_ACTUAL_MBAR, PGVA_VACUUM_ACTUAL_MBAR,
+    PGVA_OUTPUT_PRESSURE_ACTUAL_MBAR, PGVA_STATUS, PGVA_WARNING, PGVA_ERROR,
+)
+
+
+def register_blocks(addresses: Iterable[int],
+                    max_gap: int = PGVA_BLOCK_READ_MAX_GAP,
+                    max_count: int = MODBUS_MAX_REGISTERS_PER_READ
+                    ) -> List[Tuple[int, int]]:
+    """
+    Group register addresses into (start, count) ranges, one read request
+    each. Addresses up to ``max_gap`` registers apart share a range; no
+    range is longer than ``max_count``.
+    """
+    blocks = []
+    for address in sorted(set(addresses)):
+        if blocks:
+            start, count = blocks[-1]
+            end = start + count
+            if address - end <= max_gap and address - start < max_count:
+                blocks[-1] = (start, address - start + 1)
+                continue
+        blocks.append((address, 1))
+    return blocks
+
+
+def to_signed16(raw_value: int) -> int:
+    """Unsigned 16-bit register value to signed."""
+    return raw_value - 65536 if raw_value > 32767 else raw_value
+
 
 class PGVAEthernetCommunication:
     """
     Handles ethernet communication with Festo PGVA device using Modbus TCP.
+
+    Registers read together are fetched in as few requests as possible (see
+    read_input_registers_block). While connected, a PGVAStatusPoller keeps
+    the latest process values and status words in ``status_poller.latest``;
+    status queries and pressure waits use that snapshot instead of going to
+    the device. Requests are serialized: the poller thread and callers share
+    one Modbus client.
     """
     
     def __init__(self, ip_address: str = "192.168.0.1", port: int = 502,
-                 unit_id: int = 0, timeout: float = 5.0):
+                 unit_id: int = 0, timeout: float = 5.0,
+                 status_poll_interval_s: float = PGVA_STATUS_POLL_INTERVAL_S):
         """
         Initialize PGVA ethernet communication.
 
@@ -37,12 +87,19 @@ class PGVAEthernetCommunication:
             port: Port number for Modbus TCP communication
             unit_id: Modbus unit ID for the device
             timeout: Connection/request timeout in seconds
+            status_poll_interval_s: Seconds between background status
+                reads; 0 disables the poller
         """
         self.ip_address = ip_address
         self.port = port
         self.unit_id = unit_id
         self.connected = False
         self.client = ModbusTcpClient(host=ip_address, port=port, timeout=timeout)
+        self._client_lock = threading.RLock()
+        self.status_poller = None
+        if status_poll_interval_s:
+            self.status_poller = PGVAStatusPoller(
+                self.read_status_snapshot, interval_s=status_poll_interval_s)
         logger.info("Using pymodbus for PGVA communication")
         
     def connect(self, timeout: float = 5.0) -> bool:
@@ -56,10 +113,13 @@ class PGVAEthernetCommunication:
             True if connection successful, False otherwise
         """
         try:
-            self.connected = self.client.connect()
+            with self._client_lock:
+                self.connected = self.client.connect()
             if self.connected:
                 logger.info(f"Connected to PGVA at {self.ip_address}:"
                             f"{self.port}")
+                if self.status_poller is not None:
+                    self.status_poller.start()
             else:
                 logger.error("Failed to connect to PGVA")
             return self.connected
@@ -70,15 +130,150 @@ class PGVAEthernetCommunication:
     
     def disconnect(self):
         """Disconnect from the PGVA device."""
+        if self.status_poller is not None:
+            self.status_poller.stop()
         try:
             if self.client:
-                self.client.close()
+                with self._client_lock:
+                    self.client.close()
                 logger.info("Disconnected from PGVA")
         except Exception as e:
             logger.error(f"Error disconnecting from PGVA: {e}")
         finally:
             self.connected = False
 
+    def _write_register(self, address: int, value: int):
+        with self._client_lock:
+            return self.client.write_register(address=address, value=value)
+
+    def _read_block(self, read, addresses: Iterable[int], what: str,
+                    partial: bool = False) -> Dict[int, int]:
+        """Read ``addresses`` with ``read`` (a client read_*_registers
+        method), one request per register_blocks range.
+
+        A block may span registers the device does not map; if it rejects
+        the block, its requested registers are read one at a time instead.
+        With ``partial`` a register that still fails is left out of the
+        result rather than raising.
+        """
+        addresses = sorted(set(addresses))
+        values = {}
+        with self._client_lock:
+            for start, count in register_blocks(addresses):
+                result = read(address=start, count=count)
+                if not result.isError():
+                    values.update(zip(range(start, start + count),
+                                      result.registers))
+                    continue
+                if count == 1 and not partial:
+                    raise ModbusException(f"Error reading {what}: {result}")
+                logger.debug(f"Block read of {what} {start}+{count} failed "
+                             f"({result}); reading registers one by one")
+                for address in addresses:
+                    if not start <= address < start + count:
+                        continue
+                    single = read(address=address, count=1)
+                    if not single.isError():
+                        values[address] = single.registers[0]
+                    elif not partial:
+                        raise ModbusException(
+                            f"Error reading {what} at {address}: {single}")
+        return values
+
+    def read_input_registers_block(self, addresses: Iterable[int],
+                                   partial: bool = False) -> Dict[int, int]:
+        """
+        Read several input registers in as few requests as possible.
+
+        Args:
+            addresses: Input register addresses to read
+            partial: Leave unreadable registers out instead of raising
+
+        Returns:
+            Raw register values keyed by address (including registers
+            spanned between the requested ones)
+        """
+        return self._read_block(self.client.read_input_registers,
+                                addresses, "input registers", partial)
+
+    def read_holding_registers_block(self, addresses: Iterable[int],
+                                     partial: bool = False
+                                     ) -> Dict[int, int]:
+        """
+        Read several holding registers in as few requests as possible.
+
+        Args:
+            addresses: Holding register addresses to read
+            partial: Leave unreadable registers out instead of raising
+
+        Returns:
+            Raw register values keyed by address
+        """
+        return self._read_block(self.client.read_holding_registers,
+                                addresses, "holding registers", partial)
+
+    def read_status_snapshot(self) -> PGVAStatusSnapshot:
+        """
+        Read the process values and status words in one go (the status
+        poller's read; also usable directly).
+        """
+        timestamp = time.monotonic()
+        registers = self.read_input_registers_block(PGVA_POLL_REGISTERS)
+        return PGVAStatusSnapshot(
+            timestamp=timestamp,
+            pressure_mbar=float(registers[PGVA_PRESSURE_ACTUAL_MBAR]),
+            vacuum_mbar=float(to_signed16(registers[PGVA_VACUUM_ACTUAL_MBAR])),
+            output_pressure_mbar=float(
+                to_signed16(registers[PGVA_OUTPUT_PRESSURE_ACTUAL_MBAR])),
+            status_word=int(registers[PGVA_STATUS]),
+            warning_word=int(registers[PGVA_WARNING]),
+            error_word=int(registers[PGVA_ERROR]),
+        )
+
+    def cached_status(self, max_age_s: float = None):
+        """
+        The poller's latest snapshot, or None when there is none or it is
+        older than ``max_age_s`` (default: two poll intervals). Never
+        touches the network.
+        """
+        if self.status_poller is None or not self.status_poller.running:
+            return None
+        snapshot = self.status_poller.latest
+        if max_age_s is None:
+            max_age_s = 2 * self.status_poller.interval_s
+        if snapshot is None or snapshot.age_s > max_age_s:
+            return None
+        return snapshot
+
+    def read_setpoints(self) -> Dict:
+        """
+        Read the configured thresholds, output pressure and trigger time
+        (holding registers) in one go.
+
+        Returns:
+            Dictionary of the current setpoints
+        """
+        registers = self.read_holding_registers_block((
+            PGVA_PRESSURE_THRESHOLD_MBAR, PGVA_VACUUM_THRESHOLD_MBAR,
+            PGVA_OUTPUT_PRESSURE_MBAR, PGVA_TRIGGER_ACTUATION_TIME))
+        return {
+            "pressure_threshold_mbar": float(
+                registers[PGVA_PRESSURE_THRESHOLD_MBAR]),
+            "vacuum_threshold_mbar": float(
+                to_signed16(registers[PGVA_VACUUM_THRESHOLD_MBAR])),
+            "output_pressure_mbar": float(
+                to_signed16(registers[PGVA_OUTPUT_PRESSURE_MBAR])),
+            "trigger_actuation_time_ms": int(
+                registers[PGVA_TRIGGER_ACTUATION_TIME]),
+        }
+
+    def _read_input_register(self, address: int, what: str) -> int:
+        try:
+            return self.read_input_registers_block((address,))[address]
+        except Exception as e:
+            logger.error(f"Error reading {what}: {e}")
+            raise
+
     def read_pressure_mbar(self) -> float:
         """
         Read current pressure from PGVA device in mbar.
@@ -86,15 +281,8 @@ class PGVAEthernetCommunication:
         Returns:
             Current pressure value in mbar
         """
-        try:
-            result = self.client.read_input_registers(
-                address=PGVA_PRESSURE_ACTUAL_MBAR, count=1)
-            if result.isError():
-                raise ModbusException(f"Error reading pressure: {result}")
-            return float(result.registers[0])
-        except Exception as e:
-            logger.error(f"Error reading pressure: {e}")
-            raise
+        return float(self._read_input_register(PGVA_PRESSURE_ACTUAL_MBAR,
+                                               "pressure"))
     
     def read_vacuum_mbar(self) -> float:
         """
@@ -104,23 +292,8 @@ class PGVAEthernetCommunication:
         Returns:
             Current vacuum value in mbar (negative value)
         """
-        try:
-            result = self.client.read_input_registers(
-                address=PGVA_VACUUM_ACTUAL_MBAR, count=1)
-            if result.isError():
-                raise ModbusException(f"Error reading vacuum: {result}")
-            
-            # Convert from unsigned 16-bit to signed 16-bit
-            raw_value = result.registers[0]
-            if raw_value > 32767:
-                signed_value = raw_value - 65536
-            else:
-                signed_value = raw_value
-            
-            return float(signed_value)
-        except Exception as e:
-            logger.error(f"Error reading vacuum: {e}")
-            raise
+        return float(to_signed16(self._read_input_register(
+            PGVA_VACUUM_ACTUAL_MBAR, "vacuum")))
     
     def read_output_pressure_mbar(self) -> float:
         """
@@ -131,24 +304,8 @@ class PGVAEthernetCommunication:
         Returns:
             Current output pressure value in mbar (can be negative or positive)
         """
-        try:
-            result = self.client.read_input_registers(
-                address=PGVA_OUTPUT_PRESSURE_ACTUAL_MBAR, count=1)
-            if result.isError():
-                raise ModbusException(f"Error reading output pressure: "
-                                      f"{result}")
-            
-            # Convert from unsigned 16-bit to signed 16-bit
-            raw_value = result.registers[0]
-            if raw_value > 32767:
-                signed_value = raw_value - 65536
-            else:
-                signed_value = raw_value
-            
-            return float(signed_value)
-        except Exception as e:
-            logger.error(f"Error reading output pressure: {e}")
-            raise
+        return float(to_signed16(self._read_input_register(
+            PGVA_OUTPUT_PRESSURE_ACTUAL_MBAR, "output pressure")))
     
     def set_pressure_threshold_mbar(self, pressure: float) -> bool:
         """
@@ -161,7 +318,7 @@ class PGVAEthernetCommunication:
             True if successful, False otherwise
         """
         try:
-            result = self.client.write_register(
+            result = self._write_register(
                 address=PGVA_PRESSURE_THRESHOLD_MBAR, value=int(pressure))
             if result.isError():
                 raise ModbusException(f"Error setting pressure threshold: "
@@ -182,7 +339,7 @@ class PGVAEthernetCommunication:
             True if successful, False otherwise
         """
         try:
-            result = self.client.write_register(
+            result = self._write_register(
                 address=PGVA_VACUUM_THRESHOLD_MBAR, value=int(vacuum))
             if result.isError():
                 raise ModbusException(f"Error setting vacuum threshold: "
@@ -214,7 +371,7 @@ class PGVAEthernetCommunication:
                 # For positive values, use as-is
                 modbus_value = int(pressure)
             
-            result = self.client.write_register(
+            result = self._write_register(
                 address=PGVA_OUTPUT_PRESSURE_MBAR, value=modbus_value)
             if result.isError():
                 raise ModbusException(f"Error setting output pressure: "
@@ -233,15 +390,7 @@ class PGVAEthernetCommunication:
         Returns:
             Device status value (16-bit status word)
         """
-        try:
-            result = self.client.read_input_registers(
-                address=PGVA_STATUS, count=1)
-            if result.isError():
-                raise ModbusException(f"Error reading status: {result}")
-            return int(result.registers[0])
-        except Exception as e:
-            logger.error(f"Error reading status: {e}")
-            raise
+        return int(self._read_input_register(PGVA_STATUS, "status"))
     
     def get_warnings(self) -> int:
         """
@@ -250,15 +399,7 @@ class PGVAEthernetCommunication:
         Returns:
             Warning word (16 bits)
         """
-        try:
-            result = self.client.read_input_registers(
-                address=PGVA_WARNING, count=1)
-            if result.isError():
-                raise ModbusException(f"Error reading warnings: {result}")
-            return int(result.registers[0])
-        except Exception as e:
-            logger.error(f"Error reading warnings: {e}")
-            raise
+        return int(self._read_input_register(PGVA_WARNING, "warnings"))
     
     def get_errors(self) -> int:
         """
@@ -267,15 +408,7 @@ class PGVAEthernetCommunication:
         Returns:
             Error word (16 bits)
         """
-        try:
-            result = self.client.read_input_registers(
-                address=PGVA_ERROR, count=1)
-            if result.isError():
-                raise ModbusException(f"Error reading errors: {result}")
-            return int(result.registers[0])
-        except Exception as e:
-            logger.error(f"Error reading errors: {e}")
-            raise
+        return int(self._read_input_register(PGVA_ERROR, "errors"))
     
     def trigger_manual(self) -> bool:
         """
@@ -285,7 +418,7 @@ class PGVAEthernetCommunication:
             True if successful, False otherwise
         """
         try:
-            result = self.client.write_register(
+            result = self._write_register(
                 address=PGVA_MANUAL_TRIGGER, value=PGVA_CMD_TRIGGER)
             if result.isError():
                 raise ModbusException(f"Error triggering manual: "
@@ -303,7 +436,7 @@ class PGVAEthernetCommunication:
             True if successful, False otherwise
         """
         try:
-            result = self.client.write_register(
+            result = self._write_register(
                 address=PGVA_DISABLE_PUMP, value=PGVA_CMD_DISABLE)
             if result.isError():
                 raise ModbusException(f"Error enabling pump: {result}")
@@ -320,7 +453,7 @@ class PGVAEthernetCommunication:
             True if successful, False otherwise
         """
         try:
-            result = self.client.write_register(
+            result = self._write_register(
                 address=PGVA_DISABLE_PUMP, value=PGVA_CMD_ENABLE)
             if result.isError():
                 raise ModbusException(f"Error disabling pump: {result}")
@@ -337,7 +470,7 @@ class PGVAEthernetCommunication:
             True if successful, False otherwise
         """
         try:
-            result = self.client.write_register(
+            result = self._write_register(
                 address=PGVA_STORE_TO_EEPROM, value=PGVA_CMD_ENABLE)
             if result.isError():
                 raise ModbusException(f"Error storing to EEPROM: "
@@ -347,6 +480,19 @@ class PGVAEthernetCommunication:
             logger.error(f"Error storing to EEPROM: {e}")
             return False
     
+    def read_status_words(self) -> Tuple[int, int, int]:
+        """
+        Status, warning and error words: from the poller's snapshot when it
+        is fresh, else read from the device in one request.
+        """
+        snapshot = self.cached_status()
+        if snapshot is not None:
+            return snapshot.status_word, snapshot.warning_word, snapshot.error_word
+        registers = self.read_input_registers_block(
+            (PGVA_STATUS, PGVA_WARNING, PGVA_ERROR))
+        return (int(registers[PGVA_STATUS]), int(registers[PGVA_WARNING]),
+                int(registers[PGVA_ERROR]))
+
     def get_comprehensive_status(self) -> Dict:
         """
         Get comprehensive device status including status, warnings, and errors.
@@ -355,9 +501,7 @@ class PGVAEthernetCommunication:
             Dictionary containing parsed status, warnings, and errors
         """
         try:
-            status_value = self.get_status()
-            warning_value = self.get_warnings()
-            error_value = self.get_errors()
+            status_value, warning_value, error_value = self.read_status_words()
             
             # Parse the status information
             parsed_status = PGVAStatusParser.parse_status_word(status_value)
@@ -403,39 +547,22 @@ class PGVAEthernetCommunication:
             Dictionary containing device information
         """
         try:
-            device_info = {}
-            
-            # Read firmware information
-            fw_version = self.client.read_input_registers(
-                address=PGVA_FIRMWARE_VERSION, count=1)
-            fw_sub_version = self.client.read_input_registers(
-                address=PGVA_FIRMWARE_SUB_VERSION, count=1)
-            fw_build = self.client.read_input_registers(
-                address=PGVA_FIRMWARE_BUILD, count=1)
-            
-            if not fw_version.isError():
-                device_info["firmware_version"] = fw_version.registers[0]
-            if not fw_sub_version.isError():
-                device_info["firmware_sub_version"] = fw_sub_version.registers[0]
-            if not fw_build.isError():
-                device_info["firmware_build"] = fw_build.registers[0]
-                
-            # Read counters
-            trigger_counter = self.client.read_input_registers(
-                address=PGVA_TRIGGER_COUNTER, count=1)
-            pump_counter = self.client.read_input_registers(
-                address=PGVA_PUMP_COUNTER, count=1)
-            life_counter = self.client.read_input_registers(
-                address=PGVA_LIFE_COUNTER, count=1)
-            
-            if not trigger_counter.isError():
-                device_info["trigger_count"] = trigger_counter.registers[0]
-            if not pump_counter.isError():
-                device_info["pump_runtime_seconds"] = pump_counter.registers[0]
-            if not life_counter.isError():
-                device_info["life_runtime_minutes"] = life_counter.registers[0]
-            
-            return device_info
+            # Firmware information and counters, in as few requests as
+            # possible; registers the device will not return are left out
+            registers = self.read_input_registers_block((
+                PGVA_FIRMWARE_VERSION, PGVA_FIRMWARE_SUB_VERSION,
+                PGVA_FIRMWARE_BUILD, PGVA_TRIGGER_COUNTER, PGVA_PUMP_COUNTER,
+                PGVA_LIFE_COUNTER), partial=True)
+            fields = (
+                ("firmware_version", PGVA_FIRMWARE_VERSION),
+                ("firmware_sub_version", PGVA_FIRMWARE_SUB_VERSION),
+                ("firmware_build", PGVA_FIRMWARE_BUILD),
+                ("trigger_count", PGVA_TRIGGER_COUNTER),
+                ("pump_runtime_seconds", PGVA_PUMP_COUNTER),
+                ("life_runtime_minutes", PGVA_LIFE_COUNTER),
+            )
+            return {key: registers[address] for key, address in fields
+                    if address in registers}
             
         except Exception as e:
             logger.error(f"Error getting device info: {e}")
@@ -528,7 +655,7 @@ class PGVAEthernetCommunication:
             return False
         
         try:
-            result = self.client.write_register(address=PGVA_TRIGGER_ACTUATION_TIME, value=time_ms)
+            result = self._write_register(address=PGVA_TRIGGER_ACTUATION_TIME, value=time_ms)
             if result.isError():
                 logger.error(f"Failed to set trigger actuation time: {result}")
                 return False
@@ -553,7 +680,7 @@ class PGVAEthernetCommunication:
             return False
         
         try:
-            result = self.client.write_register(address=PGVA_MANUAL_TRIGGER, value=PGVA_CMD_TRIGGER)
+            result = self._write_register(address=PGVA_MANUAL_TRIGGER, value=PGVA_CMD_TRIGGER)
             if result.isError():
                 logger.error(f"Failed to activate manual trigger: {result}")
                 return False
@@ -578,7 +705,7 @@ class PGVAEthernetCommunication:
             return False
         
         try:
-            result = self.client.write_register(address=PGVA_MANUAL_TRIGGER, value=PGVA_CMD_DISABLE)
+            result = self._write_register(address=PGVA_MANUAL_TRIGGER, value=PGVA_CMD_DISABLE)
             if result.isError():
                 logger.error(f"Failed to deactivate manual trigger: {result}")
                 return False
@@ -741,7 +868,24 @@ class PGVAEthernetCommunication:
             timeout_seconds: maximum time to wait
             cancel_event: optional threading.Event; if set, the wait aborts
                 early (used to unblock this loop on application shutdown)
-        """
+
+        With the status poller running this waits on its snapshots (which
+        it then reads at the fast rate): the first one read after the call
+        that reports the pressure reached ends the wait. Otherwise the
+        status word is polled directly every 100 ms.
+        """
+        if self.status_poller is not None and self.status_poller.running:
+            start_time = time.monotonic()
+            snapshot = self.status_poller.wait_for(
+                lambda s: s.pressure_reached, timeout_seconds,
+                cancel_event=cancel_event, newer_than=start_time)
+            if snapshot is None:
+                if cancel_event is not None and cancel_event.is_set():
+                    logger.info("Pressure wait cancelled")
+                return False
+            logger.info(f"Target pressure reached after "
+                        f"{snapshot.timestamp - start_time:.2f} s")
+            return True
 
         start_time = time.time()
         elapsed = 0
@@ -756,7 +900,7 @@ class PGVAEthernetCommunication:
         if elapsed >= timeout_seconds:
             return False
         else:
-            logger.info(f"Target pressure reached after {elapsed:.2f} ms")
+            logger.info(f"Target pressure reached after {elapsed:.2f} s")
             return True
     
     def is_building_pressure(self) -> bool:
@@ -0,0 +1,214 @@
+"""
+Background status polling for the Festo PGVA.
+
+The poller reads the PGVA process values and status words in one Modbus
+request at a fixed rate and keeps the latest result as a timestamped
+snapshot, so UI and protocol code can read the device state without going
+on the network themselves. Code waiting on a condition (e.g. the output
+pressure being reached) subscribes to new snapshots instead of polling the
+device on its own; the poller switches to a fast rate while anyone waits.
+With no waiter, no subscriber and no read of the snapshot for a while the
+poller goes quiet (no Modbus traffic) until the snapshot is asked for again.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from logger.logger_service import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds between status reads while nobody is waiting on the device.
+PGVA_STATUS_POLL_INTERVAL_S = 0.25
+# Seconds between status reads while a wait_for() is active (pressure settle):
+# the rate the per-wait read loop this replaced used, in one request per read.
+PGVA_STATUS_FAST_POLL_INTERVAL_S = 0.1
+# Seconds without a waiter, subscriber or read of ``latest`` after which the
+# poller stops reading the device until the snapshot is wanted again.
+PGVA_STATUS_IDLE_TIMEOUT_S = 5.0
+
+# Status word bit 6: output pressure reached (0 = in progress, 1 = achieved).
+PGVA_STATUS_PRESSURE_REACHED_BIT = 6
+
+
+@dataclass(frozen=True)
+class PGVAStatusSnapshot:
+    """Device state as read in one poll."""
+
+    timestamp: float  # time.monotonic() when the read was issued
+    pressure_mbar: float
+    vacuum_mbar: float
+    output_pressure_mbar: float
+    status_word: int
+    warning_word: int
+    error_word: int
+
+    @property
+    def pressure_reached(self) -> bool:
+        return bool((self.status_word >> PGVA_STATUS_PRESSURE_REACHED_BIT) & 1)
+
+    @property
+    def age_s(self) -> float:
+        return time.monotonic() - self.timestamp
+
+
+class PGVAStatusPoller:
+    """
+    Keeps a PGVAStatusSnapshot current on a daemon thread.
+
+    ``read_snapshot()`` performs the (single) device read and returns a
+    snapshot; a failed read keeps the previous snapshot, whose ``age_s`` then
+    grows, and is kept in ``last_error``. Subscribers are called with every
+    new snapshot on the poller thread.
+
+    Polling is demand-driven: it runs while a wait_for() or a subscriber is
+    active, or until ``idle_timeout_s`` after the last read of ``latest``.
+    Reading ``latest`` while idle wakes the poller; that read returns the
+    old snapshot (check ``age_s``), the next one a fresh snapshot.
+    """
+
+    def __init__(self, read_snapshot: Callable[[], PGVAStatusSnapshot],
+                 interval_s: float = PGVA_STATUS_POLL_INTERVAL_S,
+                 fast_interval_s: float = PGVA_STATUS_FAST_POLL_INTERVAL_S,
+                 idle_timeout_s: float = PGVA_STATUS_IDLE_TIMEOUT_S):
+        self._read_snapshot = read_snapshot
+        self.interval_s = float(interval_s)
+        self.fast_interval_s = float(fast_interval_s)
+        self.idle_timeout_s = float(idle_timeout_s)
+
+        self._condition = threading.Condition()
+        self._latest: Optional[PGVAStatusSnapshot] = None
+        self._waiters = 0
+        self._subscribers = []
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._last_read = time.monotonic()  # of ``latest``; starts the idle countdown
+
+        self.last_error: Optional[Exception] = None
+        self.polls_count = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def idle(self) -> bool:
+        """True while nobody needs snapshots: the poller is not reading the device."""
+        with self._condition:
+            return self._idle_locked()
+
+    def _idle_locked(self) -> bool:
+        return (not self._waiters and not self._subscribers
+                and time.monotonic() - self._last_read > self.idle_timeout_s)
+
+    @property
+    def latest(self) -> Optional[PGVAStatusSnapshot]:
+        """The most recent snapshot (None before the first successful read). Keeps the poller polling, or
+        wakes it when idle."""
+        with self._condition:
+            was_idle = self._idle_locked()
+            self._last_read = time.monotonic()
+            snapshot = self._latest
+        if was_idle:
+            self._wake.set()
+        return snapshot
+
+    def start(self):
+        if self.running:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="pgva-status-poller")
+        self._thread.start()
+
+    def stop(self, timeout_s: float = 1.0):
+        self._stopped.set()
+        self._wake.set()
+        with self._condition:
+            self._condition.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout_s)
+        self._thread = None
+
+    def subscribe(self, callback: Callable[[PGVAStatusSnapshot], None]) -> Callable[[], None]:
+        """Call ``callback(snapshot)`` for every new snapshot. Returns an unsubscribe function."""
+        with self._condition:
+            self._subscribers.append(callback)
+        self._wake.set()
+
+        def unsubscribe():
+            with self._condition:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def wait_for(self, predicate: Callable[[PGVAStatusSnapshot], bool], timeout_s: float,
+                 cancel_event=None, newer_than: float = None) -> Optional[PGVAStatusSnapshot]:
+        """
+        Block until a snapshot read after ``newer_than`` (a time.monotonic()
+        value, default: now) satisfies ``predicate``. Returns that snapshot,
+        or None on timeout, when ``cancel_event`` is set, or when the poller
+        stops.
+        """
+        newer_than = time.monotonic() if newer_than is None else newer_than
+        deadline = time.monotonic() + timeout_s
+        with self._condition:
+            self._waiters += 1
+        self._wake.set()  # switch to the fast rate now, not after the current interval
+        try:
+            with self._condition:
+                while True:
+                    snapshot = self._latest
+                    if snapshot is not None and snapshot.timestamp > newer_than and predicate(snapshot):
+                        return snapshot
+                    if cancel_event is not None and cancel_event.is_set():
+                        return None
+                    if self._stopped.is_set():
+                        return None
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return None
+                    # Bounded so a set cancel_event is noticed even if polls stall.
+                    self._condition.wait(min(remaining, max(self.interval_s, self.fast_interval_s)))
+        finally:
+            with self._condition:
+                self._waiters -= 1
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.clear()
+            try:
+                snapshot = self._read_snapshot()
+            except Exception as e:
+                if self.last_error is None or type(e) is not type(self.last_error):
+                    logger.warning(f"PGVA status poll failed: {e}")
+                self.last_error = e
+            else:
+                if self.last_error is not None:
+                    logger.info("PGVA status polling recovered")
+                self.last_error = None
+                self._publish(snapshot)
+
+            with self._condition:
+                interval = self.fast_interval_s if self._waiters else self.interval_s
+            self._wake.wait(interval)
+            # Nobody needs snapshots: no device traffic until a waiter, a subscriber or a read of latest.
+            while not self._stopped.is_set() and self.idle:
+                self._wake.clear()
+                if not self.idle:
+                    break
+                self._wake.wait()
+
+    def _publish(self, snapshot: PGVAStatusSnapshot):
+        with self._condition:
+            self._latest = snapshot
+            self.polls_count += 1
+            subscribers = list(self._subscribers)
+            self._condition.notify_all()
+        for callback in subscribers:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.error(f"PGVA status subscriber failed: {e}", exc_info=True)
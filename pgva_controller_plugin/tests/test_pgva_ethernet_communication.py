@@ -0,0 +1,101 @@
+"""PGVAEthernetCommunication register reads and writes reach the Modbus client."""
+
+import pytest
+
+# Needs the plugin package's register map (pgva_controller_plugin.consts).
+comm_module = pytest.importorskip("pgva_controller_plugin.services.pgva_ethernet_communication")
+
+
+class FakeResult:
+    def __init__(self, error=False, registers=()):
+        self.error = error
+        self.registers = list(registers)
+
+    def isError(self):
+        return self.error
+
+
+class FakeClient:
+    """Records register writes; checks each is made under the client lock."""
+
+    def __init__(self, lock, error=False):
+        self.lock = lock
+        self.error = error
+        self.writes = []
+
+    def write_register(self, address, value):
+        assert self.lock._is_owned()
+        self.writes.append((address, value))
+        return FakeResult(self.error)
+
+
+class FakeInputRegisters:
+    """Input registers valued at their address; reads touching an address in
+    ``unmapped`` are rejected, as a PGVA rejects illegal addresses."""
+
+    def __init__(self, unmapped=()):
+        self.unmapped = set(unmapped)
+        self.reads = []
+
+    def __call__(self, address, count):
+        self.reads.append((address, count))
+        span = range(address, address + count)
+        if self.unmapped.intersection(span):
+            return FakeResult(error=True)
+        return FakeResult(registers=span)
+
+
+def make_communication(error=False):
+    comm = comm_module.PGVAEthernetCommunication(status_poll_interval_s=0)
+    comm.client = FakeClient(comm._client_lock, error=error)
+    return comm
+
+
+def test_setpoint_write_reaches_client():
+    comm = make_communication()
+    assert comm.set_pressure_threshold_mbar(450.4)
+    assert comm.client.writes == [(comm_module.PGVA_PRESSURE_THRESHOLD_MBAR, 450)]
+
+
+def test_pump_command_write_reaches_client():
+    comm = make_communication()
+    assert comm.enable_pump()
+    assert comm.client.writes == [(comm_module.PGVA_DISABLE_PUMP, comm_module.PGVA_CMD_DISABLE)]
+
+
+def test_device_error_is_reported_as_failure():
+    comm = make_communication(error=True)
+    assert not comm.set_pressure_threshold_mbar(450)
+    assert len(comm.client.writes) == 1
+
+
+def test_rejected_block_falls_back_to_single_register_reads():
+    comm = make_communication()
+    gap = comm_module.PGVA_FIRMWARE_VERSION + 1
+    read = FakeInputRegisters(unmapped=[gap])
+    addresses = (comm_module.PGVA_FIRMWARE_VERSION, gap + 1)
+    values = comm._read_block(read, addresses, "input registers")
+    assert values == {address: address for address in addresses}
+    assert read.reads[0] == (comm_module.PGVA_FIRMWARE_VERSION, 3)
+
+
+def test_partial_read_leaves_out_unreadable_registers():
+    comm = make_communication()
+    bad = comm_module.PGVA_FIRMWARE_BUILD
+    read = FakeInputRegisters(unmapped=[bad])
+    addresses = (comm_module.PGVA_FIRMWARE_VERSION, bad)
+    values = comm._read_block(read, addresses, "input registers", partial=True)
+    assert bad not in values
+    assert values[comm_module.PGVA_FIRMWARE_VERSION] == comm_module.PGVA_FIRMWARE_VERSION
+    with pytest.raises(comm_module.ModbusException):
+        comm._read_block(read, addresses, "input registers")
+
+
+def test_device_info_keeps_the_registers_it_could_read():
+    comm = make_communication()
+    comm.client.read_input_registers = FakeInputRegisters(
+        unmapped=[comm_module.PGVA_PUMP_COUNTER])
+    info = comm.get_device_info()
+    assert "pump_runtime_seconds" not in info
+    assert info["firmware_version"] == comm_module.PGVA_FIRMWARE_VERSION
+    assert info["life_runtime_minutes"] == comm_module.PGVA_LIFE_COUNTER
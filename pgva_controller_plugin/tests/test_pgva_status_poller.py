@@ -0,0 +1,142 @@
+"""PGVAStatusPoller snapshots, subscriptions and waits."""
+
+import threading
+import time
+
+from pgva_controller_plugin.services.pgva_status_poller import PGVAStatusPoller, PGVAStatusSnapshot
+
+PRESSURE_REACHED = 1 << 6
+
+
+class FakeDevice:
+    """Counts status reads; the pressure is reached once ``reached_after`` reads have been made."""
+
+    def __init__(self, reached_after=None):
+        self.reads = 0
+        self.reached_after = reached_after
+        self.fail = False
+
+    def read_snapshot(self):
+        if self.fail:
+            raise ConnectionError("no route to device")
+        self.reads += 1
+        reached = self.reached_after is not None and self.reads > self.reached_after
+        return PGVAStatusSnapshot(
+            timestamp=time.monotonic(), pressure_mbar=900.0, vacuum_mbar=-700.0, output_pressure_mbar=120.0,
+            status_word=PRESSURE_REACHED if reached else 0, warning_word=0, error_word=0)
+
+
+def make_poller(device, interval_s=0.5, fast_interval_s=0.01):
+    return PGVAStatusPoller(device.read_snapshot, interval_s=interval_s, fast_interval_s=fast_interval_s)
+
+
+def test_latest_snapshot_and_subscribers():
+    device = FakeDevice()
+    poller = make_poller(device, interval_s=0.01)
+    received = []
+    unsubscribe = poller.subscribe(received.append)
+    poller.start()
+    try:
+        deadline = time.monotonic() + 2
+        while len(received) < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        unsubscribe()
+        count = len(received)
+        time.sleep(0.05)
+        assert count >= 3
+        assert len(received) == count  # unsubscribed
+        assert poller.latest.output_pressure_mbar == 120.0
+        assert poller.latest.age_s < 1
+    finally:
+        poller.stop()
+    assert not poller.running
+
+
+def test_wait_switches_to_fast_rate_and_returns_first_fresh_match():
+    # Slow rate alone would need ~2.5 s for five reads.
+    device = FakeDevice(reached_after=5)
+    poller = make_poller(device, interval_s=0.5, fast_interval_s=0.01)
+    poller.start()
+    try:
+        started = time.monotonic()
+        snapshot = poller.wait_for(lambda s: s.pressure_reached, timeout_s=2)
+        assert snapshot is not None and snapshot.pressure_reached
+        assert snapshot.timestamp > started
+        assert time.monotonic() - started < 0.5
+    finally:
+        poller.stop()
+
+
+def test_wait_ignores_snapshots_read_before_it_started():
+    device = FakeDevice(reached_after=0)  # "reached" from the first read on
+    poller = make_poller(device, interval_s=0.5, fast_interval_s=0.01)
+    poller.start()
+    try:
+        while poller.latest is None:
+            time.sleep(0.005)
+        stale = poller.latest
+        snapshot = poller.wait_for(lambda s: s.pressure_reached, timeout_s=1)
+        assert snapshot is not stale
+        assert snapshot.timestamp > stale.timestamp
+    finally:
+        poller.stop()
+
+
+def test_wait_times_out_and_honours_cancel():
+    poller = make_poller(FakeDevice(reached_after=None), fast_interval_s=0.01)
+    poller.start()
+    try:
+        assert poller.wait_for(lambda s: s.pressure_reached, timeout_s=0.05) is None
+
+        cancel = threading.Event()
+        threading.Timer(0.05, cancel.set).start()
+        started = time.monotonic()
+        assert poller.wait_for(lambda s: s.pressure_reached, timeout_s=5, cancel_event=cancel) is None
+        assert time.monotonic() - started < 1
+    finally:
+        poller.stop()
+
+
+def test_failed_reads_keep_the_last_snapshot():
+    device = FakeDevice()
+    poller = make_poller(device, interval_s=0.01)
+    poller.start()
+    try:
+        while poller.latest is None:
+            time.sleep(0.005)
+        device.fail = True
+        time.sleep(0.05)
+        assert isinstance(poller.last_error, ConnectionError)
+        assert poller.latest is not None
+        device.fail = False
+        time.sleep(0.05)
+        assert poller.last_error is None
+    finally:
+        poller.stop()
+
+
+def test_idle_poller_stops_reading_until_the_snapshot_is_wanted():
+    device = FakeDevice(reached_after=0)
+    poller = PGVAStatusPoller(device.read_snapshot, interval_s=0.01, fast_interval_s=0.01, idle_timeout_s=0.05)
+    poller.start()
+    try:
+        deadline = time.monotonic() + 2
+        while not poller.idle and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.02)
+        reads = device.reads
+        time.sleep(0.1)
+        assert poller.idle and device.reads == reads  # no traffic while nobody reads
+
+        poller.latest  # wakes it
+        deadline = time.monotonic() + 2
+        while device.reads == reads and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert device.reads > reads
+
+        while not poller.idle and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert poller.wait_for(lambda s: s.pressure_reached, timeout_s=1) is not None
+    finally:
+        poller.stop()
+    assert not poller.running
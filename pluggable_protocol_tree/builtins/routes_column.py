@@ -18,6 +18,14 @@ order the legacy protocol_grid did them:
      dropbot's ack. Acts as backpressure so we don't flood the
      hardware queue.
 
+With ``use_phase_sequencer`` on, a plain step (no preview, no phase
+hold, no Route Reps Dur budget, starting at its first phase) skips the
+per-phase round-trip: its whole schedule goes to the electrode
+controller in one ``ELECTRODES_PHASE_SCHEDULE_REQUEST``, which plays it
+with local timing and streams ``ELECTRODES_PHASE_PROGRESS`` back. The
+display publish then follows each progress message, and Stop / Pause
+are forwarded on ``ELECTRODES_PHASE_SCHEDULE_CONTROL``.
+
 The hardware-side consumer (dropbot_controller) does NOT know about
 preview mode — preview gating happens entirely on the sender side, by
 not publishing the hardware message at all. Matches the legacy split
@@ -30,17 +38,25 @@ ALL phases have completed and been ack'd.
 
 import logging
 import time
+import uuid
 
 from pyface.qt.QtCore import Qt
-from traits.api import List, Str
+from traits.api import Bool, List, Str
 
-from electrode_controller.consts import electrode_state_change_publisher
+from electrode_controller.consts import (
+    electrode_phase_schedule_control_publisher,
+    electrode_phase_schedule_publisher,
+    electrode_state_change_publisher,
+)
+from electrode_controller.models import ElectrodePhaseProgress
 from microdrop_utils.dramatiq_pub_sub_helpers import publish_message
 from pluggable_protocol_tree.consts import (
     ELECTRODE_TO_CHANNEL_KEY,
+    ELECTRODES_PHASE_PROGRESS,
     ELECTRODES_STATE_APPLIED,
     PROTOCOL_TREE_DISPLAY_STATE,
 )
+from pluggable_protocol_tree.execution.exceptions import AbortError
 from pluggable_protocol_tree.models.column import (
     BaseColumnHandler, BaseColumnModel, Column,
 )
@@ -181,10 +197,48 @@ class RoutesHandler(BaseColumnHandler):
     DurationColumnHandler at priority 90 doesn't dwell a second time.
     """
     priority = 30
-    wait_for_topics = [ELECTRODES_STATE_APPLIED]
+    wait_for_topics = [ELECTRODES_STATE_APPLIED, ELECTRODES_PHASE_PROGRESS]
     # Provider default for the Protocol Settings ack-wait grid: 5.0s of
     # headroom for cold-broker first-publish (~1-2s); typical ack <100ms.
     default_ack_time_s = 5.0
+    # Hand plain steps' phase schedules to the electrode controller instead
+    # of one publish + ack round-trip per phase (see module docstring).
+    # Off by default: the controller behind ELECTRODES_STATE_CHANGE must
+    # also serve ELECTRODES_PHASE_SCHEDULE_REQUEST. Set from the
+    # use_phase_sequencer protocol preference by the dock pane.
+    use_phase_sequencer = Bool(False)
+
+    @staticmethod
+    def _phase_channels(electrodes, mapping):
+        """Sorted actuation channels for ``electrodes`` (sorted IDs)."""
+        for e in electrodes:
+            if e not in mapping:
+                logger.warning(
+                    f"electrode {e!r} has no channel mapping; "
+                    f"actuation channel skipped"
+                )
+        return sorted(mapping[e] for e in electrodes if e in mapping)
+
+    @staticmethod
+    def _publish_display(ctx, electrodes, static_routes, step_uuid,
+                         step_label):
+        """Display: synchronous, no ack. editable tracks Advanced Mode so
+        the operator can edit the running step in the device viewer (#434);
+        the echo-back of our own actuation is prevented on the DV side
+        (publish_electrode_update ignores apply-time mutations), not by
+        forcing editable False."""
+        display_msg = ProtocolTreeDisplayMessage(
+            electrodes=electrodes,
+            routes=static_routes,
+            step_id=step_uuid,
+            step_label=step_label,
+            free_mode=False,
+            editable=bool(getattr(ctx.protocol, "advanced_mode", False)),
+        )
+        publish_message(
+            topic=PROTOCOL_TREE_DISPLAY_STATE,
+            message=display_msg.serialize(),
+        )
 
     def _run_phase(self, phase, *, ctx, mapping, static_routes, step_uuid,
                    step_label, preview_mode, per_phase_dwell, stop_event,
@@ -249,36 +303,16 @@ class RoutesHandler(BaseColumnHandler):
         phase_start = time.monotonic()
 
         electrodes = sorted(phase)
-        channels = sorted(mapping[e] for e in electrodes if e in mapping)
-        for e in electrodes:
-            if e not in mapping:
-                logger.warning(
-                    f"electrode {e!r} has no channel mapping; "
-                    f"actuation channel skipped"
-                )
+        channels = self._phase_channels(electrodes, mapping)
 
         if signals is not None and emit_phase_started:
             signals.phase_started = (
                 phase_index, phase_total, per_phase_dwell,
             )
 
-        # 1. Display: synchronous, no ack. editable tracks Advanced Mode so
-        # the operator can edit the running step in the device viewer (#434);
-        # the echo-back of our own actuation is prevented on the DV side
-        # (publish_electrode_update ignores apply-time mutations), not by
-        # forcing editable False.
-        display_msg = ProtocolTreeDisplayMessage(
-            electrodes=electrodes,
-            routes=static_routes,
-            step_id=step_uuid,
-            step_label=step_label,
-            free_mode=False,
-            editable=bool(getattr(ctx.protocol, "advanced_mode", False)),
-        )
-        publish_message(
-            topic=PROTOCOL_TREE_DISPLAY_STATE,
-            message=display_msg.serialize(),
-        )
+        # 1. Display.
+        self._publish_display(ctx, electrodes, static_routes, step_uuid,
+                              step_label)
 
         # 2. Hardware: only when not preview. dropbot_controller
         # has no preview-mode awareness — gating happens here, on
@@ -360,6 +394,108 @@ class RoutesHandler(BaseColumnHandler):
                 time.sleep(_SLICE_S)
         return True
 
+    def _play_phases_on_controller(self, phases, *, ctx, mapping,
+                                   static_routes, step_uuid, step_label,
+                                   per_phase_dwell, stop_event, pause_event,
+                                   signals):
+        """Play ``phases`` as one schedule on the electrode controller.
+
+        Each ELECTRODES_PHASE_PROGRESS message for the schedule updates the
+        cursor / status bar and publishes that phase's display state; the
+        schedule's "done" ends the step's phases. Stop and Pause / resume
+        are forwarded as control messages. A seek requested while paused
+        stops the schedule and hands the rest of the step back to the
+        per-phase loop.
+
+        Returns the index the per-phase loop should continue from
+        (``len(phases)`` when nothing is left). Raises TimeoutError when a
+        phase's progress is overdue by more than the ack wait, RuntimeError
+        when the controller reports an error, AbortError on Stop.
+        """
+        cursor = ctx.protocol.cursor
+        total = len(phases)
+        electrode_sets = [sorted(phase) for phase in phases]
+        schedule_id = uuid.uuid4().hex
+        electrode_phase_schedule_publisher.publish(
+            schedule_id,
+            [self._phase_channels(e, mapping) for e in electrode_sets],
+            [per_phase_dwell] * total,
+        )
+
+        def _ours(payload):
+            return ElectrodePhaseProgress.model_validate_json(
+                payload).schedule_id == schedule_id
+
+        def _due():
+            # Next progress message: the current phase's dwell plus the ack
+            # wait (0 = fire-and-forget, never overdue).
+            if self.ack_time_s <= 0:
+                return float("inf")
+            return time.monotonic() + per_phase_dwell + self.ack_time_s
+
+        due = time.monotonic() + self.ack_time_s if self.ack_time_s > 0 \
+            else float("inf")
+        phase_index = 0
+        paused = False
+        while True:
+            if pause_event.is_set() and not paused:
+                electrode_phase_schedule_control_publisher.publish(
+                    schedule_id, "pause")
+                paused = True
+            elif paused and not pause_event.is_set():
+                if cursor.resume_target is not None:
+                    electrode_phase_schedule_control_publisher.publish(
+                        schedule_id, "stop")
+                    return phase_index
+                electrode_phase_schedule_control_publisher.publish(
+                    schedule_id, "resume")
+                paused = False
+                due = _due()
+            try:
+                payload = ctx.wait_for(
+                    ELECTRODES_PHASE_PROGRESS, timeout=_SLICE_S,
+                    predicate=_ours, freeze_timers=False)
+            except TimeoutError:
+                if not paused and time.monotonic() > due:
+                    electrode_phase_schedule_control_publisher.publish(
+                        schedule_id, "stop")
+                    raise TimeoutError(
+                        f"No progress from the electrode controller for "
+                        f"phase {phase_index + 1}/{total} of {step_label} "
+                        f"within {self.ack_time_s}s of its dwell. The "
+                        f"controller may be disconnected, or may not serve "
+                        f"phase schedules.") from None
+                continue
+            except AbortError:
+                electrode_phase_schedule_control_publisher.publish(
+                    schedule_id, "stop")
+                raise
+
+            progress = ElectrodePhaseProgress.model_validate_json(payload)
+            if progress.state == "phase":
+                phase_index = progress.phase_index
+                cursor.phase_index = phase_index
+                if signals is not None:
+                    signals.phase_started = (
+                        phase_index + 1, total, per_phase_dwell,
+                    )
+                self._publish_display(ctx, electrode_sets[phase_index],
+                                      static_routes, step_uuid, step_label)
+                due = _due()
+            elif progress.state == "done":
+                return total
+            elif progress.state == "stopped":
+                if not stop_event.is_set():
+                    logger.warning(
+                        f"Phase schedule for {step_label} was stopped by the "
+                        f"electrode controller at phase {phase_index + 1}/"
+                        f"{total}")
+                return total
+            else:
+                raise RuntimeError(
+                    f"Electrode controller failed to play {step_label}: "
+                    f"{progress.detail}")
+
     def _run_dynamic_duration_loop(self, row, *, ctx, mapping, static_routes,
                                    step_uuid, step_label, preview_mode,
                                    per_phase_dwell, stop_event, pause_event,
@@ -689,6 +825,18 @@ class RoutesHandler(BaseColumnHandler):
                 (lambda: not overrun_prompted
                  and (_monotonic() - step_start) >= budget)
                 if (in_duration_mode and budget > 0) else None)
+            # Plain step: let the electrode controller play the phases with
+            # local timing (see module docstring). Whatever it hands back
+            # (a seek while paused) continues in the per-phase loop below.
+            if (self.use_phase_sequencer and phases and not preview_mode
+                    and not phase_hold and not in_duration_mode
+                    and phase_i == 0 and cursor.resume_target is None
+                    and not stop_event.is_set()):
+                phase_i = self._play_phases_on_controller(
+                    phases, ctx=ctx, mapping=mapping, static_routes=routes,
+                    step_uuid=step_uuid, step_label=step_label,
+                    per_phase_dwell=per_phase_dwell, stop_event=stop_event,
+                    pause_event=pause_event, signals=signals)
             while phase_i < total_phases:
                 if stop_event.is_set():
                     break
@@ -13,7 +13,7 @@ from dropbot_controller.consts import CAPACITANCE_UPDATED, REALTIME_MODE_UPDATED
 
 from microdrop_application.consts import ADVANCED_MODE_CHANGE
 
-from electrode_controller.consts import ELECTRODES_STATE_CHANGE, ELECTRODES_STATE_APPLIED
+from electrode_controller.consts import ELECTRODES_STATE_CHANGE, ELECTRODES_STATE_APPLIED, ELECTRODES_PHASE_PROGRESS
 
 from pluggable_protocol_tree.models.cell_sync import (
     ProtocolTreeRowSelectedPublisher, ProtocolTreeSetCellPublisher,
@@ -17,6 +17,7 @@ from typing import Optional
 
 import dramatiq
 
+from microdrop_utils import startup_profiler
 from pluggable_protocol_tree.consts import EXECUTOR_LISTENER_NAME
 from pluggable_protocol_tree.execution.step_context import StepContext
 
@@ -64,10 +65,11 @@ def warm_broker_connection() -> None:
     fails. The first real publish will pay the cost in those cases.
     """
     try:
-        broker = dramatiq.get_broker()
-        client = getattr(broker, "client", None)
-        if client is not None and hasattr(client, "ping"):
-            client.ping()
+        with startup_profiler.span("warm broker connection", "broker"):
+            broker = dramatiq.get_broker()
+            client = getattr(broker, "client", None)
+            if client is not None and hasattr(client, "ping"):
+                client.ping()
     except Exception:
         pass
 
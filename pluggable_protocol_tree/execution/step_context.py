@@ -465,7 +465,8 @@ class StepContext(HasTraits):
             box.deposit(payload)
 
     def wait_for(self, topic: str, timeout: float = 5.0,
-                 predicate: Optional[Callable] = None):
+                 predicate: Optional[Callable] = None,
+                 freeze_timers: bool = True):
         """Block until a message on ``topic`` satisfying ``predicate``
         arrives, or the timeout/stop fires.
 
@@ -474,6 +475,11 @@ class StepContext(HasTraits):
         and the protocol's stop_event becomes the only cancellation
         path.
 
+        ``freeze_timers=False`` keeps the status timers running: for
+        short polls made while the awaited work is itself part of the
+        step's timing (e.g. progress of a phase schedule the electrode
+        controller is playing).
+
         Returns the payload. Raises:
           * ``KeyError`` if ``topic`` was not declared in any handler's
             ``wait_for_topics`` (the executor would not have opened a
@@ -493,7 +499,7 @@ class StepContext(HasTraits):
         # runs on the executor's worker thread; setting the Traits event drives
         # the status controller synchronously. Skipped headless (signals None).
         # try/finally keeps the freeze balanced across TimeoutError / AbortError.
-        signals = self.protocol.signals
+        signals = self.protocol.signals if freeze_timers else None
         if signals is not None:
             signals.ack_wait_started = True
         try:
@@ -91,6 +91,7 @@ class LoggingIngestion(HasTraits):
         self.log_data({
             "step_idx": self._step_idx,
             "utc_time": int(data.get("reception_time", 0) or 0),
+            "reception_time_s": float(data.get("reception_time", 0) or 0),
             "instrument_time_us": int(data.get("instrument_time_us", 0) or 0),
             "step_id": self._step_id,
             "Capacitance (pF)": cap,
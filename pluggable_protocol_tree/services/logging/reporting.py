@@ -10,6 +10,7 @@ from typing import Dict, List, Optional
 import pandas as pd
 
 from logger.logger_service import get_logger
+from microdrop_utils.frame_timestamps import load_frame_timestamps
 
 from pluggable_protocol_tree.services.logging.consts import RUN_TIMESTAMP_FMT
 from pluggable_protocol_tree.services.logging.persistence import LoggingPersistence
@@ -29,8 +30,8 @@ except Exception:                              # pragma: no cover
 
 logger = get_logger(__name__)
 
-_NUMERIC_EXCLUDE = {"step_idx", "utc_time", "instrument_time_us",
-                    "step_id", "actuated_channels"}
+_NUMERIC_EXCLUDE = {"step_idx", "utc_time", "reception_time_s",
+                    "instrument_time_us", "step_id", "actuated_channels"}
 
 # Metadata keys whose values are filesystem paths and should render as
 # clickable file:// anchors instead of raw strings. Legacy parity with
@@ -49,7 +50,7 @@ class LoggingReport:
             LoggingReport._data_files_section(data_files or []),
             LoggingReport._summary_section(entries, columns),
             LoggingReport._trends_section(entries, columns, device_context),
-            LoggingReport._media_section(media),
+            LoggingReport._media_section(media, entries),
         ]
         if notes:
             sections.append(LoggingReport._notes_section(notes))
@@ -251,10 +252,12 @@ class LoggingReport:
                 for ch, n in counts.to_dict().items()}
 
     @staticmethod
-    def _media_section(media: Dict[str, List[str]]) -> str:
+    def _media_section(media: Dict[str, List[str]],
+                       entries: Optional[List[dict]] = None) -> str:
         """Render legacy-parity Media Captures with thumbnails and
         click-to-play video placeholders. Mirrors
-        protocol_data_logger._get_files_summary."""
+        protocol_data_logger._get_files_summary. Videos with a frame
+        timestamp sidecar also list the frame each logged step starts on."""
         videos = media.get("video", []) or []
         images = media.get("image", []) or []
         others = media.get("other", []) or []
@@ -263,7 +266,8 @@ class LoggingReport:
         out = ["<h2>Media Captures</h2>"]
         if videos:
             out.append("<h3>Video Captures</h3>")
-            out.append(LoggingReport._media_items(videos, kind="video"))
+            out.append(LoggingReport._media_items(videos, kind="video",
+                                                  entries=entries))
         if images:
             out.append("<h3>Image Captures</h3>")
             out.append(LoggingReport._media_items(images, kind="image"))
@@ -273,7 +277,8 @@ class LoggingReport:
         return "".join(out)
 
     @staticmethod
-    def _media_items(paths: List[str], *, kind: str) -> str:
+    def _media_items(paths: List[str], *, kind: str,
+                     entries: Optional[List[dict]] = None) -> str:
         """Numbered list of <a>basename</a> + (image thumbnail | video
         play-button placeholder | nothing) per item. ``kind`` is one of
         "image" / "video" / "other"."""
@@ -312,9 +317,46 @@ class LoggingReport:
                     "<div style=\"font-size:50px;color:white;\">&#9658;</div>"
                     "</div>"
                 )
+                extra += LoggingReport._video_step_frames(p, entries)
             parts.append(f"<b>{idx}.</b> {link_html}{extra}<br><br>")
         return "".join(parts)
 
+    @staticmethod
+    def _video_step_frames(video_path, entries: Optional[List[dict]]) -> str:
+        """Capture timing of a video from its frame timestamp sidecar, and
+        the exact frame each logged step starts on (first sample's
+        reception time looked up in the per-frame capture times). Uses the
+        sub-second ``reception_time_s`` column; ``utc_time`` (whole
+        seconds) only for logs written before it existed. Empty when the
+        video has no sidecar."""
+        timestamps = load_frame_timestamps(video_path)
+        if timestamps is None or not timestamps.frame_count:
+            return ""
+        start = datetime.fromtimestamp(timestamps.start_utc_s)
+        out = [f"<br>{timestamps.frame_count} frames captured from "
+               f"{start:%Y-%m-%d %H:%M:%S} over {timestamps.duration_s:.1f} s "
+               f"({timestamps.measured_fps:.1f} fps measured)"]
+        if entries:
+            df = pd.DataFrame(entries)
+            time_column = ("reception_time_s" if "reception_time_s" in df.columns
+                           else "utc_time")
+            if {"step_idx", time_column} <= set(df.columns):
+                step_starts = (df[df[time_column] > 0]
+                               .groupby("step_idx")[time_column].min())
+                rows = []
+                for step_idx, utc_s in step_starts.items():
+                    frame = timestamps.frame_index_at_utc(float(utc_s))
+                    if frame is None:
+                        continue
+                    rows.append(
+                        f"<tr><td>Step {int(step_idx)}</td><td>{frame}</td>"
+                        f"<td>{timestamps.capture_time_s(frame):.3f}</td></tr>")
+                if rows:
+                    out.append("<table><tr><th>Step</th><th>Frame</th>"
+                               "<th>Capture time (s)</th></tr>"
+                               f"{''.join(rows)}</table>")
+        return "".join(out)
+
     @staticmethod
     def _notes_section(notes: List[str]) -> str:
         items = "".join(f"<li>{_html.escape(str(n))}</li>" for n in notes)
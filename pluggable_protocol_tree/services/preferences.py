@@ -83,6 +83,14 @@ class ProtocolPreferences(PreferencesHelper):
 
     capture_time = Enum(StepTime.START, StepTime.END, value=StepTime.START)
 
+    # Hand plain steps' phase schedules to the electrode controller, which
+    # plays them with local timing, instead of one publish + ack round-trip
+    # per phase (RoutesHandler.use_phase_sequencer). Needs the DropBot
+    # electrode controller: it is the only ELECTRODES_PHASE_SCHEDULE_REQUEST
+    # consumer (the mock DropBot and OpenDrop controllers are not), so it
+    # stays off by default.
+    use_phase_sequencer = Bool(False, desc="Play step phases on the electrode controller (DropBot only)")
+
     PROTOCOL_REPO_DIR = Directory()
 
     # Programmatic preference (no Settings-dialog item, like
@@ -250,6 +258,14 @@ class ProtocolPreferencesPane(PreferencesPane):
         group_style_sheet=preferences_group_style_sheet,
     )
 
+    electrode_actuation_grid = create_grid_group(
+        items=["use_phase_sequencer"],
+        label_text=["Play Step Phases on Controller? (DropBot only)"],
+        group_label="Electrode Actuation",
+        group_show_border=True,
+        group_style_sheet=preferences_group_style_sheet,
+    )
+
     realtime_mode_settings_grid = create_grid_group(
         items=["prompt_to_restore_realtime_mode", "keep_realtime_mode_after_protocol"],
         label_text=["Prompt to keep Realtime Mode?", "Keep Realtime Mode active?"],
@@ -282,6 +298,8 @@ class ProtocolPreferencesPane(PreferencesPane):
         Item("_"),
         camera_settings_grid,
         Item("_"),
+        electrode_actuation_grid,
+        Item("_"),
         ack_times_grid,
         Item("_"),  # Separator to space this out from further contributions to the pane.
         resizable=True
@@ -1031,3 +1031,101 @@ def test_dynamic_vt_loop_budget_smaller_than_one_cycle_runs_return_only(qapp):
     # No full cycle fit; only the single return-to-start phase ran.
     assert len(displays) == 1
     assert ctx.step_phases_done_event.is_set() is True
+
+
+# --- RoutesHandler with the electrode controller's phase sequencer ---
+
+def _sequencer_row(duration_s=0.0):
+    col = make_routes_column()
+    RowType = build_row_type([col], base=BaseRow)
+    row = RowType()
+    row.electrodes = ["e0"]
+    row.routes = [["e1", "e2"]]
+    row.trail_length = 1
+    row.trail_overlay = 0
+    row.soft_start = False
+    row.soft_end = False
+    row.repeat_duration = 0.0
+    row.linear_repeats = False
+    row.duration_s = duration_s
+    row.repetitions = 1
+    return col, row
+
+
+def _sequencer_ctx(progress):
+    """StepContext stand-in whose ELECTRODES_PHASE_PROGRESS mailbox replays
+    ``progress`` (filled in once the schedule is published)."""
+    from pluggable_protocol_tree.consts import ELECTRODES_PHASE_PROGRESS
+
+    ctx = MagicMock()
+    ctx.protocol.cursor = ExecutionCursor()
+    ctx.protocol.stop_event.is_set.return_value = False
+    ctx.protocol.pause_event.is_set.return_value = False
+    ctx.protocol.preview_mode = False
+    ctx.scratch = {}
+    ctx.protocol.scratch = {"electrode_to_channel": {"e0": 0, "e1": 1, "e2": 2}}
+
+    def wait_for(topic, timeout=5.0, predicate=None, freeze_timers=True):
+        assert topic == ELECTRODES_PHASE_PROGRESS and not freeze_timers
+        while progress:
+            payload = progress.pop(0)
+            if predicate is None or predicate(payload):
+                return payload
+        raise TimeoutError
+    ctx.wait_for.side_effect = wait_for
+    return ctx
+
+
+def test_routes_handler_hands_plain_step_to_phase_sequencer():
+    """One schedule request for the whole step instead of a hardware publish
+    + ack per phase; the display follows the controller's progress."""
+    import pluggable_protocol_tree.builtins.routes_column as mod
+    from electrode_controller.models import ElectrodePhaseProgress
+    from pluggable_protocol_tree.consts import PROTOCOL_TREE_DISPLAY_STATE
+    from pluggable_protocol_tree.models.display_state import (
+        ProtocolTreeDisplayMessage,
+    )
+
+    col, row = _sequencer_row(duration_s=0.25)
+    col.handler.use_phase_sequencer = True
+    progress = []
+    ctx = _sequencer_ctx(progress)
+
+    def fake_schedule_publish(schedule_id, phases, durations_s):
+        schedules.append((phases, durations_s))
+        # A leftover message from an earlier schedule must be ignored.
+        progress.append(ElectrodePhaseProgress(schedule_id="stale", state="done").model_dump_json())
+        progress.extend(
+            ElectrodePhaseProgress(schedule_id=schedule_id, state="phase", phase_index=i,
+                                   phase_total=len(phases)).model_dump_json()
+            for i in range(len(phases)))
+        progress.append(ElectrodePhaseProgress(schedule_id=schedule_id, state="done").model_dump_json())
+
+    schedules, published = [], []
+    with patch.object(mod.electrode_phase_schedule_publisher, "publish", side_effect=fake_schedule_publish), \
+            patch.object(mod, "publish_message", side_effect=lambda **kw: published.append(kw)):
+        col.handler.on_step(row, ctx)
+
+    assert schedules == [([[0, 1], [0, 2]], [0.25, 0.25])]
+    assert [p["topic"] for p in published] == [PROTOCOL_TREE_DISPLAY_STATE] * 2
+    assert [ProtocolTreeDisplayMessage.deserialize(p["message"]).electrodes for p in published] == [
+        ["e0", "e1"], ["e0", "e2"]]
+    assert ctx.protocol.cursor.phase_index == 1
+    assert ctx.scratch[mod.DURATION_CONSUMED_KEY] is True
+
+
+def test_routes_handler_stops_schedule_when_progress_is_overdue():
+    import pytest
+    import pluggable_protocol_tree.builtins.routes_column as mod
+
+    col, row = _sequencer_row()
+    col.handler.use_phase_sequencer = True
+    col.handler.ack_time_s = 0.1
+    ctx = _sequencer_ctx([])
+
+    with patch.object(mod.electrode_phase_schedule_publisher, "publish"), \
+            patch.object(mod.electrode_phase_schedule_control_publisher, "publish") as control, \
+            pytest.raises(TimeoutError, match="phase schedules"):
+        col.handler.on_step(row, ctx)
+
+    assert control.call_args.args[1] == "stop"
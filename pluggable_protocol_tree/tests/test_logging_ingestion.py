@@ -79,6 +79,14 @@ def test_log_capacitance_stamps_step_and_phase_and_force():
     assert e["utc_time"] == 1700000000
 
 
+def test_log_capacitance_keeps_sub_second_reception_time():
+    ing = LoggingIngestion()
+    ing.set_step(step_id="s", step_idx=1)
+    ing.log_capacitance(_msg(recv=1700000000.75))
+    assert ing.entries[-1]["utc_time"] == 1700000000
+    assert ing.entries[-1]["reception_time_s"] == 1700000000.75
+
+
 def test_log_capacitance_per_phase_attribution():
     ing = LoggingIngestion()
     ing.set_step(step_id="s", step_idx=1)
@@ -267,6 +267,58 @@ def test_media_section_renders_thumbnails_and_play_placeholders(tmp_path):
     assert "swap" not in html.lower() or "onclick" in html        # placeholder exists
 
 
+def test_video_with_frame_timestamps_lists_step_start_frames(tmp_path):
+    """A video's frame timestamp sidecar maps each step's first logged
+    sample to the exact frame on screen at that time."""
+    import numpy as np
+    from microdrop_utils.frame_timestamps import FrameTimestamps, frame_timestamps_path
+
+    vid = tmp_path / "vid_001.mkv"
+    vid.write_bytes(b"")
+    start_s = 1_700_000_000
+    # 10 fps for 1 s, then a 1 s stall, then 10 fps again.
+    offsets_ms = [i * 100 for i in range(10)] + [2000 + i * 100 for i in range(11)]
+    FrameTimestamps(start_utc_us=start_s * 1_000_000,
+                    offsets_us=np.array(offsets_ms, dtype=np.int64) * 1000,
+                    ).write(frame_timestamps_path(vid))
+    entries = [{"step_idx": 1, "utc_time": start_s, "Capacitance (pF)": 1.0},
+               {"step_idx": 2, "utc_time": start_s + 2, "Capacitance (pF)": 2.0},
+               {"step_idx": 3, "utc_time": start_s + 60, "Capacitance (pF)": 3.0}]
+    html = LoggingReport.build_html(
+        entries=entries, columns=["step_idx", "utc_time", "Capacitance (pF)"],
+        metadata={}, media={"video": [str(vid)], "image": [], "other": []},
+        device_context=LoggingDeviceContext(experiment_directory=Path(".")),
+        notes=None)
+    assert "21 frames captured" in html
+    assert "<tr><td>Step 1</td><td>0</td><td>0.000</td></tr>" in html
+    # Frame 10 (captured at 2.0 s), not the constant-rate estimate (frame 20).
+    assert "<tr><td>Step 2</td><td>10</td><td>2.000</td></tr>" in html
+    assert "Step 3" not in html.split("Video Captures")[1]  # after the recording
+
+
+def test_video_step_frames_use_sub_second_reception_time(tmp_path):
+    """Step starts are looked up with the float reception time, not the
+    whole-second utc_time column."""
+    import numpy as np
+    from microdrop_utils.frame_timestamps import FrameTimestamps, frame_timestamps_path
+
+    vid = tmp_path / "vid_001.mkv"
+    vid.write_bytes(b"")
+    start_s = 1_700_000_000
+    FrameTimestamps(start_utc_us=start_s * 1_000_000,
+                    offsets_us=np.arange(40, dtype=np.int64) * 100_000,
+                    ).write(frame_timestamps_path(vid))
+    entries = [{"step_idx": 1, "utc_time": start_s, "reception_time_s": start_s + 0.25},
+               {"step_idx": 2, "utc_time": start_s + 2, "reception_time_s": start_s + 2.45}]
+    html = LoggingReport.build_html(
+        entries=entries, columns=["step_idx", "utc_time", "reception_time_s"],
+        metadata={}, media={"video": [str(vid)], "image": [], "other": []},
+        device_context=LoggingDeviceContext(experiment_directory=Path(".")),
+        notes=None)
+    assert "<tr><td>Step 1</td><td>2</td><td>0.200</td></tr>" in html
+    assert "<tr><td>Step 2</td><td>24</td><td>2.400</td></tr>" in html
+
+
 def test_media_section_omitted_when_no_captures():
     html = LoggingReport.build_html(
         entries=[], columns=[], metadata={},
@@ -0,0 +1,46 @@
+"""The use_phase_sequencer protocol preference reaches RoutesHandler.
+
+The dock pane is the only bridge from the preference to the running
+columns (like the ack-wait grid); exercised here with a stand-in pane so
+no Tasks window is needed.
+"""
+
+from types import SimpleNamespace
+
+from apptools.preferences.api import Preferences
+
+from pluggable_protocol_tree.builtins.name_column import make_name_column
+from pluggable_protocol_tree.builtins.routes_column import make_routes_column
+from pluggable_protocol_tree.services.preferences import ProtocolPreferences
+from pluggable_protocol_tree.views.dock_pane import PluggableProtocolDockPane
+
+
+def _sync(pane):
+    PluggableProtocolDockPane._sync_handler_phase_sequencer(pane)
+
+
+def test_phase_sequencer_is_off_by_default():
+    prefs = ProtocolPreferences(preferences=Preferences())
+    assert prefs.use_phase_sequencer is False
+    assert make_routes_column().handler.use_phase_sequencer is False
+
+
+def test_preference_is_pushed_into_routes_handler_only():
+    prefs = ProtocolPreferences(preferences=Preferences())
+    routes, name = make_routes_column(), make_name_column()
+    pane = SimpleNamespace(preferences=prefs, columns=[name, routes])
+
+    prefs.use_phase_sequencer = True
+    _sync(pane)
+    assert routes.handler.use_phase_sequencer is True
+    assert name.handler.trait("use_phase_sequencer") is None
+
+    prefs.use_phase_sequencer = False
+    _sync(pane)
+    assert routes.handler.use_phase_sequencer is False
+
+
+def test_preference_persists_on_the_node():
+    node = Preferences()
+    ProtocolPreferences(preferences=node).use_phase_sequencer = True
+    assert ProtocolPreferences(preferences=node).use_phase_sequencer is True
@@ -162,6 +162,7 @@ class PluggableProtocolDockPane(TraitsDockPane):
         # below only sees edits made from here on — push the persisted
         # grid values in once so a user-tuned wait survives a relaunch.
         self._sync_handler_ack_times()
+        self._sync_handler_phase_sequencer()
 
     def create_contents(self, parent):
         self._pane = pane = ProtocolTreePane(
@@ -380,6 +381,7 @@ class PluggableProtocolDockPane(TraitsDockPane):
         # grid entries and push any persisted ack waits into them.
         self.preferences.seed_ack_times_from_columns(self.columns)
         self._sync_handler_ack_times()
+        self._sync_handler_phase_sequencer()
         logger.debug(
             f"protocol columns rebuilt: +{sorted(added)} -{sorted(removed)}"
         )
@@ -1150,6 +1152,22 @@ class PluggableProtocolDockPane(TraitsDockPane):
                             f"{col.handler.ack_time_s}s --> {ack_time_s}s")
                 col.handler.ack_time_s = ack_time_s
 
+    @observe("preferences.use_phase_sequencer", post_init=True)
+    def _sync_handler_phase_sequencer(self, event=None):
+        """Push the Protocol Settings phase-sequencer switch into every
+        column handler that can hand its phases to the electrode
+        controller (RoutesHandler). post_init for the same reason as
+        _sync_handler_ack_times; traits_init covers the initial sync."""
+        enabled = self.preferences.use_phase_sequencer
+        for col in self.columns:
+            handler = col.handler
+            if handler.trait("use_phase_sequencer") is None:
+                continue
+            if handler.use_phase_sequencer != enabled:
+                logger.info(f"Protocol Tree: phase sequencer "
+                            f"{'enabled' if enabled else 'disabled'} for {col.id} column")
+                handler.use_phase_sequencer = enabled
+
     @observe("manager.rows_changed")
     def _on_manager_rows_changed(self, event):
         """Structural mutation — re-check the baseline path set."""
@@ -16,17 +16,40 @@ entry-point's package — discovery looks for it in three places, in order:
 We read the TOML into the same PluginManifest the rest of PluginGroupManager
 consumes, and record the entry point's distribution name so callers can tell a
 bundled plugin (shipped by the app's own distribution) from an installed one.
+
+Scanning every distribution's metadata (and importing each entry point's
+module for step 1) is a noticeable share of startup in a large environment, so
+the result is cached in the app-data dir, keyed by environment_fingerprint() —
+a stat of every ``*.dist-info`` / ``*.egg-info`` entry on sys.path. Installing,
+removing or rebuilding any distribution changes the fingerprint;
+package_installer also drops the cache after every pixi change. Manifests read
+from plain files (package data, e.g. an editable install) are re-validated by
+their own stat, so editing one is picked up without a reinstall.
 """
+import hashlib
 import importlib.metadata as importlib_metadata
 import importlib.resources as importlib_resources
+import json
+import os
+import sys
+import tempfile
+import time
 import tomllib
+from pathlib import Path
 
+from plugin_management import paths
 from plugin_management.consts import ENTRY_POINT_GROUP, MANIFEST_RESOURCE
 from plugin_management.manifest import manifest_from_dict, ManifestError
 from logger.logger_service import get_logger
 
 logger = get_logger(__name__)
 
+#: Bump whenever the cache layout or the discovery rules change, so caches
+#: written by older code are rescanned instead of reused.
+MANIFEST_CACHE_VERSION = 1
+
+_METADATA_DIR_SUFFIXES = (".dist-info", ".egg-info")
+
 
 def _dist_name(ep) -> str:
     dist = getattr(ep, "dist", None)
@@ -34,8 +57,20 @@ def _dist_name(ep) -> str:
     return (name or "").strip()
 
 
-def _read_manifest_text(ep):
-    """Return the ``microdrop_plugin.toml`` text for an entry point, or None.
+def _file_path(location):
+    """Filesystem path of a resource/dist file, or None when it has none
+    (e.g. inside a zip)."""
+    try:
+        path = Path(os.fspath(location))
+    except TypeError:
+        return None
+    return str(path) if path.is_file() else None
+
+
+def _find_manifest(ep):
+    """``(text, source)`` for an entry point's ``microdrop_plugin.toml``, or
+    ``(None, None)``. ``source`` is the manifest's file path when it is a plain
+    file outside the dist-info (steps 1 and 3), else None.
 
     Tries package data (the entry-point module), then the distribution's
     dist-info, then any same-named file the distribution installed."""
@@ -45,19 +80,19 @@ def _read_manifest_text(ep):
     try:
         resource = importlib_resources.files(ep.module) / MANIFEST_RESOURCE
         if resource.is_file():
-            return resource.read_text(encoding="utf-8")
+            return resource.read_text(encoding="utf-8"), _file_path(resource)
     except (ImportError, OSError, TypeError):
         pass
 
     dist = getattr(ep, "dist", None)
     if dist is None:
-        return None
+        return None, None
 
     # 2. dist-info metadata file
     try:
         text = dist.read_text(MANIFEST_RESOURCE)
         if text is not None:
-            return text
+            return text, None
     except (OSError, AttributeError):
         pass
 
@@ -65,21 +100,61 @@ def _read_manifest_text(ep):
     try:
         for path in dist.files or ():
             if path.name == MANIFEST_RESOURCE:
-                return path.read_text(encoding="utf-8")
+                locate = getattr(path, "locate", None)
+                return (path.read_text(encoding="utf-8"),
+                        _file_path(locate()) if locate is not None else None)
     except (OSError, AttributeError):
         pass
 
-    return None
+    return None, None
 
 
-def discover_entry_point_manifests():
-    """``[(PluginManifest, dist_name)]`` for every installed package advertising a
-    ``microdrop.plugins`` entry point and shipping a ``microdrop_plugin.toml``.
-    Best-effort: a bad package is logged and skipped, never raised."""
-    found = []
+def _read_manifest_text(ep):
+    """Return the ``microdrop_plugin.toml`` text for an entry point, or None."""
+    return _find_manifest(ep)[0]
+
+
+def environment_fingerprint(path_entries=None) -> str:
+    """SHA-256 over the interpreter prefix and the stat (mtime, size) of every
+    distribution metadata entry — and its ``entry_points.txt`` — on
+    ``path_entries`` (default sys.path). Installing, removing or rebuilding a
+    distribution changes it; nothing is read or imported, so it costs one
+    directory listing per path entry and a couple of stats per distribution."""
+    digest = hashlib.sha256(
+        f"v{MANIFEST_CACHE_VERSION}:{sys.prefix}".encode())
+    for entry in (sys.path if path_entries is None else path_entries):
+        digest.update(f"\0{entry}".encode())
+        try:
+            with os.scandir(entry or ".") as it:
+                metadata = sorted((e for e in it if e.name.endswith(_METADATA_DIR_SUFFIXES)),
+                                  key=lambda e: e.name)
+        except OSError:
+            continue  # missing dir, zip archive, ...
+        for e in metadata:
+            for path in (e.path, os.path.join(e.path, "entry_points.txt")):
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    digest.update(b"\0-")
+                    continue
+                digest.update(f"\0{e.name}:{st.st_mtime_ns}:{st.st_size}".encode())
+    return digest.hexdigest()
+
+
+def _source_stat(source):
+    try:
+        st = os.stat(source)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _scan():
+    """``(found, records)``: the discovered manifests and their cache records."""
+    found, records = [], []
     for ep in importlib_metadata.entry_points(group=ENTRY_POINT_GROUP):
         try:
-            text = _read_manifest_text(ep)
+            text, source = _find_manifest(ep)
             if text is None:
                 raise ManifestError(
                     f"no {MANIFEST_RESOURCE} found for entry-point plugin '{ep.name}'")
@@ -88,5 +163,89 @@ def discover_entry_point_manifests():
                 tomllib.TOMLDecodeError) as e:
             logger.exception(f"skipping entry-point plugin '{ep.name}': {e}")
             continue
-        found.append((manifest, _dist_name(ep)))
+        dist_name = _dist_name(ep)
+        found.append((manifest, dist_name))
+        records.append({
+            "text": text,
+            "dist_name": dist_name,
+            "source": source,
+            "source_stat": _source_stat(source) if source else None,
+        })
+    return found, records
+
+
+def _load_cache(fingerprint):
+    """The cached ``[(PluginManifest, dist_name)]`` for ``fingerprint``, or
+    None on a miss. A cache that is unreadable, for another environment, or
+    whose manifest files changed since is a miss."""
+    try:
+        data = json.loads(paths.manifest_cache_file().read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"could not read the plugin manifest cache: {e}")
+        return None
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return None
+    try:
+        found = []
+        for record in data["manifests"]:
+            source = record.get("source")
+            if source and _source_stat(source) != record.get("source_stat"):
+                logger.debug(f"plugin manifest {source} changed; rescanning")
+                return None
+            found.append((manifest_from_dict(tomllib.loads(record["text"])),
+                          record.get("dist_name", "")))
+    except (KeyError, TypeError, ValueError, tomllib.TOMLDecodeError) as e:
+        logger.warning(f"discarding invalid plugin manifest cache: {e}")
+        return None
+    return found
+
+
+def _save_cache(fingerprint, records):
+    """Write the cache via a temp file + replace, so a concurrently starting
+    process never reads a partial file. Failure is logged, never raised."""
+    try:
+        path = paths.manifest_cache_file()
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint, "manifests": records}, f)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except Exception as e:
+        logger.warning(f"could not write the plugin manifest cache: {e}")
+
+
+def invalidate_manifest_cache():
+    """Drop the cached discovery so the next one rescans. Called after any
+    package install/removal; never raises."""
+    try:
+        paths.manifest_cache_file().unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"could not remove the plugin manifest cache: {e}")
+
+
+def discover_entry_point_manifests(use_cache=True):
+    """``[(PluginManifest, dist_name)]`` for every installed package advertising a
+    ``microdrop.plugins`` entry point and shipping a ``microdrop_plugin.toml``.
+    Best-effort: a bad package is logged and skipped, never raised.
+
+    With ``use_cache`` an unchanged environment is answered from the on-disk
+    cache without scanning; a scan refreshes the cache."""
+    fingerprint = environment_fingerprint() if use_cache else None
+    if use_cache:
+        cached = _load_cache(fingerprint)
+        if cached is not None:
+            logger.debug(f"plugin manifests: {len(cached)} from cache")
+            return cached
+
+    started = time.perf_counter()
+    found, records = _scan()
+    logger.info(f"plugin manifests: scanned entry points, {len(found)} found "
+                f"in {(time.perf_counter() - started) * 1000:.0f} ms")
+    if use_cache:
+        _save_cache(fingerprint, records)
     return found
@@ -2,7 +2,8 @@
 
 Uses `pixi add <name>` (channel registered on demand) so the conda solver
 resolves the package + its run-dependencies. Qt-free; snapshots pyproject.toml
-+ pixi.lock for rollback.
++ pixi.lock for rollback. Every env-mutating command, successful or not, drops
+the cached entry-point manifest discovery.
 """
 import importlib.metadata
 import json
@@ -11,6 +12,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from plugin_management import paths
+from plugin_management.entry_point_discovery import invalidate_manifest_cache
 from plugin_management.consts import ENTRY_POINT_GROUP, PLUGIN_CHANNEL_URL
 from logger.logger_service import get_logger
 
@@ -127,6 +129,8 @@ def install_from_channel(name, channel_url=PLUGIN_CHANNEL_URL, *, cwd=None,
     except Exception:
         _restore(cwd, snapshot)
         raise
+    finally:
+        invalidate_manifest_cache()
     diff = _diff_or_none(before, _try_snapshot(cwd))
     logger.info(f"installed plugin '{spec}' from {channel_url}")
     return EnvChangeResult(
@@ -175,6 +179,8 @@ def reinstall_from_channel(name, channel_url=PLUGIN_CHANNEL_URL, *, cwd=None,
                 f"could not re-materialize the env after a failed reinstall "
                 f"of '{name}': {e}")
         raise
+    finally:
+        invalidate_manifest_cache()
     diff = _diff_or_none(before, _try_snapshot(cwd))
     logger.info(f"reinstalled plugin '{spec}' from {channel_url}")
     return EnvChangeResult(
@@ -326,8 +332,11 @@ def uninstall_package(name, *, cwd=None) -> EnvChangeResult:
     and the controllers' on_error path surfaces it in an error dialog."""
     cwd = Path(cwd or WORKSPACE_DIR)
     before = _try_snapshot(cwd)
-    _run(["remove", name], cwd=cwd)
-    _run(["install"], cwd=cwd)
+    try:
+        _run(["remove", name], cwd=cwd)
+        _run(["install"], cwd=cwd)
+    finally:
+        invalidate_manifest_cache()
     diff = _diff_or_none(before, _try_snapshot(cwd))
     return EnvChangeResult(
         name=name, diff=diff,
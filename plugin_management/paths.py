@@ -1,7 +1,7 @@
 """Filesystem locations for plugin management.
 
-Provides helpers for the app-data cache that stores the last-fetched channel
-package index."""
+Provides helpers for the app-data caches that store the last-fetched channel
+package index and the last entry-point manifest discovery."""
 
 from pathlib import Path
 
@@ -14,3 +14,12 @@ def plugin_index_file() -> Path:
     home = Path(ETSConfig.application_home)
     home.mkdir(parents=True, exist_ok=True)
     return home / "plugin_index.json"
+
+
+def manifest_cache_file() -> Path:
+    """App-data file caching the last entry-point manifest discovery (JSON),
+    keyed by a fingerprint of the installed distributions' metadata. Lives
+    under ETSConfig.application_home; the dir is created if missing."""
+    home = Path(ETSConfig.application_home)
+    home.mkdir(parents=True, exist_ok=True)
+    return home / "plugin_manifest_cache.json"
@@ -5,6 +5,7 @@ module (step 1), in the distribution's dist-info (step 2), or as any other
 file the distribution installs — e.g. a top-level manifest shipped as a
 namespaced data file (step 3). _read_manifest_text tries them in that order.
 """
+import os
 import types
 
 from plugin_management import entry_point_discovery as d
@@ -118,3 +119,85 @@ def test_step1_reads_package_data_manifest():
         assert d._read_manifest_text(ep) == MANIFEST
     finally:
         d.importlib_resources.files = original
+
+
+# ---- discovery cache ------------------------------------------------------
+
+def _install_dist(site, name="demo_dist", version="1.0"):
+    """A minimal installed distribution in ``site`` advertising a
+    microdrop.plugins entry point, manifest in its dist-info (step 2)."""
+    info = site / f"{name}-{version}.dist-info"
+    info.mkdir(parents=True)
+    (info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n", encoding="utf-8")
+    (info / "entry_points.txt").write_text(
+        f"[microdrop.plugins]\n{name} = no_such_pkg_{name}\n", encoding="utf-8")
+    (info / "microdrop_plugin.toml").write_text(
+        MANIFEST.replace("toplevel_demo", name), encoding="utf-8")
+    return info
+
+
+def _cached_env(tmp_path, monkeypatch):
+    site = tmp_path / "site"
+    site.mkdir()
+    monkeypatch.setattr(d.sys, "path", [str(site)])
+    monkeypatch.setattr(d.paths, "manifest_cache_file",
+                        lambda: tmp_path / "plugin_manifest_cache.json")
+    scans = []
+    real_scan = d._scan
+    monkeypatch.setattr(d, "_scan", lambda: scans.append(1) or real_scan())
+    return site, scans
+
+
+def test_unchanged_environment_is_answered_from_cache(tmp_path, monkeypatch):
+    site, scans = _cached_env(tmp_path, monkeypatch)
+    _install_dist(site)
+
+    first = d.discover_entry_point_manifests()
+    second = d.discover_entry_point_manifests()
+
+    assert len(scans) == 1
+    assert [(m.name, dist) for m, dist in first] == [("demo_dist", "demo_dist")]
+    assert second == first
+
+
+def test_installing_a_distribution_rescans(tmp_path, monkeypatch):
+    site, scans = _cached_env(tmp_path, monkeypatch)
+    _install_dist(site)
+    d.discover_entry_point_manifests()
+
+    _install_dist(site, name="other_dist")
+    found = d.discover_entry_point_manifests()
+
+    assert len(scans) == 2
+    assert sorted(m.name for m, _ in found) == ["demo_dist", "other_dist"]
+
+
+def test_invalidate_and_corrupt_cache_rescan(tmp_path, monkeypatch):
+    site, scans = _cached_env(tmp_path, monkeypatch)
+    _install_dist(site)
+    d.discover_entry_point_manifests()
+
+    d.invalidate_manifest_cache()
+    d.discover_entry_point_manifests()
+    (tmp_path / "plugin_manifest_cache.json").write_text("{not json", encoding="utf-8")
+    assert [m.name for m, _ in d.discover_entry_point_manifests()] == ["demo_dist"]
+    assert len(scans) == 3
+
+
+def test_edited_package_data_manifest_rescans(tmp_path, monkeypatch):
+    site, scans = _cached_env(tmp_path, monkeypatch)
+    manifest = tmp_path / "microdrop_plugin.toml"
+    manifest.write_text(MANIFEST, encoding="utf-8")
+    ep = types.SimpleNamespace(name="demo", module="pkgx", dist=None)
+    monkeypatch.setattr(d.importlib_metadata, "entry_points", lambda group: [ep])
+    monkeypatch.setattr(d.importlib_resources, "files", lambda _pkg: tmp_path)
+
+    d.discover_entry_point_manifests()
+    d.discover_entry_point_manifests()
+    manifest.write_text(MANIFEST.replace('"g"', '"g2"'), encoding="utf-8")
+    os.utime(manifest, ns=(0, 0))
+    found = d.discover_entry_point_manifests()
+
+    assert len(scans) == 2
+    assert [g.name for g in found[0][0].groups] == ["g2"]
@@ -264,3 +264,24 @@ def test_reinstall_failure_rolls_back_and_rematerializes(tmp_path, monkeypatch):
 
     assert (tmp_path / "pyproject.toml").read_text(encoding="utf-8") == "orig"
     assert ["install"] in calls
+
+
+def test_env_changes_invalidate_the_manifest_cache(tmp_path, monkeypatch):
+    invalidated = []
+    monkeypatch.setattr(package_installer, "invalidate_manifest_cache",
+                        lambda: invalidated.append(1))
+    monkeypatch.setattr(package_installer, "_registered_channels", set())
+    monkeypatch.setattr(package_installer, "_try_snapshot", lambda cwd: None)
+    monkeypatch.setattr(package_installer, "_run", lambda *a, **k: None)
+
+    package_installer.install_from_channel("p", cwd=tmp_path)
+    package_installer.reinstall_from_channel("p", cwd=tmp_path)
+    package_installer.uninstall_package("p", cwd=tmp_path)
+
+    def fail(args, cwd=None):
+        raise package_installer.InstallError("boom")
+    monkeypatch.setattr(package_installer, "_run", fail)
+    with pytest.raises(package_installer.InstallError):
+        package_installer.uninstall_package("p", cwd=tmp_path)
+
+    assert len(invalidated) == 4
@@ -37,6 +37,11 @@ collect_imports(str(Path(pyface_timer.__file__).parent), 'pyface.timer')
 collect_imports(str(Path(pyface_tasks.__file__).parent), 'pyface.tasks')
 collect_imports(str(Path(traitsui.__file__).parent), 'traitsui.qt')
 
+# Plugins are listed as "module:Class" specs and imported lazily at startup, so
+# the analysis can't see them.
+from examples.plugin_consts import plugin_modules
+hiddenimports += plugin_modules()
+
 import teensy_minimal_rpc
 import dramatiq
 